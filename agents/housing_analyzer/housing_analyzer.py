@@ -15,6 +15,8 @@ each bill against four local control risk criteria aligned with CSF's mission:
 Analysis results are stored back into tracked_bills.json (one "analysis" block
 per bill). The agent runs incrementally — only newly added bills or bills whose
 status has changed since last analysis are re-evaluated, keeping API costs low.
+Companion bills (near-identical title + digest, e.g. an AB and its SB twin)
+reuse the matching bill's analysis instead of triggering another API call.
 
 Pipeline:  load → screen → analyze → store → report
 
@@ -69,6 +71,13 @@ except ImportError:
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from agents.shared.bill_similarity import _find_similar_bills
+from agents.shared.token_ledger import (
+    TokenBudgetExceeded,
+    configure_ledger,
+    print_ledger_summary,
+    tracked_create,
+)
 from agents.shared.utils import (
     ensure_dir,
     load_json,
@@ -89,6 +98,10 @@ MAX_RETRIES      = 5      # maximum number of retry attempts after initial failu
 RETRY_BASE_DELAY = 5.0   # seconds — doubles each attempt (exponential backoff)
 RETRY_MAX_DELAY  = 120.0  # seconds — cap so we never wait longer than 2 minutes
 
+# Companion / duplicate detection — reuse an existing analysis instead of
+# calling Claude when a bill's title + digest nearly matches an analyzed bill.
+DEFAULT_COMPANION_THRESHOLD = 0.9   # estimated Jaccard similarity (MinHash)
+
 SCORE_LABELS = {
     "strong":   "🔴 Strong Risk",
     "moderate": "🟠 Moderate Risk",
@@ -330,6 +343,12 @@ class HousingAnalyzer:
         )
         self._model = self.config.get("model", DEFAULT_MODEL)
 
+        companions_cfg = self.config.get("companions") or {}
+        self._companions_enabled: bool = companions_cfg.get("enabled", True)
+        self._companion_threshold: float = float(
+            companions_cfg.get("threshold", DEFAULT_COMPANION_THRESHOLD)
+        )
+
     # -----------------------------------------------------------------------
     # Setup
     # -----------------------------------------------------------------------
@@ -400,26 +419,48 @@ class HousingAnalyzer:
                 f"({'all' if force else 'new/changed/unanalyzed'})"
             )
 
+            similar = (
+                _find_similar_bills(bills, self._companion_threshold)
+                if to_analyze and self._companions_enabled
+                else {}
+            )
+            if similar:
+                self.logger.info(
+                    f"Companions: {len(similar)} bills have a near-duplicate "
+                    f"(similarity ≥ {self._companion_threshold:.2f})"
+                )
+
             # ------------------------------------------------------------------
             # Stage 3 + 4: Analyze + Store (incremental)
             # ------------------------------------------------------------------
             newly_analyzed: list[str] = []
+            pending = set(to_analyze)
             for i, bill_num in enumerate(to_analyze, 1):
                 bill = bills[bill_num]
                 self.logger.info(
                     f"[{i}/{len(to_analyze)}] Analyzing {bill_num}: {bill.get('title', '')[:60]}"
                 )
                 try:
-                    analysis = self._analyze_bill(bill)
+                    analysis = self._reuse_companion_analysis(
+                        bill, bills, similar.get(bill_num, []), pending,
+                    )
+                    reused = analysis is not None
+                    if not reused:
+                        analysis = self._analyze_bill(bill)
                     bills[bill_num]["analysis"] = analysis
                     newly_analyzed.append(bill_num)
+                    pending.discard(bill_num)
 
                     # Save incrementally after each bill
                     data["bills"] = bills
                     data["last_updated"] = datetime.now().isoformat()
                     save_json(data, self.bills_path, self.logger)
 
-                    time.sleep(RATE_LIMIT_DELAY)
+                    if not reused:
+                        time.sleep(RATE_LIMIT_DELAY)
+                except TokenBudgetExceeded as exc:
+                    self.logger.error(f"Token budget reached — stopping analysis: {exc}")
+                    break
                 except Exception as exc:
                     self.logger.error(f"Failed to analyze {bill_num}: {exc}")
                     # Continue with remaining bills rather than aborting
@@ -506,6 +547,44 @@ class HousingAnalyzer:
 
         return result
 
+    def _reuse_companion_analysis(
+        self,
+        bill: dict,
+        bills: dict,
+        matches: list[tuple[str, float]],
+        pending: set[str],
+    ) -> Optional[dict]:
+        """
+        Return a copy of a companion bill's analysis, or None to call Claude.
+
+        A match is usable only if its analysis is current — i.e. it is not
+        itself still queued for (re-)analysis this run. Under --force every
+        bill starts queued, so only analyses produced earlier in the same run
+        qualify. reused_from always names the bill Claude actually scored.
+        """
+        for other_num, similarity in matches:
+            if other_num in pending:
+                continue
+            source = bills.get(other_num, {}).get("analysis")
+            if not source:
+                continue
+
+            origin = source.get("reused_from", other_num)
+            analysis = {
+                k: v for k, v in source.items()
+                if k not in ("reused_from", "similarity")
+            }
+            analysis["reused_from"] = origin
+            analysis["similarity"] = round(similarity, 3)
+            analysis["analyzed_date"] = datetime.now().strftime("%Y-%m-%d")
+            analysis["status_at_analysis"] = bill.get("status", "")
+            self.logger.info(
+                f"  → Reusing analysis from companion {origin} "
+                f"(similarity {similarity:.2f}) — no API call"
+            )
+            return analysis
+        return None
+
     # -----------------------------------------------------------------------
     # Stage 3: Analyze
     # -----------------------------------------------------------------------
@@ -622,7 +701,9 @@ class HousingAnalyzer:
         last_exc: Exception | None = None
         for attempt in range(MAX_RETRIES + 1):
             try:
-                response = self._anthropic.messages.create(
+                response = tracked_create(
+                    self._anthropic,
+                    "housing_analyzer",
                     model=self._model,
                     max_tokens=512,
                     system=SYSTEM_PROMPT,
@@ -1089,6 +1170,14 @@ Examples:
         metavar="BILL_NUMBER",
         help="Analyze a single bill (e.g. AB1751 or 'AB 1751').",
     )
+    parser.add_argument(
+        "--budget",
+        type=int,
+        metavar="TOKENS",
+        default=None,
+        help="Stop before any Claude call that would take this run past TOKENS "
+             "total tokens (default: CSF_TOKEN_BUDGET, or unlimited).",
+    )
     parser.add_argument(
         "--config",
         metavar="PATH",
@@ -1107,12 +1196,14 @@ Examples:
         )
         sys.exit(1)
 
+    configure_ledger(budget=args.budget)
     analyzer = HousingAnalyzer(config_path=Path(args.config))
     analyzer.run(
         force=args.force,
         summary_only=args.summary_only,
         single_bill=args.bill,
     )
+    print_ledger_summary()
 
 
 if __name__ == "__main__":
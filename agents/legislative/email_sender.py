@@ -5,6 +5,7 @@ Converts bill data directly to inline-styled HTML and sends via SMTP.
 
 Why build HTML directly (instead of converting the markdown report):
   - Email clients strip <style> blocks; every element needs inline styles
+    (the send-time compaction pass can hoist repeated ones — email.style_block)
   - The email layout differs from the markdown report (wider content, CTAs)
   - More control over rendering across Gmail, Outlook, and Apple Mail
 
@@ -39,7 +40,12 @@ from datetime import datetime, timedelta
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+
+from agents.shared.action_classifier import parse_iso_date
+from agents.shared.html_compact import CompactStats, compact_html
+from agents.shared.html_fragments import FragmentCache
+from agents.shared.smtp_outbox import SmtpSettings, send_via_outbox
 
 
 # ---------------------------------------------------------------------------
@@ -56,8 +62,12 @@ def build_and_send_email(
     """
     Build an HTML email from bill data and send it via SMTP.
 
-    Returns True on success, False on failure (logs error, does not raise).
-    This makes it safe to call from the pipeline without breaking the run.
+    Each recipient gets their own copy through the on-disk outbox
+    (agents/shared/smtp_outbox.py), which retries transient failures.
+
+    Returns True if every recipient got it, False otherwise (logs error,
+    does not raise). This makes it safe to call from the pipeline without
+    breaking the run.
     """
     log = logger or logging.getLogger(__name__)
 
@@ -90,14 +100,14 @@ def build_and_send_email(
     subject = config["email"]["subject_template"].format(date=date_str)
 
     # Build email content
-    html_body = _build_html(new_bills, changed_bills, all_bills, config, date_str)
+    html_body = _fit_email_html(new_bills, changed_bills, all_bills, config, date_str, log)
     plain_body = _build_plaintext(new_bills, changed_bills, all_bills, date_str)
 
-    # Assemble MIME message (multipart/alternative: plain + HTML)
+    # Assemble MIME message (multipart/alternative: plain + HTML).
+    # No To: header — the outbox addresses each recipient's copy.
     msg = MIMEMultipart("alternative")
     msg["Subject"] = subject
     msg["From"] = f"{config['email']['from_name']} <{smtp_user}>"
-    msg["To"] = ", ".join(recipients)
 
     msg.attach(MIMEText(plain_body, "plain", "utf-8"))
     msg.attach(MIMEText(html_body, "html", "utf-8"))
@@ -105,16 +115,18 @@ def build_and_send_email(
     # Send via SMTP with STARTTLS
     host = config["email"]["smtp_host"]
     port = config["email"]["smtp_port"]
+    settings = SmtpSettings(host=host, port=port, user=smtp_user, password=smtp_pass)
 
     try:
-        log.info(f"Sending email to {recipients} via {host}:{port}")
-        with smtplib.SMTP(host, port, timeout=30) as server:
-            server.ehlo()
-            server.starttls()
-            server.ehlo()
-            server.login(smtp_user, smtp_pass)
-            server.sendmail(smtp_user, recipients, msg.as_bytes())
-        log.info(f"Email sent successfully to: {', '.join(recipients)}")
+        log.info(f"Sending email to {len(recipients)} recipient(s) via {host}:{port}")
+        report = send_via_outbox(msg, smtp_user, recipients, settings, logger=log)
+        if not report.ok:
+            log.error(
+                f"Email not delivered to {len(report.failed) + len(report.pending)} "
+                f"of {len(recipients)} recipient(s) (outbox batch {report.batch})"
+            )
+            return False
+        log.info(f"Email sent successfully to {len(report.sent)} recipient(s)")
         return True
     except smtplib.SMTPAuthenticationError:
         log.error(
@@ -171,19 +183,7 @@ def build_status_page(
     )
 
     # Identify stalled bills: tracked but no status update in the last stalled_days.
-    # Sorted oldest-first so the most dormant bills appear at the top.
-    today = datetime.now().date()
-    cutoff = today - timedelta(days=stalled_days)
-    stalled: list[dict] = []
-    for bill in all_bills.values():
-        sd = bill.get("status_date", "")
-        if sd:
-            try:
-                if datetime.strptime(sd, "%Y-%m-%d").date() < cutoff:
-                    stalled.append(bill)
-            except ValueError:
-                pass
-    stalled.sort(key=lambda b: b.get("status_date", ""))
+    stalled = _find_stalled_bills(all_bills, stalled_days)
 
     html = _build_page_html(
         new_bills=new_bills,
@@ -248,6 +248,37 @@ _CRIT_MODERATE_BG = {"pro_housing_production": "#f1948a", "densification": "#f5c
 _CRIT_MODERATE_TX = {"pro_housing_production": "#78281f", "densification": "#784212",
                       "reduce_discretion": "#784212", "cost_to_cities": "#4a235a"}
 
+# Table styles shared by the index, watchlist, and stalled tables. These
+# tables run to hundreds of rows, so the font and text color are set once on
+# the <table> (cells inherit them) and each row is <tr valign="top">; a cell
+# carries only its padding and rule.
+_TABLE_STYLE = (
+    f"border-collapse:collapse; border:1px solid {_COLOR_BORDER}; "
+    f"font-size:12px; color:{_COLOR_TEXT}; {_FONT}"
+)
+_TH_STYLE = (
+    f"padding:8px 10px; background:{_COLOR_ACCENT}; color:#fff; "
+    f"font-size:11px; font-weight:600; text-align:left; {_FONT}"
+)
+_TD_STYLE = f"padding:8px 10px; border-bottom:1px solid {_COLOR_BORDER};"
+_TD_MUTED_STYLE = f"{_TD_STYLE} color:{_COLOR_MUTED};"
+_TD_RISK_STYLE = f"{_TD_STYLE} white-space:nowrap; font-size:10px;"
+
+# Bill and change cards are cached by their display fields, so the email and
+# the status page built in the same run share every unchanged one. Table rows
+# are too cheap to key (building the key costs what the f-string does); their
+# risk cell is cached by the five criterion scores, which few bills differ in.
+_fragments = FragmentCache()
+
+# Default email.size_budget_kb — Gmail clips HTML over ~102 KB (see _fit_email_html)
+_SIZE_BUDGET_KB = 96
+
+# Floors the size-budget cuts hold to before cutting anything else: the index
+# keeps its highest-risk rows, and the new and changed sections each keep
+# their highest-risk cards (see _fit_email_html)
+_INDEX_MIN_ROWS = 20
+_CARD_MIN       = 3
+
 
 # ---------------------------------------------------------------------------
 # Analysis section helpers
@@ -325,6 +356,27 @@ def _score_pills(analysis: dict) -> str:
     return "".join(pills) if pills else ""
 
 
+def _risk_cell(analysis: dict) -> str:
+    """Criteria pills for a table cell (_TD_RISK_STYLE sets their font)."""
+    def render() -> str:
+        pills = []
+        for k in _CRIT_KEYS:
+            score = analysis.get(k, "none")
+            if score == "strong":
+                colors, weight = f"background:{_CRIT_STRONG_BG[k]}; color:#fff;", 700
+            elif score == "moderate":
+                colors, weight = f"background:{_CRIT_MODERATE_BG[k]}; color:{_CRIT_MODERATE_TX[k]};", 600
+            else:
+                continue
+            pills.append(
+                f'<span style="display:inline-block; {colors} font-weight:{weight}; '
+                f'padding:2px 7px; border-radius:3px; margin-right:3px;">{_CRIT_LETTER[k]}</span>'
+            )
+        return "".join(pills) if pills else f'<span style="color:{_COLOR_BORDER};">—</span>'
+
+    return _fragments.get("risk_cell", tuple(analysis.get(k, "none") for k in _CRIT_KEYS), render)
+
+
 def _render_comms_brief(comms_brief: str) -> str:
     """
     Parse and render the structured comms_brief into formatted HTML.
@@ -457,7 +509,7 @@ def _html_analysis_section(all_bills: dict) -> str:
   </table>"""
 
     # ── Key bills (top 8 high-interest) ──────────────────────────────────────
-    key_bills_html = ""
+    key_bills: list[str] = []
     for num, bill in high_interest[:8]:
         analysis    = bill.get("analysis", {})
         url         = bill.get("text_url", "")
@@ -492,7 +544,7 @@ def _html_analysis_section(all_bills: dict) -> str:
             f'vertical-align:middle; {_FONT}">{n_risk}&nbsp;criteria</span>'
         )
 
-        key_bills_html += _row(f"""
+        key_bills.append(_row(f"""
   <div style="padding:16px 32px 20px 32px; border-bottom:1px solid {_COLOR_TEAL_LIGHT};">
     <table role="presentation" width="100%" cellpadding="0" cellspacing="0">
       <tr>
@@ -515,8 +567,9 @@ def _html_analysis_section(all_bills: dict) -> str:
     {brief_card}
     {f'<p style="margin:6px 0 0 0;">{view_link}</p>' if view_link else ""}
   </div>
-""", bg=_COLOR_CARD, padding="0")
+""", bg=_COLOR_CARD, padding="0"))
 
+    key_bills_html = "".join(key_bills)
     if not key_bills_html:
         key_bills_html = _row(
             f'<p style="padding:16px 32px; color:{_COLOR_MUTED}; '
@@ -525,7 +578,7 @@ def _html_analysis_section(all_bills: dict) -> str:
         )
 
     # ── By criterion (strong scores, ≤5 per criterion) ───────────────────────
-    crit_cells = ""
+    crit_rows: list[str] = []
     legend_items = [
         f'<span style="display:inline-block; background:{_CRIT_STRONG_BG[k]}; '
         f'color:#fff; font-size:10px; font-weight:700; padding:2px 7px; '
@@ -554,7 +607,7 @@ def _html_analysis_section(all_bills: dict) -> str:
         )
         letter = _CRIT_LETTER[k]
         bg     = _CRIT_STRONG_BG[k]
-        crit_cells += f"""
+        crit_rows.append(f"""
       <tr>
         <td style="padding:6px 0; border-bottom:1px solid {_COLOR_BORDER};
                    vertical-align:top; width:30px;">
@@ -566,8 +619,9 @@ def _html_analysis_section(all_bills: dict) -> str:
                    font-size:12px; color:{_COLOR_TEXT}; vertical-align:top; {_FONT}">
           {bill_links}
         </td>
-      </tr>"""
+      </tr>""")
 
+    crit_cells        = "".join(crit_rows)
     crit_section_html = ""
     if crit_cells:
         crit_section_html = _row(f"""
@@ -669,8 +723,15 @@ def _build_html(
     all_bills: dict,
     config: dict,
     date_str: str,
+    index_limit: Optional[int] = None,
+    stalled_limit: Optional[int] = None,
+    card_limit: Optional[int] = None,
 ) -> str:
-    """Assemble the full HTML email string."""
+    """Assemble the full HTML email string.
+
+    index_limit / stalled_limit cut those tables short, and card_limit the
+    new and changed bill cards (see _fit_email_html).
+    """
     lookback    = config["legislative"]["lookback_days"]
     stalled_days = config["legislative"].get("stalled_days", 14)
     include_index = config["email"].get("include_full_index", True)
@@ -680,18 +741,7 @@ def _build_html(
     watchlist_bills = [b for b in all_bills.values() if b.get("watchlist")]
 
     # Stalled bills — no status update in the last stalled_days
-    today  = datetime.now().date()
-    cutoff = today - timedelta(days=stalled_days)
-    stalled_bills: list[dict] = []
-    for bill in all_bills.values():
-        sd = bill.get("status_date", "")
-        if sd:
-            try:
-                if datetime.strptime(sd, "%Y-%m-%d").date() < cutoff:
-                    stalled_bills.append(bill)
-            except ValueError:
-                pass
-    stalled_bills.sort(key=lambda b: b.get("status_date", ""))
+    stalled_bills = _find_stalled_bills(all_bills, stalled_days)
 
     sections = [
         _html_header(date_str, lookback),
@@ -704,7 +754,9 @@ def _build_html(
         sections.append(_html_watchlist_section(watchlist_bills))
 
     if stalled_bills:
-        sections.append(_html_stalled_section(stalled_bills, stalled_days))
+        sections.append(_html_stalled_section(
+            stalled_bills, stalled_days, limit=stalled_limit, pages_url=pages_url,
+        ))
 
     if new_bills:
         sections.append(_html_bill_section(
@@ -712,15 +764,17 @@ def _build_html(
             new_bills,
             badge_color=_COLOR_GREEN,
             badge_label="NEW",
+            limit=card_limit,
+            pages_url=pages_url,
         ))
 
     if changed_bills:
-        sections.append(_html_changes_section(changed_bills))
+        sections.append(_html_changes_section(changed_bills, limit=card_limit, pages_url=pages_url))
 
     sections += [_html_hearings_section(all_bills)]
 
     if include_index:
-        sections.append(_html_index_section(all_bills))
+        sections.append(_html_index_section(all_bills, limit=index_limit, pages_url=pages_url))
 
     sections.append(_html_footer(date_str, pages_url=pages_url))
 
@@ -750,6 +804,115 @@ def _build_html(
 </html>"""
 
 
+def _fit_email_html(
+    new_bills: list[dict],
+    changed_bills: list[dict],
+    all_bills: dict,
+    config: dict,
+    date_str: str,
+    log: logging.Logger,
+) -> str:
+    """
+    The email HTML, compacted and cut down to fit email.size_budget_kb.
+
+    Gmail clips HTML over ~102 KB, hiding everything past the cut. The email
+    is compacted first (agents/shared/html_compact.py; email.style_block opts
+    in to hoisting repeated styles into a <head> <style>). If it's still over
+    budget, content is cut in this order until it fits:
+
+      1. the stalled table — every stalled bill is also in the index;
+      2. the full index, down to its _INDEX_MIN_ROWS highest-risk bills;
+      3. the new and changed bill cards, down to _CARD_MIN per section;
+      4. the rest of the index, then the rest of the cards.
+
+    Each cut keeps as many rows as fit and ends in a note linking to the
+    dashboard (github.pages_url), which always has everything. Logs the size
+    before and after.
+
+    Row counts are found by search over trial renders; each one re-renders
+    and re-compacts the email, which is cheap once the tables are short.
+    """
+    email_cfg   = config["email"]
+    budget      = int(email_cfg.get("size_budget_kb", _SIZE_BUDGET_KB) * 1024)
+    style_block = email_cfg.get("style_block", False)
+    n_stalled   = len(_find_stalled_bills(all_bills, config["legislative"].get("stalled_days", 14)))
+    n_cards     = max(len(new_bills), len(changed_bills))
+    cuts = [
+        ("stalled_limit", n_stalled,      0),
+        ("index_limit",   len(all_bills), _INDEX_MIN_ROWS),
+        ("card_limit",    n_cards,        _CARD_MIN),
+        ("index_limit",   len(all_bills), 0),
+        ("card_limit",    n_cards,        0),
+    ]
+
+    renders: dict[tuple, tuple[str, CompactStats]] = {}
+
+    def render(**limits) -> tuple[str, CompactStats]:
+        key = tuple(sorted(limits.items()))
+        if key not in renders:
+            raw = _build_html(new_bills, changed_bills, all_bills, config, date_str, **limits)
+            renders[key] = compact_html(raw, style_block=style_block)
+        return renders[key]
+
+    html, stats = render()
+    before = stats.before
+    limits: dict[str, int] = {}
+    for name, total, floor in cuts:
+        if stats.after <= budget:
+            break
+        hi = min(limits.get(name, total), total)
+        if hi <= floor:
+            continue
+
+        def size(rows: int) -> int:
+            return render(**{**limits, name: rows})[1].after
+
+        limits[name] = max(_most_rows_within(size, hi, stats.after, budget, lo=floor), floor)
+        html, stats = render(**limits)
+
+    log.info(f"Email HTML: {before:,} bytes → {stats.after:,} compacted (budget {budget:,})")
+    if limits:
+        cut = ", ".join(f"{t.split('_')[0]} to {n}" for t, n in limits.items())
+        log.warning(f"Email over size budget — cut {cut}; the dashboard has the rest")
+    if stats.after > budget:
+        log.warning(f"Email is still {stats.after:,} bytes — Gmail may clip it")
+    return html
+
+
+def _most_rows_within(
+    size: Callable[[int], int], hi: int, hi_size: int, budget: int, lo: int = 0,
+) -> int:
+    """
+    Largest n in [lo, hi] with size(n) <= budget, or -1 if not even size(lo) is.
+
+    size() must not decrease with n; hi_size is size(hi), already known to be
+    over budget. Each row adds about the same bytes, so the next probe is
+    interpolated between the bracket's ends — a few renders instead of the
+    log2(hi) of a bisection, which is still used when a probe doesn't halve
+    the bracket.
+    """
+    lo_size = size(lo)
+    if lo_size > budget:
+        return -1
+    while hi - lo > 1:
+        width = hi - lo
+        probe = lo + (budget - lo_size) * width // (hi_size - lo_size)
+        probe = min(max(probe, lo + 1), hi - 1)
+        probe_size = size(probe)
+        if probe_size <= budget:
+            lo, lo_size = probe, probe_size
+        else:
+            hi, hi_size = probe, probe_size
+        if hi - lo > width // 2 and hi - lo > 1:
+            mid = (lo + hi) // 2
+            mid_size = size(mid)
+            if mid_size <= budget:
+                lo, lo_size = mid, mid_size
+            else:
+                hi, hi_size = mid, mid_size
+    return lo
+
+
 def _row(content: str, bg: str = _COLOR_CARD, padding: str = "0") -> str:
     """Wrap content in a table row (the basic email layout unit)."""
     return f"""
@@ -840,10 +1003,46 @@ def _html_bill_section(
     bills: list[dict],
     badge_color: str,
     badge_label: str,
+    limit: Optional[int] = None,
+    pages_url: str = "",
 ) -> str:
+    """Bill cards in bill-number order; with `limit`, only the highest-risk ones."""
+    shown = _highest_risk(bills, limit)
     bill_rows = "".join(_html_bill_card(b, badge_color, badge_label) for b in
-                        sorted(bills, key=lambda b: b.get("bill_number", "")))
-    return _section_header(heading) + bill_rows
+                        sorted(shown, key=lambda b: b.get("bill_number", "")))
+    return _section_header(heading) + bill_rows + _html_more_cards(len(shown), len(bills), pages_url)
+
+
+_BILL_CARD = _row(f"""
+  <div style="padding:20px 32px; border-bottom:1px solid {_COLOR_BORDER};">
+    <table role="presentation" width="100%" cellpadding="0" cellspacing="0">
+      <tr>
+        <td style="vertical-align:top;">
+          <span style="display:inline-block; background:{{badge_color}};
+                       color:#fff; font-size:10px; font-weight:700;
+                       padding:2px 7px; border-radius:3px; letter-spacing:0.5px;
+                       vertical-align:middle; margin-right:8px; {_FONT}">
+            {{badge_label}}
+          </span>
+          <strong style="font-size:15px; color:{_COLOR_ACCENT}; {_FONT}">{{num}}</strong>
+        </td>
+        {{intro_cell}}
+      </tr>
+    </table>
+    <p style="margin:6px 0 4px 0; font-size:14px; font-weight:600;
+              color:{_COLOR_TEXT}; line-height:1.3; {_FONT}">
+      {{title}}
+    </p>
+    <p style="margin:0; font-size:12px; color:{_COLOR_MUTED}; {_FONT}">
+      {{author_line}}
+      <strong>Status:</strong> {{status}}
+    </p>
+    {{committee_html}}
+    {{summary_html}}
+    {{tag_html}}
+    {{cta_html}}
+  </div>
+""", bg=_COLOR_CARD, padding="0")
 
 
 def _html_bill_card(bill: dict, badge_color: str, badge_label: str) -> str:
@@ -853,44 +1052,45 @@ def _html_bill_card(bill: dict, badge_color: str, badge_label: str) -> str:
     status = bill.get("status", "")
     summary = bill.get("summary", "")
     url = bill.get("text_url", "")
-    subjects = bill.get("subjects", [])
-    committees = bill.get("committees", [])
+    subjects = tuple(bill.get("subjects", [])[:5])
+    committees = tuple(bill.get("committees", [])[:2])
     intro_date = bill.get("introduced_date", "")
 
-    # Subject tags
-    tag_html = ""
-    if subjects:
-        tags = "".join(
-            f'<span style="display:inline-block; background:{_COLOR_ACCENT_LIGHT}; '
-            f'color:{_COLOR_ACCENT}; font-size:11px; padding:2px 8px; '
-            f'border-radius:3px; margin:0 4px 4px 0; {_FONT}">{t}</span>'
-            for t in subjects[:5]
-        )
-        tag_html = f'<div style="margin-top:10px;">{tags}</div>'
+    def render() -> str:
+        # Subject tags
+        tag_html = ""
+        if subjects:
+            tags = "".join(
+                f'<span style="display:inline-block; background:{_COLOR_ACCENT_LIGHT}; '
+                f'color:{_COLOR_ACCENT}; font-size:11px; padding:2px 8px; '
+                f'border-radius:3px; margin:0 4px 4px 0; {_FONT}">{t}</span>'
+                for t in subjects
+            )
+            tag_html = f'<div style="margin-top:10px;">{tags}</div>'
 
-    # Summary block
-    summary_html = ""
-    if summary:
-        short = summary[:280] + ("…" if len(summary) > 280 else "")
-        summary_html = f"""
+        # Summary block
+        summary_html = ""
+        if summary:
+            short = summary[:280] + ("…" if len(summary) > 280 else "")
+            summary_html = f"""
         <p style="margin:10px 0 0 0; font-size:13px; color:{_COLOR_TEXT};
                   line-height:1.6; border-left:3px solid {_COLOR_ACCENT_LIGHT};
                   padding-left:12px; {_FONT}">
           {short}
         </p>"""
 
-    # Committee
-    committee_html = ""
-    if committees:
-        committee_html = f"""
+        # Committee
+        committee_html = ""
+        if committees:
+            committee_html = f"""
         <p style="margin:8px 0 0 0; font-size:12px; color:{_COLOR_MUTED}; {_FONT}">
-          <strong>Committee:</strong> {', '.join(committees[:2])}
+          <strong>Committee:</strong> {', '.join(committees)}
         </p>"""
 
-    # CTA button
-    cta_html = ""
-    if url:
-        cta_html = f"""
+        # CTA button
+        cta_html = ""
+        if url:
+            cta_html = f"""
         <p style="margin:14px 0 0 0;">
           <a href="{url}" target="_blank"
              style="display:inline-block; background:{_COLOR_ACCENT};
@@ -901,64 +1101,41 @@ def _html_bill_card(bill: dict, badge_color: str, badge_label: str) -> str:
           </a>
         </p>"""
 
-    return _row(f"""
-  <div style="padding:20px 32px; border-bottom:1px solid {_COLOR_BORDER};">
-    <table role="presentation" width="100%" cellpadding="0" cellspacing="0">
-      <tr>
-        <td style="vertical-align:top;">
-          <span style="display:inline-block; background:{badge_color};
-                       color:#fff; font-size:10px; font-weight:700;
-                       padding:2px 7px; border-radius:3px; letter-spacing:0.5px;
-                       vertical-align:middle; margin-right:8px; {_FONT}">
-            {badge_label}
-          </span>
-          <strong style="font-size:15px; color:{_COLOR_ACCENT}; {_FONT}">{num}</strong>
-        </td>
-        {"" if not intro_date else f'<td align="right" style="font-size:12px; color:{_COLOR_MUTED}; vertical-align:top; {_FONT}">{intro_date}</td>'}
-      </tr>
-    </table>
-    <p style="margin:6px 0 4px 0; font-size:14px; font-weight:600;
-              color:{_COLOR_TEXT}; line-height:1.3; {_FONT}">
-      {title}
-    </p>
-    <p style="margin:0; font-size:12px; color:{_COLOR_MUTED}; {_FONT}">
-      {f"<strong>Author:</strong> {author} &nbsp;·&nbsp; " if author else ""}
-      <strong>Status:</strong> {status or "—"}
-    </p>
-    {committee_html}
-    {summary_html}
-    {tag_html}
-    {cta_html}
-  </div>
-""", bg=_COLOR_CARD, padding="0")
+        return _BILL_CARD.format(
+            badge_color=badge_color,
+            badge_label=badge_label,
+            num=num,
+            intro_cell="" if not intro_date else (
+                f'<td align="right" style="font-size:12px; color:{_COLOR_MUTED}; '
+                f'vertical-align:top; {_FONT}">{intro_date}</td>'
+            ),
+            title=title,
+            author_line=f"<strong>Author:</strong> {author} &nbsp;·&nbsp; " if author else "",
+            status=status or "—",
+            committee_html=committee_html,
+            summary_html=summary_html,
+            tag_html=tag_html,
+            cta_html=cta_html,
+        )
 
+    return _fragments.get(
+        "bill_card",
+        (badge_color, badge_label, num, title, author, status, summary, url,
+         subjects, committees, intro_date),
+        render,
+    )
 
-def _html_changes_section(changed_bills: list[dict]) -> str:
-    cards = ""
-    for bill in changed_bills:
-        num = bill.get("bill_number", "")
-        title = bill.get("title", "")
-        prev = bill.get("_prev_status") or "—"
-        new = bill.get("status", "—")
-        author = bill.get("author", "")
-        url = bill.get("text_url", "")
 
-        cta = (
-            f'<a href="{url}" target="_blank" '
-            f'style="color:{_COLOR_ACCENT}; font-size:12px; {_FONT}">View bill →</a>'
-            if url else ""
-        )
-
-        cards += _row(f"""
+_CHANGE_CARD = _row(f"""
   <div style="padding:18px 32px; border-bottom:1px solid {_COLOR_BORDER};">
     <span style="display:inline-block; background:{_COLOR_ORANGE};
                  color:#fff; font-size:10px; font-weight:700; padding:2px 7px;
                  border-radius:3px; letter-spacing:0.5px;
                  margin-right:8px; {_FONT}">UPDATED</span>
-    <strong style="font-size:14px; color:{_COLOR_ACCENT}; {_FONT}">{num}</strong>
+    <strong style="font-size:14px; color:{_COLOR_ACCENT}; {_FONT}">{{num}}</strong>
     <p style="margin:6px 0 4px 0; font-size:13px; font-weight:600;
-              color:{_COLOR_TEXT}; {_FONT}">{title}</p>
-    {"" if not author else f'<p style="margin:0 0 8px 0; font-size:12px; color:{_COLOR_MUTED}; {_FONT}">Author: {author}</p>'}
+              color:{_COLOR_TEXT}; {_FONT}">{{title}}</p>
+    {{author_html}}
     <table role="presentation" cellpadding="0" cellspacing="0"
            style="width:100%; border:1px solid {_COLOR_BORDER}; border-radius:4px;
                   background:#fafafa; margin-top:6px;">
@@ -970,7 +1147,7 @@ def _html_changes_section(changed_bills: list[dict]) -> str:
             Previous
           </div>
           <div style="font-size:12px; color:{_COLOR_MUTED};
-                      text-decoration:line-through; {_FONT}">{prev}</div>
+                      text-decoration:line-through; {_FONT}">{{prev}}</div>
         </td>
         <td style="padding:10px 14px; width:50%; vertical-align:top;">
           <div style="font-size:10px; color:{_COLOR_MUTED}; text-transform:uppercase;
@@ -978,15 +1155,62 @@ def _html_changes_section(changed_bills: list[dict]) -> str:
             Now
           </div>
           <div style="font-size:12px; color:{_COLOR_GREEN}; font-weight:600;
-                      {_FONT}">{new}</div>
+                      {_FONT}">{{new}}</div>
         </td>
       </tr>
     </table>
-    {"" if not cta else f'<p style="margin:10px 0 0 0;">{cta}</p>'}
+    {{cta_html}}
   </div>
 """, bg=_COLOR_CARD, padding="0")
 
-    return _section_header(f"Status Changes ({len(changed_bills)})") + cards
+
+def _html_change_card(bill: dict) -> str:
+    num = bill.get("bill_number", "")
+    title = bill.get("title", "")
+    prev = bill.get("_prev_status") or "—"
+    new = bill.get("status", "—")
+    author = bill.get("author", "")
+    url = bill.get("text_url", "")
+
+    def render() -> str:
+        cta = (
+            f'<a href="{url}" target="_blank" '
+            f'style="color:{_COLOR_ACCENT}; font-size:12px; {_FONT}">View bill →</a>'
+            if url else ""
+        )
+        return _CHANGE_CARD.format(
+            num=num,
+            title=title,
+            author_html="" if not author else (
+                f'<p style="margin:0 0 8px 0; font-size:12px; color:{_COLOR_MUTED}; '
+                f'{_FONT}">Author: {author}</p>'
+            ),
+            prev=prev,
+            new=new,
+            cta_html="" if not cta else f'<p style="margin:10px 0 0 0;">{cta}</p>',
+        )
+
+    return _fragments.get("change_card", (num, title, prev, new, author, url), render)
+
+
+def _html_changes_section(
+    changed_bills: list[dict], limit: Optional[int] = None, pages_url: str = "",
+) -> str:
+    shown = _highest_risk(changed_bills, limit)
+    cards = "".join(_html_change_card(bill) for bill in shown)
+    return (
+        _section_header(f"Status Changes ({len(changed_bills)})")
+        + cards
+        + _html_more_cards(len(shown), len(changed_bills), pages_url)
+    )
+
+
+def _highest_risk(bills: list[dict], limit: Optional[int]) -> list[dict]:
+    """The `limit` highest-risk of `bills`, in their original order (all if no limit)."""
+    if limit is None or limit >= len(bills):
+        return bills
+    keep = {id(b) for b in sorted(bills, key=_risk_rank, reverse=True)[:limit]}
+    return [b for b in bills if id(b) in keep]
 
 
 def _html_hearings_section(all_bills: dict) -> str:
@@ -1003,11 +1227,11 @@ def _html_hearings_section(all_bills: dict) -> str:
     if not hearings:
         return ""
 
-    rows = ""
+    rows: list[str] = []
     for h in hearings[:10]:
         committee = h.get("committee", "TBD")
         location = h.get("location", "")
-        rows += f"""
+        rows.append(f"""
         <tr>
           <td style="padding:10px 0; border-bottom:1px solid {_COLOR_BORDER};
                      vertical-align:top; width:100px;">
@@ -1027,68 +1251,119 @@ def _html_hearings_section(all_bills: dict) -> str:
               {h['bill_title'][:70]}
             </div>
           </td>
-        </tr>"""
+        </tr>""")
 
     return (
         _section_header(f"Upcoming Hearings ({len(hearings)})")
         + _row(f"""
   <div style="padding:4px 32px 20px 32px;">
     <table role="presentation" width="100%" cellpadding="0" cellspacing="0">
-      {rows}
+      {"".join(rows)}
     </table>
   </div>
 """, bg=_COLOR_CARD, padding="0")
     )
 
 
-def _html_index_section(all_bills: dict) -> str:
-    if not all_bills:
-        return ""
+_INDEX_ROW = f"""
+        <tr valign="top">
+          <td style="{_TD_STYLE} white-space:nowrap;">{{bill_cell}}</td>
+          <td style="{_TD_RISK_STYLE}">{{risk_cell}}</td>
+          <td style="{_TD_STYLE}">{{author}}</td>
+          <td style="{_TD_STYLE}">{{status}}</td>
+          <td style="{_TD_STYLE}">{{title}}</td>
+        </tr>"""
+
 
-    header_style = (
-        f"padding:8px 10px; background:{_COLOR_ACCENT}; color:#fff; "
-        f"font-size:11px; font-weight:600; text-align:left; {_FONT}"
+def _html_index_row(num: str, bill: dict) -> str:
+    url = bill.get("text_url", "")
+    author = (bill.get("author") or "")[:20]
+    status = (bill.get("status") or "")[:45]
+    title = (bill.get("title") or "")[:55]
+    return _INDEX_ROW.format(
+        bill_cell=(
+            f'<a href="{url}" style="color:{_COLOR_ACCENT};">{num}</a>'
+            if url else num
+        ),
+        risk_cell=_risk_cell(bill.get("analysis") or {}),
+        author=author,
+        status=status,
+        title=title,
     )
-    cell_style = (
-        f"padding:8px 10px; font-size:12px; color:{_COLOR_TEXT}; "
-        f"border-bottom:1px solid {_COLOR_BORDER}; vertical-align:top; {_FONT}"
+
+
+def _risk_rank(bill: dict) -> tuple[int, int]:
+    """(strong, moderate) criterion counts — higher sorts as more relevant."""
+    a = bill.get("analysis") or {}
+    return (
+        sum(1 for k in _CRIT_KEYS if a.get(k) == "strong"),
+        sum(1 for k in _CRIT_KEYS if a.get(k) == "moderate"),
     )
 
-    rows = ""
-    for num in sorted(all_bills.keys()):
-        b = all_bills[num]
-        url = b.get("text_url", "")
-        bill_cell = (
-            f'<a href="{url}" style="color:{_COLOR_ACCENT}; {_FONT}">{num}</a>'
-            if url else num
+
+def _more_note(shown: int, total: int, pages_url: str) -> str:
+    """"Showing N of M" text for content cut short to fit the email size budget."""
+    more = f"{total - shown} more not shown to keep this email under Gmail's size limit"
+    if pages_url:
+        more = (
+            f'{more} — <a href="{pages_url}" style="color:{_COLOR_ACCENT}; font-weight:600; '
+            f'{_FONT}">see them all on the live dashboard →</a>'
         )
-        author = (b.get("author") or "")[:20]
-        status = (b.get("status") or "")[:45]
-        title = (b.get("title") or "")[:55]
-        pills = _score_pills(b.get("analysis") or {})
-        risk_cell = pills if pills else f'<span style="color:{_COLOR_BORDER};">—</span>'
-        rows += f"""
-        <tr>
-          <td style="{cell_style} white-space:nowrap;">{bill_cell}</td>
-          <td style="{cell_style} white-space:nowrap;">{risk_cell}</td>
-          <td style="{cell_style}">{author}</td>
-          <td style="{cell_style}">{status}</td>
-          <td style="{cell_style}">{title}</td>
-        </tr>"""
+    return f"Showing {shown} of {total}. {more}"
+
+
+def _html_more_row(shown: int, total: int, colspan: int, pages_url: str) -> str:
+    """Closing table row for a table cut short to fit the email size budget."""
+    return (
+        f'<tr><td colspan="{colspan}" style="{_TD_MUTED_STYLE} font-style:italic;">'
+        f"{_more_note(shown, total, pages_url)}</td></tr>"
+    )
+
+
+def _html_more_cards(shown: int, total: int, pages_url: str) -> str:
+    """Closing note for a card section cut short ("" if nothing was cut)."""
+    if shown >= total:
+        return ""
+    return _row(
+        f'<p style="margin:0; padding:14px 32px; font-size:12px; color:{_COLOR_MUTED}; '
+        f'font-style:italic; {_FONT}">{_more_note(shown, total, pages_url)}</p>',
+        bg=_COLOR_CARD, padding="0",
+    )
+
+
+def _html_index_section(all_bills: dict, limit: Optional[int] = None, pages_url: str = "") -> str:
+    """
+    Render the 'All Tracked Bills' table, sorted by bill number.
+
+    With `limit`, only the `limit` highest-risk bills are listed (still in
+    bill-number order) and a closing row links to the full index on the
+    dashboard — see _fit_email_html().
+    """
+    if not all_bills:
+        return ""
+
+    nums = sorted(all_bills)
+    more = ""
+    if limit is not None and limit < len(nums):
+        keep = set(sorted(nums, key=lambda n: _risk_rank(all_bills[n]), reverse=True)[:limit])
+        nums = [n for n in nums if n in keep]
+        more = _html_more_row(limit, len(all_bills), 5, pages_url)
+
+    rows = "".join(_html_index_row(num, all_bills[num]) for num in nums) + more
 
     return (
         _section_header(f"All Tracked Bills ({len(all_bills)})")
         + _row(f"""
   <div style="padding:0 32px 20px 32px; overflow-x:auto;">
     <table role="presentation" width="100%" cellpadding="0" cellspacing="0"
-           style="border-collapse:collapse; border:1px solid {_COLOR_BORDER};">
+           style="{_TABLE_STYLE}">
       <thead>
         <tr>
-          <th style="{header_style}">Bill</th>
-          <th style="{header_style}">Risk</th>
-          <th style="{header_style}">Author</th>
-          <th style="{header_style}">Status</th>
-          <th style="{header_style}">Title</th>
+          <th style="{_TH_STYLE}">Bill</th>
+          <th style="{_TH_STYLE}">Risk</th>
+          <th style="{_TH_STYLE}">Author</th>
+          <th style="{_TH_STYLE}">Status</th>
+          <th style="{_TH_STYLE}">Title</th>
         </tr>
       </thead>
       <tbody>{rows}</tbody>
@@ -1135,6 +1410,24 @@ def _html_footer(date_str: str, pages_url: str = "") -> str:
 # Status page helpers (standalone web page, not email)
 # ---------------------------------------------------------------------------
 
+def _linked_bill_cell(num: str, url: str) -> str:
+    return (
+        f'<a href="{url}" style="color:{_COLOR_ACCENT}; font-weight:600;">{num}</a>'
+        if url else f"<strong>{num}</strong>"
+    )
+
+
+_WATCHLIST_ROW = f"""
+        <tr valign="top">
+          <td style="{_TD_STYLE} white-space:nowrap;">{{bill_cell}}</td>
+          <td style="{_TD_MUTED_STYLE}">{{status}}</td>
+          <td style="{_TD_MUTED_STYLE} white-space:nowrap;">{{status_date}}</td>
+          <td style="{_TD_MUTED_STYLE}">{{next_hearing}}</td>
+          <td style="{_TD_RISK_STYLE}">{{risk_cell}}</td>
+          <td style="{_TD_MUTED_STYLE} font-style:italic;">{{note}}</td>
+        </tr>"""
+
+
 def _html_watchlist_section(watchlist_bills: list[dict]) -> str:
     """
     Render the Staff Watchlist table for the GitHub Pages status dashboard.
@@ -1149,36 +1442,14 @@ def _html_watchlist_section(watchlist_bills: list[dict]) -> str:
 
     today = datetime.now().date()
 
-    header_style = (
-        f"padding:8px 10px; background:{_COLOR_ACCENT}; color:#fff; "
-        f"font-size:11px; font-weight:600; text-align:left; {_FONT}"
-    )
-    cell_style = (
-        f"padding:8px 10px; font-size:12px; color:{_COLOR_TEXT}; "
-        f"border-bottom:1px solid {_COLOR_BORDER}; vertical-align:top; {_FONT}"
-    )
-    muted_cell = (
-        f"padding:8px 10px; font-size:12px; color:{_COLOR_MUTED}; "
-        f"border-bottom:1px solid {_COLOR_BORDER}; vertical-align:top; {_FONT}"
-    )
-
-    # Accent color for staff watchlist badge
-    _COLOR_WATCHLIST = "#6c5ce7"  # purple — distinct from green (new) and orange (changed)
-
-    rows = ""
+    rows = []
     for bill in sorted(watchlist_bills, key=lambda b: b.get("bill_number", "")):
         num  = bill.get("bill_number", "")
         url  = bill.get("text_url", "")
-        bill_cell = (
-            f'<a href="{url}" style="color:{_COLOR_ACCENT}; font-weight:600; '
-            f'{_FONT}">{num}</a>'
-            if url else f'<strong style="{_FONT}">{num}</strong>'
-        )
         status     = (bill.get("status") or "—")[:55]
         status_date = bill.get("status_date", "—")
         note        = (bill.get("watchlist_note") or "")[:60]
-        pills       = _score_pills(bill.get("analysis") or {})
-        risk_cell   = pills if pills else f'<span style="color:{_COLOR_BORDER};">—</span>'
+        analysis    = bill.get("analysis") or {}
 
         # Next upcoming hearing (if any)
         next_hearing = "—"
@@ -1194,15 +1465,14 @@ def _html_watchlist_section(watchlist_bills: list[dict]) -> str:
                 if h.get("committee"):
                     next_hearing += f"<br><span style='font-size:11px;color:{_COLOR_MUTED};{_FONT}'>{h['committee'][:45]}</span>"
 
-        rows += f"""
-        <tr>
-          <td style="{cell_style} white-space:nowrap;">{bill_cell}</td>
-          <td style="{muted_cell}">{status}</td>
-          <td style="{muted_cell} white-space:nowrap;">{status_date}</td>
-          <td style="{muted_cell}">{next_hearing}</td>
-          <td style="{cell_style} white-space:nowrap;">{risk_cell}</td>
-          <td style="{muted_cell}; font-style:italic;">{note}</td>
-        </tr>"""
+        rows.append(_WATCHLIST_ROW.format(
+            bill_cell=_linked_bill_cell(num, url),
+            status=status,
+            status_date=status_date,
+            next_hearing=next_hearing,
+            risk_cell=_risk_cell(analysis),
+            note=note,
+        ))
 
     return (
         _section_header(f"Staff Watchlist ({len(watchlist_bills)})")
@@ -1214,18 +1484,18 @@ def _html_watchlist_section(watchlist_bills: list[dict]) -> str:
     </p>
     <div style="overflow-x:auto;">
       <table role="presentation" width="100%" cellpadding="0" cellspacing="0"
-             style="border-collapse:collapse; border:1px solid {_COLOR_BORDER};">
+             style="{_TABLE_STYLE}">
         <thead>
           <tr>
-            <th style="{header_style}">Bill</th>
-            <th style="{header_style}">Status</th>
-            <th style="{header_style}">Last Action</th>
-            <th style="{header_style}">Next Hearing</th>
-            <th style="{header_style}">Risk Score</th>
-            <th style="{header_style}">Note</th>
+            <th style="{_TH_STYLE}">Bill</th>
+            <th style="{_TH_STYLE}">Status</th>
+            <th style="{_TH_STYLE}">Last Action</th>
+            <th style="{_TH_STYLE}">Next Hearing</th>
+            <th style="{_TH_STYLE}">Risk Score</th>
+            <th style="{_TH_STYLE}">Note</th>
           </tr>
         </thead>
-        <tbody>{rows}</tbody>
+        <tbody>{"".join(rows)}</tbody>
       </table>
     </div>
   </div>
@@ -1236,73 +1506,85 @@ def _html_watchlist_section(watchlist_bills: list[dict]) -> str:
 def _safe_date(date_str: str):
     """Parse a YYYY-MM-DD string to a date object; return date.min on failure."""
     from datetime import date as _date
-    try:
-        return datetime.strptime(date_str, "%Y-%m-%d").date()
-    except (ValueError, TypeError):
-        return _date.min
+    return parse_iso_date(date_str) or _date.min
+
 
+def _find_stalled_bills(all_bills: dict, stalled_days: int) -> list[dict]:
+    """
+    Bills with no status update in the last `stalled_days` days.
 
-def _html_stalled_section(stalled_bills: list[dict], lookback_days: int) -> str:
+    Sorted oldest-first so the most dormant bills appear at the top.
+    status_date strings repeat across the store, so parsing goes through the
+    shared memoized parser.
+    """
+    cutoff = datetime.now().date() - timedelta(days=stalled_days)
+    stalled: list[dict] = []
+    for bill in all_bills.values():
+        sd = parse_iso_date(bill.get("status_date", "") or "")
+        if sd and sd < cutoff:
+            stalled.append(bill)
+    stalled.sort(key=lambda b: b.get("status_date", ""))
+    return stalled
+
+
+_STALLED_ROW = f"""
+        <tr valign="top">
+          <td style="{_TD_STYLE} white-space:nowrap;">{{bill_cell}}</td>
+          <td style="{_TD_RISK_STYLE}">{{risk_cell}}</td>
+          <td style="{_TD_STYLE}">{{title}}</td>
+          <td style="{_TD_MUTED_STYLE}">{{author}}</td>
+          <td style="{_TD_MUTED_STYLE} white-space:nowrap;">{{introduced}}</td>
+          <td style="{_TD_MUTED_STYLE}">{{status}}</td>
+          <td style="{_TD_MUTED_STYLE} white-space:nowrap; text-align:right;">{{days_ago}}</td>
+        </tr>"""
+
+
+def _html_stalled_section(
+    stalled_bills: list[dict],
+    lookback_days: int,
+    limit: Optional[int] = None,
+    pages_url: str = "",
+) -> str:
     """
     Render the 'Watching — No Recent Activity' table.
 
     Shows bills that are being tracked but have had no status update in the
     last `lookback_days` days. Intended for the status web page, not the email.
+    With `limit`, only the first `limit` (most dormant) bills are listed and a
+    closing row links to the dashboard.
     """
     if not stalled_bills:
         return ""
 
     today = datetime.now().date()
 
-    header_style = (
-        f"padding:8px 10px; background:{_COLOR_ACCENT}; color:#fff; "
-        f"font-size:11px; font-weight:600; text-align:left; {_FONT}"
-    )
-    cell_style = (
-        f"padding:8px 10px; font-size:12px; color:{_COLOR_TEXT}; "
-        f"border-bottom:1px solid {_COLOR_BORDER}; vertical-align:top; {_FONT}"
-    )
-    muted_cell = (
-        f"padding:8px 10px; font-size:12px; color:{_COLOR_MUTED}; "
-        f"border-bottom:1px solid {_COLOR_BORDER}; vertical-align:top; {_FONT}"
-    )
-
-    rows = ""
-    for bill in stalled_bills:
+    rows = []
+    for bill in stalled_bills[:limit]:
         num = bill.get("bill_number", "")
         url = bill.get("text_url", "")
-        bill_cell = (
-            f'<a href="{url}" style="color:{_COLOR_ACCENT}; font-weight:600; '
-            f'{_FONT}">{num}</a>'
-            if url else f'<strong style="{_FONT}">{num}</strong>'
-        )
         author = (bill.get("author") or "")[:28]
         status = (bill.get("status") or "—")[:55]
         title = (bill.get("title") or "")[:60]
         introduced = bill.get("introduced_date", "")
         sd = bill.get("status_date", "")
-        pills = _score_pills(bill.get("analysis") or {})
-        risk_cell = pills if pills else f'<span style="color:{_COLOR_BORDER};">—</span>'
+        analysis = bill.get("analysis") or {}
 
         days_ago = sd  # fallback: show raw date
-        if sd:
-            try:
-                bill_date = datetime.strptime(sd, "%Y-%m-%d").date()
-                days = (today - bill_date).days
-                days_ago = f"{days}d ago"
-            except ValueError:
-                pass
-
-        rows += f"""
-        <tr>
-          <td style="{cell_style} white-space:nowrap;">{bill_cell}</td>
-          <td style="{cell_style} white-space:nowrap;">{risk_cell}</td>
-          <td style="{cell_style}">{title}</td>
-          <td style="{muted_cell}">{author}</td>
-          <td style="{muted_cell} white-space:nowrap;">{introduced}</td>
-          <td style="{muted_cell}">{status}</td>
-          <td style="{muted_cell} white-space:nowrap; text-align:right;">{days_ago}</td>
-        </tr>"""
+        bill_date = parse_iso_date(sd) if sd else None
+        if bill_date:
+            days_ago = f"{(today - bill_date).days}d ago"
+
+        rows.append(_STALLED_ROW.format(
+            bill_cell=_linked_bill_cell(num, url),
+            risk_cell=_risk_cell(analysis),
+            title=title,
+            author=author,
+            introduced=introduced,
+            status=status,
+            days_ago=days_ago,
+        ))
+    if limit is not None and limit < len(stalled_bills):
+        rows.append(_html_more_row(limit, len(stalled_bills), 7, pages_url))
 
     return (
         _section_header(f"Watching — No Recent Activity ({len(stalled_bills)})")
@@ -1314,19 +1596,19 @@ def _html_stalled_section(stalled_bills: list[dict], lookback_days: int) -> str:
     </p>
     <div style="overflow-x:auto;">
       <table role="presentation" width="100%" cellpadding="0" cellspacing="0"
-             style="border-collapse:collapse; border:1px solid {_COLOR_BORDER};">
+             style="{_TABLE_STYLE}">
         <thead>
           <tr>
-            <th style="{header_style}">Bill</th>
-            <th style="{header_style}">Risk</th>
-            <th style="{header_style}">Title</th>
-            <th style="{header_style}">Author</th>
-            <th style="{header_style}">Introduced</th>
-            <th style="{header_style}">Last Status</th>
-            <th style="{header_style}; text-align:right;">Last Activity</th>
+            <th style="{_TH_STYLE}">Bill</th>
+            <th style="{_TH_STYLE}">Risk</th>
+            <th style="{_TH_STYLE}">Title</th>
+            <th style="{_TH_STYLE}">Author</th>
+            <th style="{_TH_STYLE}">Introduced</th>
+            <th style="{_TH_STYLE}">Last Status</th>
+            <th style="{_TH_STYLE}; text-align:right;">Last Activity</th>
           </tr>
         </thead>
-        <tbody>{rows}</tbody>
+        <tbody>{"".join(rows)}</tbody>
       </table>
     </div>
   </div>
@@ -16,6 +16,7 @@ Reads:
 
 Writes:
     data/legislative/action_digest.json
+    data/legislative/action_digest_<slug>.json   — per client (--clients mode)
 
 Claude call (1):
     - Gut-and-amend detection (CA tactic: complete bill content replacement)
@@ -34,6 +35,12 @@ Usage:
     python agents/legislative/legislative_intel.py --lookahead 7
     python agents/legislative/legislative_intel.py --no-claude    # pure logic only
     python agents/legislative/legislative_intel.py --lookback 7
+    python agents/legislative/legislative_intel.py --incremental  # hourly runs
+    python agents/legislative/legislative_intel.py --clients all  # every client, buckets once
+
+Incremental mode (--incremental) keeps data/legislative/digest_state.json:
+per-bill bucket contributions keyed by a content hash, plus the date each
+bill's time window next moves. Only changed or due bills are re-evaluated.
 
 Requires:
     ANTHROPIC_API_KEY  (only needed for Claude call; --no-claude skips it)
@@ -42,14 +49,16 @@ Requires:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import logging
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 
 # ---------------------------------------------------------------------------
 # Path bootstrap — add project root before any intra-package imports
@@ -64,6 +73,25 @@ try:
 except ImportError:
     pass
 
+from agents.shared.action_classifier import (
+    AMEND_KEYWORDS as _AMEND_KEYWORDS,
+    HEARING_RE as _HEARING_RE,
+    ROUTING_PATTERNS as _ROUTING_PATTERNS,
+    classify_action,
+    classify_stage,
+    is_amendment_action,
+    is_routing_action,
+    parse_ca_date,
+    parse_iso_date,
+)
+from agents.shared.client_utils import _list_clients
+from agents.shared.token_ledger import (
+    TokenBudgetExceeded,
+    configure_ledger,
+    print_ledger_summary,
+    tracked_create,
+)
+
 # ---------------------------------------------------------------------------
 # Logging
 # ---------------------------------------------------------------------------
@@ -77,7 +105,9 @@ PROJECT_ROOT = _PROJECT_ROOT
 BILLS_FILE   = PROJECT_ROOT / "data" / "bills" / "tracked_bills.json"
 DIGEST_DIR   = PROJECT_ROOT / "data" / "legislative"
 DIGEST_FILE  = DIGEST_DIR / "action_digest.json"
+STATE_FILE   = DIGEST_DIR / "digest_state.json"   # --incremental per-bill cache
 CLIENTS_DIR  = PROJECT_ROOT / "clients"
+ARCHIVE_JSON = PROJECT_ROOT / "docs" / "newsletters" / "archive.json"  # newsletter_writer index
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -87,6 +117,7 @@ HEARING_LOOKAHEAD   = 14    # days: flag hearings this far out
 AMENDMENT_LOOKBACK  = 14    # days: flag amendments this recent
 STALL_THRESHOLD     = 30    # days: flag high-risk bills with no movement
 MIN_RISK_FOR_STALL  = 2     # minimum criteria (strong/moderate) to be "stalled"
+MAX_CLIENT_WORKERS  = 4     # --clients: concurrent per-client Claude calls
 
 # Risk analysis criterion keys — matches housing_analyzer + bill_utils
 _CRIT_KEYS = {
@@ -96,11 +127,10 @@ _CRIT_KEYS = {
     "D": "cost_to_cities",
 }
 
-# Regex: parse "May be heard in committee March 7" from action text
-_HEARING_RE = re.compile(
-    r"may be heard in committee\s+([A-Za-z]+ \d{1,2})",
-    re.IGNORECASE,
-)
+# _HEARING_RE, _AMEND_KEYWORDS, and _ROUTING_PATTERNS live in
+# agents/shared/action_classifier.py (imported above) so every consumer
+# shares one set of compiled patterns and one classification cache.
+
 # Regex: parse "May be acted upon on or after March 16" from action text
 _ACTION_DATE_RE = re.compile(
     r"may be acted upon on or after\s+([A-Za-z]+ \d{1,2})",
@@ -121,9 +151,6 @@ _ADVANCE_KEYWORDS = [
     "chaptered",
 ]
 
-# Action description keywords indicating amendments
-_AMEND_KEYWORDS = ["amended", "amend,", "amendment"]
-
 # Stage ordering for sorting and filtering (higher = further along)
 _STAGE_ORDER = {
     "introduced":         0,
@@ -137,15 +164,6 @@ _STAGE_ORDER = {
     "other":             -1,
 }
 
-# Cross-chamber / routing-step statuses — don't flag as "stalled"
-_ROUTING_PATTERNS = [
-    "in senate",
-    "in assembly",
-    "to com. on rls. for assignment",
-    "read first time. to com",
-    "to com. on rls",
-]
-
 
 # ---------------------------------------------------------------------------
 # Helper: parse CA legislative date string
@@ -158,25 +176,10 @@ def _parse_ca_date(date_str: str) -> Optional[date]:
     Assumes current year. If the result is more than 30 days in the past
     (e.g., a December date encountered in January), tries next year.
 
-    Returns None on parse failure.
+    Returns None on parse failure. Memoized per (date_str, today) in
+    agents.shared.action_classifier.
     """
-    if not date_str:
-        return None
-    date_str = date_str.strip().rstrip(".")
-    today = date.today()
-
-    # Include the year in the parse string to avoid Python 3.15 ambiguity warning
-    for fmt in ("%Y %B %d", "%Y %b %d"):
-        try:
-            candidate = datetime.strptime(f"{today.year} {date_str}", fmt).date()
-            # If the date is more than 30 days in the past, try next year
-            if candidate < today - timedelta(days=30):
-                candidate = datetime.strptime(f"{today.year + 1} {date_str}", fmt).date()
-            return candidate
-        except ValueError:
-            continue
-
-    return None
+    return parse_ca_date(date_str)
 
 
 # ---------------------------------------------------------------------------
@@ -194,35 +197,13 @@ def _risk_count(bill: dict) -> int:
 # ---------------------------------------------------------------------------
 
 def _classify_stage(description: str) -> str:
-    """Return a stage label for an action description."""
-    dl = description.lower()
-    if "signed by governor" in dl or "chaptered" in dl:
-        return "enacted"
-    if "ordered to the senate" in dl or ("in senate" in dl and "read first time" in dl):
-        return "cross_chamber"
-    if "ordered to the assembly" in dl or ("in assembly" in dl and "read first time" in dl):
-        return "cross_chamber"
-    if "read third time" in dl and "passed" in dl:
-        return "floor_passage"
-    if "read third time" in dl:
-        return "floor_reading"
-    if "ordered to third reading" in dl:
-        return "floor_reading"
-    if "read second time" in dl:
-        return "floor_progression"
-    if "do pass" in dl or "pass as amended" in dl:
-        return "committee_passage"
-    if "referred to com" in dl or "referred to coms" in dl:
-        return "committee_referral"
-    if "introduced" in dl or "read first time" in dl:
-        return "introduced"
-    return "other"
+    """Return a stage label for an action description (memoized)."""
+    return classify_stage(description)
 
 
 def _is_routing_action(description: str) -> bool:
     """Return True if this action is a standard routing step (not a real stall)."""
-    dl = description.lower()
-    return any(p in dl for p in _ROUTING_PATTERNS)
+    return is_routing_action(description)
 
 
 # ---------------------------------------------------------------------------
@@ -370,7 +351,7 @@ def _find_amended(bills: dict, lookback: int = AMENDMENT_LOOKBACK) -> list[dict]
     for bn, bill in bills.items():
         for action in bill.get("actions", []):
             desc = action.get("description", "")
-            if not any(kw in desc.lower() for kw in _AMEND_KEYWORDS):
+            if not is_amendment_action(desc):
                 continue
             try:
                 action_date = date.fromisoformat(action.get("date", ""))
@@ -450,13 +431,367 @@ def _find_stalled(bills: dict, threshold: int = STALL_THRESHOLD) -> list[dict]:
     return stalled
 
 
+# ---------------------------------------------------------------------------
+# Single-pass bucket engine
+# ---------------------------------------------------------------------------
+
+_BUCKETS = ("urgent", "moving", "amended", "stalled")
+
+
+class _Window(NamedTuple):
+    """Date boundaries for one digest run — computed once, shared by every bill."""
+    today:          date
+    tomorrow:       date
+    deadline:       date       # last day a hearing counts as urgent
+    cutoff:         date       # first day an action counts as recent
+    stall_cutoff:   date
+    lookback:       timedelta  # lookback + 1 day: when a recent action ages out
+    lookahead:      timedelta
+    stall:          timedelta  # stall_threshold + 1 day
+
+
+def _make_window(
+    today:             date,
+    lookback:          int = AMENDMENT_LOOKBACK,
+    hearing_lookahead: int = HEARING_LOOKAHEAD,
+    stall_threshold:   int = STALL_THRESHOLD,
+) -> _Window:
+    return _Window(
+        today        = today,
+        tomorrow     = today + timedelta(days=1),
+        deadline     = today + timedelta(days=hearing_lookahead),
+        cutoff       = today - timedelta(days=lookback),
+        stall_cutoff = today - timedelta(days=stall_threshold),
+        lookback     = timedelta(days=lookback + 1),
+        lookahead    = timedelta(days=hearing_lookahead),
+        stall        = timedelta(days=stall_threshold + 1),
+    )
+
+
+def _bill_buckets(
+    bn:   str,
+    bill: dict,
+    w:    _Window,
+) -> tuple[dict[str, Optional[dict]], Optional[date]]:
+    """
+    Compute one bill's contribution to every bucket in a single walk of its actions.
+
+    Returns ({"urgent": entry|None, "moving": ..., "amended": ..., "stalled": ...},
+    recheck_on) where recheck_on is the first future date on which the passage
+    of time alone could change this bill's contribution (an entry's day count
+    ticks, an action ages out of the lookback window, a hearing enters the
+    lookahead window, or the bill crosses the stall threshold). None means the
+    contribution only changes if the bill itself changes.
+    """
+    today, deadline, cutoff = w.today, w.deadline, w.cutoff
+    min_advance = _STAGE_ORDER["committee_passage"]
+
+    risk    = _risk_count(bill)
+    actions = bill.get("actions", [])
+    recheck: list[date] = []
+    oldest_recent: Optional[date] = None   # earliest in-window action that counted
+
+    # Urgent — structured calendar wins; fall back to action text below
+    earliest: Optional[date] = None
+    source = "parsed"
+    for h in bill.get("upcoming_hearings", []):
+        try:
+            d = date.fromisoformat(h["date"])
+            if today <= d <= deadline:
+                earliest = d
+                source   = "calendar"
+                break
+            if d > deadline:
+                recheck.append(d - w.lookahead)
+        except (KeyError, ValueError):
+            pass
+
+    advance_actions: list[dict] = []
+    amend_hit: Optional[tuple[date, str]] = None
+
+    for action in actions:
+        desc   = action.get("description", "")
+        traits = classify_action(desc)
+
+        if earliest is None and traits.hearing_text:
+            parsed = parse_ca_date(traits.hearing_text, today)
+            if parsed and today <= parsed <= deadline:
+                earliest = parsed
+            elif parsed and parsed > deadline:
+                recheck.append(parsed - w.lookahead)
+            elif parsed:
+                # Past dates roll to next year once 30 days stale
+                recheck.append(parsed + timedelta(days=31))
+
+        action_date = parse_iso_date(action.get("date", ""))
+        if action_date is None or action_date < cutoff:
+            continue
+
+        stage = traits.stage
+        if _STAGE_ORDER.get(stage, -1) >= min_advance:
+            advance_actions.append({
+                "date":        str(action_date),
+                "description": desc,
+                "stage":       stage,
+                "chamber":     action.get("chamber", ""),
+            })
+            if oldest_recent is None or action_date < oldest_recent:
+                oldest_recent = action_date
+
+        if traits.is_amendment:
+            if amend_hit is None:
+                amend_hit = (action_date, desc)
+            if oldest_recent is None or action_date < oldest_recent:
+                oldest_recent = action_date
+
+    if oldest_recent is not None:
+        recheck.append(oldest_recent + w.lookback)
+
+    out: dict[str, Optional[dict]] = dict.fromkeys(_BUCKETS)
+
+    if earliest:
+        recheck.append(w.tomorrow)   # days_until counts down daily
+        out["urgent"] = {
+            "bill_number":   bn,
+            "title":         bill.get("title", ""),
+            "author":        bill.get("author", ""),
+            "status":        bill.get("status", ""),
+            "eligible_date": str(earliest),
+            "days_until":    (earliest - today).days,
+            "date_source":   source,
+            "committees":    bill.get("committees", []),
+            "text_url":      bill.get("text_url", ""),
+            "analysis":      bill.get("analysis", {}),
+            "watchlist":     bill.get("watchlist", False),
+            "watchlist_note": bill.get("watchlist_note", ""),
+            "risk_count":    risk,
+        }
+
+    if advance_actions:
+        advance_actions.sort(key=lambda x: x["date"], reverse=True)
+        out["moving"] = {
+            "bill_number":     bn,
+            "title":           bill.get("title", ""),
+            "author":          bill.get("author", ""),
+            "status":          bill.get("status", ""),
+            "current_stage":   advance_actions[0]["stage"],
+            "advance_actions": advance_actions,
+            "text_url":        bill.get("text_url", ""),
+            "analysis":        bill.get("analysis", {}),
+            "watchlist":       bill.get("watchlist", False),
+            "watchlist_note":  bill.get("watchlist_note", ""),
+            "risk_count":      risk,
+        }
+
+    if amend_hit:
+        out["amended"] = {
+            "bill_number":           bn,
+            "title":                 bill.get("title", ""),
+            "author":                bill.get("author", ""),
+            "amendment_date":        str(amend_hit[0]),
+            "amendment_description": amend_hit[1][:250],
+            "text_url":              bill.get("text_url", ""),
+            "analysis":              bill.get("analysis", {}),
+            "watchlist":             bill.get("watchlist", False),
+            "risk_count":            risk,
+        }
+
+    # Stalled — only high-risk bills untouched since the stall cutoff
+    if risk >= MIN_RISK_FOR_STALL:
+        sd_str = bill.get("status_date", "")
+        sd     = parse_iso_date(sd_str)
+        if sd is not None and not (actions and is_routing_action(actions[-1].get("description", ""))):
+            if sd < w.stall_cutoff:
+                recheck.append(w.tomorrow)   # days_stalled counts up daily
+                out["stalled"] = {
+                    "bill_number":  bn,
+                    "title":        bill.get("title", ""),
+                    "author":       bill.get("author", ""),
+                    "status":       bill.get("status", ""),
+                    "status_date":  sd_str,
+                    "days_stalled": (today - sd).days,
+                    "analysis":     bill.get("analysis", {}),
+                    "risk_count":   risk,
+                }
+            else:
+                recheck.append(sd + w.stall)
+
+    future = [d for d in recheck if d > today]
+    return out, (min(future) if future else None)
+
+
+def _assemble_buckets(contributions: list[dict[str, Optional[dict]]]) -> dict[str, list[dict]]:
+    """Collect per-bill contributions (in bill order) and apply each bucket's sort."""
+    buckets: dict[str, list[dict]] = {
+        name: [c[name] for c in contributions if c.get(name)] for name in _BUCKETS
+    }
+    buckets["urgent"].sort(key=lambda x: (x["eligible_date"], -x["risk_count"]))
+    buckets["moving"].sort(
+        key=lambda x: (-x["risk_count"], -_STAGE_ORDER.get(x["current_stage"], 0))
+    )
+    buckets["amended"].sort(key=lambda x: (-x["risk_count"], x["amendment_date"]))
+    buckets["amended"].sort(key=lambda x: (-x["risk_count"],))
+    buckets["stalled"].sort(key=lambda x: -x["days_stalled"])
+    return buckets
+
+
+def _build_buckets(
+    bills:             dict,
+    lookback:          int = AMENDMENT_LOOKBACK,
+    hearing_lookahead: int = HEARING_LOOKAHEAD,
+    stall_threshold:   int = STALL_THRESHOLD,
+) -> dict[str, list[dict]]:
+    """
+    Compute the urgent, moving, amended, and stalled buckets in one pass.
+
+    Produces exactly what _find_urgent / _find_moving / _find_amended /
+    _find_stalled return, but walks each bill's actions once: every
+    description is classified once (stage, amendment, routing, and hearing
+    text together, memoized across bills by the shared action classifier),
+    every action date is parsed once per distinct string, and risk_count is
+    computed once per bill.
+
+    Returns {"urgent": [...], "moving": [...], "amended": [...], "stalled": [...]}.
+    """
+    w = _make_window(date.today(), lookback, hearing_lookahead, stall_threshold)
+    return _assemble_buckets([_bill_buckets(bn, bill, w)[0] for bn, bill in bills.items()])
+
+
+# ---------------------------------------------------------------------------
+# Incremental digest state
+# ---------------------------------------------------------------------------
+
+# Every bill field that can reach a bucket entry — hashing only these keeps
+# bill_tracker's bookkeeping fields (last_updated, source) from forcing rework.
+_DIGEST_FIELDS = (
+    "title", "author", "status", "status_date", "committees", "text_url",
+    "actions", "upcoming_hearings", "analysis", "watchlist", "watchlist_note",
+)
+
+
+def _bill_hash(bill: dict) -> str:
+    """Content hash of the bill fields the digest reads."""
+    payload = json.dumps(
+        {k: bill.get(k) for k in _DIGEST_FIELDS},
+        sort_keys=True, ensure_ascii=False, default=str,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _build_buckets_incremental(
+    bills:             dict,
+    state:             dict,
+    lookback:          int = AMENDMENT_LOOKBACK,
+    hearing_lookahead: int = HEARING_LOOKAHEAD,
+    stall_threshold:   int = STALL_THRESHOLD,
+) -> tuple[dict[str, list[dict]], dict, dict]:
+    """
+    Rebuild buckets, re-evaluating only bills that changed or whose time window moved.
+
+    A bill is recomputed when its content hash differs from the stored one,
+    when today has reached its stored recheck_on date, or when the window
+    parameters differ from the previous run. Everything else reuses its
+    stored contribution. The result is identical to _build_buckets().
+
+    Returns (buckets, new_state, stats) where stats counts
+    {"total", "changed", "time_window", "reused", "removed"}.
+    """
+    today  = date.today()
+    w      = _make_window(today, lookback, hearing_lookahead, stall_threshold)
+    params = {
+        "lookback":          lookback,
+        "hearing_lookahead": hearing_lookahead,
+        "stall_threshold":   stall_threshold,
+    }
+    prev_bills = state.get("bills", {}) if state.get("params") == params else {}
+
+    new_entries: dict[str, dict] = {}
+    contributions: list[dict[str, Optional[dict]]] = []
+    stats = {"total": len(bills), "changed": 0, "time_window": 0, "reused": 0, "removed": 0}
+
+    for bn, bill in bills.items():
+        h    = _bill_hash(bill)
+        prev = prev_bills.get(bn)
+        if prev and prev.get("hash") == h:
+            recheck_on = prev.get("recheck_on")
+            if recheck_on is None or today.isoformat() < recheck_on:
+                stats["reused"] += 1
+                new_entries[bn] = prev
+                contributions.append(prev["buckets"])
+                continue
+            stats["time_window"] += 1
+        else:
+            stats["changed"] += 1
+
+        contrib, recheck_on = _bill_buckets(bn, bill, w)
+        new_entries[bn] = {
+            "hash":       h,
+            "recheck_on": recheck_on.isoformat() if recheck_on else None,
+            "buckets":    contrib,
+        }
+        contributions.append(contrib)
+
+    stats["removed"] = len(set(prev_bills) - set(bills))
+    new_state = {
+        "version":     1,
+        "computed_on": today.isoformat(),
+        "params":      params,
+        "bills":       new_entries,
+    }
+    return _assemble_buckets(contributions), new_state, stats
+
+
 # ---------------------------------------------------------------------------
 # Last issue extraction
 # ---------------------------------------------------------------------------
 
 def _extract_last_issue(client_id: str = DEFAULT_CLIENT) -> dict:
     """
-    Parse the most recent newsletter HTML for the given client.
+    Return subject, preview text, and story beats from the client's last issue.
+
+    newsletter_writer records these in docs/newsletters/archive.json when it
+    archives an issue, so the newest archive entry is used directly when it
+    carries story_beats and is at least as new as the newest newsletter HTML.
+    Otherwise (legacy issues, or docs/ absent) falls back to parsing the HTML.
+
+    Returns an empty dict if no newsletter is found or parsing fails.
+    """
+    newsletter_dir = PROJECT_ROOT / "outputs" / "clients" / client_id / "newsletter"
+    newest_html = max(
+        (p.name for p in newsletter_dir.glob("newsletter_*.html")),
+        default="",
+    ) if newsletter_dir.exists() else ""
+
+    entry = _last_archive_entry(client_id)
+    if entry and "story_beats" in entry and entry.get("filename", "") >= newest_html:
+        log.debug(f"Last issue read from archive index: {entry.get('filename')}")
+        return {
+            "subject":      entry.get("subject", ""),
+            "preview_text": entry.get("preview_text", ""),
+            "story_beats":  entry.get("story_beats", []),
+            "source_file":  entry.get("filename", ""),
+        }
+
+    return _parse_last_issue_html(client_id)
+
+
+def _last_archive_entry(client_id: str) -> dict:
+    """Newest archive.json entry for client_id, or {} if none/unreadable."""
+    if not ARCHIVE_JSON.exists():
+        return {}
+    try:
+        entries = json.loads(ARCHIVE_JSON.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    client_entries = [e for e in entries if e.get("client_id") == client_id]
+    if not client_entries:
+        return {}
+    return max(client_entries, key=lambda e: (e.get("date", ""), e.get("week", "")))
+
+
+def _parse_last_issue_html(client_id: str = DEFAULT_CLIENT) -> dict:
+    """
+    Parse the most recent newsletter HTML for the given client (legacy path).
 
     Extracts:
       - subject: from the <title> tag
@@ -551,15 +886,16 @@ def _call_claude(
     amended:    list[dict],
     urgent:     list[dict],
     last_issue: dict,
-) -> dict:
+) -> Optional[dict]:
     """
     Single Claude call producing:
       - gut_and_amend: list of bills with CA gut-and-amend signals
       - spot_bills:    list of placeholder/boilerplate bills
       - week_summary:  1–2 sentence factual anchor for the newsletter
 
-    Falls back to empty results with a warning if ANTHROPIC_API_KEY is unset
-    or the call fails. The digest is still written — pure-logic buckets remain.
+    Returns None with a warning if ANTHROPIC_API_KEY is unset or the call
+    fails; the caller writes the digest with empty Claude fields (pure-logic
+    buckets remain) and doesn't mark that result as reusable.
     """
     api_key = os.environ.get("ANTHROPIC_API_KEY", "").strip()
     if not api_key:
@@ -567,7 +903,7 @@ def _call_claude(
             "ANTHROPIC_API_KEY not set — skipping Claude call. "
             "Digest will have empty gut_and_amend, spot_bills, and week_summary."
         )
-        return {"gut_and_amend": [], "spot_bills": [], "week_summary": ""}
+        return None
 
     import anthropic
     client = anthropic.Anthropic(api_key=api_key)
@@ -699,7 +1035,9 @@ Return ONLY valid JSON. No markdown, no preamble.\
 
     log.info("→ Calling Claude for legislative intelligence (gut-and-amend + week_summary)...")
     try:
-        message = client.messages.create(
+        message = tracked_create(
+            client,
+            "legislative_intel",
             model="claude-sonnet-4-6",
             max_tokens=1500,
             system=system_prompt,
@@ -721,43 +1059,44 @@ Return ONLY valid JSON. No markdown, no preamble.\
 
     except json.JSONDecodeError as exc:
         log.warning(f"Claude returned invalid JSON: {exc} — returning empty intelligence")
-        return {"gut_and_amend": [], "spot_bills": [], "week_summary": ""}
+        return None
+    except TokenBudgetExceeded:
+        raise
     except Exception as exc:
         log.warning(f"Claude call failed: {exc} — returning empty intelligence")
-        return {"gut_and_amend": [], "spot_bills": [], "week_summary": ""}
+        return None
 
 
-# ---------------------------------------------------------------------------
-# Main orchestrator
-# ---------------------------------------------------------------------------
+def _digest_path(client_id: str) -> Path:
+    """Per-client digest path used by --clients mode."""
+    return DIGEST_DIR / f"action_digest_{client_id}.json"
 
-def run(
-    client_id:        str  = DEFAULT_CLIENT,
-    lookback:         int  = AMENDMENT_LOOKBACK,
-    hearing_lookahead: int = HEARING_LOOKAHEAD,
-    no_claude:        bool = False,
-) -> Path:
-    """
-    Build and write the action digest. Returns the path to the written file.
 
-    Args:
-        client_id:        Client slug — determines which newsletter to read
-                          for last_issue anti-repetition (default: "csf")
-        lookback:         Days to look back for moving and amended buckets
-        hearing_lookahead: Days to look ahead for urgent hearings
-        no_claude:        If True, skip Claude call — pure-logic buckets only
+def _reusable_claude_result(claude_key: Optional[str], digest_file: Path = DIGEST_FILE) -> Optional[dict]:
+    """
+    Return the Claude fields previously written to digest_file if they were
+    produced from identical inputs (same claude_key recorded for that file in
+    STATE_FILE), else None.
     """
-    today = date.today()
+    if not claude_key or not STATE_FILE.exists() or not digest_file.exists():
+        return None
+    try:
+        prev_state  = json.loads(STATE_FILE.read_text(encoding="utf-8"))
+        prev_digest = json.loads(digest_file.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if prev_state.get("claude_keys", {}).get(digest_file.name) != claude_key:
+        return None
+    return {k: prev_digest.get(k, default) for k, default in (
+        ("gut_and_amend", []), ("spot_bills", []), ("week_summary", ""),
+    )}
 
-    log.info("=" * 58)
-    log.info("CSF Legislative Intelligence — digest start")
-    log.info(f"  Date:             {today.isoformat()}")
-    log.info(f"  Client:           {client_id}")
-    log.info(f"  Lookback:         {lookback} days")
-    log.info(f"  Hearing lookahead: {hearing_lookahead} days")
-    log.info(f"  Claude call:      {'disabled (--no-claude)' if no_claude else 'enabled'}")
 
-    # --- Load bill data ---
+# ---------------------------------------------------------------------------
+# Main orchestrator
+# ---------------------------------------------------------------------------
+
+def _load_bills() -> dict:
     if not BILLS_FILE.exists():
         log.error(f"Bill data not found: {BILLS_FILE}")
         sys.exit(1)
@@ -766,81 +1105,254 @@ def run(
     bills_data = json.loads(BILLS_FILE.read_text(encoding="utf-8"))
     bills      = bills_data.get("bills", {})
     log.info(f"   {len(bills)} bills loaded")
+    return bills
 
-    # --- Pure-logic buckets ---
-    log.info("→ Building intelligence buckets...")
 
-    urgent  = _find_urgent(bills, lookahead=hearing_lookahead)
-    moving  = _find_moving(bills, lookback=lookback)
-    amended = _find_amended(bills, lookback=lookback)
-    stalled = _find_stalled(bills)
+def _compute_buckets(
+    bills:             dict,
+    lookback:          int,
+    hearing_lookahead: int,
+    incremental:       bool,
+) -> tuple[dict[str, list[dict]], dict]:
+    """Pure-logic buckets (client-independent). Returns (buckets, state)."""
+    log.info("→ Building intelligence buckets...")
 
-    log.info(f"   Urgent (hearings ≤ {hearing_lookahead} days):   {len(urgent)}")
-    log.info(f"   Moving (stage advancement):    {len(moving)}")
-    log.info(f"   Amended:                       {len(amended)}")
-    log.info(f"   Stalled (≥ {STALL_THRESHOLD} days, 2+ criteria): {len(stalled)}")
+    state: dict = {}
+    if incremental:
+        prev_state = {}
+        if STATE_FILE.exists():
+            try:
+                prev_state = json.loads(STATE_FILE.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError) as exc:
+                log.warning(f"   Could not read {STATE_FILE.name}: {exc} — full rebuild")
+        buckets, state, stats = _build_buckets_incremental(
+            bills, prev_state, lookback=lookback, hearing_lookahead=hearing_lookahead,
+        )
+        state["claude_keys"] = prev_state.get("claude_keys", {})
+        log.info(
+            f"   Incremental: {stats['changed']} changed, {stats['time_window']} time-window, "
+            f"{stats['reused']} reused, {stats['removed']} removed"
+        )
+    else:
+        buckets = _build_buckets(bills, lookback=lookback, hearing_lookahead=hearing_lookahead)
+
+    log.info(f"   Urgent (hearings ≤ {hearing_lookahead} days):   {len(buckets['urgent'])}")
+    log.info(f"   Moving (stage advancement):    {len(buckets['moving'])}")
+    log.info(f"   Amended:                       {len(buckets['amended'])}")
+    log.info(f"   Stalled (≥ {STALL_THRESHOLD} days, 2+ criteria): {len(buckets['stalled'])}")
+    return buckets, state
+
+
+def _client_digest(
+    client_id:   str,
+    bills:       dict,
+    buckets:     dict[str, list[dict]],
+    state:       dict,
+    digest_file: Path,
+    no_claude:   bool,
+    incremental: bool,
+) -> tuple[dict, Optional[str]]:
+    """
+    The client-dependent half of a run: last-issue extraction plus the Claude
+    call. Returns (digest, claude_key); claude_key is None unless the digest
+    holds real Claude results (reused or fresh), so a fallback to empty
+    intelligence is never reused by a later run. Safe to run concurrently per
+    client — reads shared inputs only; the caller writes files.
+    """
+    urgent, moving, amended = buckets["urgent"], buckets["moving"], buckets["amended"]
 
-    # --- Extract last issue for anti-repetition ---
-    log.info("→ Extracting last issue for anti-repetition...")
     last_issue = _extract_last_issue(client_id)
     if last_issue:
         n_beats = len(last_issue.get("story_beats", []))
-        log.info(f"   Found: {last_issue['source_file']} ({n_beats} story beats)")
+        log.info(f"   [{client_id}] Last issue: {last_issue['source_file']} ({n_beats} story beats)")
     else:
-        log.info("   No previous newsletter found — skipping anti-repetition")
+        log.info(f"   [{client_id}] No previous newsletter found — skipping anti-repetition")
 
-    # --- Claude call (optional) ---
     claude_result = {"gut_and_amend": [], "spot_bills": [], "week_summary": ""}
+    claude_key    = None
+    if incremental:
+        claude_key = hashlib.blake2b(
+            json.dumps(
+                [sorted(e["hash"] for e in state["bills"].values()),
+                 moving, amended, urgent, last_issue],
+                sort_keys=True, default=str,
+            ).encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
     if not no_claude:
-        claude_result = _call_claude(bills, moving, amended, urgent, last_issue)
+        prev_claude = _reusable_claude_result(claude_key, digest_file) if incremental else None
+        if prev_claude is not None:
+            log.info(f"→ [{client_id}] Claude inputs unchanged since last digest — reusing its results")
+            claude_result = prev_claude
+        else:
+            fresh = _call_claude(bills, moving, amended, urgent, last_issue)
+            if fresh is None:
+                claude_key = None      # fell back to empty — retry next run
+            else:
+                claude_result = fresh
 
-    # --- Build digest ---
-    week_str = today.strftime("%G-W%V")
     digest = {
         "generated":      datetime.now().isoformat(),
-        "week":           week_str,
+        "week":           date.today().strftime("%G-W%V"),
+        "client":         client_id,
         "bills_analyzed": len(bills),
         "urgent":         urgent,
         "moving":         moving,
         "amended":        amended,
-        "stalled":        stalled,
+        "stalled":        buckets["stalled"],
         "gut_and_amend":  claude_result.get("gut_and_amend", []),
         "spot_bills":     claude_result.get("spot_bills", []),
         "last_issue":     last_issue,
         "week_summary":   claude_result.get("week_summary", ""),
     }
+    return digest, (claude_key if not no_claude else None)
+
 
-    # --- Write digest ---
+def _write_digest(digest: dict, digest_file: Path) -> None:
     DIGEST_DIR.mkdir(parents=True, exist_ok=True)
-    DIGEST_FILE.write_text(
+    digest_file.write_text(
         json.dumps(digest, indent=2, ensure_ascii=False),
         encoding="utf-8",
     )
-    log.info(f"→ Digest written → {DIGEST_FILE.relative_to(PROJECT_ROOT)}")
+    log.info(f"→ Digest written → {digest_file.relative_to(PROJECT_ROOT)}")
+
+
+def _write_state(state: dict) -> None:
+    STATE_FILE.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+    log.info(f"→ Incremental state written → {STATE_FILE.relative_to(PROJECT_ROOT)}")
+
+
+def _log_run_header(clients: list[str], lookback: int, hearing_lookahead: int,
+                    no_claude: bool, incremental: bool) -> None:
+    log.info("=" * 58)
+    log.info("CSF Legislative Intelligence — digest start")
+    log.info(f"  Date:             {date.today().isoformat()}")
+    if len(clients) == 1:
+        log.info(f"  Client:           {clients[0]}")
+    else:
+        log.info(f"  Clients:          {', '.join(clients)}")
+    log.info(f"  Lookback:         {lookback} days")
+    log.info(f"  Hearing lookahead: {hearing_lookahead} days")
+    log.info(f"  Claude call:      {'disabled (--no-claude)' if no_claude else 'enabled'}")
+    log.info(f"  Mode:             {'incremental' if incremental else 'full'}")
+
+
+def run(
+    client_id:        str  = DEFAULT_CLIENT,
+    lookback:         int  = AMENDMENT_LOOKBACK,
+    hearing_lookahead: int = HEARING_LOOKAHEAD,
+    no_claude:        bool = False,
+    incremental:      bool = False,
+) -> Path:
+    """
+    Build and write the action digest. Returns the path to the written file.
+
+    Args:
+        client_id:        Client slug — determines which newsletter to read
+                          for last_issue anti-repetition (default: "csf")
+        lookback:         Days to look back for moving and amended buckets
+        hearing_lookahead: Days to look ahead for urgent hearings
+        no_claude:        If True, skip Claude call — pure-logic buckets only
+        incremental:      If True, re-evaluate only bills whose content changed
+                          or whose time window moved since the last run
+                          (STATE_FILE), and reuse the previous Claude results
+                          when none of their inputs changed
+    """
+    _log_run_header([client_id], lookback, hearing_lookahead, no_claude, incremental)
+
+    bills          = _load_bills()
+    buckets, state = _compute_buckets(bills, lookback, hearing_lookahead, incremental)
+
+    log.info("→ Extracting last issue for anti-repetition...")
+    digest, claude_key = _client_digest(
+        client_id, bills, buckets, state, DIGEST_FILE, no_claude, incremental,
+    )
+
+    _write_digest(digest, DIGEST_FILE)
+    if incremental:
+        state["claude_keys"][DIGEST_FILE.name] = claude_key
+        _write_state(state)
+
+    _print_summary(digest, hearing_lookahead, DIGEST_FILE)
+    return DIGEST_FILE
+
+
+def run_clients(
+    client_ids:        list[str],
+    lookback:          int  = AMENDMENT_LOOKBACK,
+    hearing_lookahead: int  = HEARING_LOOKAHEAD,
+    no_claude:         bool = False,
+    incremental:       bool = False,
+    max_workers:       int  = MAX_CLIENT_WORKERS,
+) -> list[Path]:
+    """
+    Build digests for several clients from one bucket computation.
+
+    Only last_issue (and therefore the Claude call) depends on the client, so
+    bills are loaded and bucketed once and the per-client Claude calls run
+    concurrently. Writes data/legislative/action_digest_<client>.json for each
+    client, and also action_digest.json for DEFAULT_CLIENT so single-digest
+    readers keep working. Returns the per-client paths in client_ids order.
+    """
+    _log_run_header(client_ids, lookback, hearing_lookahead, no_claude, incremental)
+
+    bills          = _load_bills()
+    buckets, state = _compute_buckets(bills, lookback, hearing_lookahead, incremental)
+
+    log.info(f"→ Building {len(client_ids)} client digests ({min(max_workers, len(client_ids))} concurrent)...")
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(client_ids)))) as pool:
+        futures = {
+            cid: pool.submit(
+                _client_digest, cid, bills, buckets, state, _digest_path(cid),
+                no_claude, incremental,
+            )
+            for cid in client_ids
+        }
+        results = {cid: fut.result() for cid, fut in futures.items()}
+
+    paths = []
+    for cid in client_ids:
+        digest, claude_key = results[cid]
+        targets = [_digest_path(cid)] + ([DIGEST_FILE] if cid == DEFAULT_CLIENT else [])
+        for path in targets:
+            _write_digest(digest, path)
+            if incremental:
+                state["claude_keys"][path.name] = claude_key
+        paths.append(_digest_path(cid))
+    if incremental:
+        _write_state(state)
+
+    for cid, path in zip(client_ids, paths):
+        _print_summary(results[cid][0], hearing_lookahead, path)
+    return paths
+
+
+def _print_summary(digest: dict, hearing_lookahead: int, digest_file: Path) -> None:
+    urgent, moving = digest["urgent"], digest["moving"]
+    last_issue     = digest["last_issue"]
+    week_str       = digest["week"]
+    client_label   = f" [{digest['client']}]" if digest.get("client") else ""
 
-    # --- Terminal summary ---
     print(f"\n{'=' * 58}")
-    print(f"  CSF Legislative Intelligence — {week_str}")
+    print(f"  CSF Legislative Intelligence — {week_str}{client_label}")
     print(f"{'=' * 58}")
-    print(f"  Bills analyzed:          {len(bills)}")
+    print(f"  Bills analyzed:          {digest['bills_analyzed']}")
     print(f"  Urgent (≤{hearing_lookahead} days):        {len(urgent)}")
     if urgent:
         print(f"    → soonest: {urgent[0]['bill_number']} on {urgent[0]['eligible_date']}")
     print(f"  Moving this lookback:    {len(moving)}")
     if moving:
         print(f"    → top: {moving[0]['bill_number']} ({moving[0]['current_stage']})")
-    print(f"  Amended:                 {len(amended)}")
-    print(f"  Stalled (≥{STALL_THRESHOLD} days):      {len(stalled)}")
+    print(f"  Amended:                 {len(digest['amended'])}")
+    print(f"  Stalled (≥{STALL_THRESHOLD} days):      {len(digest['stalled'])}")
     print(f"  Gut-and-amend detected:  {len(digest['gut_and_amend'])}")
     print(f"  Spot bills detected:     {len(digest['spot_bills'])}")
     print(f"  Last issue extracted:    {'yes → ' + last_issue.get('source_file', '') if last_issue else 'no'}")
     if digest["week_summary"]:
         print(f"  Week summary:            {digest['week_summary'][:75]}...")
-    print(f"  Digest written to:       {DIGEST_FILE.relative_to(PROJECT_ROOT)}")
+    print(f"  Digest written to:       {digest_file.relative_to(PROJECT_ROOT)}")
     print(f"{'=' * 58}\n")
 
-    return DIGEST_FILE
-
 
 # ---------------------------------------------------------------------------
 # CLI entry point
@@ -860,12 +1372,22 @@ examples:
   python agents/legislative/legislative_intel.py --no-claude       # pure logic only
   python agents/legislative/legislative_intel.py --lookahead 7     # hearings ≤7 days out
   python agents/legislative/legislative_intel.py --lookback 7      # 7-day window for moved/amended
+  python agents/legislative/legislative_intel.py --incremental     # only re-evaluate changed bills
+  python agents/legislative/legislative_intel.py --clients all     # per-client digests, buckets once
+  python agents/legislative/legislative_intel.py --clients csf,cma
         """,
     )
     parser.add_argument(
         "--client", type=str, default=DEFAULT_CLIENT,
         help=f"Client slug for last_issue extraction (default: {DEFAULT_CLIENT})",
     )
+    parser.add_argument(
+        "--clients", type=str, default=None, metavar="all|SLUG,SLUG",
+        help=(
+            "Build a digest per client (action_digest_<slug>.json) from one bucket "
+            f"computation; also writes action_digest.json for {DEFAULT_CLIENT}"
+        ),
+    )
     parser.add_argument(
         "--lookback", type=int, default=AMENDMENT_LOOKBACK,
         help=f"Days to look back for moving/amended bills (default: {AMENDMENT_LOOKBACK})",
@@ -878,14 +1400,50 @@ examples:
         "--no-claude", action="store_true", default=False,
         help="Skip Claude API call — write pure-logic buckets only (no API cost)",
     )
+    parser.add_argument(
+        "--incremental", action="store_true", default=False,
+        help=(
+            "Re-evaluate only bills changed since the last digest (or whose time "
+            "window moved); reuse Claude results when their inputs are unchanged"
+        ),
+    )
+    parser.add_argument(
+        "--budget", type=int, default=None, metavar="TOKENS",
+        help="Abort before a Claude call would take this run past TOKENS total tokens "
+             "(default: CSF_TOKEN_BUDGET, or unlimited)",
+    )
 
     args = parser.parse_args()
-    run(
-        client_id=args.client,
-        lookback=args.lookback,
-        hearing_lookahead=args.lookahead,
-        no_claude=args.no_claude,
-    )
+    configure_ledger(budget=args.budget)
+    try:
+        if args.clients:
+            if args.clients == "all":
+                client_ids = _list_clients()
+            else:
+                client_ids = [c.strip() for c in args.clients.split(",") if c.strip()]
+            if not client_ids:
+                log.error(f"No clients found for --clients {args.clients}")
+                sys.exit(1)
+            run_clients(
+                client_ids,
+                lookback=args.lookback,
+                hearing_lookahead=args.lookahead,
+                no_claude=args.no_claude,
+                incremental=args.incremental,
+            )
+        else:
+            run(
+                client_id=args.client,
+                lookback=args.lookback,
+                hearing_lookahead=args.lookahead,
+                no_claude=args.no_claude,
+                incremental=args.incremental,
+            )
+    except TokenBudgetExceeded as exc:
+        log.error(f"Token budget exceeded — aborting: {exc}")
+        print_ledger_summary()
+        sys.exit(1)
+    print_ledger_summary()
 
 
 if __name__ == "__main__":
@@ -17,21 +17,52 @@ Pipeline position:
 
 Output:
     data/media/media_digest.json   ← read by downstream agents
+    data/media/feed_state.json     ← per-feed ETag / Last-Modified + last entries
+                                     (conditional GET; a 304 re-scores cached entries)
+    data/media/feed_health.json    ← per-feed success/latency history + circuit breaker
+    data/media/article_store.jsonl ← every article seen, keyed by canonical URL; new
+                                     entries are scored once and the digest is
+                                     assembled from the store by date window
+    data/media/legislator_index.json ← author/committee → bill index (rebuilt when
+                                     tracked_bills.json authors/committees change)
+    data/media/mention_series.bin  ← daily mention counts per bill × source (array
+                                     columns); trending_bills = z-score spikes
+    data/media/article_text.jsonl  ← extracted full text of the top-K candidates
+                                     (optional; config.yaml article_text), fetched
+                                     once per canonical URL and re-scored
+
+Feeds are configured in agents/media/config.yaml (rss_feeds, active: true/false).
+
+Relevance (0–5) = (1.0 per tracked bill mentioned + 0.5 × the strongest
+author/committee link + topic score) × source weight. Author and committee
+names come from agents/shared/legislator_index.py; every article carries
+bill_links [{bill_number, confidence, via}], plus up to scanner.similar_bills_k
+bills whose title + summary is most similar to the article (via "similarity",
+agents/shared/bill_linker.py) — coverage that describes a bill without naming it.
+The topic score comes from a TF-IDF profile of the tracked bills and client
+voice files, applied to the whole digest window in one batch
+(scanner.relevance_model: tfidf), or from _TOPIC_KEYWORDS (keywords). The
+keyword score is a floor under the profile's: an article the hand-tuned list
+accepts is never dropped by the model.
 
 Usage:
     .venv/bin/python agents/media/media_scanner.py            # default (7-day lookback)
     .venv/bin/python agents/media/media_scanner.py --lookback 3
     .venv/bin/python agents/media/media_scanner.py --bills path/to/tracked_bills.json
     .venv/bin/python agents/media/media_scanner.py --dry-run  # scan but don't write
+    .venv/bin/python agents/media/media_scanner.py --full-fetch  # ignore ETag/Last-Modified
+    .venv/bin/python agents/media/media_scanner.py --fetch-text 20  # score top 20 on full text
 
 Data sources:
-    RSS feeds   — CalMatters, Capitol Weekly, KQED, LAist, Google News (no key needed)
+    RSS feeds   — config.yaml rss_feeds: CalMatters, Capitol Weekly, KQED, LAist,
+                  Google News (no key needed)
     NewsAPI     — requires NEWSAPI_KEY in .env (free tier: 100 req/day, 1-month lookback)
+                  queries from config.yaml; requests counted in data/media/newsapi_ledger.json
     X API v2    — STUB: requires X_BEARER_TOKEN ($100/month Basic tier)
                   See _scan_x_api() for activation instructions
 
 Requires:
-    feedparser, requests, python-dateutil (all in requirements.txt)
+    feedparser, requests, python-dateutil, PyYAML, beautifulsoup4, lxml (all in requirements.txt)
     Optional: NEWSAPI_KEY, X_BEARER_TOKEN in .env
 """
 
@@ -43,17 +74,44 @@ import logging
 import os
 import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:            # Windows: reservations are only serialized within one process
+    fcntl = None
 
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
 from dotenv import load_dotenv
 load_dotenv(_PROJECT_ROOT / ".env", override=True)
 
 import feedparser
 import requests
+import yaml
 from dateutil import parser as dateparser
 
+from agents.shared.article_dedupe import canonical_url, dedupe_articles
+from agents.shared.article_store import STORE_FILE, ArticleStore
+from agents.shared.article_text import (
+    cache_record, fetch_article_texts, is_transient, is_unresolvable, text_cache,
+)
+from agents.shared.bill_linker import BillLinker, build_bill_linker
+from agents.shared.client_utils import CLIENTS_DIR
+from agents.shared.legislator_index import LegislatorIndex, load_index
+from agents.shared.mention_series import (
+    SERIES_FILE, SPIKE_BASELINE_DAYS, SPIKE_MIN_Z, SPIKE_RECENT_DAYS, MentionSeries,
+)
+from agents.shared.relevance_model import TopicProfile, article_text, build_topic_profile
+
 # ---------------------------------------------------------------------------
 # Logging
 # ---------------------------------------------------------------------------
@@ -69,69 +127,41 @@ PROJECT_ROOT = _PROJECT_ROOT
 BILLS_FILE   = PROJECT_ROOT / "data" / "bills" / "tracked_bills.json"
 OUTPUT_DIR   = PROJECT_ROOT / "data" / "media"
 OUTPUT_FILE  = OUTPUT_DIR / "media_digest.json"
+CONFIG_FILE  = Path(__file__).resolve().parent / "config.yaml"
+FEED_STATE_FILE  = OUTPUT_DIR / "feed_state.json"    # ETag / Last-Modified + last entries per feed
+FEED_HEALTH_FILE = OUTPUT_DIR / "feed_health.json"   # success/latency history + circuit breaker
+NEWSAPI_LEDGER_FILE = OUTPUT_DIR / "newsapi_ledger.json"   # requests used per UTC day
+
+BODY_EXCERPT_CHARS = 2000   # lead of the full text kept on the store record for topic scoring
+LINK_SCORE_WEIGHT  = 0.5    # relevance credit for the strongest author/committee link
 
 # ---------------------------------------------------------------------------
 # RSS feed sources
 # ---------------------------------------------------------------------------
 #
-# Only feeds confirmed reachable as of 2026-02-25.
-# LA Times (feeds.latimes.com) and Sacramento Bee are currently broken/blocked.
-# Google News search RSS provides broad coverage as a catch-all.
-#
-# Feed format: {"name": display label, "url": RSS URL, "weight": relevance multiplier}
+# Feeds are defined in agents/media/config.yaml (rss_feeds). Only entries with
+# active: true are scanned. Feed format:
+#   {"name": display label, "url": RSS URL, "weight": relevance multiplier}
 # weight > 1.0 = authoritative CA policy source (bumps relevance score)
 
-RSS_FEEDS = [
-    {
-        "name":   "CalMatters — Housing",
-        "url":    "https://calmatters.org/housing/feed/",
-        "weight": 1.5,   # Primary CA policy publication, housing beat — highest authority
-    },
-    {
-        "name":   "Capitol Weekly",
-        "url":    "https://capitolweekly.net/feed/",
-        "weight": 1.4,   # Sacramento insider publication
-    },
-    {
-        "name":   "KQED News",
-        "url":    "https://www.kqed.org/news/feed/",
-        "weight": 1.1,
-    },
-    {
-        "name":   "LAist",
-        "url":    "https://laist.com/rss",
-        "weight": 1.0,
-    },
-    {
-        "name":   "Google News — CA Housing (recent)",
-        "url":    (
-            "https://news.google.com/rss/search"
-            "?q=california+housing+local+control+zoning+when:7d"
-            "&hl=en-US&gl=US&ceid=US:en"
-        ),
-        "weight": 1.0,
-        # NOTE: `when:7d` scopes Google News to the past 7 days.
-        # Without it, Google News returns historically popular results (months old).
-    },
-    {
-        "name":   "Google News — CA Preemption (recent)",
-        "url":    (
-            "https://news.google.com/rss/search"
-            "?q=california+zoning+preemption+city+council+when:7d"
-            "&hl=en-US&gl=US&ceid=US:en"
-        ),
-        "weight": 1.0,
-    },
-    {
-        "name":   "Google News — Local Control (recent)",
-        "url":    (
-            "https://news.google.com/rss/search"
-            "?q=%22local+control%22+california+housing+when:7d"
-            "&hl=en-US&gl=US&ceid=US:en"
-        ),
-        "weight": 1.1,   # Quoted phrase match — more precise signal
-    },
-]
+# Download settings — feeds are fetched concurrently, each with its own
+# (connect, read) timeout so one slow source can't stall the scan.
+RSS_MAX_WORKERS     = 6
+RSS_CONNECT_TIMEOUT = 5     # seconds
+RSS_READ_TIMEOUT    = 15    # seconds
+
+# Circuit breaker — overridable via config.yaml rss_health. After
+# FAILURE_THRESHOLD consecutive failures (error, timeout, or unparseable) a
+# feed is skipped until its backoff expires; each further failure on a retry
+# doubles the backoff, capped at MAX_BACKOFF_DAYS. One success closes it.
+FEED_FAILURE_THRESHOLD = 3
+FEED_BASE_BACKOFF_HRS  = 24
+FEED_MAX_BACKOFF_DAYS  = 30
+FEED_HISTORY_LEN       = 20    # recent results kept per feed
+_RSS_HEADERS = {
+    "User-Agent": "CSF-MediaScanner/1.0 (+https://github.com/twgonzalez/csf-agents)",
+    "Accept":     "application/rss+xml, application/atom+xml, application/xml;q=0.9, */*;q=0.8",
+}
 
 # ---------------------------------------------------------------------------
 # Keyword and bill-number matching
@@ -173,14 +203,35 @@ def _normalize_bill_number(match: re.Match) -> str:
     return f"{match.group(1).upper()}{match.group(2)}"
 
 
+def _all_bill_mentions(text: str) -> list[str]:
+    """Return every bill number mentioned in text (tracked or not), sorted."""
+    return sorted({_normalize_bill_number(m) for m in _BILL_PATTERN.finditer(text or "")})
+
+
 def _extract_bill_mentions(text: str, tracked: set[str]) -> list[str]:
     """Return bill numbers mentioned in text that are in the tracked set."""
-    found = set()
-    for m in _BILL_PATTERN.finditer(text or ""):
-        bn = _normalize_bill_number(m)
-        if bn in tracked:
-            found.add(bn)
-    return sorted(found)
+    return [bn for bn in _all_bill_mentions(text) if bn in tracked]
+
+
+def _keyword_score(title: str, summary: str) -> float:
+    """Topic-keyword part of the relevance score (before source weight)."""
+    score = 0.0
+
+    text_lower   = (title or "").lower()
+    summary_lower = (summary or "").lower()
+
+    for kw in _TOPIC_KEYWORDS:
+        kw_lower = kw.lower()
+        if kw_lower in text_lower:
+            score += 0.3
+        elif kw_lower in summary_lower:
+            score += 0.1
+
+    return score
+
+
+def _combine_score(bill_signal: float, keyword_score: float, weight: float) -> float:
+    return round(min((bill_signal * 1.0 + keyword_score) * weight, 5.0), 2)
 
 
 def _score_article(title: str, summary: str, bill_mentions: list[str], weight: float) -> float:
@@ -194,33 +245,325 @@ def _score_article(title: str, summary: str, bill_mentions: list[str], weight: f
 
     Articles with score < 0.3 after weighting are considered off-topic.
     """
-    score = 0.0
-    score += len(bill_mentions) * 1.0
+    return _combine_score(len(bill_mentions), _keyword_score(title, summary), weight)
 
-    text_lower   = (title or "").lower()
-    summary_lower = (summary or "").lower()
 
-    for kw in _TOPIC_KEYWORDS:
-        kw_lower = kw.lower()
-        if kw_lower in text_lower:
-            score += 0.3
-        elif kw_lower in summary_lower:
-            score += 0.1
+# ---------------------------------------------------------------------------
+# Seen-article store (score each canonical URL once)
+# ---------------------------------------------------------------------------
+
+def _stored_record(
+    store: ArticleStore | None,
+    *,
+    url: str,
+    title: str,
+    summary: str,
+    published: str | None,
+    source: str,
+    source_type: str,
+    weight: float,
+) -> dict:
+    """Return the store record for an entry, scoring it only if it's new.
+
+    Known canonical URLs are just marked seen again. Without a store the
+    record is built and scored every time (pre-store behavior).
+    """
+    key   = canonical_url(url) or (title or "").strip().lower()
+    today = date.today()
+    rec   = store.get(key) if store is not None else None
+    if rec is not None:
+        store.touch(key, today)
+        return rec
+
+    rec = {
+        "canonical_url":     key,
+        "url":               url,
+        "title":             title,
+        "summary":           (summary or "")[:500],
+        "source":            source,
+        "source_type":       source_type,
+        "source_weight":     weight,
+        "published":         published,
+        "first_seen":        today.isoformat(),
+        "last_seen":         today.isoformat(),
+        "bill_mentions_all": _all_bill_mentions(f"{title} {summary}"),
+        "keyword_score":     _keyword_score(title, summary),
+    }
+    if store is not None:
+        store.add(rec)
+    return rec
+
+
+def _bill_links(bill_mentions: list[str], name_links: list[dict]) -> tuple[list[dict], float]:
+    """Merge bill-number mentions with author/committee links.
+
+    Returns (bill_links, bill_signal): number mentions come first at
+    confidence 1.0; bill_signal is 1.0 per number mention plus
+    LINK_SCORE_WEIGHT × the strongest name link to any other bill.
+    """
+    links = [{"bill_number": bn, "confidence": 1.0, "via": "bill_number"} for bn in bill_mentions]
+    extra = [l for l in name_links if l["bill_number"] not in bill_mentions]
+    bonus = LINK_SCORE_WEIGHT * max((l["confidence"] for l in extra), default=0.0)
+    return links + extra, len(bill_mentions) + bonus
 
-    return round(min(score * weight, 5.0), 2)
+
+def _link_text(article: dict) -> str:
+    return "\n".join(
+        article.get(k) or "" for k in ("title", "summary", "body_excerpt")
+    )
+
+
+def _article_from_record(
+    rec: dict,
+    tracked_bills: set[str],
+    topic_score: float | None = None,
+    name_links: list[dict] | None = None,
+) -> dict:
+    """Digest article dict from a store record, scored against tracked_bills.
+
+    topic_score (from the TF-IDF topic profile) replaces the stored keyword
+    score when given and higher; name_links (from the legislator index) add bill_links
+    beyond the bill numbers in the text.
+    """
+    bill_mentions = [bn for bn in rec["bill_mentions_all"] if bn in tracked_bills]
+    links, signal = _bill_links(bill_mentions, name_links or [])
+    topic_score = max(topic_score or 0.0, rec["keyword_score"])
+    return {
+        "source":          rec["source"],
+        "source_type":     rec["source_type"],
+        "source_weight":   rec["source_weight"],
+        "title":           rec["title"],
+        "url":             rec["url"],
+        "canonical_url":   rec["canonical_url"],
+        "published":       rec["published"],
+        "summary":         rec["summary"],
+        "bill_mentions":   bill_mentions,
+        "bill_links":      links,
+        "relevance_score": _combine_score(signal, topic_score, rec["source_weight"]),
+    }
+
+
+def _articles_from_store(
+    store: ArticleStore,
+    tracked_bills: set[str],
+    lookback_days: int,
+    min_score: float,
+    profile: TopicProfile | None = None,
+    legislators: LegislatorIndex | None = None,
+) -> list[dict]:
+    """All stored articles in the lookback window scoring ≥ min_score.
+
+    Includes articles seen on earlier runs that have since rolled off their
+    feed, so the digest reflects the whole window, not just this fetch. With
+    a topic profile the whole window is scored in one batch against it;
+    otherwise the stored keyword scores are used. With a legislator index
+    each article is also linked to bills by author / committee.
+    """
+    since  = date.today() - timedelta(days=lookback_days)
+    recs   = store.in_window(since)
+    topics = profile.topic_scores([article_text(r) for r in recs]) if profile else [None] * len(recs)
+    links  = [legislators.match(_link_text(r)) for r in recs] if legislators else [None] * len(recs)
+    articles = [
+        _article_from_record(r, tracked_bills, t, l) for r, t, l in zip(recs, topics, links)
+    ]
+    articles = [a for a in articles if a["relevance_score"] >= min_score]
+    articles.sort(key=lambda a: (-a["relevance_score"], a.get("published") or ""))
+    return articles
+
+
+def _body_candidates(
+    store: ArticleStore,
+    tracked_bills: set[str],
+    lookback_days: int,
+    top_k: int,
+) -> list[dict]:
+    """The top_k highest-scoring store records in the window not yet body-scored."""
+    since = date.today() - timedelta(days=lookback_days)
+    recs  = [r for r in store.in_window(since) if "body_status" not in r]
+    recs.sort(key=lambda r: (
+        -_article_from_record(r, tracked_bills)["relevance_score"],
+        r.get("published") or "",
+    ))
+    return recs[:top_k]
+
+
+def _score_bodies(
+    store: ArticleStore,
+    cache: ArticleStore,
+    tracked_bills: set[str],
+    lookback_days: int,
+    top_k: int,
+) -> int:
+    """Fetch full text for the top_k candidates and fold it into their scores.
+
+    Text comes from the cache when present; only uncached canonical URLs are
+    downloaded (concurrently). Transient failures (network error, 429, 5xx)
+    are neither cached nor stamped, so the record stays a candidate and is
+    retried next run. Every other record gains body_status, and on success
+    its bill mentions and keyword score are recomputed over title + summary +
+    body (body keywords count like summary keywords), and the lead of the body
+    is kept as body_excerpt for the topic model. Returns the number of pages
+    downloaded.
+    """
+    candidates = _body_candidates(store, tracked_bills, lookback_days, top_k)
+    if not candidates:
+        log.info("   Full text: no new candidates")
+        return 0
+
+    today   = date.today()
+    pending = {}
+    for rec in candidates:
+        key = rec["canonical_url"]
+        if key in cache:
+            cache.touch(key, today)
+        elif key.startswith("http"):
+            # Fetch the link as the feed gave it — the canonical form is only
+            # a dedupe key (dropped AMP suffixes, slashes and params can 404) —
+            # unless it's a JS-only redirect (Google News) the key has decoded
+            url = rec["url"]
+            pending[key] = key if is_unresolvable(url) and not is_unresolvable(key) else url
+
+    started = time.perf_counter()
+    fetched = fetch_article_texts(list(pending.values()))
+    retry = set()
+    for key, url in pending.items():
+        if is_transient(fetched[url]["status"]):
+            retry.add(key)
+        else:
+            cache.add(cache_record(key, fetched[url], today))
+    if pending:
+        ok = sum(1 for url in pending.values() if fetched[url]["status"] == "ok")
+        log.info(
+            f"   Full text: fetched {len(pending)} page(s) in {time.perf_counter() - started:.1f}s "
+            f"({ok} extracted, {len(retry)} to retry), {len(candidates) - len(pending)} from cache"
+        )
+
+    gained = 0
+    for rec in candidates:
+        if rec["canonical_url"] in retry:
+            continue
+        cached = cache.get(rec["canonical_url"]) or {"status": "no_url", "text": ""}
+        rec["body_status"] = cached["status"]
+        if cached["status"] == "ok":
+            before = set(rec["bill_mentions_all"])
+            rec["bill_mentions_all"] = sorted(before | set(_all_bill_mentions(cached["text"])))
+            rec["keyword_score"]     = _keyword_score(
+                rec["title"], f"{rec['summary']} {cached['text']}"
+            )
+            rec["body_excerpt"]      = cached["text"][:BODY_EXCERPT_CHARS]
+            gained += bool((set(rec["bill_mentions_all"]) - before) & tracked_bills)
+        store.add(rec)
+    log.info(f"   Full text: {gained} article(s) gained a tracked-bill mention from the body")
+    return len(pending)
+
+
+# ---------------------------------------------------------------------------
+# Topic relevance model
+# ---------------------------------------------------------------------------
+
+def _build_profile(bills: dict) -> TopicProfile:
+    """TF-IDF topic profile from tracked bills, client voice files, and _TOPIC_KEYWORDS."""
+    started = time.perf_counter()
+    profile = build_topic_profile(bills, CLIENTS_DIR, _TOPIC_KEYWORDS)
+    log.info(
+        f"   Topic profile: {len(profile):,} terms from {len(bills)} bills + voice files "
+        f"({(time.perf_counter() - started) * 1000:.0f} ms)"
+    )
+    return profile
+
+
+def _build_legislator_index(bills: dict) -> LegislatorIndex:
+    """Author / committee index, rebuilt only when the bill store's names change."""
+    index = load_index(bills)
+    log.info(f"   Legislator index: {len(index.spec['authors'])} authors, "
+             f"{len(index.spec['committees'])} committees")
+    return index
+
+
+def _link_similar_bills(articles: list[dict], linker: BillLinker, k: int) -> int:
+    """Add up to k similarity links per article (bills not already linked). Returns links added."""
+    started = time.perf_counter()
+    added   = 0
+    for a, links in zip(articles, linker.links([_link_text(a) for a in articles], k)):
+        have = {l["bill_number"] for l in a.get("bill_links", [])}
+        new  = [l for l in links if l["bill_number"] not in have]
+        a["bill_links"] = a.get("bill_links", []) + new
+        added += len(new)
+    log.info(
+        f"   Similar-bill links: {added} across {len(articles)} articles × {len(linker)} bills "
+        f"({(time.perf_counter() - started) * 1000:.0f} ms)"
+    )
+    return added
+
+
+def _rescore_articles(
+    articles: list[dict],
+    min_score: float,
+    profile: TopicProfile | None = None,
+    legislators: LegislatorIndex | None = None,
+) -> list[dict]:
+    """Re-score already-built article dicts (no-store path) in one batch.
+
+    Same scoring as _articles_from_store: topic profile (floored at the
+    keyword score, or keywords alone) plus bill-number mentions and legislator-index links.
+    """
+    topics = [_keyword_score(a["title"], a["summary"]) for a in articles]
+    if profile is not None:
+        learned = profile.topic_scores([article_text(a) for a in articles])
+        topics  = [max(l, k) for l, k in zip(learned, topics)]
+    for a, topic in zip(articles, topics):
+        name_links = legislators.match(_link_text(a)) if legislators else []
+        a["bill_links"], signal = _bill_links(a["bill_mentions"], name_links)
+        a["relevance_score"] = _combine_score(signal, topic, a["source_weight"])
+    return [a for a in articles if a["relevance_score"] >= min_score]
 
 
 # ---------------------------------------------------------------------------
 # Date parsing helpers
 # ---------------------------------------------------------------------------
 
+# Feed and NewsAPI dates are almost always one of these two shapes; both fast
+# paths return the calendar date *as written* (no timezone shift), matching
+# dateutil.parse(..., ignoretz=True).
+# ISO 8601:  "2026-02-27", "2026-02-27T18:04:00Z"
+_ISO_DATE_RE    = re.compile(r"\s*(\d{4})-(\d{2})-(\d{2})(?:[T ]|$)")
+# RFC 822:   "Fri, 27 Feb 2026 18:04:00 GMT", "27 Feb 2026 10:00 +0000"
+_RFC822_DATE_RE = re.compile(r"\s*(?:[A-Za-z]{3},?\s+)?(\d{1,2})\s+([A-Za-z]{3})\s+(\d{4})\b")
+_MONTH_ABBR = {
+    m: i for i, m in enumerate(
+        ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"],
+        start=1,
+    )
+}
+
+
+def _parse_date_fast(date_str: str) -> str | None:
+    """ISO 8601 / RFC 822 → YYYY-MM-DD without dateutil; None if neither shape."""
+    try:
+        m = _ISO_DATE_RE.match(date_str)
+        if m:
+            return date(int(m.group(1)), int(m.group(2)), int(m.group(3))).isoformat()
+        m = _RFC822_DATE_RE.match(date_str)
+        if m and m.group(2).lower() in _MONTH_ABBR:
+            return date(int(m.group(3)), _MONTH_ABBR[m.group(2).lower()], int(m.group(1))).isoformat()
+    except ValueError:
+        pass
+    return None
+
+
+@lru_cache(maxsize=8192)
 def _parse_date(date_str: str | None) -> str | None:
     """Parse a date string from any common format → ISO date string (YYYY-MM-DD).
 
+    Tries the ISO 8601 / RFC 822 fast paths, then dateutil as a last resort.
+    Memoized by string — feeds repeat the same timestamps across scans.
     Returns None if the string is empty or unparseable.
     """
     if not date_str:
         return None
+    fast = _parse_date_fast(date_str)
+    if fast:
+        return fast
     try:
         dt = dateparser.parse(date_str, ignoretz=True)
         return dt.date().isoformat() if dt else None
@@ -228,6 +571,25 @@ def _parse_date(date_str: str | None) -> str | None:
         return None
 
 
+def _entry_date(entry) -> str | None:
+    """Publication date of a feedparser entry → YYYY-MM-DD.
+
+    Order: string fast paths, then feedparser's *_parsed struct, then
+    dateutil. The struct is not first because feedparser normalizes it to
+    UTC, which would move late-evening Pacific posts to the next day relative
+    to the as-written date used everywhere else.
+    """
+    raw = entry.get("published") or entry.get("updated") or entry.get("created")
+    if raw:
+        fast = _parse_date_fast(raw)
+        if fast:
+            return fast
+    st = entry.get("published_parsed") or entry.get("updated_parsed") or entry.get("created_parsed")
+    if st:
+        return date(st.tm_year, st.tm_mon, st.tm_mday).isoformat()
+    return _parse_date(raw)
+
+
 def _is_within_lookback(date_str: str | None, lookback_days: int) -> bool:
     """Return True if date_str (ISO YYYY-MM-DD) falls within the lookback window."""
     if not date_str:
@@ -244,75 +606,335 @@ def _is_within_lookback(date_str: str | None, lookback_days: int) -> bool:
 # Module 1: RSS scanner
 # ---------------------------------------------------------------------------
 
-def _scan_rss_feeds(
-    feeds: list[dict],
+def _load_config(path: Path = CONFIG_FILE) -> dict:
+    """Load agents/media/config.yaml; {} if missing or invalid."""
+    if not path.exists():
+        log.warning(f"   Config not found: {path}")
+        return {}
+    try:
+        return yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    except (OSError, yaml.YAMLError) as exc:
+        log.warning(f"   Could not read {path.name}: {exc}")
+        return {}
+
+
+def _load_feeds(config: dict) -> list[dict]:
+    """Active rss_feeds from config → [{"name", "url", "weight"}]."""
+    feeds = []
+    for f in config.get("rss_feeds") or []:
+        if not f.get("active", True) or not f.get("url"):
+            continue
+        feeds.append({
+            "name":   f.get("name") or f["url"],
+            "url":    f["url"],
+            "weight": float(f.get("weight", 1.0)),
+        })
+    return feeds
+
+
+def _load_feed_health(path: Path = FEED_HEALTH_FILE) -> dict:
+    """Per-feed health keyed by feed URL; {} if absent/corrupt."""
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        log.warning(f"   Could not read {path.name}: {exc} — resetting feed health")
+        return {}
+
+
+def _save_feed_health(health: dict, path: Path = FEED_HEALTH_FILE) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(health, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def _breaker_open(entry: dict | None, now: datetime) -> bool:
+    """True while a feed's circuit breaker is open (skip without fetching)."""
+    if not entry or not entry.get("open_until"):
+        return False
+    return now < datetime.fromisoformat(entry["open_until"])
+
+
+def _record_feed_result(
+    health: dict,
+    url: str,
+    ok: bool,
+    latency: float,
+    error: str | None,
+    now: datetime,
+    settings: dict | None = None,
+) -> dict:
+    """Append one fetch result to a feed's history and update its breaker.
+
+    settings may override failure_threshold, base_backoff_hours and
+    max_backoff_days (config.yaml rss_health). Returns the updated entry.
+    """
+    settings  = settings or {}
+    threshold = int(settings.get("failure_threshold", FEED_FAILURE_THRESHOLD))
+    base_hrs  = float(settings.get("base_backoff_hours", FEED_BASE_BACKOFF_HRS))
+    max_days  = float(settings.get("max_backoff_days", FEED_MAX_BACKOFF_DAYS))
+
+    entry = health.setdefault(url, {"consecutive_failures": 0, "open_until": None, "history": []})
+    entry["history"] = (entry.get("history", []) + [{
+        "at":      now.isoformat(timespec="seconds"),
+        "ok":      ok,
+        "latency": round(latency, 3),
+        **({"error": error[:200]} if error else {}),
+    }])[-FEED_HISTORY_LEN:]
+
+    if ok:
+        entry["consecutive_failures"] = 0
+        entry["open_until"] = None
+    else:
+        entry["consecutive_failures"] = entry.get("consecutive_failures", 0) + 1
+        over = entry["consecutive_failures"] - threshold
+        if over >= 0:
+            backoff = min(timedelta(hours=base_hrs * (2 ** over)), timedelta(days=max_days))
+            entry["open_until"] = (now + backoff).isoformat(timespec="seconds")
+
+    oks = [h for h in entry["history"] if h["ok"]]
+    entry["success_rate"]   = round(len(oks) / len(entry["history"]), 2)
+    entry["median_latency"] = (
+        round(sorted(h["latency"] for h in oks)[len(oks) // 2], 3) if oks else None
+    )
+    return entry
+
+
+def _load_feed_state(path: Path = FEED_STATE_FILE) -> dict:
+    """Per-feed conditional-GET state keyed by feed URL; {} if absent/corrupt."""
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        log.warning(f"   Could not read {path.name}: {exc} — fetching all feeds in full")
+        return {}
+
+
+def _save_feed_state(state: dict, path: Path = FEED_STATE_FILE) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(state, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def _fetch_feed(feed_cfg: dict, cached: dict | None = None) -> dict:
+    """Download one feed's raw bytes with connect/read timeouts.
+
+    If cached carries an ETag / Last-Modified from a previous scan, sends a
+    conditional request; status 304 means the feed is unchanged and content
+    is None. Never raises — returns {"status", "content", "headers", "etag",
+    "last_modified", "error", "latency"}. Runs on a worker thread.
+    """
+    headers = dict(_RSS_HEADERS)
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    started = time.perf_counter()
+    try:
+        resp = requests.get(
+            feed_cfg["url"],
+            headers=headers,
+            timeout=(RSS_CONNECT_TIMEOUT, RSS_READ_TIMEOUT),
+        )
+        if resp.status_code != 304:
+            resp.raise_for_status()
+        return {
+            "status":  resp.status_code,
+            "content": resp.content if resp.status_code != 304 else None,
+            "headers": {
+                "content-type":     resp.headers.get("Content-Type", ""),
+                "content-location": resp.url,
+            },
+            "etag":          resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+            "error":   None,
+            "latency": time.perf_counter() - started,
+        }
+    except requests.RequestException as exc:
+        return {
+            "status":  None,
+            "content": None,
+            "headers": {},
+            "etag":    None,
+            "last_modified": None,
+            "error":   exc,
+            "latency": time.perf_counter() - started,
+        }
+
+
+def _entry_records(parsed) -> list[dict]:
+    """Normalize parsed feed entries → {id, title, summary, link, published}.
+
+    This is the form cached in FEED_STATE_FILE, so a 304 can be re-scored
+    (against the current lookback and bill list) without re-parsing.
+    """
+    records = []
+    for entry in parsed.entries:
+        summary = entry.get("summary", "") or entry.get("description", "")
+        link    = entry.get("link", "")
+        records.append({
+            "id":        entry.get("id") or link or entry.get("title", ""),
+            "title":     entry.get("title", ""),
+            # Strip HTML tags from summary for cleaner text matching
+            "summary":   re.sub(r"<[^>]+>", " ", summary).strip(),
+            "link":      link,
+            "published": _entry_date(entry),
+        })
+    return records
+
+
+def _feed_articles(
+    records: list[dict],
+    feed_cfg: dict,
     tracked_bills: set[str],
     lookback_days: int,
-    min_score: float = 0.3,
+    min_score: float,
+    store: ArticleStore | None = None,
 ) -> list[dict]:
-    """Fetch and filter all RSS feeds.
+    """Filter and score one feed's entry records → article dicts.
 
-    Returns a list of article dicts sorted by relevance_score descending.
-    Handles feed errors gracefully — a dead feed logs a warning and continues.
+    With a store, entries whose canonical URL was seen on an earlier run
+    reuse their stored scoring inputs instead of being re-scored.
     """
+    name   = feed_cfg["name"]
+    weight = feed_cfg.get("weight", 1.0)
     articles: list[dict] = []
 
-    for feed_cfg in feeds:
-        name   = feed_cfg["name"]
-        url    = feed_cfg["url"]
-        weight = feed_cfg.get("weight", 1.0)
+    for rec in records:
+        if not _is_within_lookback(rec["published"], lookback_days):
+            continue
 
-        try:
-            log.info(f"   RSS ← {name}")
-            parsed = feedparser.parse(url)
+        stored = _stored_record(
+            store,
+            url=rec["link"], title=rec["title"], summary=rec["summary"],
+            published=rec["published"], source=name, source_type="rss", weight=weight,
+        )
+        article = _article_from_record(stored, tracked_bills)
 
-            if parsed.bozo and not parsed.entries:
-                log.warning(f"      ⚠ {name}: feed parse error — {parsed.bozo_exception}")
-                continue
+        if article["relevance_score"] < min_score:
+            continue
 
-            feed_count = 0
-            for entry in parsed.entries:
-                title    = entry.get("title",   "")
-                summary  = entry.get("summary", "") or entry.get("description", "")
-                link     = entry.get("link",    "")
-                pub_date = _parse_date(
-                    entry.get("published") or
-                    entry.get("updated")   or
-                    entry.get("created")
-                )
+        articles.append(article)
 
-                if not _is_within_lookback(pub_date, lookback_days):
-                    continue
+    return articles
 
-                # Strip HTML tags from summary for cleaner text matching
-                clean_summary = re.sub(r"<[^>]+>", " ", summary).strip()
 
-                bill_mentions = _extract_bill_mentions(
-                    f"{title} {clean_summary}", tracked_bills
+def _scan_rss_feeds(
+    feeds: list[dict],
+    tracked_bills: set[str],
+    lookback_days: int,
+    min_score: float = 0.3,
+    max_workers: int = RSS_MAX_WORKERS,
+    feed_state: dict | None = None,
+    feed_health: dict | None = None,
+    health_settings: dict | None = None,
+    store: ArticleStore | None = None,
+) -> list[dict]:
+    """Fetch and filter all RSS feeds.
+
+    Downloads run concurrently (bounded by max_workers); parsing and scoring
+    happen in feed order on the calling thread, so log output and results are
+    deterministic. Returns a list of article dicts sorted by relevance_score
+    descending. Handles feed errors gracefully — a dead feed logs a warning
+    and continues.
+
+    feed_state (FEED_STATE_FILE contents, updated in place) enables
+    conditional requests: a 304 skips parsing and re-scores the entries
+    cached from the last full download.
+
+    feed_health (FEED_HEALTH_FILE contents, updated in place) records each
+    feed's success/latency history; feeds whose circuit breaker is open are
+    skipped without a request.
+
+    store (ArticleStore) makes scoring incremental: only canonical URLs not
+    seen on an earlier run are scored.
+    """
+    articles: list[dict] = []
+    if feed_state is None:
+        feed_state = {}
+    if feed_health is None:
+        feed_health = {}
+
+    now = datetime.now()
+    skipped = [f for f in feeds if _breaker_open(feed_health.get(f["url"]), now)]
+    for f in skipped:
+        h = feed_health[f["url"]]
+        log.info(
+            f"   RSS ⏸ {f['name']}: circuit open until {h['open_until']} "
+            f"({h['consecutive_failures']} consecutive failures) — skipped"
+        )
+    feeds = [f for f in feeds if f not in skipped]
+    if not feeds:
+        return articles
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(feeds)))) as pool:
+        fetches = list(pool.map(
+            lambda f: _fetch_feed(f, feed_state.get(f["url"])), feeds
+        ))
+
+    for feed_cfg, fetch in zip(feeds, fetches):
+        name   = feed_cfg["name"]
+        cached = feed_state.get(feed_cfg["url"])
+
+        def record(ok: bool, error: str | None = None) -> None:
+            entry = _record_feed_result(
+                feed_health, feed_cfg["url"], ok, fetch["latency"], error, now, health_settings,
+            )
+            if not ok and entry.get("open_until"):
+                log.warning(
+                    f"      ⚠ {name}: {entry['consecutive_failures']} consecutive failures — "
+                    f"circuit open until {entry['open_until']}"
                 )
-                score = _score_article(title, clean_summary, bill_mentions, weight)
 
-                if score < min_score:
-                    continue
+        if fetch["error"] is not None:
+            log.info(f"   RSS ← {name}  ({fetch['latency']:.2f}s)")
+            log.warning(f"      ⚠ {name}: failed to fetch — {fetch['error']}")
+            record(False, str(fetch["error"]))
+            continue
 
-                articles.append({
-                    "source":          name,
-                    "source_type":     "rss",
-                    "title":           title,
-                    "url":             link,
-                    "published":       pub_date,
-                    "summary":         clean_summary[:500],
-                    "bill_mentions":   bill_mentions,
-                    "relevance_score": score,
-                })
-                feed_count += 1
+        try:
+            if fetch["status"] == 304 and cached:
+                log.info(f"   RSS ← {name}  ({fetch['latency']:.2f}s, 304 not modified)")
+                records = cached.get("entries", [])
+            else:
+                log.info(f"   RSS ← {name}  ({fetch['latency']:.2f}s)")
+                parsed = feedparser.parse(fetch["content"], response_headers=fetch["headers"])
+
+                if parsed.bozo and not parsed.entries:
+                    log.warning(f"      ⚠ {name}: feed parse error — {parsed.bozo_exception}")
+                    record(False, f"parse error: {parsed.bozo_exception}")
+                    continue
 
-            log.info(f"      → {feed_count} relevant article(s)")
+                records = _entry_records(parsed)
+                feed_state[feed_cfg["url"]] = {
+                    "etag":          fetch["etag"],
+                    "last_modified": fetch["last_modified"],
+                    "fetched":       datetime.now().isoformat(timespec="seconds"),
+                    "entry_ids":     [r["id"] for r in records],
+                    "entries":       records,
+                }
+
+            feed_articles = _feed_articles(
+                records, feed_cfg, tracked_bills, lookback_days, min_score, store
+            )
+            articles.extend(feed_articles)
+            log.info(f"      → {len(feed_articles)} relevant article(s)")
+            record(True)
 
         except Exception as exc:
-            log.warning(f"      ⚠ {name}: failed to fetch — {exc}")
+            log.warning(f"      ⚠ {name}: failed to parse — {exc}")
+            record(False, f"parse error: {exc}")
             continue
 
+    slowest = max(zip(fetches, feeds), key=lambda p: p[0]["latency"])
+    log.info(
+        f"   RSS wall time {time.perf_counter() - started:.2f}s "
+        f"(slowest: {slowest[1]['name']} {slowest[0]['latency']:.2f}s)"
+    )
+
     # Sort by relevance then recency
     articles.sort(key=lambda a: (-a["relevance_score"], a["published"] or ""))
     return articles
@@ -325,100 +947,239 @@ def _scan_rss_feeds(
 # Free tier: 100 requests/day, articles up to 1 month old, rate limited.
 # Requires NEWSAPI_KEY in .env — get a free key at https://newsapi.org/register
 #
-# Paid tiers unlock older archives and higher rate limits. For CSF usage the
-# free tier is sufficient (1 request per weekly run).
+# Paid tiers unlock older archives and higher rate limits. Every request is
+# counted in NEWSAPI_LEDGER_FILE (per UTC day, NewsAPI's reset boundary) so
+# scheduled and manual runs together stay under the daily quota.
+#
+# Queries come from config.yaml newsapi.queries. They run concurrently; each
+# pages forward (page_size results at a time, up to max_results_per_query)
+# only while at least NEWSAPI_PAGINATE_MIN_RELEVANT of the last page scored
+# above min_score.
 
 _NEWSAPI_ENDPOINT = "https://newsapi.org/v2/everything"
 
-_NEWSAPI_QUERIES = [
-    "california housing local control",
-    "california zoning preemption city",
-    "california housing bill legislature",
-]
+NEWSAPI_DAILY_LIMIT           = 100   # free tier requests/day
+NEWSAPI_PAGE_SIZE             = 20
+NEWSAPI_MAX_RESULTS           = 100   # free tier can't page past result 100
+NEWSAPI_PAGINATE_MIN_RELEVANT = 0.5   # fraction of a page that must be relevant to fetch the next
+NEWSAPI_MAX_WORKERS           = 4
+NEWSAPI_TIMEOUT               = 15    # seconds (read)
 
 
-def _scan_newsapi(
-    tracked_bills: set[str],
-    lookback_days: int,
-    min_score: float = 0.3,
-) -> tuple[list[dict], str]:
-    """Query NewsAPI for recent CA housing policy coverage.
+class _NewsApiLedger:
+    """Thread-safe per-UTC-day request counter persisted across runs.
 
-    Returns (articles, status) where status is one of:
-        "ok"             — results returned
-        "not_configured" — NEWSAPI_KEY not set (skip silently)
-        "error"          — API call failed (logged, returns empty list)
+    reserve() claims one request before it is sent: it re-reads the day's
+    count and writes the increment back under an exclusive lock on the
+    ledger file, so overlapping runs can't both spend the last requests.
     """
-    api_key = os.environ.get("NEWSAPI_KEY", "").strip()
-    if not api_key:
-        log.info("   NewsAPI: NEWSAPI_KEY not set — skipping")
-        return [], "not_configured"
 
-    from_date = (date.today() - timedelta(days=min(lookback_days, 30))).isoformat()
-    articles:   list[dict] = []
-    seen_urls:  set[str]   = set()
+    def __init__(self, path: Path = NEWSAPI_LEDGER_FILE, limit: int = NEWSAPI_DAILY_LIMIT):
+        self.path  = path
+        self.limit = limit
+        self.day   = datetime.now(timezone.utc).date().isoformat()
+        self.made  = 0
+        self._lock = threading.Lock()
 
-    for query in _NEWSAPI_QUERIES:
+    def _read(self) -> dict:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    @contextmanager
+    def _locked_counts(self) -> Iterator[dict]:
+        """The persisted counts, held under a file lock and written back if changed."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a+", encoding="utf-8") as fh:
+            if fcntl is not None:
+                fcntl.flock(fh, fcntl.LOCK_EX)      # released when the file closes
+            fh.seek(0)
+            try:
+                counts = json.loads(fh.read() or "{}")
+            except json.JSONDecodeError:
+                counts = {}
+            before = dict(counts)
+            yield counts
+            if counts != before:
+                # Keep two weeks of history for auditing
+                counts = dict(sorted(counts.items())[-14:])
+                fh.seek(0)
+                fh.truncate()
+                fh.write(json.dumps(counts, indent=2))
+
+    @property
+    def remaining(self) -> int:
+        return max(0, self.limit - self._read().get(self.day, 0))
+
+    def reserve(self) -> bool:
+        with self._lock, self._locked_counts() as counts:
+            used = counts.get(self.day, 0)
+            if used >= self.limit:
+                return False
+            counts[self.day] = used + 1
+            self.made += 1
+            return True
+
+
+def _newsapi_query(
+    query: str,
+    api_key: str,
+    from_date: str,
+    tracked_bills: set[str],
+    min_score: float,
+    max_results: int,
+    page_size: int,
+    ledger: _NewsApiLedger,
+) -> tuple[list[dict], str]:
+    """Fetch one query's pages. Runs on a worker thread; never touches the store.
+
+    Returns (raw NewsAPI article items, status) where status is "ok",
+    "error" (bad key, or a failed request — earlier pages are kept),
+    "rate_limited", or "quota_exhausted".
+    """
+    items: list[dict] = []
+    max_results = min(max_results, NEWSAPI_MAX_RESULTS)
+    page = 1
+    while len(items) < max_results:
+        if not ledger.reserve():
+            log.warning(f"   NewsAPI: daily quota ({ledger.limit}) reached — stopping '{query}'")
+            return items, "quota_exhausted"
         params = {
             "q":          query,
             "from":       from_date,
             "language":   "en",
             "sortBy":     "relevancy",
-            "pageSize":   20,
+            "pageSize":   min(page_size, max_results - len(items)),
+            "page":       page,
             "apiKey":     api_key,
         }
+        started = time.perf_counter()
         try:
-            resp = requests.get(_NEWSAPI_ENDPOINT, params=params, timeout=15)
+            resp = requests.get(_NEWSAPI_ENDPOINT, params=params, timeout=(RSS_CONNECT_TIMEOUT, NEWSAPI_TIMEOUT))
 
             if resp.status_code == 401:
                 log.error("   NewsAPI: invalid API key — check NEWSAPI_KEY in .env")
                 return [], "error"
-            if resp.status_code == 426:
+            if resp.status_code in (426, 429):
                 log.warning("   NewsAPI: free tier limit reached — upgrade plan for more")
-                return articles, "rate_limited"
+                return items, "rate_limited"
 
             resp.raise_for_status()
-            data = resp.json()
+            batch = resp.json().get("articles", [])
+        except requests.RequestException as exc:
+            log.warning(f"   NewsAPI: request failed for '{query}' p{page} — {exc}")
+            return items, "error"
+        items.extend(batch)
+
+        relevant = sum(
+            1 for it in batch
+            if _score_article(
+                it.get("title") or "", it.get("description") or "",
+                _extract_bill_mentions(f"{it.get('title') or ''} {it.get('description') or ''}", tracked_bills),
+                1.0,
+            ) >= min_score
+        )
+        log.info(
+            f"   NewsAPI ← '{query}' p{page}: {len(batch)} results, "
+            f"{relevant} relevant ({time.perf_counter() - started:.2f}s)"
+        )
+        if len(batch) < params["pageSize"] or relevant < NEWSAPI_PAGINATE_MIN_RELEVANT * len(batch):
+            break
+        page += 1
+    return items, "ok"
 
-            for item in data.get("articles", []):
-                url = item.get("url", "")
-                if url in seen_urls:
-                    continue
-                seen_urls.add(url)
 
-                title    = item.get("title",       "") or ""
-                summary  = item.get("description", "") or ""
-                pub_date = _parse_date(item.get("publishedAt"))
+def _scan_newsapi(
+    tracked_bills: set[str],
+    lookback_days: int,
+    min_score: float = 0.3,
+    store: ArticleStore | None = None,
+    settings: dict | None = None,
+    ledger: _NewsApiLedger | None = None,
+) -> tuple[list[dict], str]:
+    """Query NewsAPI for recent CA housing policy coverage.
 
-                if not _is_within_lookback(pub_date, lookback_days):
-                    continue
+    settings is config.yaml's newsapi block (enabled, queries,
+    max_results_per_query, page_size, daily_request_limit).
 
-                bill_mentions = _extract_bill_mentions(
-                    f"{title} {summary}", tracked_bills
-                )
-                score = _score_article(title, summary, bill_mentions, weight=1.0)
+    Returns (articles, status) where status is one of:
+        "ok"              — results returned
+        "not_configured"  — NEWSAPI_KEY not set, or disabled in config (skip silently)
+        "error"           — bad key or a failed request (logged; pages fetched before it are kept)
+        "rate_limited"    — NewsAPI refused a request (partial results)
+        "quota_exhausted" — daily ledger limit reached (partial or no results)
+    """
+    settings = settings or {}
+    api_key  = os.environ.get("NEWSAPI_KEY", "").strip()
+    if not api_key:
+        log.info("   NewsAPI: NEWSAPI_KEY not set — skipping")
+        return [], "not_configured"
+    if not settings.get("enabled", True):
+        log.info("   NewsAPI: disabled in config.yaml — skipping")
+        return [], "not_configured"
+    queries = settings.get("queries") or []
+    if not queries:
+        log.info("   NewsAPI: no queries in config.yaml — skipping")
+        return [], "not_configured"
 
-                if score < min_score:
-                    continue
+    if ledger is None:
+        ledger = _NewsApiLedger(limit=int(settings.get("daily_request_limit", NEWSAPI_DAILY_LIMIT)))
+    log.info(f"   NewsAPI: {ledger.remaining} of {ledger.limit} requests left today (UTC)")
+    if ledger.remaining <= 0:
+        return [], "quota_exhausted"
 
-                articles.append({
-                    "source":          item.get("source", {}).get("name", "NewsAPI"),
-                    "source_type":     "newsapi",
-                    "title":           title,
-                    "url":             url,
-                    "published":       pub_date,
-                    "summary":         summary[:500],
-                    "bill_mentions":   bill_mentions,
-                    "relevance_score": score,
-                })
+    from_date   = (date.today() - timedelta(days=min(lookback_days, 30))).isoformat()
+    max_results = int(settings.get("max_results_per_query", NEWSAPI_PAGE_SIZE))
+    page_size   = int(settings.get("page_size", NEWSAPI_PAGE_SIZE))
 
-        except requests.RequestException as exc:
-            log.warning(f"   NewsAPI: request failed for '{query}' — {exc}")
-            continue
+    def run_query(query: str) -> tuple[list[dict], str]:
+        return _newsapi_query(
+            query, api_key, from_date, tracked_bills, min_score,
+            max_results, page_size, ledger,
+        )
+
+    with ThreadPoolExecutor(max_workers=max(1, min(NEWSAPI_MAX_WORKERS, len(queries)))) as pool:
+        results = list(pool.map(run_query, queries))
+
+    statuses = [status for _, status in results]
+
+    articles:   list[dict] = []
+    seen_urls:  set[str]   = set()
+    for items, _ in results:
+        for item in items:
+            url = item.get("url", "")
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+
+            title    = item.get("title",       "") or ""
+            summary  = item.get("description", "") or ""
+            pub_date = _parse_date(item.get("publishedAt"))
+
+            if not _is_within_lookback(pub_date, lookback_days):
+                continue
+
+            stored = _stored_record(
+                store,
+                url=url, title=title, summary=summary, published=pub_date,
+                source=item.get("source", {}).get("name", "NewsAPI"),
+                source_type="newsapi", weight=1.0,
+            )
+            article = _article_from_record(stored, tracked_bills)
+
+            if article["relevance_score"] < min_score:
+                continue
 
-    log.info(f"   NewsAPI → {len(articles)} relevant article(s)")
+            articles.append(article)
+
+    log.info(
+        f"   NewsAPI → {len(articles)} relevant article(s) "
+        f"({ledger.made} request(s) this run, {ledger.remaining} left today)"
+    )
     articles.sort(key=lambda a: (-a["relevance_score"], a["published"] or ""))
-    return articles, "ok"
+    status = next((s for s in ("error", "rate_limited", "quota_exhausted") if s in statuses), "ok")
+    return articles, status
 
 
 # ---------------------------------------------------------------------------
@@ -568,6 +1329,27 @@ def _scan_x_api(
 # Digest builder
 # ---------------------------------------------------------------------------
 
+def _trending_bills(
+    series: MentionSeries,
+    tracked_bills: set[str],
+    settings: dict | None = None,
+    today: date | None = None,
+) -> list[dict]:
+    """Tracked bills whose daily mentions spike above their trailing baseline."""
+    settings = settings or {}
+    spikes = series.spikes(
+        "bill",
+        end           = today or date.today(),
+        recent_days   = settings.get("recent_days", SPIKE_RECENT_DAYS),
+        baseline_days = settings.get("baseline_days", SPIKE_BASELINE_DAYS),
+        min_z         = settings.get("min_z", SPIKE_MIN_Z),
+    )
+    return [
+        {"bill_number": s["key"], "mentions": s["mentions"], "baseline": s["baseline"], "z": s["z"]}
+        for s in spikes if s["key"] in tracked_bills
+    ]
+
+
 def _build_digest(
     articles: list[dict],
     x_posts:  list[dict],
@@ -577,16 +1359,17 @@ def _build_digest(
     lookback_days: int,
     sources_scanned: list[str],
     max_articles: int = 20,
+    trending: list[dict] | None = None,
 ) -> dict:
-    """Assemble the final media_digest.json structure."""
-    # Deduplicate articles by URL
-    seen: set[str] = set()
-    deduped: list[dict] = []
-    for a in articles:
-        key = a.get("url") or a.get("title", "")
-        if key not in seen:
-            seen.add(key)
-            deduped.append(a)
+    """Assemble the final media_digest.json structure.
+
+    Near-duplicate copies of a story (same canonical URL, same headline, or
+    MinHash-similar title + summary) collapse to the highest-weighted source
+    before the max_articles cut, so syndicated copies don't take slots.
+    """
+    deduped = dedupe_articles(articles)
+    if len(deduped) < len(articles):
+        log.info(f"   Near-duplicates collapsed: {len(articles)} → {len(deduped)} articles")
 
     deduped = deduped[:max_articles]
 
@@ -611,6 +1394,7 @@ def _build_digest(
             "total_x_posts":     len(x_posts),
             "top_bill_mentions": top_bills,
             "bill_mention_counts": bill_counts,
+            "trending_bills":    trending or [],
             "sources_scanned":   sources_scanned,
             "newsapi_status":    newsapi_status,
             "x_status":          x_status,
@@ -661,6 +1445,20 @@ optional env vars:
         "--dry-run", action="store_true",
         help="Scan and print summary but do not write media_digest.json",
     )
+    p.add_argument(
+        "--full-fetch", action="store_true",
+        help="Ignore cached ETag/Last-Modified and download every feed in full",
+    )
+    p.add_argument(
+        "--fetch-text", type=int, default=None, metavar="K",
+        help="Fetch and score the full text of the top K candidates "
+             "(default: config.yaml article_text; 0 disables)",
+    )
+    p.add_argument(
+        "--no-store", action="store_true",
+        help="Don't use the seen-article store: score every entry and build the "
+             "digest from this scan only",
+    )
     return p.parse_args()
 
 
@@ -677,27 +1475,82 @@ def main() -> None:
     tracked_bills = set(data["bills"].keys())
     log.info(f"   {len(tracked_bills)} tracked bill numbers loaded")
 
+    config  = _load_config()
+    model   = (config.get("scanner") or {}).get("relevance_model", "tfidf")
+    profile = _build_profile(data["bills"]) if model == "tfidf" else None
+    legislators = _build_legislator_index(data["bills"])
+    similar_k   = int((config.get("scanner") or {}).get("similar_bills_k", 3))
+
     # ── Scan RSS feeds ───────────────────────────────────────────────────────
-    log.info(f"→ Scanning {len(RSS_FEEDS)} RSS feeds (lookback: {args.lookback} days)...")
+    rss_feeds   = _load_feeds(config)
+    feed_health = _load_feed_health()
+    log.info(f"→ Scanning {len(rss_feeds)} RSS feeds (lookback: {args.lookback} days)...")
+    feed_state   = {} if args.full_fetch else _load_feed_state()
+    store        = None if args.no_store else ArticleStore()
+    known_before = len(store) if store is not None else 0
     rss_articles = _scan_rss_feeds(
-        RSS_FEEDS, tracked_bills, args.lookback, args.min_score
+        rss_feeds, tracked_bills, args.lookback, args.min_score,
+        feed_state=feed_state,
+        feed_health=feed_health,
+        health_settings=config.get("rss_health"),
+        store=store,
     )
 
     # ── Scan NewsAPI ─────────────────────────────────────────────────────────
     log.info("→ Scanning NewsAPI...")
     newsapi_articles, newsapi_status = _scan_newsapi(
-        tracked_bills, args.lookback, args.min_score
+        tracked_bills, args.lookback, args.min_score, store=store,
+        settings=config.get("newsapi"),
     )
 
     # ── Scan X API (stub) ────────────────────────────────────────────────────
     log.info("→ Scanning X API...")
     x_posts, x_status = _scan_x_api(tracked_bills, args.lookback)
 
+    # ── Full-text scoring (optional) ─────────────────────────────────────────
+    text_cfg = config.get("article_text") or {}
+    top_k    = args.fetch_text if args.fetch_text is not None else (
+        int(text_cfg.get("top_k", 0)) if text_cfg.get("enabled") else 0
+    )
+    cache = None
+    if top_k > 0 and store is None:
+        log.info("→ Full-text scoring needs the article store — skipped (--no-store)")
+    elif top_k > 0:
+        log.info(f"→ Scoring full text of top {top_k} candidate(s)...")
+        cache = text_cache()
+        _score_bodies(store, cache, tracked_bills, args.lookback, top_k)
+        # The cache isn't output: keep it even on --dry-run so no page is fetched twice
+        cache.save()
+
     # ── Combine and deduplicate ───────────────────────────────────────────────
-    all_articles  = rss_articles + newsapi_articles
-    all_articles.sort(key=lambda a: (-a["relevance_score"], a.get("published") or ""))
-    sources_scanned = [f["name"] for f in RSS_FEEDS]
-    if newsapi_status == "ok":
+    if store is not None:
+        log.info(
+            f"→ Article store: {len(store) - known_before} new, "
+            f"{known_before} previously seen ({STORE_FILE.name})"
+        )
+        all_articles = _articles_from_store(
+            store, tracked_bills, args.lookback, args.min_score,
+            profile=profile, legislators=legislators,
+        )
+    else:
+        all_articles = rss_articles + newsapi_articles
+        all_articles = _rescore_articles(
+            all_articles, args.min_score, profile=profile, legislators=legislators,
+        )
+        all_articles.sort(key=lambda a: (-a["relevance_score"], a.get("published") or ""))
+    if similar_k > 0 and all_articles:
+        _link_similar_bills(all_articles, build_bill_linker(data["bills"]), similar_k)
+    # ── Mention time series + trending bills ─────────────────────────────────
+    series = MentionSeries()
+    series.record_window(all_articles, date.today() - timedelta(days=args.lookback), date.today())
+    trending = _trending_bills(series, tracked_bills, config.get("trends"))
+    log.info(
+        f"→ Mention series: {len(series):,} day rows, "
+        f"{len(trending)} trending bill(s) ({SERIES_FILE.name})"
+    )
+
+    sources_scanned = [f["name"] for f in rss_feeds]
+    if newsapi_status in ("ok", "rate_limited", "quota_exhausted") or newsapi_articles:
         sources_scanned.append("NewsAPI")
 
     digest = _build_digest(
@@ -708,6 +1561,7 @@ def main() -> None:
         tracked_bills   = tracked_bills,
         lookback_days   = args.lookback,
         sources_scanned = sources_scanned,
+        trending        = trending,
     )
 
     # ── Print summary ─────────────────────────────────────────────────────────
@@ -719,6 +1573,10 @@ def main() -> None:
         print(f"  Top bills:       {', '.join(s['top_bill_mentions'][:5])}")
     else:
         print("  Top bills:       (none mentioned by name in coverage)")
+    if s["trending_bills"]:
+        print("  Trending:        " + ", ".join(
+            f"{t['bill_number']} (z {t['z']:.1f})" for t in s["trending_bills"][:5]
+        ))
 
     if digest["articles"]:
         print(f"\n  Top {min(5, len(digest['articles']))} articles by relevance:")
@@ -733,6 +1591,11 @@ def main() -> None:
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     OUTPUT_FILE.write_text(json.dumps(digest, indent=2, ensure_ascii=False), encoding="utf-8")
+    _save_feed_state(feed_state)
+    _save_feed_health(feed_health)
+    if store is not None:
+        store.save()
+    series.save()
     print(f"\n  ✓ Written to: {OUTPUT_FILE.relative_to(PROJECT_ROOT)}\n")
 
 
@@ -17,11 +17,18 @@ Client system:
     Default client: clients/csf/  (California Stewardship Fund)
     Add a client:   create clients/<slug>/client.yml + clients/<slug>/voices/default.md
     Select client:  --client <slug>
+    Several:        --client all  (or --client csf,cma)
     List clients:   --list-clients
 
+    With several clients, bills, digests, and editorial memory are loaded once,
+    each client's selection + Claude call runs concurrently (Claude calls share
+    one MAX_CLAUDE_CONCURRENCY limit), and the archive index is written once.
+
 Usage:
     .venv/bin/python agents/newsletter/newsletter_writer.py              # csf, dry-run
     .venv/bin/python agents/newsletter/newsletter_writer.py --client cma
+    .venv/bin/python agents/newsletter/newsletter_writer.py --client all   # every client, one process
+    .venv/bin/python agents/newsletter/newsletter_writer.py --sections     # outline, then sections in parallel
     .venv/bin/python agents/newsletter/newsletter_writer.py --send       # send to recipients
     .venv/bin/python agents/newsletter/newsletter_writer.py --list-clients
     .venv/bin/python agents/newsletter/newsletter_writer.py --bills path/to/bills.json
@@ -42,6 +49,9 @@ import logging
 import os
 import smtplib
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
@@ -64,7 +74,17 @@ from agents.shared.client_utils import (
     CLIENTS_DIR, DEFAULT_CLIENT, DEFAULT_VOICE,
     _load_client, _list_clients, _load_voice, _list_voices,
 )
+from agents.shared.action_classifier import classify_stage, parse_iso_date
 from agents.shared.bill_utils import _CRIT_KEYS, _select_bills, _build_bill_context
+from agents.shared.html_compact import GMAIL_CLIP_BYTES, compact_html
+from agents.shared.json_stream import JsonStreamParser, SchemaDeparture
+from agents.shared.smtp_outbox import SmtpSettings, send_via_outbox
+from agents.shared.token_ledger import (
+    TokenBudgetExceeded,
+    configure_ledger,
+    print_ledger_summary,
+    tracked_stream,
+)
 
 # ---------------------------------------------------------------------------
 # Logging
@@ -84,6 +104,15 @@ ARCHIVE_DIR    = PROJECT_ROOT / "docs" / "newsletters"
 ARCHIVE_JSON   = ARCHIVE_DIR / "archive.json"
 # CLIENTS_DIR, DEFAULT_CLIENT, DEFAULT_VOICE — imported from agents.shared.client_utils
 
+# ---------------------------------------------------------------------------
+# Concurrency (--client all)
+# ---------------------------------------------------------------------------
+
+MAX_CLIENT_WORKERS     = 4   # clients prepared + generated at once
+MAX_CLAUDE_CONCURRENCY = 3   # Claude calls in flight at once, across all clients
+
+_claude_slots = threading.BoundedSemaphore(MAX_CLAUDE_CONCURRENCY)
+
 # ---------------------------------------------------------------------------
 # Design constants
 # Inline styles only — Gmail and Outlook strip <style> blocks entirely.
@@ -236,7 +265,17 @@ def _build_archive_index(entries: list[dict]) -> None:
     (ARCHIVE_DIR / "index.html").write_text(index_html, encoding="utf-8")
 
 
-def _archive_newsletter(
+def _load_archive() -> list[dict]:
+    """Return docs/newsletters/archive.json entries (newest first), or [] if absent/unreadable."""
+    if not ARCHIVE_JSON.exists():
+        return []
+    try:
+        return json.loads(ARCHIVE_JSON.read_text(encoding="utf-8"))
+    except Exception:
+        return []
+
+
+def _archive_issue(
     html:           str,
     subject:        str,
     client_id:      str,
@@ -245,15 +284,12 @@ def _archive_newsletter(
     week_date:      str,
     filename:       str,
     featured_bills: list = None,
-) -> None:
+    preview_text:   str  = "",
+    story_beats:    list = None,
+) -> dict:
     """
-    Archive a completed newsletter to docs/newsletters/ for GitHub Pages hosting.
-
-    Copies the HTML file, updates docs/newsletters/archive.json, and regenerates
-    docs/newsletters/index.html so past issues are browsable at:
-        https://<user>.github.io/<repo>/newsletters/
-
-    Silently skips if the docs/ directory doesn't exist (e.g., fresh checkouts).
+    Copy one completed newsletter into docs/newsletters/<client>/ and return
+    its archive.json entry. _write_archive() records the entries.
 
     Args:
         html:           Full newsletter HTML string.
@@ -265,32 +301,18 @@ def _archive_newsletter(
         filename:       Newsletter filename (e.g. "newsletter_2026-W09.html").
         featured_bills: Bill numbers that appeared in this issue's watch list
                         (used for editorial memory in future issues).
+        preview_text:   Inbox preview line for the issue.
+        story_beats:    Flattened [line1, line2, reveal, ...] story headings.
+                        Stored so legislative_intel's anti-repetition step can
+                        read the last issue from archive.json instead of
+                        re-parsing the HTML.
     """
-    if not ARCHIVE_DIR.parent.exists():
-        log.debug("Archive skipped — docs/ directory not found")
-        return
-
-    # Copy HTML to per-client archive directory
     client_dir = ARCHIVE_DIR / client_id
     client_dir.mkdir(parents=True, exist_ok=True)
     dest = client_dir / filename
     dest.write_text(html, encoding="utf-8")
     log.info(f"   Archived → {dest.relative_to(PROJECT_ROOT)}")
-
-    # Load existing archive metadata
-    entries: list[dict] = []
-    if ARCHIVE_JSON.exists():
-        try:
-            entries = json.loads(ARCHIVE_JSON.read_text(encoding="utf-8"))
-        except Exception:
-            entries = []
-
-    # Upsert: remove any existing entry for the same week + client, then append
-    entries = [
-        e for e in entries
-        if not (e.get("week") == week_str and e.get("client_id") == client_id)
-    ]
-    entries.append({
+    return {
         "week":           week_str,
         "date":           week_date,
         "client_id":      client_id,
@@ -299,17 +321,31 @@ def _archive_newsletter(
         "filename":       filename,
         "path":           f"{client_id}/{filename}",
         "featured_bills": featured_bills or [],
-    })
+        "preview_text":   preview_text,
+        "story_beats":    story_beats or [],
+    }
+
+
+def _write_archive(new_entries: list[dict]) -> None:
+    """
+    Upsert entries into docs/newsletters/archive.json and regenerate
+    docs/newsletters/index.html once, so past issues are browsable at:
+        https://<user>.github.io/<repo>/newsletters/
+
+    An existing entry for the same week + client is replaced.
+    """
+    replaced = {(e["week"], e["client_id"]) for e in new_entries}
+    entries  = [
+        e for e in _load_archive()
+        if (e.get("week"), e.get("client_id")) not in replaced
+    ] + new_entries
     entries.sort(key=lambda e: (e.get("date", ""), e.get("week", "")), reverse=True)
 
-    # Write updated archive JSON
     ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
     ARCHIVE_JSON.write_text(
         json.dumps(entries, indent=2, ensure_ascii=False),
         encoding="utf-8",
     )
-
-    # Regenerate the archive index page
     _build_archive_index(entries)
     log.info(f"   Archive index → {(ARCHIVE_DIR / 'index.html').relative_to(PROJECT_ROOT)}")
 
@@ -318,21 +354,18 @@ def _archive_newsletter(
 # Editorial memory — recent coverage history
 # ---------------------------------------------------------------------------
 
-def _load_recent_coverage(client_id: str, n: int = 3) -> list[dict]:
+def _load_recent_coverage(client_id: str, n: int = 3, entries: list[dict] = None) -> list[dict]:
     """
     Return metadata from the last N newsletter issues for this client.
 
     Each entry has at minimum: week, date, subject, featured_bills (list of
-    bill numbers that appeared in that issue's watch list).
+    bill numbers that appeared in that issue's watch list). Pass `entries`
+    (from _load_archive()) to avoid re-reading archive.json per client.
 
     Returns [] if the archive doesn't exist or is unreadable.
     """
-    if not ARCHIVE_JSON.exists():
-        return []
-    try:
-        entries = json.loads(ARCHIVE_JSON.read_text(encoding="utf-8"))
-    except Exception:
-        return []
+    if entries is None:
+        entries = _load_archive()
     client_entries = [e for e in entries if e.get("client_id") == client_id]
     return client_entries[:n]
 
@@ -397,20 +430,60 @@ def _build_coverage_block(recent: list[dict], all_bills: dict) -> str:
 # Action digest loader (legislative_intel.py output)
 # ---------------------------------------------------------------------------
 
-def _load_digest() -> dict:
+def _load_digest(client_id: str = DEFAULT_CLIENT) -> dict:
     """
-    Load data/legislative/action_digest.json produced by legislative_intel.py.
+    Load the action digest produced by legislative_intel.py.
 
-    Returns an empty dict if the file is absent — the newsletter writer falls
+    Prefers the per-client action_digest_<client_id>.json written by
+    `legislative_intel.py --clients`, falling back to action_digest.json.
+    Returns an empty dict if neither exists — the newsletter writer falls
     back to its pre-digest behavior, so the pipeline is backward-compatible.
     """
+    return _read_digest(_digest_file(client_id))
+
+
+def _digest_file(client_id: str) -> Path:
+    """The client's own digest unless the shared one was generated more recently.
+
+    A --clients run writes action_digest_<client>.json; a later single-client
+    run only rewrites action_digest.json, leaving the per-client file stale.
+    """
+    client_file = DIGEST_FILE.with_name(f"action_digest_{client_id}.json")
+    if not client_file.exists():
+        return DIGEST_FILE
     if not DIGEST_FILE.exists():
+        return client_file
+    return client_file if _digest_generated(client_file) >= _digest_generated(DIGEST_FILE) else DIGEST_FILE
+
+
+def _digest_generated(path: Path) -> str:
+    """A digest's "generated" ISO timestamp ("" if unreadable)."""
+    try:
+        return str(json.loads(path.read_text(encoding="utf-8")).get("generated", ""))
+    except (OSError, ValueError):
+        return ""
+
+
+def _load_digests(client_ids: list[str]) -> dict[str, dict]:
+    """_load_digest() for several clients, reading each distinct digest file once."""
+    by_file = {}
+    for cid in client_ids:
+        by_file.setdefault(_digest_file(cid), []).append(cid)
+    digests = {}
+    for path, cids in by_file.items():
+        digest = _read_digest(path)
+        digests.update({cid: digest for cid in cids})
+    return digests
+
+
+def _read_digest(digest_file: Path) -> dict:
+    if not digest_file.exists():
         log.info("   No action_digest.json found — running without legislative intelligence layer")
         return {}
     try:
-        digest = json.loads(DIGEST_FILE.read_text(encoding="utf-8"))
+        digest = json.loads(digest_file.read_text(encoding="utf-8"))
         log.info(
-            f"   Digest loaded: {digest.get('week', '?')} | "
+            f"   Digest loaded ({digest_file.name}): {digest.get('week', '?')} | "
             f"urgent={len(digest.get('urgent', []))} | "
             f"moving={len(digest.get('moving', []))} | "
             f"amended={len(digest.get('amended', []))} | "
@@ -429,10 +502,13 @@ def _build_digest_context(digest: dict) -> str:
     Injected as the first section of the user prompt so Claude anchors the
     newsletter story to actual legislative activity rather than static bill lists.
 
-    Only includes non-empty buckets — keeps the prompt concise.
+    Only includes non-empty buckets — keeps the prompt concise. Hearing
+    countdowns are recomputed against today (the digest may be a few days
+    old) and missing stage labels are re-derived with the shared classifier.
     """
     if not digest:
         return ""
+    today = date.today()
 
     lines: list[str] = [
         "== THIS WEEK'S LEGISLATIVE ACTIVITY (factual spine — anchor your story here) =="
@@ -456,8 +532,10 @@ def _build_digest_context(digest: dict) -> str:
             lines.append(
                 f"  • {u['bill_number']}{wl}: {u['title'][:65]}"
             )
+            eligible   = parse_iso_date(u.get("eligible_date", ""))
+            days_until = (eligible - today).days if eligible else u.get("days_until", "?")
             lines.append(
-                f"    Eligible: {u['eligible_date']} ({u['days_until']} days) | "
+                f"    Eligible: {u['eligible_date']} ({days_until} days) | "
                 f"risk criteria: {u['risk_count']}/4"
             )
             committees = u.get("committees", [])
@@ -481,7 +559,11 @@ def _build_digest_context(digest: dict) -> str:
         lines += ["", "MOVING BILLS (advanced a legislative stage this week):"]
         for m in moving[:6]:
             wl = " [STAFF WATCHLIST]" if m.get("watchlist") else ""
-            stage = m.get("current_stage", "unknown").replace("_", " ")
+            advances = m.get("advance_actions", [])
+            stage = (
+                m.get("current_stage")
+                or (classify_stage(advances[0].get("description", "")) if advances else "unknown")
+            ).replace("_", " ")
             lines.append(f"  • {m['bill_number']}{wl}: {m['title'][:65]}")
             lines.append(f"    Stage: {stage} | risk criteria: {m['risk_count']}/4")
             for adv in m.get("advance_actions", [])[:1]:
@@ -588,6 +670,106 @@ USE THESE TERMS: "preempts local authority", "removes discretionary review", \
 AVOID: "controversial", "opponents say", "some argue", false balance\
 """
 
+# Shape of the JSON object _generate_content asks for — checked as it streams.
+_NEWSLETTER_SCHEMA = {
+    "subject":        {"type": str},
+    "preview_text":   {"type": str},
+    "dek":            {"type": str},
+    "story":          {"type": list, "count": 4, "item_keys": ("line1", "line2", "reveal", "body")},
+    "watch_items":    {"type": list, "item_keys": ("bill_number", "label", "one_line")},
+    "call_to_action": {"type": dict, "keys": ("heading", "body")},
+    "close":          {"type": dict, "keys": ("heading", "body")},
+}
+_FIELD_SPECS = {
+    "subject": """\
+"subject": A single compelling email subject line. \
+Formula: [specific threat or number] + [implication or tension]. \
+Make it the most alarming true thing from this issue. 8–14 words. \
+Ground it in this week's concrete activity (hearing date, bill passage, amendment). \
+Example: "Sacramento just introduced its opening argument. Your city is the rebuttal.\"""",
+    "preview_text": """\
+"preview_text": ~85 characters shown in Gmail/Apple Mail after the subject. \
+Complement — don't repeat — the subject. Create curiosity about what's inside. \
+Example: "Five bills. Three share the same objective. Once you see the pattern, you can't unsee it.\"""",
+    "dek": """\
+"dek": A 2–3 sentence standfirst paragraph. Answers "why does this matter to me right now?" \
+Sets the stakes before a single heading is read. Italic editorial voice. Not a summary — a hook. \
+Must compel the reader to continue.""",
+    "story": """\
+"story": An array of exactly 4 objects, each with:
+  "line1": First short declarative (2–5 words). The fact.
+  "line2": Second short declarative (2–5 words). The tension.
+  "reveal": Third line (2–6 words). The stakes — what it all means. \
+This is displayed in italic burnt orange. Make it the gut-punch. \
+Examples: "your city's infrastructure budget." / "who controls California's land." / "six days."
+  "body": One paragraph (3–5 sentences) of narrative prose. No bullet points. \
+Weave specific bill numbers and risk details into the prose naturally.""",
+    "watch_items": """\
+"watch_items": Array of objects for each watch-list bill, with:
+  "bill_number": e.g. "AB1751"
+  "author": last name only
+  "label": bill number + short title (e.g. "AB1751 — Missing Middle Townhome Act")
+  "one_line": One direct sentence. What it does + why it threatens local control. No hedging.
+  "flag": true for the single highest-priority bill this week, false for all others.""",
+    "call_to_action": """\
+"call_to_action": Object with:
+  "heading": Short editorial statement (5–8 words). Frame the action, don't just describe it.
+  "body": 2–3 sentences. One specific, time-bound action that serves all audiences. \
+Include the framing line: "This isn't about stopping housing — it's about who decides.\"""",
+    "close": """\
+"close": Object with:
+  "heading": 3–5 words. Tone: strategic confidence, not alarm.
+  "body": 2–3 sentences. Connect this week to the longer arc. End with resolve, not anxiety.""",
+}
+# --sections: a short outline call, then these sections as concurrent calls that
+# share it. Each section is checked against its own schema as it streams, and
+# the parts are assembled into the same dict _NEWSLETTER_SCHEMA describes.
+_OUTLINE_SCHEMA = {
+    "subject":      {"type": str},
+    "preview_text": {"type": str},
+    "dek":          {"type": str},
+    "anchor_facts": {"type": list},
+    "beats":        {"type": list, "count": 4, "item_keys": ("line1", "line2", "reveal", "thesis")},
+}
+_OUTLINE_SPECS = {
+    "anchor_facts": """\
+"anchor_facts": 3–5 short strings — the concrete facts this issue rests on (hearing dates, \
+votes, amendments, bill numbers), taken from the intelligence above. Every section is written from these.""",
+    "beats": """\
+"beats": An array of exactly 4 objects — the story's headings and what each paragraph will argue — each with:
+  "line1": First short declarative (2–5 words). The fact.
+  "line2": Second short declarative (2–5 words). The tension.
+  "reveal": Third line (2–6 words). The stakes — what it all means. \
+This is displayed in italic burnt orange. Make it the gut-punch.
+  "thesis": One sentence: the single point the paragraph under this heading makes, \
+naming the bills it will cite.""",
+}
+_STORY_BODIES_SPEC = """\
+"story": An array of exactly 4 objects, one per outline beat and in the same order, each with:
+  "body": One paragraph (3–5 sentences) of narrative prose that delivers that beat's thesis \
+under its heading. No bullet points. Weave specific bill numbers and risk details into the prose naturally."""
+
+# section → (schema, prompt specs, max_tokens)
+_SECTIONS = {
+    "story":   (
+        {"story": {"type": list, "count": 4, "item_keys": ("body",)}},
+        [_STORY_BODIES_SPEC],
+        2500,
+    ),
+    "watch":   (
+        {"watch_items": _NEWSLETTER_SCHEMA["watch_items"]},
+        [_FIELD_SPECS["watch_items"]],
+        1500,
+    ),
+    "closing": (
+        {k: _NEWSLETTER_SCHEMA[k] for k in ("call_to_action", "close")},
+        [_FIELD_SPECS["call_to_action"], _FIELD_SPECS["close"]],
+        800,
+    ),
+}
+
+_GENERATION_ATTEMPTS = 3   # total streamed attempts before giving up on off-schema output
+
 
 def _build_system_prompt(client: dict, voice_text: str = "") -> str:
     """Build the system prompt from client config + voice file.
@@ -617,30 +799,17 @@ def _build_system_prompt(client: dict, voice_text: str = "") -> str:
 
 
 
-def _generate_content(
-    bill_set:         dict,
-    anthropic_client: anthropic.Anthropic,
-    client_cfg:       dict,
-    voice_text:       str  = "",
-    digest:           dict = None,
-    recent_coverage:  list = None,
-    all_bills:        dict = None,
-) -> dict:
-    """Single Claude call returning all newsletter content as a structured dict.
+def _build_prompt_context(
+    bill_set:        dict,
+    digest:          dict,
+    recent_coverage: list = None,
+    all_bills:       dict = None,
+) -> str:
+    """The week's intelligence every generation prompt starts from.
 
-    Args:
-        bill_set:         Bills selected by _select_bills() — watch_list, new_bills, etc.
-        anthropic_client: Anthropic API client.
-        client_cfg:       Client brand + identity config.
-        voice_text:       Voice file content for tone/framing.
-        digest:           Action digest from legislative_intel.py (optional — falls back
-                          gracefully to pre-digest behavior if None or empty).
-        recent_coverage:  Last N archive entries for this client (editorial memory).
-        all_bills:        Full bill dict — used to surface unfeatured high-risk bills.
+    Digest block first (Claude uses it as the spine), then the watch list, new
+    bills, staff watchlist, anti-repetition and editorial-memory blocks.
     """
-    if digest is None:
-        digest = {}
-
     watch_ctx     = "\n\n".join(_build_bill_context(b) for b in bill_set["watch_list"])
     new_ctx       = "\n\n".join(_build_bill_context(b) for b in bill_set["new_bills"])
     watchlist_ctx = "\n\n".join(
@@ -654,32 +823,12 @@ def _generate_content(
     anti_rep_block  = _build_anti_repetition_block(digest)
     coverage_block  = _build_coverage_block(recent_coverage or [], all_bills or {})
 
-    # Story arc guidance — updated when digest is present to anchor [0] on real activity
-    arc_guidance = (
-        "The 4 paragraphs must tell a coherent story arc:\n"
-        "  [0] = START HERE: use the WEEK SUMMARY above as your factual anchor. What actually\n"
-        "        happened in the legislature this week + why it matters RIGHT NOW to your reader.\n"
-        "        Lead with the most urgent concrete fact — a hearing date, a bill that passed,\n"
-        "        an imminent eligibility deadline. Not a general preemption recap.\n"
-        "  [1] = How the specific bills listed above work together mechanically\n"
-        "  [2] = The deeper threat (usually the fee / budget / fiscal authority angle)\n"
-        "  [3] = Connects to the broader session pattern and the organization's mission"
-    ) if digest else (
-        "The 4 paragraphs must tell a coherent story arc:\n"
-        "  [0] = What happened this week and why it matters\n"
-        "  [1] = How these specific bills work together mechanically\n"
-        "  [2] = The deeper threat (usually the fee / budget angle)\n"
-        "  [3] = Connects to the broader session pattern and the organization's mission"
-    )
-
     # Digest section (injected first, before bill lists, so Claude uses it as the spine)
     digest_section = (
         f"{digest_ctx}\n\n" if digest_ctx else ""
     )
 
-    user_prompt = f"""\
-Here is this week's legislative intelligence. Write the newsletter as specified.
-
+    return f"""\
 {digest_section}\
 == HIGH-RISK WATCH LIST (strong/moderate on 2+ criteria) ==
 {watch_ctx if watch_ctx else "(No bills currently scored high-risk)"}
@@ -695,80 +844,201 @@ especially when they reinforce the broader session pattern.
 {anti_rep_block}
 {coverage_block}
 ---
+"""
 
-Return a JSON object with exactly these keys:
-
-"subject": A single compelling email subject line. \
-Formula: [specific threat or number] + [implication or tension]. \
-Make it the most alarming true thing from this issue. 8–14 words. \
-Ground it in this week's concrete activity (hearing date, bill passage, amendment). \
-Example: "Sacramento just introduced its opening argument. Your city is the rebuttal."
-
-"preview_text": ~85 characters shown in Gmail/Apple Mail after the subject. \
-Complement — don't repeat — the subject. Create curiosity about what's inside. \
-Example: "Five bills. Three share the same objective. Once you see the pattern, you can't unsee it."
 
-"dek": A 2–3 sentence standfirst paragraph. Answers "why does this matter to me right now?" \
-Sets the stakes before a single heading is read. Italic editorial voice. Not a summary — a hook. \
-Must compel the reader to continue.
+def _arc_guidance(digest: dict) -> str:
+    """Story arc guidance — anchors [0] on real activity when a digest is present."""
+    return (
+        "The 4 paragraphs must tell a coherent story arc:\n"
+        "  [0] = START HERE: use the WEEK SUMMARY above as your factual anchor. What actually\n"
+        "        happened in the legislature this week + why it matters RIGHT NOW to your reader.\n"
+        "        Lead with the most urgent concrete fact — a hearing date, a bill that passed,\n"
+        "        an imminent eligibility deadline. Not a general preemption recap.\n"
+        "  [1] = How the specific bills listed above work together mechanically\n"
+        "  [2] = The deeper threat (usually the fee / budget / fiscal authority angle)\n"
+        "  [3] = Connects to the broader session pattern and the organization's mission"
+    ) if digest else (
+        "The 4 paragraphs must tell a coherent story arc:\n"
+        "  [0] = What happened this week and why it matters\n"
+        "  [1] = How these specific bills work together mechanically\n"
+        "  [2] = The deeper threat (usually the fee / budget angle)\n"
+        "  [3] = Connects to the broader session pattern and the organization's mission"
+    )
 
-"story": An array of exactly 4 objects, each with:
-  "line1": First short declarative (2–5 words). The fact.
-  "line2": Second short declarative (2–5 words). The tension.
-  "reveal": Third line (2–6 words). The stakes — what it all means. \
-This is displayed in italic burnt orange. Make it the gut-punch. \
-Examples: "your city's infrastructure budget." / "who controls California's land." / "six days."
-  "body": One paragraph (3–5 sentences) of narrative prose. No bullet points. \
-Weave specific bill numbers and risk details into the prose naturally.
 
-{arc_guidance}
+def _json_request(specs: list[str]) -> str:
+    """The closing instruction block: one spec paragraph per key, then the JSON-only rule."""
+    return (
+        "Return a JSON object with exactly these keys:\n\n"
+        + "\n\n".join(specs)
+        + "\n\nReturn ONLY valid JSON. No markdown fences. No commentary outside the JSON object.\n"
+    )
 
-"watch_items": Array of objects for each watch-list bill, with:
-  "bill_number": e.g. "AB1751"
-  "author": last name only
-  "label": bill number + short title (e.g. "AB1751 — Missing Middle Townhome Act")
-  "one_line": One direct sentence. What it does + why it threatens local control. No hedging.
-  "flag": true for the single highest-priority bill this week, false for all others.
 
-"call_to_action": Object with:
-  "heading": Short editorial statement (5–8 words). Frame the action, don't just describe it.
-  "body": 2–3 sentences. One specific, time-bound action that serves all audiences. \
-Include the framing line: "This isn't about stopping housing — it's about who decides."
+def _generate_content(
+    bill_set:         dict,
+    anthropic_client: anthropic.Anthropic,
+    client_cfg:       dict,
+    voice_text:       str  = "",
+    digest:           dict = None,
+    recent_coverage:  list = None,
+    all_bills:        dict = None,
+    tag:              str  = "",
+) -> dict:
+    """Single streamed Claude call returning all newsletter content as a structured dict.
 
-"close": Object with:
-  "heading": 3–5 words. Tone: strategic confidence, not alarm.
-  "body": 2–3 sentences. Connect this week to the longer arc. End with resolve, not anxiety.
+    Args:
+        bill_set:         Bills selected by _select_bills() — watch_list, new_bills, etc.
+        anthropic_client: Anthropic API client.
+        client_cfg:       Client brand + identity config.
+        voice_text:       Voice file content for tone/framing.
+        digest:           Action digest from legislative_intel.py (optional — falls back
+                          gracefully to pre-digest behavior if None or empty).
+        recent_coverage:  Last N archive entries for this client (editorial memory).
+        all_bills:        Full bill dict — used to surface unfeatured high-risk bills.
+        tag:              Log prefix (e.g. "[cma] ") when several clients run at once.
+    """
+    if digest is None:
+        digest = {}
 
-Return ONLY valid JSON. No markdown fences. No commentary outside the JSON object.
-"""
+    specs = [_FIELD_SPECS[k] for k in _NEWSLETTER_SCHEMA]
+    specs.insert(specs.index(_FIELD_SPECS["story"]) + 1, _arc_guidance(digest))
+    user_prompt = (
+        "Here is this week's legislative intelligence. Write the newsletter as specified.\n\n"
+        + _build_prompt_context(bill_set, digest, recent_coverage, all_bills)
+        + "\n"
+        + _json_request(specs)
+    )
 
     system_prompt = _build_system_prompt(client_cfg, voice_text)
-    log.info("→ Calling Claude to generate newsletter content...")
-    message = anthropic_client.messages.create(
+    log.info(f"→ {tag}Calling Claude to generate newsletter content (streaming)...")
+    return _stream_json(
+        anthropic_client,
+        _NEWSLETTER_SCHEMA,
+        tag=tag,
         model="claude-sonnet-4-6",
         max_tokens=4500,   # increased from 3000 — digest context grows the response
         system=system_prompt,
         messages=[{"role": "user", "content": user_prompt}],
     )
 
-    raw = message.content[0].text.strip()
-    # Strip markdown fences (Claude sometimes wraps JSON in ```json ... ```)
-    if raw.startswith("```"):
-        raw = raw.split("\n", 1)[1] if "\n" in raw else raw[3:]
-        raw = raw.rsplit("```", 1)[0].strip()
 
-    # Claude occasionally emits trailing commas before } or ] — strip them.
-    import re as _re
-    cleaned = _re.sub(r",\s*([}\]])", r"\1", raw)
+def _generate_content_sections(
+    bill_set:         dict,
+    anthropic_client: anthropic.Anthropic,
+    client_cfg:       dict,
+    voice_text:       str  = "",
+    digest:           dict = None,
+    recent_coverage:  list = None,
+    all_bills:        dict = None,
+    tag:              str  = "",
+) -> dict:
+    """Outline first, then the story bodies, watch items, and CTA/close concurrently.
+
+    Same arguments and return value as _generate_content(). The outline call
+    is short (subject, preview, dek, anchor facts, and the four beats'
+    headings + theses); each _SECTIONS call then gets the same intelligence
+    plus that outline, so wall-clock time is roughly the outline plus the
+    slowest section rather than one long completion. Section calls share
+    _claude_slots with every other Claude call in the process.
+    """
+    if digest is None:
+        digest = {}
+
+    context       = _build_prompt_context(bill_set, digest, recent_coverage, all_bills)
+    system_prompt = _build_system_prompt(client_cfg, voice_text)
+    model         = "claude-sonnet-4-6"
 
-    try:
-        return json.loads(cleaned)
-    except json.JSONDecodeError as exc:
-        log.error(
-            f"Claude returned invalid JSON (stop_reason={message.stop_reason}): {exc}\n"
-            f"Raw response (first 500 chars): {raw[:500]}"
+    outline_specs = [_FIELD_SPECS[k] for k in ("subject", "preview_text", "dek")] + [
+        _OUTLINE_SPECS["anchor_facts"], _OUTLINE_SPECS["beats"], _arc_guidance(digest),
+    ]
+    log.info(f"→ {tag}Calling Claude for the issue outline (streaming)...")
+    outline = _stream_json(
+        anthropic_client,
+        _OUTLINE_SCHEMA,
+        tag=tag,
+        model=model,
+        max_tokens=1200,
+        system=system_prompt,
+        messages=[{"role": "user", "content": (
+            "Here is this week's legislative intelligence. Outline this week's newsletter "
+            "as specified — the sections will be written from your outline.\n\n"
+            + context + "\n" + _json_request(outline_specs)
+        )}],
+    )
+
+    section_context = (
+        "Here is this week's legislative intelligence and the outline for this week's "
+        "newsletter. Write only the section requested, consistent with the outline.\n\n"
+        + context
+        + "\n== ISSUE OUTLINE ==\n"
+        + json.dumps(outline, indent=2, ensure_ascii=False)
+        + "\n\n"
+    )
+    log.info(f"→ {tag}Calling Claude for {len(_SECTIONS)} sections concurrently (streaming)...")
+    with ThreadPoolExecutor(max_workers=len(_SECTIONS)) as pool:
+        futures = {
+            name: pool.submit(
+                _stream_json,
+                anthropic_client,
+                schema,
+                tag=f"{tag}[{name}] ",
+                model=model,
+                max_tokens=max_tokens,
+                system=system_prompt,
+                messages=[{"role": "user", "content": section_context + _json_request(specs)}],
+            )
+            for name, (schema, specs, max_tokens) in _SECTIONS.items()
+        }
+        sections = {name: fut.result() for name, fut in futures.items()}
+
+    return {
+        "subject":        outline["subject"],
+        "preview_text":   outline["preview_text"],
+        "dek":            outline["dek"],
+        "story":          [
+            {"line1": beat["line1"], "line2": beat["line2"], "reveal": beat["reveal"], "body": part["body"]}
+            for beat, part in zip(outline["beats"], sections["story"]["story"])
+        ],
+        "watch_items":    sections["watch"]["watch_items"],
+        "call_to_action": sections["closing"]["call_to_action"],
+        "close":          sections["closing"]["close"],
+    }
+
+
+def _stream_json(anthropic_client: anthropic.Anthropic, schema: dict, tag: str = "", **kwargs) -> dict:
+    """Stream one Claude call through JsonStreamParser; retry early on schema departure.
+
+    Each attempt holds one of the shared _claude_slots while it streams, so
+    concurrent clients never have more than MAX_CLAUDE_CONCURRENCY calls in
+    flight. Logs each top-level key (prefixed with `tag`) as it completes. A
+    response that departs from the schema (prose before the JSON, an unknown
+    key, a malformed story beat, a truncated object) is abandoned the moment
+    it does, and the call is retried up to _GENERATION_ATTEMPTS times in
+    total.
+    """
+    for attempt in range(1, _GENERATION_ATTEMPTS + 1):
+        started = time.perf_counter()
+        parser  = JsonStreamParser(
+            schema,
+            on_value=lambda key, _: log.info(f"   {tag}✓ {key:<15} {time.perf_counter() - started:5.1f}s"),
         )
-        raise
+        try:
+            with _claude_slots:
+                started = time.perf_counter()
+                message = tracked_stream(anthropic_client, "newsletter_writer", on_text=parser.feed, **kwargs)
+            if message.stop_reason == "max_tokens":
+                log.warning(f"   {tag}⚠ Response hit max_tokens")
+            return parser.finish()
+        except SchemaDeparture as exc:
+            log.warning(
+                f"   {tag}⚠ Attempt {attempt}/{_GENERATION_ATTEMPTS}: response left the schema after "
+                f"{time.perf_counter() - started:.1f}s ({parser.chars:,} chars) — {exc}"
+            )
+            if attempt == _GENERATION_ATTEMPTS:
+                log.error(f"Raw response (first 500 chars): {parser.text[:500]}")
+                raise
 
 
 # ---------------------------------------------------------------------------
@@ -1031,11 +1301,38 @@ def _build_html(content: dict, bill_set: dict, week_label: str, client_cfg: dict
 # Email delivery
 # ---------------------------------------------------------------------------
 
-def _send_email(html: str, subject: str, newsletter_name: str = "Newsletter") -> bool:
-    """Send the newsletter via Gmail SMTP with STARTTLS."""
+def _recipients_var(client_id: str, shared_ok: bool) -> str:
+    """Environment variable holding `client_id`'s recipient list.
+
+    NEWSLETTER_RECIPIENTS_<SLUG> (e.g. NEWSLETTER_RECIPIENTS_CMA) when it is
+    set. The shared NEWSLETTER_RECIPIENTS only stands in when shared_ok — a
+    single-client run — so `--client all --send` never mails one list every
+    client's issue.
+    """
+    own = "NEWSLETTER_RECIPIENTS_" + "".join(c if c.isalnum() else "_" for c in client_id.upper())
+    if os.environ.get(own, "").strip() or not shared_ok:
+        return own
+    return "NEWSLETTER_RECIPIENTS"
+
+
+def _send_email(
+    html:            str,
+    subject:         str,
+    newsletter_name: str = "Newsletter",
+    recipients_var:  str = "NEWSLETTER_RECIPIENTS",
+) -> bool:
+    """Send the newsletter via Gmail SMTP with STARTTLS to the list in `recipients_var`.
+
+    The HTML is compacted for sending only — the saved and archived copies
+    stay readable. Styles stay inline (see Design constants); an issue has
+    no tables to cut, so an over-size one is sent with a warning.
+
+    Each recipient gets their own copy through the on-disk outbox
+    (agents/shared/smtp_outbox.py). True only if every recipient got it.
+    """
     smtp_user      = os.environ.get("EMAIL_USER",            "").strip()
     smtp_pass      = os.environ.get("EMAIL_PASSWORD",        "").strip()
-    recipients_raw = os.environ.get("NEWSLETTER_RECIPIENTS", "").strip()
+    recipients_raw = os.environ.get(recipients_var,          "").strip()
 
     if not smtp_user:
         log.error("Email not sent: EMAIL_USER not set.")
@@ -1044,7 +1341,7 @@ def _send_email(html: str, subject: str, newsletter_name: str = "Newsletter") ->
         log.error("Email not sent: EMAIL_PASSWORD not set.")
         return False
     if not recipients_raw:
-        log.error("Email not sent: NEWSLETTER_RECIPIENTS not set.")
+        log.error(f"Email not sent: {recipients_var} not set.")
         return False
 
     recipients = [r.strip() for r in recipients_raw.split(",") if r.strip()]
@@ -1058,23 +1355,22 @@ def _send_email(html: str, subject: str, newsletter_name: str = "Newsletter") ->
     msg = MIMEMultipart("alternative")
     msg["Subject"] = subject
     msg["From"]    = f"{newsletter_name} <{smtp_user}>"
-    msg["To"]      = ", ".join(recipients)
+    html, size = compact_html(html)
+    log.info(f"   HTML: {size.before:,} bytes → {size.after:,} compacted")
+    if size.after > GMAIL_CLIP_BYTES:
+        log.warning(f"   ⚠ {size.after:,} bytes is over Gmail's ~102 KB clip — the end will be hidden")
+
     msg.attach(MIMEText(plain, "plain", "utf-8"))
     msg.attach(MIMEText(html,  "html",  "utf-8"))
 
     smtp_host = "smtp.gmail.com"
     smtp_port = 587
+    settings  = SmtpSettings(host=smtp_host, port=smtp_port, user=smtp_user, password=smtp_pass)
 
     try:
         log.info(f"→ Sending to {len(recipients)} recipient(s) via {smtp_host}:{smtp_port}...")
-        with smtplib.SMTP(smtp_host, smtp_port, timeout=30) as server:
-            server.ehlo()
-            server.starttls()
-            server.ehlo()
-            server.login(smtp_user, smtp_pass)
-            server.sendmail(smtp_user, recipients, msg.as_bytes())
-        log.info(f"   ✓ Sent to: {', '.join(recipients)}")
-        return True
+        report = send_via_outbox(msg, smtp_user, recipients, settings, logger=log)
+        return report.ok
     except smtplib.SMTPAuthenticationError:
         log.error(
             "Authentication failed. For Gmail, use an App Password — "
@@ -1103,25 +1399,36 @@ examples:
   # Generate for a specific client
   python agents/newsletter/newsletter_writer.py --client cma
 
+  # Generate every configured client (or a list) in one process
+  python agents/newsletter/newsletter_writer.py --client all
+  python agents/newsletter/newsletter_writer.py --client csf,cma
+
   # Generate and send to NEWSLETTER_RECIPIENTS
   python agents/newsletter/newsletter_writer.py --client csf --send
 
+  # Several clients: each is sent to its own NEWSLETTER_RECIPIENTS_<SLUG>
+  python agents/newsletter/newsletter_writer.py --client all --send
+
   # List all configured clients
   python agents/newsletter/newsletter_writer.py --list-clients
 
   # List voices available for a client
   python agents/newsletter/newsletter_writer.py --client csf --list-voices
 
+  # Outline first, then write the sections concurrently (lower wall-clock time)
+  python agents/newsletter/newsletter_writer.py --sections
+
   # Override lookback window or bill data source
   python agents/newsletter/newsletter_writer.py --lookback 7
   python agents/newsletter/newsletter_writer.py --bills data/bills/tracked_bills.json
         """,
     )
     p.add_argument(
-        "--client", type=str, default=DEFAULT_CLIENT,
+        "--client", type=str, default=DEFAULT_CLIENT, metavar="SLUG|all|SLUG,SLUG",
         help=(
             f"Client to generate content for (default: '{DEFAULT_CLIENT}'). "
             f"Must match a directory in clients/<name>/. "
+            f"'all' or a comma-separated list generates several clients in one run. "
             f"Run --list-clients to see all configured clients."
         ),
     )
@@ -1146,7 +1453,9 @@ examples:
         help=(
             "Send the newsletter to NEWSLETTER_RECIPIENTS via Gmail SMTP. "
             "Requires EMAIL_USER, EMAIL_PASSWORD, and NEWSLETTER_RECIPIENTS "
-            "environment variables. Without this flag, generates HTML only."
+            "environment variables; with several clients, each client's list "
+            "comes from NEWSLETTER_RECIPIENTS_<SLUG> instead. "
+            "Without this flag, generates HTML only."
         ),
     )
     p.add_argument(
@@ -1157,78 +1466,82 @@ examples:
         "--lookback", type=int, default=14,
         help="Days to look back when identifying new bills (default: 14)",
     )
+    p.add_argument(
+        "--budget", type=int, default=None, metavar="TOKENS",
+        help=(
+            "Abort before a Claude call would take this run past TOKENS total "
+            "tokens (default: CSF_TOKEN_BUDGET, or unlimited)."
+        ),
+    )
+    p.add_argument(
+        "--sections", action="store_true", default=False,
+        help=(
+            "Generate in sections: one short outline call, then the story bodies, "
+            "watch items, and CTA/close as concurrent calls that share it."
+        ),
+    )
+    p.add_argument(
+        "--concurrency", type=int, default=MAX_CLAUDE_CONCURRENCY, metavar="N",
+        help=(
+            f"Maximum Claude calls in flight at once across all clients "
+            f"(default: {MAX_CLAUDE_CONCURRENCY})."
+        ),
+    )
     return p.parse_args()
 
 
-def main() -> None:
-    args = _parse_args()
+def _resolve_clients(spec: str) -> list[str]:
+    """--client value → client slugs: 'all', 'csf', or 'csf,cma'."""
+    if spec == "all":
+        return _list_clients()
+    return list(dict.fromkeys(c.strip() for c in spec.split(",") if c.strip()))
 
-    # ── --list-clients: print available clients and exit ─────────────────────
-    if args.list_clients:
-        clients = _list_clients()
-        if clients:
-            print("\n  Available clients (clients/):\n")
-            for c in clients:
-                marker = " ← default" if c == DEFAULT_CLIENT else ""
-                print(f"    {c}{marker}")
-            print(f"\n  Usage: --client <name>   e.g. --client cma\n")
-        else:
-            print(f"\n  No client directories found in {CLIENTS_DIR}\n")
-        sys.exit(0)
 
-    api_key = os.environ.get("ANTHROPIC_API_KEY")
-    if not api_key:
-        log.error("ANTHROPIC_API_KEY not set. Add it to .env or your environment.")
-        sys.exit(1)
+def _set_claude_concurrency(n: int) -> None:
+    global _claude_slots
+    _claude_slots = threading.BoundedSemaphore(max(1, n))
 
-    # ── Load client config ────────────────────────────────────────────────────
-    client_cfg      = _load_client(args.client)
-    client_id       = client_cfg.get("slug", args.client)
-    client_name     = client_cfg.get("client_name", client_id)
-    newsletter_name = client_cfg.get("newsletter", {}).get("name", f"{client_name} Legislative Intelligence")
 
-    print(f"\n  {newsletter_name} — Newsletter Writer")
-    print("  " + "─" * (len(newsletter_name) + 20))
+def _newsletter_name(client_cfg: dict) -> str:
+    client_name = client_cfg.get("client_name", client_cfg.get("slug", ""))
+    return client_cfg.get("newsletter", {}).get("name", f"{client_name} Legislative Intelligence")
 
-    # ── Resolve voice ─────────────────────────────────────────────────────────
-    voices_dir = CLIENTS_DIR / client_id / "voices"
-    voice_name = args.voice or client_cfg.get("default_voice", DEFAULT_VOICE)
 
-    # ── --list-voices: print voices for selected client and exit ──────────────
-    if args.list_voices:
-        voices = _list_voices(voices_dir)
-        if voices:
-            default_v = client_cfg.get("default_voice", DEFAULT_VOICE)
-            print(f"\n  Available voices for '{client_id}' (clients/{client_id}/voices/):\n")
-            for v in voices:
-                marker = " ← default" if v == default_v else ""
-                print(f"    {v}{marker}")
-            print(f"\n  Usage: --voice <name>   e.g. --voice urgent\n")
-        else:
-            print(f"\n  No voice files found in {voices_dir}\n")
-        sys.exit(0)
+def _write_issue(
+    client_id:        str,
+    bills:            dict,
+    digest:           dict,
+    archive_entries:  list[dict],
+    anthropic_client: anthropic.Anthropic,
+    voice:            str  = None,
+    lookback:         int  = 14,
+    tag:              str  = "",
+    sectioned:        bool = False,
+) -> dict:
+    """
+    One client's issue: bill selection, Claude generation, HTML render, and
+    outputs/clients/<slug>/newsletter/newsletter_<week>.html.
 
-    voice_text = _load_voice(voice_name, voices_dir)
+    Reads shared inputs only (bills, digest, archive entries), so several
+    clients can run concurrently. Returns the issue — client_name,
+    newsletter_name, subject, preview_text, html, out_path, and its archive
+    entry fields under "archive" — for the caller to archive and send.
+    """
+    client_cfg  = _load_client(client_id)
+    client_id   = client_cfg.get("slug", client_id)
+    client_name = client_cfg.get("client_name", client_id)
 
-    # ── Load bill data ──────────────────────────────────────────────────────
-    bills_path = args.bills or BILLS_FILE
-    log.info(f"→ Loading {bills_path.name}...")
-    data  = json.loads(bills_path.read_text())
-    bills = data["bills"]
-    log.info(f"   {len(bills)} bills loaded")
+    voices_dir = CLIENTS_DIR / client_id / "voices"
+    voice_text = _load_voice(voice or client_cfg.get("default_voice", DEFAULT_VOICE), voices_dir)
 
-    # ── Load editorial memory (recent coverage history) ─────────────────────
-    log.info("→ Loading editorial memory (recent coverage)...")
-    recent_coverage   = _load_recent_coverage(client_id, n=3)
+    # ── Editorial memory + this week's developments ─────────────────────────
+    recent_coverage   = _load_recent_coverage(client_id, n=3, entries=archive_entries)
     recently_featured = {b for e in recent_coverage for b in e.get("featured_bills", [])}
-    recently_featured_log = ", ".join(sorted(recently_featured)) or "(none)"
-    log.info(f"   Recent issues: {len(recent_coverage)} | Featured bills: {recently_featured_log}")
-
-    # ── Load legislative intelligence digest (optional — graceful fallback) ─
-    log.info("→ Loading legislative intelligence digest...")
-    digest = _load_digest()
-
-    # Build the set of bills with new developments this week (overrides featured penalty)
+    log.info(
+        f"   {tag}Recent issues: {len(recent_coverage)} | "
+        f"Featured bills: {', '.join(sorted(recently_featured)) or '(none)'}"
+    )
+    # Bills with new developments this week (overrides featured penalty)
     recently_active = {
         m["bill_number"] for m in digest.get("moving", [])
     } | {
@@ -1236,23 +1549,24 @@ def main() -> None:
     }
 
     # ── Select bills for this issue ─────────────────────────────────────────
-    log.info("→ Selecting bills for this issue...")
     bill_set = _select_bills(
         bills,
-        lookback_days=args.lookback,
+        lookback_days=lookback,
         max_watch=5,
         max_new=4,
         recently_featured=recently_featured,
         recently_active=recently_active,
     )
-    log.info(f"   Watch list:        {len(bill_set['watch_list'])} bills")
-    log.info(f"   New this week:     {len(bill_set['new_bills'])} bills")
-    log.info(f"   Upcoming hearings: {len(bill_set['upcoming_hearings'])}")
-    log.info(f"   Staff watchlist:   {len(bill_set.get('watchlist_bills', []))} bills")
+    log.info(
+        f"   {tag}Watch list: {len(bill_set['watch_list'])} | "
+        f"New: {len(bill_set['new_bills'])} | "
+        f"Hearings: {len(bill_set['upcoming_hearings'])} | "
+        f"Staff watchlist: {len(bill_set.get('watchlist_bills', []))}"
+    )
 
     # ── Generate content via Claude ─────────────────────────────────────────
-    anthropic_client = anthropic.Anthropic(api_key=api_key)
-    content = _generate_content(
+    generate = _generate_content_sections if sectioned else _generate_content
+    content  = generate(
         bill_set,
         anthropic_client,
         client_cfg,
@@ -1260,18 +1574,11 @@ def main() -> None:
         digest,
         recent_coverage=recent_coverage,
         all_bills=bills,
+        tag=tag,
     )
-    log.info("   ✓ Content generated")
-
-    # ── Print email metadata ─────────────────────────────────────────────────
-    subject      = content.get("subject", newsletter_name)
-    preview_text = content.get("preview_text", "")
-    print(f"\n  Client:       {client_name}")
-    print(f"  Subject:      {subject}")
-    print(f"  Preview text: {preview_text[:85]}{'…' if len(preview_text) > 85 else ''}")
+    log.info(f"   {tag}✓ Content generated")
 
     # ── Render and write HTML ───────────────────────────────────────────────
-    log.info("→ Rendering HTML...")
     week_label = "WEEK OF " + date.today().strftime("%B %-d, %Y").upper()
     html       = _build_html(content, bill_set, week_label, client_cfg)
 
@@ -1281,35 +1588,196 @@ def main() -> None:
     out_path = output_dir / f"newsletter_{iso_week}.html"
     out_path.write_text(html, encoding="utf-8")
 
-    print(f"\n  ✓ Written to: {out_path.relative_to(PROJECT_ROOT)}")
+    newsletter_name = _newsletter_name(client_cfg)
+    subject         = content.get("subject", newsletter_name)
+    preview_text    = content.get("preview_text", "")
+    return {
+        "client_name":     client_name,
+        "newsletter_name": newsletter_name,
+        "subject":         subject,
+        "preview_text":    preview_text,
+        "html":            html,
+        "out_path":        out_path,
+        "archive": {
+            "subject":        subject,
+            "client_id":      client_id,
+            "client_name":    client_name,
+            "week_str":       iso_week,
+            "week_date":      date.today().isoformat(),
+            "filename":       out_path.name,
+            "featured_bills": [
+                item.get("bill_number", "") for item in content.get("watch_items", [])
+                if item.get("bill_number")
+            ],
+            "preview_text":   preview_text,
+            "story_beats":    [
+                beat
+                for p in content.get("story", [])
+                for beat in (p.get("line1", ""), p.get("line2", ""), p.get("reveal", ""))
+                if beat
+            ],
+        },
+    }
 
-    # ── Archive to docs/newsletters/ (GitHub Pages) ─────────────────────────
-    log.info("→ Archiving to docs/newsletters/...")
-    week_date      = date.today().isoformat()
-    featured_bills = [
-        item.get("bill_number", "") for item in content.get("watch_items", [])
-        if item.get("bill_number")
-    ]
-    _archive_newsletter(
-        html=html,
-        subject=subject,
-        client_id=client_id,
-        client_name=client_name,
-        week_str=iso_week,
-        week_date=week_date,
-        filename=out_path.name,
-        featured_bills=featured_bills,
+
+def run_clients(
+    client_ids:       list[str],
+    anthropic_client: anthropic.Anthropic,
+    bills:            dict,
+    voice:            str  = None,
+    lookback:         int  = 14,
+    max_workers:      int  = MAX_CLIENT_WORKERS,
+    sectioned:        bool = False,
+) -> tuple[dict[str, dict], dict[str, str]]:
+    """
+    Write issues for several clients from one load of the shared inputs.
+
+    Digests and archive.json are read once; each client's selection and
+    Claude call run concurrently (Claude calls are further limited by
+    _claude_slots). Successful issues are archived together and the archive
+    index is rebuilt once. Returns ({client: issue}, {client: error}) in
+    client_ids order; a client that fails for any reason (token budget,
+    off-schema output after retries, API error, missing client config)
+    doesn't stop the others or keep their issues out of the archive. With
+    several clients an unknown slug fails outright rather than falling back
+    to the default client's config.
+    """
+    log.info("→ Loading editorial memory and legislative intelligence digests...")
+    archive_entries = _load_archive()
+    digests         = _load_digests(client_ids)
+
+    tags  = {cid: (f"[{cid}] " if len(client_ids) > 1 else "") for cid in client_ids}
+    known = set(_list_clients()) if len(client_ids) > 1 else set(client_ids)
+    log.info(
+        f"→ Writing {len(client_ids)} issue(s) "
+        f"({min(max_workers, len(client_ids))} concurrent)..."
+    )
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(client_ids)))) as pool:
+        futures = {
+            cid: pool.submit(
+                _write_issue, cid, bills, digests[cid], archive_entries, anthropic_client,
+                voice, lookback, tags[cid], sectioned,
+            )
+            for cid in client_ids if cid in known
+        }
+        issues, failed = {}, {}
+        for cid in client_ids:
+            if cid not in futures:
+                failed[cid] = f"unknown client — no clients/{cid}/client.yml"
+            else:
+                try:
+                    issues[cid] = futures[cid].result()
+                    continue
+                except (TokenBudgetExceeded, SchemaDeparture) as exc:
+                    failed[cid] = str(exc)
+                except SystemExit as exc:       # _load_client exits when no config loads
+                    failed[cid] = f"client config not loaded (exit {exc.code})"
+                except Exception as exc:
+                    failed[cid] = f"{type(exc).__name__}: {exc}"
+            log.error(f"{tags[cid]}Newsletter not written: {failed[cid]}")
+
+    if issues and ARCHIVE_DIR.parent.exists():
+        log.info("→ Archiving to docs/newsletters/...")
+        _write_archive([_archive_issue(html=i["html"], **i["archive"]) for i in issues.values()])
+    elif issues:
+        log.debug("Archive skipped — docs/ directory not found")
+    return issues, failed
+
+
+def main() -> None:
+    args = _parse_args()
+
+    # ── --list-clients: print available clients and exit ─────────────────────
+    if args.list_clients:
+        clients = _list_clients()
+        if clients:
+            print("\n  Available clients (clients/):\n")
+            for c in clients:
+                marker = " ← default" if c == DEFAULT_CLIENT else ""
+                print(f"    {c}{marker}")
+            print(f"\n  Usage: --client <name>   e.g. --client cma  (or --client all)\n")
+        else:
+            print(f"\n  No client directories found in {CLIENTS_DIR}\n")
+        sys.exit(0)
+
+    client_ids = _resolve_clients(args.client)
+    if not client_ids:
+        log.error(f"No clients found for --client {args.client}")
+        sys.exit(1)
+
+    # ── --list-voices: print voices for the selected client(s) and exit ──────
+    if args.list_voices:
+        for client_id in client_ids:
+            client_cfg = _load_client(client_id)
+            voices_dir = CLIENTS_DIR / client_id / "voices"
+            voices     = _list_voices(voices_dir)
+            if voices:
+                default_v = client_cfg.get("default_voice", DEFAULT_VOICE)
+                print(f"\n  Available voices for '{client_id}' (clients/{client_id}/voices/):\n")
+                for v in voices:
+                    marker = " ← default" if v == default_v else ""
+                    print(f"    {v}{marker}")
+            else:
+                print(f"\n  No voice files found in {voices_dir}")
+        print(f"\n  Usage: --voice <name>   e.g. --voice urgent\n")
+        sys.exit(0)
+
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if not api_key:
+        log.error("ANTHROPIC_API_KEY not set. Add it to .env or your environment.")
+        sys.exit(1)
+
+    if len(client_ids) == 1:
+        title = _newsletter_name(_load_client(client_ids[0]))
+    else:
+        title = f"{len(client_ids)} clients ({', '.join(client_ids)})"
+    print(f"\n  {title} — Newsletter Writer")
+    print("  " + "─" * (len(title) + 20))
+
+    # ── Load bill data (once for every client) ──────────────────────────────
+    bills_path = args.bills or BILLS_FILE
+    log.info(f"→ Loading {bills_path.name}...")
+    data  = json.loads(bills_path.read_text())
+    bills = data["bills"]
+    log.info(f"   {len(bills)} bills loaded")
+
+    # ── Generate, render, and archive ───────────────────────────────────────
+    configure_ledger(budget=args.budget)
+    _set_claude_concurrency(args.concurrency)
+    anthropic_client = anthropic.Anthropic(api_key=api_key)
+    issues, failed = run_clients(
+        client_ids,
+        anthropic_client,
+        bills,
+        voice=args.voice,
+        lookback=args.lookback,
+        sectioned=args.sections,
     )
+    print_ledger_summary()
+
+    for issue in issues.values():
+        preview_text = issue["preview_text"]
+        print(f"\n  Client:       {issue['client_name']}")
+        print(f"  Subject:      {issue['subject']}")
+        print(f"  Preview text: {preview_text[:85]}{'…' if len(preview_text) > 85 else ''}")
+        print(f"  ✓ Written to: {issue['out_path'].relative_to(PROJECT_ROOT)}")
 
     # ── Send or report dry-run status ───────────────────────────────────────
     if args.send:
-        ok = _send_email(html, subject, newsletter_name)
-        if not ok:
-            sys.exit(1)
-    else:
+        for cid, issue in issues.items():
+            var = _recipients_var(cid, shared_ok=len(client_ids) == 1)
+            if not _send_email(issue["html"], issue["subject"], issue["newsletter_name"], var):
+                failed.setdefault(cid, "send failed")
+    elif issues:
         print(f"\n  (Dry-run — HTML only. Use --send to email NEWSLETTER_RECIPIENTS.)")
-        print(f"\n  Open in browser:\n    file://{out_path}\n")
+        print(f"\n  Open in browser:")
+        for issue in issues.values():
+            print(f"    file://{issue['out_path']}")
+        print()
 
+    if failed:
+        log.error(f"Failed: {', '.join(failed)}")
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
@@ -82,6 +82,12 @@ from agents.shared.client_utils import (
     DEFAULT_CLIENT,
     DEFAULT_VOICE,
 )
+from agents.shared.token_ledger import (
+    TokenBudgetExceeded,
+    configure_ledger,
+    print_ledger_summary,
+    tracked_create,
+)
 
 load_dotenv(PROJECT_ROOT / ".env", override=True)
 
@@ -134,6 +140,14 @@ def _load_media_digest(path: Path | None = None) -> dict | None:
         return None
 
 
+def _related_bills(article: dict, limit: int = 3) -> list[str]:
+    """Bills linked to an article by author, committee, or similarity (not named in it)."""
+    return [
+        l["bill_number"] for l in article.get("bill_links", [])
+        if l.get("via") != "bill_number"
+    ][:limit]
+
+
 def _format_media_context(digest: dict | None) -> str:
     """Format media digest into a Claude-readable context block for op-ed framing."""
     if not digest:
@@ -149,6 +163,8 @@ def _format_media_context(digest: dict | None) -> str:
         "== NEWS & MEDIA CONTEXT (past 7 days) ==",
         "Use these stories as potential news pegs or evidence for the argument.",
         "Hook into the most relevant story if it strengthens local control framing.",
+        "\"Related\" bills are matched by author, committee, or subject — the story",
+        "doesn't name them, so verify the connection before citing it.",
         "",
     ]
     for a in articles:
@@ -157,9 +173,11 @@ def _format_media_context(digest: dict | None) -> str:
         title        = a.get("title", "")
         pub          = a.get("published", "")
         bills        = a.get("bill_mentions", [])
+        related      = _related_bills(a)
         blurb        = a.get("summary", "")[:200]
         bill_str     = f"  [bills: {', '.join(bills)}]" if bills else ""
-        lines.append(f"  [{score:.1f}] {source} | {pub} | {title}{bill_str}")
+        rel_str      = f"  [related: {', '.join(related)}]" if related else ""
+        lines.append(f"  [{score:.1f}] {source} | {pub} | {title}{bill_str}{rel_str}")
         if blurb:
             lines.append(f"       Summary: {blurb}")
 
@@ -168,6 +186,13 @@ def _format_media_context(digest: dict | None) -> str:
         lines.append("")
         lines.append(f"Bills getting the most media attention: {', '.join(top_bills[:5])}")
 
+    trending = summary.get("trending_bills", [])
+    if trending:
+        lines.append(
+            "Bills trending in coverage (spiking above their usual level): "
+            + ", ".join(f"{t['bill_number']} ({t['mentions']} mentions)" for t in trending[:5])
+        )
+
     return "\n".join(lines)
 
 
@@ -443,7 +468,9 @@ CRITICAL RULES:
     system_prompt = _build_system_prompt(voice_text, client_cfg or {}, format_type, target)
 
     log.info(f"→ Calling Claude ({model}) to draft {format_type} for {anchor_bill['bill_number']}...")
-    message = anthropic_client.messages.create(
+    message = tracked_create(
+        anthropic_client,
+        "oped_writer",
         model=model,
         max_tokens=3000,
         system=system_prompt,
@@ -972,6 +999,11 @@ examples:
         "--dry-run", action="store_true", default=False,
         help="Generate content and print to stdout but do not write output files.",
     )
+    p.add_argument(
+        "--budget", type=int, default=None, metavar="TOKENS",
+        help="Abort before a Claude call would take this run past TOKENS total tokens "
+             "(default: CSF_TOKEN_BUDGET, or unlimited).",
+    )
     return p.parse_args()
 
 
@@ -1082,19 +1114,26 @@ def main() -> None:
             log.info("→ No media digest found — proceeding without news context")
 
     # ── Generate content via Claude ───────────────────────────────────────────
+    configure_ledger(budget=args.budget)
     anthropic_client = anthropic.Anthropic(api_key=api_key)
-    content = _generate_content(
-        anchor_bill      = anchor_bill,
-        supporting_bills = supporting_bills,
-        anthropic_client = anthropic_client,
-        media_digest     = media_digest,
-        voice_text       = voice_text,
-        client_cfg       = client_cfg,
-        format_type      = args.format,
-        target           = args.target,
-        news_peg         = args.peg,
-    )
+    try:
+        content = _generate_content(
+            anchor_bill      = anchor_bill,
+            supporting_bills = supporting_bills,
+            anthropic_client = anthropic_client,
+            media_digest     = media_digest,
+            voice_text       = voice_text,
+            client_cfg       = client_cfg,
+            format_type      = args.format,
+            target           = args.target,
+            news_peg         = args.peg,
+        )
+    except TokenBudgetExceeded as exc:
+        log.error(f"Token budget exceeded — aborting: {exc}")
+        print_ledger_summary()
+        sys.exit(1)
     log.info("   ✓ Draft generated")
+    print_ledger_summary()
 
     # ── Print summary ─────────────────────────────────────────────────────────
     headlines = content.get("headline_options", [])
@@ -0,0 +1,179 @@
+"""
+action_classifier.py — Memoized legislative action classification + date parsing.
+
+Provides classify_action, classify_stage, is_routing_action, is_amendment_action,
+parse_ca_date, parse_iso_date, and the shared ActionTraits tuple.
+
+Action descriptions repeat heavily across bills ("Referred to Com. on H. & C.D.",
+"From printer. May be heard in committee March 7."), and the same handful of
+status/action dates recur across the whole store. Everything here is keyed on
+the raw string and LRU-cached, so each distinct description is lowercased and
+matched once per process no matter how many bills or passes consume it.
+
+Stage matching uses one precompiled alternation per stage, checked in the same
+priority order as the original substring cascade (enacted first, "other" last),
+so labels are unchanged. Shared by legislative_intel, email_sender (stalled
+logic), and newsletter_writer (digest context).
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+
+# ---------------------------------------------------------------------------
+# Patterns
+# ---------------------------------------------------------------------------
+
+# Regex: parse "May be heard in committee March 7" from action text
+HEARING_RE = re.compile(
+    r"may be heard in committee\s+([A-Za-z]+ \d{1,2})",
+    re.IGNORECASE,
+)
+
+# Action description keywords indicating amendments
+AMEND_KEYWORDS = ["amended", "amend,", "amendment"]
+
+# Cross-chamber / routing-step statuses — don't flag as "stalled"
+ROUTING_PATTERNS = [
+    "in senate",
+    "in assembly",
+    "to com. on rls. for assignment",
+    "read first time. to com",
+    "to com. on rls",
+]
+
+# One alternation per stage, in priority order. Patterns run against the
+# lowercased description; lookahead pairs express "contains A and B".
+_STAGE_PATTERNS: list[tuple[str, re.Pattern]] = [
+    ("enacted",            re.compile(r"signed by governor|chaptered")),
+    ("cross_chamber",      re.compile(
+        r"ordered to the (?:senate|assembly)"
+        r"|^(?=[\s\S]*in senate)(?=[\s\S]*read first time)"
+        r"|^(?=[\s\S]*in assembly)(?=[\s\S]*read first time)"
+    )),
+    ("floor_passage",      re.compile(r"^(?=[\s\S]*read third time)(?=[\s\S]*passed)")),
+    ("floor_reading",      re.compile(r"read third time|ordered to third reading")),
+    ("floor_progression",  re.compile(r"read second time")),
+    ("committee_passage",  re.compile(r"do pass|pass as amended")),
+    ("committee_referral", re.compile(r"referred to com")),
+    ("introduced",         re.compile(r"introduced|read first time")),
+]
+
+_AMEND_RE   = re.compile("|".join(re.escape(k) for k in AMEND_KEYWORDS))
+_ROUTING_RE = re.compile("|".join(re.escape(p) for p in ROUTING_PATTERNS))
+
+_MONTHS = {
+    name.lower(): i
+    for i, names in enumerate(
+        [("January", "Jan"), ("February", "Feb"), ("March", "Mar"), ("April", "Apr"),
+         ("May", "May"), ("June", "Jun"), ("July", "Jul"), ("August", "Aug"),
+         ("September", "Sep"), ("October", "Oct"), ("November", "Nov"), ("December", "Dec")],
+        start=1,
+    )
+    for name in names
+}
+_CA_DATE_RE = re.compile(r"([A-Za-z]+)\s+(\d{1,2})")
+
+
+# ---------------------------------------------------------------------------
+# Action classification
+# ---------------------------------------------------------------------------
+
+class ActionTraits(NamedTuple):
+    """Everything the digest buckets need to know about one action description."""
+    stage:        str
+    is_amendment: bool
+    is_routing:   bool
+    hearing_text: Optional[str]   # "March 7" from "May be heard in committee March 7"
+
+
+@lru_cache(maxsize=8192)
+def classify_action(description: str) -> ActionTraits:
+    """Classify an action description once; repeat descriptions hit the cache."""
+    dl = description.lower()
+    stage = "other"
+    for label, pattern in _STAGE_PATTERNS:
+        if pattern.search(dl):
+            stage = label
+            break
+    hearing = HEARING_RE.search(description) if "may be heard in committee" in dl else None
+    return ActionTraits(
+        stage        = stage,
+        is_amendment = _AMEND_RE.search(dl) is not None,
+        is_routing   = _ROUTING_RE.search(dl) is not None,
+        hearing_text = hearing.group(1) if hearing else None,
+    )
+
+
+def classify_stage(description: str) -> str:
+    """Return a stage label for an action description."""
+    return classify_action(description).stage
+
+
+def is_routing_action(description: str) -> bool:
+    """Return True if this action is a standard routing step (not a real stall)."""
+    return classify_action(description).is_routing
+
+
+def is_amendment_action(description: str) -> bool:
+    """Return True if the description records an amendment."""
+    return classify_action(description).is_amendment
+
+
+# ---------------------------------------------------------------------------
+# Date parsing
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=4096)
+def parse_iso_date(date_str: str) -> Optional[date]:
+    """Parse a YYYY-MM-DD string; None on failure. Memoized by string."""
+    try:
+        return date.fromisoformat(date_str)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_ca_date(date_str: str, today: Optional[date] = None) -> Optional[date]:
+    """
+    Parse a California legislative date string like "March 7" or "Jan 14".
+
+    Assumes the current year. If the result is more than 30 days in the past
+    (e.g., a December date encountered in January), uses next year.
+    Returns None on parse failure. Cached per (date_str, today).
+    """
+    if not date_str:
+        return None
+    return _parse_ca_date_cached(date_str, today or date.today())
+
+
+@lru_cache(maxsize=2048)
+def _parse_ca_date_cached(date_str: str, today: date) -> Optional[date]:
+    date_str = date_str.strip().rstrip(".")
+
+    # Fast path: "<Month> <day>" resolved with a dict lookup instead of strptime
+    m = _CA_DATE_RE.fullmatch(date_str)
+    month = _MONTHS.get(m.group(1).lower()) if m else None
+    if month:
+        try:
+            candidate = date(today.year, month, int(m.group(2)))
+            if candidate < today - timedelta(days=30):
+                candidate = date(today.year + 1, month, int(m.group(2)))
+            return candidate
+        except ValueError:
+            pass   # e.g. Feb 29 — let strptime decide, exactly as before
+
+    # Include the year in the parse string to avoid Python 3.15 ambiguity warning
+    for fmt in ("%Y %B %d", "%Y %b %d"):
+        try:
+            candidate = datetime.strptime(f"{today.year} {date_str}", fmt).date()
+            if candidate < today - timedelta(days=30):
+                candidate = datetime.strptime(f"{today.year + 1} {date_str}", fmt).date()
+            return candidate
+        except ValueError:
+            continue
+
+    return None
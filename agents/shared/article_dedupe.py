@@ -0,0 +1,318 @@
+"""
+article_dedupe.py — URL canonicalization + near-duplicate news article clustering.
+
+Provides canonical_url, article_signature, near_duplicate_clusters, and
+dedupe_articles.
+
+The same story reaches media_scanner several times: Google News wraps the
+publisher link in a redirect, CalMatters pieces are republished by other
+outlets, and NewsAPI returns syndicated copies with lightly edited headlines.
+Exact URL/title matching misses all of these, so every copy takes a slot in
+the digest.
+
+canonical_url() strips tracking parameters, fragments, and AMP suffixes and
+unwraps redirect wrappers, so trivially different links collapse to one key.
+Articles are then fingerprinted with MinHash over title words + bigrams and
+the lead of the summary (multiply-shift hashing, vectorized with numpy when it
+is installed, identical pure-Python fallback otherwise), and clustered with LSH
+banding: each article is hashed into `bands` buckets and compared only with
+the first article that landed in the same bucket, so clustering stays linear
+in the number of articles no matter how many feeds or queries are added.
+
+Word overlap can't tell "Senate passes SB 79" from "Newsom signs SB 79", or
+a bill that would "limit" local control from one that would "expand" it —
+one changed word in a short headline still leaves ~0.65 similarity. Two
+headlines that each carry a different legislative-action or direction word
+(_EVENT_WORDS) are different stories whatever their overlap, and an
+identical title only counts on its own when it is long enough not to be a
+generic label ("Opinion", "Letters to the editor").
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import html
+import random
+import re
+from collections import defaultdict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+try:
+    import numpy as np
+except ImportError:   # optional — pure-Python signatures are identical, just slower
+    np = None
+
+
+# ---------------------------------------------------------------------------
+# Tunables
+# ---------------------------------------------------------------------------
+
+DUPLICATE_THRESHOLD = 0.6    # estimated Jaccard over title + summary-lead features;
+                             # edited syndicated copies land at 0.65–0.8
+NUM_PERM            = 128    # MinHash signature length
+LSH_BANDS           = 32     # 32 bands × 4 rows → LSH threshold ≈ (1/32)^(1/4) ≈ 0.42,
+                             # well under DUPLICATE_THRESHOLD so candidates aren't missed
+SUMMARY_LEAD_WORDS  = 30     # summary words that count toward the fingerprint
+MIN_FEATURES        = 3      # below this, only exact URL/title matches cluster
+MIN_TITLE_WORDS     = 4      # content words a title needs to match on its own
+
+# Query parameters that never change which article a URL points to
+_TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "igshid", "mc_cid", "mc_eid",
+    "oc", "ocid", "cmpid", "ref", "ref_src", "smid", "sr_share", "taid",
+    "_ga", "mkt_tok", "spm", "outputtype", "cid", "share",
+}
+_TRACKING_PREFIXES = ("utm_", "at_", "pk_")
+
+# Redirect wrappers: host → query parameter holding the real URL
+_REDIRECT_PARAMS = {
+    "www.google.com":   ("url", "q"),
+    "google.com":       ("url", "q"),
+    "news.google.com":  ("url",),
+    "l.facebook.com":   ("u",),
+    "t.co":             (),
+}
+
+_GOOGLE_NEWS_ARTICLE_RE = re.compile(r"^/(?:rss/)?articles/([A-Za-z0-9_-]+)")
+_EMBEDDED_URL_RE        = re.compile(rb"https?://[\x21-\x7e]+")
+
+_MASK_64 = (1 << 64) - 1
+_SEED    = 20260301   # fixed so signatures are stable across runs
+_rng     = random.Random(_SEED)
+# Multiply-shift hash family h(x) = ((a·x + b) mod 2^64) >> 32, a odd.
+_PERM_A  = [_rng.randrange(1, 1 << 64) | 1 for _ in range(NUM_PERM)]
+_PERM_B  = [_rng.randrange(0, 1 << 64) for _ in range(NUM_PERM)]
+if np is not None:
+    _NP_A = np.array(_PERM_A, dtype=np.uint64)[:, None]
+    _NP_B = np.array(_PERM_B, dtype=np.uint64)[:, None]
+
+_WORD_RE   = re.compile(r"[a-z0-9]+")
+# Trailing " - Publisher" / " | Publisher" that aggregators append to headlines
+_PUBLISHER_SUFFIX_RE = re.compile(r"\s+[-|–—]\s+[^-|–—]{2,40}$")
+_STOPWORDS = frozenset(
+    "a an the of in to for on and or at by with from as is are be was were "
+    "into over its it s u this that after new says".split()
+)
+# Legislative stages and policy directions — headlines differing in these are different events
+_EVENT_WORDS = frozenset("""
+    introduce introduces introduced pass passes passed approve approves approved
+    advance advances advanced sign signs signed veto vetoes vetoed kill kills killed
+    reject rejects rejected block blocks blocked stall stalls stalled shelve shelves shelved
+    amend amends amended repeal repeals repealed delay delays delayed uphold upholds upheld
+    overturn overturns overturned strike strikes struck sue sues sued
+    limit limits limited expand expands expanded restrict restricts restricted
+    ban bans banned lift lifts lifted raise raises raised cut cuts
+    support supports oppose opposes opposed
+    weaken weakens strengthen strengthens
+""".split())
+
+
+# ---------------------------------------------------------------------------
+# URL canonicalization
+# ---------------------------------------------------------------------------
+
+def _decode_google_news_id(article_id: str) -> str | None:
+    """Return the publisher URL embedded in a legacy Google News article id.
+
+    Older ids are base64 protobufs that carry the URL verbatim; current
+    "AU_yqL…" ids are opaque and return None (the id itself is then used as
+    the canonical key).
+    """
+    try:
+        raw = base64.urlsafe_b64decode(article_id + "=" * (-len(article_id) % 4))
+    except (ValueError, TypeError):
+        return None
+    m = _EMBEDDED_URL_RE.search(raw)
+    return m.group(0).decode("ascii", "ignore") if m else None
+
+
+def canonical_url(url: str) -> str:
+    """Normalize a news URL to a stable dedupe key.
+
+    Unwraps redirect wrappers (Google, Google News, Facebook), lowercases the
+    scheme and host, drops "www.", fragments, tracking parameters, AMP
+    suffixes, and trailing slashes, and sorts the remaining query string.
+    Returns "" for empty input.
+    """
+    if not url:
+        return ""
+    url = html.unescape(url.strip())
+
+    for _ in range(3):   # wrappers can nest (google.com/url → news.google.com)
+        parts = urlsplit(url)
+        host  = parts.netloc.lower()
+        query = dict(parse_qsl(parts.query))
+        inner = next((query[k] for k in _REDIRECT_PARAMS.get(host, ()) if query.get(k)), None)
+        if inner and inner.startswith("http"):
+            url = inner
+            continue
+        if host == "news.google.com":
+            m = _GOOGLE_NEWS_ARTICLE_RE.match(parts.path)
+            if m:
+                decoded = _decode_google_news_id(m.group(1))
+                if decoded:
+                    url = decoded
+                    continue
+                return f"https://news.google.com/articles/{m.group(1)}"
+        break
+
+    parts = urlsplit(url)
+    host  = parts.netloc.lower().removeprefix("www.")
+    path  = re.sub(r"/amp/?$", "", parts.path) or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in _TRACKING_PARAMS and not k.lower().startswith(_TRACKING_PREFIXES)
+    )
+    return urlunsplit((parts.scheme.lower() or "https", host, path, urlencode(query), ""))
+
+
+# ---------------------------------------------------------------------------
+# Fingerprints
+# ---------------------------------------------------------------------------
+
+def _normalized_title(title: str) -> str:
+    return _PUBLISHER_SUFFIX_RE.sub("", html.unescape(title or "")).strip().lower()
+
+
+def _title_words(title: str) -> list[str]:
+    return [w for w in _WORD_RE.findall(_normalized_title(title)) if w not in _STOPWORDS]
+
+
+def _different_events(words_a: set[str], words_b: set[str]) -> bool:
+    """True when each title has an action / direction word the other lacks."""
+    return bool((words_a - words_b) & _EVENT_WORDS) and bool((words_b - words_a) & _EVENT_WORDS)
+
+
+def _features(title: str, summary: str) -> set[int]:
+    """Hashed title unigrams + bigrams and summary-lead unigrams."""
+    t_words = _title_words(title)
+    s_words = [
+        w for w in _WORD_RE.findall(html.unescape(summary or "").lower())
+        if w not in _STOPWORDS
+    ][:SUMMARY_LEAD_WORDS]
+    grams = set(t_words) | {f"{a} {b}" for a, b in zip(t_words, t_words[1:])} | set(s_words)
+    return {
+        int.from_bytes(hashlib.blake2b(g.encode(), digest_size=8).digest(), "big")
+        for g in grams
+    }
+
+
+def _minhash(features: set[int]) -> tuple[int, ...]:
+    """NUM_PERM-slot MinHash of a hashed feature set (multiply-shift family)."""
+    if np is not None:
+        x = np.fromiter(features, dtype=np.uint64, count=len(features))[None, :]
+        with np.errstate(over="ignore"):
+            return tuple(((_NP_A * x + _NP_B) >> np.uint64(32)).min(axis=1).tolist())
+    return tuple(
+        min((((a * f + b) & _MASK_64) >> 32) for f in features)
+        for a, b in zip(_PERM_A, _PERM_B)
+    )
+
+
+def _signature_similarity(sig_a: tuple[int, ...], sig_b: tuple[int, ...]) -> float:
+    """Estimate Jaccard similarity as the fraction of matching signature slots."""
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / len(sig_a)
+
+
+def article_signature(article: dict) -> tuple[int, ...] | None:
+    """MinHash signature of an article's title + summary lead; None if too thin."""
+    feats = _features(article.get("title", ""), article.get("summary", ""))
+    return _minhash(feats) if len(feats) >= MIN_FEATURES else None
+
+
+# ---------------------------------------------------------------------------
+# Clustering
+# ---------------------------------------------------------------------------
+
+def near_duplicate_clusters(
+    articles: list[dict],
+    threshold: float = DUPLICATE_THRESHOLD,
+    bands: int = LSH_BANDS,
+) -> list[list[int]]:
+    """Group article indices that are the same story.
+
+    Articles join a cluster when they share a canonical URL, a normalized
+    title of at least MIN_TITLE_WORDS content words, or an LSH bucket with
+    estimated similarity ≥ threshold and no conflicting action word in their
+    titles. Each bucket is only checked against its first member, so work is
+    O(n × bands). Returns clusters (lists of indices, ascending) in order of
+    first index.
+    """
+    parent = list(range(len(articles)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i: int, j: int) -> None:
+        ri, rj = find(i), find(j)
+        if ri != rj:
+            parent[max(ri, rj)] = min(ri, rj)
+
+    rows = NUM_PERM // bands
+    first_seen: dict[tuple, int] = {}
+    signatures: dict[int, tuple[int, ...]] = {}
+    titles:     dict[int, set[str]] = {}
+
+    for i, a in enumerate(articles):
+        titles[i]  = set(_title_words(a.get("title", "")))
+        exact_keys = [("url", a.get("canonical_url") or canonical_url(a.get("url", "")))]
+        if len(titles[i]) >= MIN_TITLE_WORDS:
+            exact_keys.append(("title", _normalized_title(a.get("title", ""))))
+        for key in exact_keys:
+            if not key[1]:
+                continue
+            if key in first_seen:
+                union(first_seen[key], i)
+            else:
+                first_seen[key] = i
+
+        sig = article_signature(a)
+        if sig is None:
+            continue
+        signatures[i] = sig
+        for band in range(bands):
+            key = ("lsh", band, sig[band * rows:(band + 1) * rows])
+            j = first_seen.setdefault(key, i)
+            if (j != i and find(i) != find(j)
+                    and _signature_similarity(sig, signatures[j]) >= threshold
+                    and not _different_events(titles[i], titles[j])):
+                union(j, i)
+
+    groups: dict[int, list[int]] = defaultdict(list)
+    for i in range(len(articles)):
+        groups[find(i)].append(i)
+    return [groups[r] for r in sorted(groups)]
+
+
+def dedupe_articles(
+    articles: list[dict],
+    threshold: float = DUPLICATE_THRESHOLD,
+) -> list[dict]:
+    """Collapse near-duplicate articles, keeping the best copy of each story.
+
+    The kept copy is the one from the highest-weighted source (source_weight),
+    then the highest relevance_score, then the earliest in input order. It
+    gains also_reported_by: the other sources carrying the story. Output keeps
+    the input order of the kept copies.
+    """
+    kept: list[tuple[int, dict]] = []
+    for cluster in near_duplicate_clusters(articles, threshold):
+        best = min(
+            cluster,
+            key=lambda i: (
+                -articles[i].get("source_weight", 1.0),
+                -articles[i].get("relevance_score", 0.0),
+                i,
+            ),
+        )
+        others = sorted({articles[i].get("source", "") for i in cluster if i != best}
+                        - {articles[best].get("source", "")})
+        kept.append((best, {**articles[best], "also_reported_by": others}))
+    kept.sort(key=lambda p: p[0])
+    return [a for _, a in kept]
@@ -0,0 +1,112 @@
+"""
+article_store.py — Rolling store of every news article media_scanner has seen.
+
+Provides ArticleStore and STORE_FILE.
+
+Records are keyed by canonical URL (article_dedupe.canonical_url) and hold
+what scoring needs so an article is only ever scored once:
+
+    canonical_url, url, title, summary, source, source_type, source_weight,
+    published, first_seen, last_seen,
+    bill_mentions_all   — every bill number in title + summary (unfiltered)
+    keyword_score       — topic-keyword part of the relevance score
+
+Bill mentions are stored unfiltered so the relevance score can be recomputed
+against the *current* tracked-bill list at digest time without re-reading the
+text.
+
+On disk the store is append-only JSONL (data/media/article_store.jsonl, one
+record per line, later lines win). It is read into an in-memory index by
+canonical URL. save() appends only new or changed records, and rewrites
+(compacts) the file once stale lines outnumber live ones or when records age
+past the retention window. JSONL keeps the file diffable in the commits the
+social workflow makes to data/media/.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+STORE_FILE   = PROJECT_ROOT / "data" / "media" / "article_store.jsonl"
+
+RETENTION_DAYS = 120    # records older than this (by last_seen) are dropped on compaction
+
+log = logging.getLogger(__name__)
+
+
+class ArticleStore:
+    """In-memory index over the append-only article JSONL file."""
+
+    def __init__(self, path: Path = STORE_FILE):
+        self.path = path
+        self._records: dict[str, dict] = {}
+        self._dirty:   dict[str, None] = {}   # ordered set
+        self._lines = 0
+        if path.exists():
+            for line in path.read_text(encoding="utf-8").splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    rec = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self._lines += 1
+                if rec.get("canonical_url"):
+                    self._records[rec["canonical_url"]] = rec
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, canonical_url: str) -> bool:
+        return canonical_url in self._records
+
+    def get(self, canonical_url: str) -> Optional[dict]:
+        return self._records.get(canonical_url)
+
+    def add(self, record: dict) -> None:
+        """Insert a newly scored record (must carry canonical_url)."""
+        self._records[record["canonical_url"]] = record
+        self._dirty[record["canonical_url"]] = None
+
+    def touch(self, canonical_url: str, seen: date) -> None:
+        """Mark an existing record as seen again on `seen`."""
+        rec = self._records[canonical_url]
+        if rec.get("last_seen") != seen.isoformat():
+            rec["last_seen"] = seen.isoformat()
+            self._dirty[canonical_url] = None
+
+    def in_window(self, since: date) -> list[dict]:
+        """Records published (or, if undated, first seen) on or after `since`."""
+        cutoff = since.isoformat()
+        return [
+            r for r in self._records.values()
+            if (r.get("published") or r.get("first_seen") or "") >= cutoff
+        ]
+
+    def save(self, today: Optional[date] = None, retention_days: int = RETENTION_DAYS) -> None:
+        """Persist changes: append dirty records, or compact when worthwhile."""
+        today   = today or date.today()
+        cutoff  = (today - timedelta(days=retention_days)).isoformat()
+        expired = [k for k, r in self._records.items() if (r.get("last_seen") or "") < cutoff]
+        for k in expired:
+            del self._records[k]
+            self._dirty.pop(k, None)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if expired or self._lines + len(self._dirty) > 2 * len(self._records):
+            with open(self.path, "w", encoding="utf-8") as f:
+                for rec in self._records.values():
+                    f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+            self._lines = len(self._records)
+            log.info(f"   Article store compacted: {len(self._records)} records ({len(expired)} expired)")
+        elif self._dirty:
+            with open(self.path, "a", encoding="utf-8") as f:
+                for k in self._dirty:
+                    f.write(json.dumps(self._records[k], ensure_ascii=False) + "\n")
+            self._lines += len(self._dirty)
+        self._dirty.clear()
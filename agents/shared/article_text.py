@@ -0,0 +1,232 @@
+"""
+article_text.py — Full-article fetch + readability-style main-text extraction.
+
+Provides extract_main_text, fetch_article_text, fetch_article_texts,
+is_transient, is_unresolvable, text_cache, cache_record, and TEXT_CACHE_FILE.
+
+RSS summaries are often a sentence or less (Google News sends only the
+headline), so a tracked bill discussed in the body never earns a mention. This
+module downloads the article page and pulls out the main text the way
+Readability does: boilerplate elements (nav, header, footer, asides, share and
+newsletter widgets) are dropped, every paragraph scores its parent and
+grandparent by length and comma count, and the container with the best score
+after a link-density penalty is taken as the article body.
+
+Extracted text is cached by canonical URL in data/media/article_text.jsonl,
+using the same append-only ArticleStore format as the seen-article store, so a
+page is downloaded at most once across runs. Failed fetches are cached too
+(with their status) so a dead link isn't retried every scan — except
+transient ones (network errors, 408 / 429, 5xx), which are left uncached so
+the next scan tries again.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import requests
+from bs4 import BeautifulSoup
+
+from agents.shared.article_store import ArticleStore
+
+PROJECT_ROOT    = Path(__file__).resolve().parent.parent.parent
+TEXT_CACHE_FILE = PROJECT_ROOT / "data" / "media" / "article_text.jsonl"
+
+# ---------------------------------------------------------------------------
+# Tunables
+# ---------------------------------------------------------------------------
+
+FETCH_MAX_WORKERS     = 6
+FETCH_CONNECT_TIMEOUT = 5           # seconds
+FETCH_READ_TIMEOUT    = 15          # seconds
+MAX_PAGE_BYTES        = 3_000_000   # skip anything larger (PDFs, galleries)
+MAX_TEXT_CHARS        = 12_000      # cached text is truncated to this
+MIN_PARAGRAPH_CHARS   = 25          # shorter blocks are captions, bylines, buttons
+MIN_BODY_CHARS        = 200         # less than this → "empty" (paywall, JS-only page)
+
+_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; CSF-MediaScanner/1.0; "
+                  "+https://github.com/twgonzalez/csf-agents)",
+    "Accept":     "text/html,application/xhtml+xml;q=0.9,*/*;q=0.5",
+}
+
+# Hosts whose article links only redirect via JavaScript — fetching them
+# returns the aggregator's page, not the story.
+_UNRESOLVABLE_HOSTS = {"news.google.com"}
+
+_BOILERPLATE_TAGS = [
+    "script", "style", "noscript", "template", "svg", "iframe", "form",
+    "nav", "header", "footer", "aside", "button", "select", "figure",
+]
+_NEGATIVE_RE = re.compile(
+    r"comment|share|social|related|promo|newsletter|subscribe|sidebar|"
+    r"footer|masthead|menu|breadcrumb|advert|sponsor|(?<![a-z])ads?(?![a-z])|popup|modal|cookie",
+    re.IGNORECASE,
+)
+_POSITIVE_RE = re.compile(r"article|body|content|entry|main|post|story|text", re.IGNORECASE)
+_BLOCK_TAGS  = ["p", "h2", "h3", "li", "blockquote", "pre"]
+_WS_RE       = re.compile(r"\s+")
+
+log = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Extraction
+# ---------------------------------------------------------------------------
+
+def _class_weight(el) -> int:
+    names = " ".join(el.get("class") or []) + " " + (el.get("id") or "")
+    weight = 0
+    if _NEGATIVE_RE.search(names):
+        weight -= 25
+    if _POSITIVE_RE.search(names):
+        weight += 25
+    return weight
+
+
+def _text(el) -> str:
+    return _WS_RE.sub(" ", el.get_text(" ", strip=True)).strip()
+
+
+def _link_density(el, text_len: int) -> float:
+    if not text_len:
+        return 1.0
+    return sum(len(_text(a)) for a in el.find_all("a")) / text_len
+
+
+def extract_main_text(html: str | bytes) -> str:
+    """Return the main article text of an HTML page ("" if none found).
+
+    Paragraph blocks of the winning container are joined with blank lines.
+    """
+    soup = BeautifulSoup(html, "lxml")
+    for el in soup(_BOILERPLATE_TAGS):
+        el.decompose()
+    for el in soup.find_all(True):
+        if el.decomposed or el.name in ("html", "body", "article", "main"):
+            continue
+        if _class_weight(el) < 0:
+            el.decompose()
+
+    scores: dict[int, float] = {}
+    nodes:  dict[int, object] = {}
+    for p in soup.find_all("p"):
+        text = _text(p)
+        if len(text) < MIN_PARAGRAPH_CHARS:
+            continue
+        score = 1 + text.count(",") + min(len(text) // 100, 3)
+        for parent, share in ((p.parent, 1.0), (p.parent.parent if p.parent else None, 0.5)):
+            if parent is None or parent.name in (None, "[document]"):
+                continue
+            key = id(parent)
+            if key not in scores:
+                nodes[key]  = parent
+                scores[key] = _class_weight(parent) + (5 if parent.name in ("article", "main") else 0)
+            scores[key] += score * share
+
+    if not scores:
+        return ""
+
+    def final(key: int) -> float:
+        node = nodes[key]
+        return scores[key] * (1 - _link_density(node, len(_text(node))))
+
+    best = nodes[max(scores, key=final)]
+    blocks = [
+        t for t in (_text(b) for b in best.find_all(_BLOCK_TAGS))
+        if len(t) >= MIN_PARAGRAPH_CHARS
+    ]
+    # Nested blocks (li > p) would repeat text; keep first occurrence only
+    text = "\n\n".join(dict.fromkeys(blocks))
+    return text[:MAX_TEXT_CHARS]
+
+
+# ---------------------------------------------------------------------------
+# Fetching
+# ---------------------------------------------------------------------------
+
+def fetch_article_text(url: str, session=requests) -> dict:
+    """Download one article page and extract its text. Never raises.
+
+    Returns {"status", "text", "fetched_url", "latency"} where status is
+    "ok", "empty" (page had no extractable body), "unresolved" (JS-only
+    redirect), "not_html", "too_large", "http_<code>", or "error".
+    """
+    result = {"status": "error", "text": "", "fetched_url": url, "latency": 0.0}
+    if is_unresolvable(url):
+        result["status"] = "unresolved"
+        return result
+
+    started = time.perf_counter()
+    try:
+        resp = session.get(
+            url, headers=_HEADERS, allow_redirects=True,
+            timeout=(FETCH_CONNECT_TIMEOUT, FETCH_READ_TIMEOUT),
+        )
+    except requests.RequestException as exc:
+        result["latency"] = time.perf_counter() - started
+        log.info(f"   ⚠ Article fetch failed: {url[:80]} — {exc.__class__.__name__}")
+        return result
+    result["latency"]     = time.perf_counter() - started
+    result["fetched_url"] = getattr(resp, "url", url) or url
+
+    if resp.status_code != 200:
+        result["status"] = f"http_{resp.status_code}"
+    elif is_unresolvable(result["fetched_url"]):
+        result["status"] = "unresolved"
+    elif "html" not in resp.headers.get("Content-Type", "text/html").lower():
+        result["status"] = "not_html"
+    elif len(resp.content) > MAX_PAGE_BYTES:
+        result["status"] = "too_large"
+    else:
+        text = extract_main_text(resp.content)
+        result["text"]   = text
+        result["status"] = "ok" if len(text) >= MIN_BODY_CHARS else "empty"
+    return result
+
+
+def is_transient(status: str) -> bool:
+    """True for fetch statuses worth retrying on a later run (not cached)."""
+    return status in ("error", "http_408", "http_429") or status.startswith("http_5")
+
+
+def is_unresolvable(url: str) -> bool:
+    """True for links that only redirect via JavaScript (fetching gets "unresolved")."""
+    return urlsplit(url).netloc.lower() in _UNRESOLVABLE_HOSTS
+
+
+def fetch_article_texts(urls: list[str], max_workers: int = FETCH_MAX_WORKERS) -> dict[str, dict]:
+    """Fetch many article pages concurrently. Returns {url: fetch_article_text result}."""
+    urls = list(dict.fromkeys(urls))
+    if not urls:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls)))) as pool:
+        return dict(zip(urls, pool.map(fetch_article_text, urls)))
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+def text_cache(path: Path = TEXT_CACHE_FILE) -> ArticleStore:
+    """Open the extracted-text cache (records keyed by canonical_url)."""
+    return ArticleStore(path)
+
+
+def cache_record(canonical: str, result: dict, today: date | None = None) -> dict:
+    """Cache record for a fetch_article_text result."""
+    today = (today or date.today()).isoformat()
+    return {
+        "canonical_url": canonical,
+        "fetched_url":   result["fetched_url"],
+        "status":        result["status"],
+        "text":          result["text"],
+        "first_seen":    today,
+        "last_seen":     today,
+    }
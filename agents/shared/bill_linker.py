@@ -0,0 +1,264 @@
+"""
+bill_linker.py — Offline bill ↔ article retrieval by TF-IDF cosine similarity.
+
+Provides BillLinker, build_bill_linker, bill_text, MIN_SIMILARITY, and TOP_K.
+
+Bill numbers and author names only catch articles that name a bill. Coverage
+often describes what a bill does instead ("a bill that would ban parking
+minimums near transit"), which shares vocabulary with the bill's own title and
+digest. Each tracked bill is embedded as a sparse TF-IDF vector over its title
++ summary, using the same hashed unigram + bigram terms as relevance_model,
+with IDF taken over the bill corpus so boilerplate shared by every bill
+("housing", "local agency") counts for little and a bill's distinctive phrases
+count for a lot. Place and agency names are stripped from the bill text first
+(they are rare, so IDF would make them a bill's strongest terms), and a link
+needs at least MIN_SHARED_TERMS terms in common, not one coincidental word.
+
+Articles are scored against every bill in one batch. The bill vectors are
+stored as term-sorted postings (CSR by term), so the article × bill dot
+products are a single gather of the postings each article term touches plus
+one np.bincount into a dense (articles × bills) score matrix; the top-k bills
+per article come from np.argpartition. Terms carried by more than MAX_DF_SHARE
+of the bills are pruned from the postings (their IDF is near the floor anyway)
+so the gather stays small. Thousands of bills against hundreds of articles
+score in tens of milliseconds; without numpy the same arithmetic runs over an
+inverted index in pure Python (identical results, slower).
+scripts/bench_bill_linker.py checks both.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter, defaultdict
+
+from agents.shared.relevance_model import _batch_term_hashes, _term_hashes, _tf, np
+
+
+# ---------------------------------------------------------------------------
+# Tunables
+# ---------------------------------------------------------------------------
+
+TOP_K            = 3       # bills linked per article, at most
+MIN_SIMILARITY   = 0.08    # cosine below this is shared vocabulary, not the same policy
+MIN_SHARED_TERMS = 2       # distinct (unpruned) bill terms an article must share to link;
+                           # one rare word ("county", "insurance") is a coincidence
+SIM_SATURATION   = 0.3     # cosine at (and above) which link confidence is 1.0
+# Calibrated on described-but-unnumbered coverage against the tracked bills:
+# genuine links land at 0.085–0.75 (paraphrases 0.13–0.25), while single-word
+# coincidences from off-topic local news reached 0.06–0.10 before the
+# shared-term rule.
+MAX_DF_SHARE     = 0.25    # terms in more than this share of bills are pruned from postings
+MAX_BATCH_PAIRS  = 4_000_000   # posting gathers per numpy chunk (bounds memory)
+SIM_DECIMALS     = 9       # cosines are ranked at this precision (deterministic ties)
+
+
+# Place and agency names in bill text. Each is rare across the bill corpus, so
+# IDF made it a bill's heaviest term: any story set in that county linked to
+# it ("Measles outbreak spreads in Los Angeles County schools" → a Los Angeles
+# common-interest-development bill). They say where a bill applies, not what
+# it does, so they are dropped before embedding. ("Office of Youth
+# Homelessness Prevention"-style names are kept: they spell out the policy.)
+_NAME     = r"[A-Z][a-z]+(?:[ -](?:(?:and|of|the|for|de|del|la|los|las)\s+)?[A-Z][a-z]+)*"
+_PLACE_RE = re.compile(
+    rf"\b(?:City and County|City|County|Town) of {_NAME}"
+    rf"|\b{_NAME} (?:County|City)\b"
+    rf"|\b{_NAME} (?:Authority|Commission|Department|Agency|Board|Council|District)\b"
+)
+
+
+def bill_text(bill: dict) -> str:
+    """The text a bill is embedded from: title + summary, place and agency names removed."""
+    return _PLACE_RE.sub(" ", f"{bill.get('title', '') or ''} . {bill.get('summary', '') or ''}")
+
+
+class BillLinker:
+    """TF-IDF bill vectors, indexed for batch top-k retrieval."""
+
+    def __init__(self, bills: dict):
+        self.bill_numbers: list[str] = sorted(bills)
+        texts = [bill_text(bills[bn]) for bn in self.bill_numbers]
+        n     = len(texts)
+        self.oov_idf = math.log(n + 1) + 1.0
+        self._max_df = max(2, int(MAX_DF_SHARE * n))
+        if np is None:
+            self._build_py(texts)
+        else:
+            self._build_np(texts)
+
+    def _build_py(self, texts: list[str]) -> None:
+        docs = [Counter(_term_hashes(t)) for t in texts]
+        df: Counter = Counter()
+        for counts in docs:
+            df.update(counts.keys())
+        n = len(docs)
+        self.idf: dict[int, float] = {h: math.log((n + 1) / (c + 1)) + 1.0 for h, c in df.items()}
+
+        # term → [(bill row, normalized weight)]; norms use every term, postings only kept ones
+        self._postings: dict[int, list[tuple[int, float]]] = defaultdict(list)
+        for row, counts in enumerate(docs):
+            vec  = {h: _tf(c) * self.idf[h] for h, c in counts.items()}
+            norm = math.sqrt(sum(v * v for v in vec.values())) or 1.0
+            for h, v in vec.items():
+                if df[h] <= self._max_df:
+                    self._postings[h].append((row, v / norm))
+
+    def _build_np(self, texts: list[str]) -> None:
+        n = len(texts)
+        rows, hashes, counts = _term_counts(*_batch_term_hashes(texts))
+        # Every bill term, sorted, with its IDF (+ OOV slot) — for article norms
+        self._np_all, inv, df = np.unique(hashes, return_inverse=True, return_counts=True)
+        idf = np.log((n + 1) / (df + 1.0)) + 1.0
+        self._np_all_idf = np.append(idf, self.oov_idf)
+
+        w     = (1.0 + np.log(counts)) * idf[inv]
+        norms = np.sqrt(np.bincount(rows, weights=w * w, minlength=n))
+        w     = w / np.where(norms > 0, norms, 1.0)[rows]
+
+        # Postings: kept terms only, sorted by (term, bill row), CSR offsets per term
+        keep  = df[inv] <= self._max_df
+        rows, hashes, w = rows[keep], hashes[keep], w[keep]
+        order = np.lexsort((rows, hashes))
+        self._np_bill  = rows[order]
+        self._np_w     = w[order]
+        self._np_terms, sizes = np.unique(hashes[order], return_counts=True)
+        self._np_ptr   = np.concatenate(([0], np.cumsum(sizes))).astype(np.int64)
+
+    def __len__(self) -> int:
+        return len(self.bill_numbers)
+
+    # ── Scoring ──────────────────────────────────────────────────────────────
+
+    def similarities(self, texts: list[str]):
+        """(len(texts) × len(bills)) cosine similarities.
+
+        A numpy array when numpy is available, else a list of {bill row: cosine}
+        dicts holding only the nonzero entries.
+        """
+        return self._scores(texts)[0]
+
+    def _scores(self, texts: list[str]):
+        """Cosine similarities and, in the same layout, the number of posting terms shared."""
+        if np is None:
+            pairs = [self._similarity_py(t) for t in texts]
+            return [p[0] for p in pairs], [p[1] for p in pairs]
+
+        scores = np.zeros((len(texts), len(self.bill_numbers)), dtype=np.float64)
+        shared = np.zeros(scores.shape, dtype=np.int64)
+        if not texts or not self.bill_numbers:
+            return scores, shared
+        rows, hashes, counts = _term_counts(*_batch_term_hashes(texts))
+        if not rows.size:
+            return scores, shared
+
+        # Article norms over every term (IDF from the bill corpus, OOV = rarest)
+        w     = (1.0 + np.log(counts)) * self._np_all_idf[_lookup(self._np_all, hashes)]
+        norms = np.sqrt(np.bincount(rows, weights=w * w, minlength=len(texts)))
+        w     = np.divide(w, norms[rows], out=np.zeros_like(w), where=norms[rows] > 0)
+
+        cols  = _lookup(self._np_terms, hashes)
+        keep  = cols < len(self._np_terms)
+        rows, cols, w = rows[keep], cols[keep], w[keep]
+        lo, n = self._np_ptr[cols], self._np_ptr[cols + 1] - self._np_ptr[cols]
+
+        # Gather every posting each article term touches, in chunks of
+        # ~MAX_BATCH_PAIRS, and sum the products into the flat score matrix
+        cum    = np.cumsum(n)
+        cuts   = np.searchsorted(cum, np.arange(MAX_BATCH_PAIRS, int(cum[-1]) if cum.size else 0,
+                                               MAX_BATCH_PAIRS), side="right")
+        bounds = [0, *cuts.tolist(), rows.size]
+        n_bills, flat, flat_shared = len(self.bill_numbers), scores.reshape(-1), shared.reshape(-1)
+        for begin, end in zip(bounds, bounds[1:]):
+            cn    = n[begin:end]
+            total = int(cn.sum())
+            if not total:
+                continue
+            idx  = np.arange(total) - np.repeat(np.cumsum(cn) - cn, cn) + np.repeat(lo[begin:end], cn)
+            keys = np.repeat(rows[begin:end], cn) * n_bills + self._np_bill[idx]
+            flat += np.bincount(keys, weights=self._np_w[idx] * np.repeat(w[begin:end], cn),
+                                minlength=flat.size)
+            flat_shared += np.bincount(keys, minlength=flat.size)
+        return scores, shared
+
+    def _similarity_py(self, text: str) -> tuple[dict[int, float], dict[int, int]]:
+        vec  = {h: _tf(c) * self.idf.get(h, self.oov_idf) for h, c in Counter(_term_hashes(text)).items()}
+        norm = math.sqrt(sum(v * v for v in vec.values()))
+        out: dict[int, float] = defaultdict(float)
+        shared: Counter = Counter()
+        if not norm:
+            return out, shared
+        for h, v in vec.items():
+            for row, bw in self._postings.get(h, ()):
+                out[row] += v / norm * bw
+                shared[row] += 1
+        return out, shared
+
+    def top_bills(
+        self,
+        texts: list[str],
+        k: int = TOP_K,
+        min_similarity: float = MIN_SIMILARITY,
+        min_shared: int = MIN_SHARED_TERMS,
+    ) -> list[list[tuple[str, float]]]:
+        """Top-k (bill_number, cosine) per text, best first, cosine ≥ min_similarity (and > 0).
+
+        Only bills sharing at least min_shared distinct terms with the text
+        are candidates. Cosines are rounded to SIM_DECIMALS before ranking so
+        ties (companion bills with the same digest) break by bill number on
+        both code paths, regardless of float summation order.
+        """
+        floor = max(min_similarity, 10 ** -SIM_DECIMALS)
+        sims, shared = self._scores(texts)
+        if np is None:
+            out = []
+            for row, hits in zip(sims, shared):
+                ranked = sorted(((round(s, SIM_DECIMALS), r) for r, s in row.items() if hits[r] >= min_shared),
+                                key=lambda sr: (-sr[0], sr[1]))
+                out.append([(self.bill_numbers[r], s) for s, r in ranked[:k] if s >= floor])
+            return out
+        if not self.bill_numbers:
+            return [[] for _ in texts]
+        k    = min(k, len(self.bill_numbers))
+        sims = np.where(shared >= min_shared, np.round(sims, SIM_DECIMALS), 0.0)
+        kth  = -np.partition(-sims, k - 1, axis=1)[:, k - 1]
+        out  = []
+        for i in range(len(texts)):
+            # Every column tied with the k-th best, so ties resolve by bill number
+            cols   = np.flatnonzero(sims[i] >= max(kth[i], floor))
+            ranked = cols[np.lexsort((cols, -sims[i, cols]))][:k]
+            out.append([(self.bill_numbers[c], float(sims[i, c])) for c in ranked.tolist()])
+        return out
+
+    def links(self, texts: list[str], k: int = TOP_K) -> list[list[dict]]:
+        """bill_links entries ({bill_number, confidence, via="similarity"}) per text."""
+        return [
+            [{"bill_number": bn, "confidence": round(min(s / SIM_SATURATION, 1.0), 2), "via": "similarity"}
+             for bn, s in hits]
+            for hits in self.top_bills(texts, k)
+        ]
+
+
+def _term_counts(rows, hashes):
+    """Distinct (row, term) pairs of a batch, sorted, with their counts."""
+    if not rows.size:
+        return rows, hashes, np.zeros(0, dtype=np.int64)
+    order  = np.lexsort((hashes, rows))
+    rows, hashes = rows[order], hashes[order]
+    first  = np.concatenate(([True], (rows[1:] != rows[:-1]) | (hashes[1:] != hashes[:-1])))
+    starts = np.flatnonzero(first)
+    counts = np.diff(np.append(starts, rows.size))
+    return rows[starts], hashes[starts], counts
+
+
+def _lookup(terms, hashes):
+    """Index of each hash in the sorted terms array, or len(terms) if absent."""
+    cols  = np.minimum(np.searchsorted(terms, hashes), len(terms))
+    known = cols < len(terms)
+    known[known] = terms[cols[known]] == hashes[known]
+    cols[~known] = len(terms)
+    return cols
+
+
+def build_bill_linker(bills: dict) -> BillLinker:
+    """BillLinker over the tracked bills' titles + summaries."""
+    return BillLinker(bills)
@@ -0,0 +1,152 @@
+"""
+bill_similarity.py — Near-duplicate / companion bill detection.
+
+Provides _bill_fingerprint_text, _shingles, _minhash_signature,
+_signature_similarity, and _find_similar_bills.
+
+California routinely carries the same policy in both houses (an AB and its SB
+companion) or re-introduces last session's text under a new number. Those bills
+share almost all of their title and digest language, so the housing analyzer
+can reuse one analysis instead of paying for a second Claude call.
+
+Similarity is estimated Jaccard overlap of word shingles, computed with MinHash
+signatures. Candidate pairs come from LSH banding (bills whose signatures agree
+on every row of at least one band), so the corpus is never compared all-pairs;
+each candidate is then confirmed against the full signature estimate.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+from collections import defaultdict
+
+
+# ---------------------------------------------------------------------------
+# Tunables
+# ---------------------------------------------------------------------------
+
+SHINGLE_SIZE   = 3      # words per shingle — digests are short, keep k small
+NUM_PERM       = 128    # MinHash signature length
+LSH_BANDS      = 16     # 16 bands × 8 rows → LSH threshold ≈ (1/16)^(1/8) ≈ 0.71
+MIN_SHINGLES   = 8      # below this, text is too thin to call anything a duplicate
+
+_MERSENNE_61   = (1 << 61) - 1
+_MAX_HASH      = (1 << 32) - 1
+_SEED          = 20260301   # fixed so signatures are stable across runs
+
+_rng    = random.Random(_SEED)
+_PERMS  = [
+    (_rng.randrange(1, _MERSENNE_61), _rng.randrange(0, _MERSENNE_61))
+    for _ in range(NUM_PERM)
+]
+
+_NON_WORD_RE   = re.compile(r"[^a-z0-9\s]+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+# ---------------------------------------------------------------------------
+# Text normalization + shingling
+# ---------------------------------------------------------------------------
+
+def _bill_fingerprint_text(bill: dict) -> str:
+    """Return the normalized title + summary text used to fingerprint a bill.
+
+    Lowercases, strips punctuation, and collapses whitespace so formatting
+    differences between the Assembly and Senate versions don't count.
+    """
+    raw  = f"{bill.get('title', '') or ''} {bill.get('summary', '') or ''}".lower()
+    text = _NON_WORD_RE.sub(" ", raw)
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def _shingles(text: str, k: int = SHINGLE_SIZE) -> set[int]:
+    """Return the set of hashed k-word shingles for *text*.
+
+    Shingles are hashed to 64-bit ints with blake2b (not hash(), which is
+    salted per process) so signatures are reproducible.
+    """
+    words = text.split()
+    if len(words) < k:
+        grams = [" ".join(words)] if words else []
+    else:
+        grams = [" ".join(words[i:i + k]) for i in range(len(words) - k + 1)]
+    return {
+        int.from_bytes(hashlib.blake2b(g.encode(), digest_size=8).digest(), "big")
+        for g in grams
+    }
+
+
+# ---------------------------------------------------------------------------
+# MinHash
+# ---------------------------------------------------------------------------
+
+def _minhash_signature(shingles: set[int]) -> tuple[int, ...]:
+    """Return the NUM_PERM-length MinHash signature of a shingle set."""
+    if not shingles:
+        return tuple([_MAX_HASH] * NUM_PERM)
+    return tuple(
+        min(((a * s + b) % _MERSENNE_61) & _MAX_HASH for s in shingles)
+        for a, b in _PERMS
+    )
+
+
+def _signature_similarity(sig_a: tuple[int, ...], sig_b: tuple[int, ...]) -> float:
+    """Estimate Jaccard similarity as the fraction of matching signature slots."""
+    matches = sum(1 for x, y in zip(sig_a, sig_b) if x == y)
+    return matches / len(sig_a)
+
+
+# ---------------------------------------------------------------------------
+# LSH candidate search
+# ---------------------------------------------------------------------------
+
+def _find_similar_bills(
+    bills: dict,
+    threshold: float = 0.9,
+    bands: int = LSH_BANDS,
+) -> dict[str, list[tuple[str, float]]]:
+    """Find near-duplicate bills in one LSH pass.
+
+    Args:
+        bills:     Dict keyed by bill number (the tracked_bills.json "bills" block).
+        threshold: Minimum estimated Jaccard similarity to report a match.
+        bands:     LSH band count; NUM_PERM must divide evenly.
+
+    Returns:
+        Dict mapping bill number → [(other_bill_number, similarity), ...],
+        sorted by descending similarity. Bills with no match are omitted.
+    """
+    rows = NUM_PERM // bands
+
+    signatures: dict[str, tuple[int, ...]] = {}
+    for bill_num, bill in bills.items():
+        sh = _shingles(_bill_fingerprint_text(bill))
+        if len(sh) >= MIN_SHINGLES:
+            signatures[bill_num] = _minhash_signature(sh)
+
+    buckets: dict[tuple, list[str]] = defaultdict(list)
+    for bill_num, sig in signatures.items():
+        for band in range(bands):
+            buckets[(band, sig[band * rows:(band + 1) * rows])].append(bill_num)
+
+    candidates: set[tuple[str, str]] = set()
+    for members in buckets.values():
+        if len(members) < 2:
+            continue
+        for i, a in enumerate(members):
+            for b in members[i + 1:]:
+                candidates.add((a, b) if a < b else (b, a))
+
+    matches: dict[str, list[tuple[str, float]]] = defaultdict(list)
+    for a, b in candidates:
+        sim = _signature_similarity(signatures[a], signatures[b])
+        if sim >= threshold:
+            matches[a].append((b, sim))
+            matches[b].append((a, sim))
+
+    return {
+        k: sorted(v, key=lambda m: (-m[1], m[0]))
+        for k, v in matches.items()
+    }
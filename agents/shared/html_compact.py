@@ -0,0 +1,162 @@
+"""
+html_compact.py — Byte-size compaction for outgoing HTML email.
+
+Provides compact_html, CompactStats, and GMAIL_CLIP_BYTES.
+
+Gmail clips any message whose HTML is over about 102 KB: everything past the
+cut (for the tracker, the bill index and the footer) sits behind a "View
+entire message" link most readers never click. Both emails we send are
+table layouts with a long inline style= on every element, so most of their
+bytes are indentation and repeated style text.
+
+compact_html() shrinks a document without changing how it renders:
+
+  - Comments are dropped (conditional <!--[if mso]> comments are kept).
+  - Runs of whitespace are collapsed to one space, and dropped entirely
+    between two tags when either is block-level (table, tr, td, div, p, …).
+    Between inline elements (</strong> <span>) the one space is kept — it
+    renders.
+  - Every style= value is normalized: one declaration per property (the last
+    one wins, as in CSS), no padding around ":" and ";", no empty
+    declarations.
+  - Optionally (style_block=True), style values repeated on many elements are
+    replaced with short class names defined once in a <style> block in <head>.
+    Only for audiences whose mail clients honor a head <style> — Gmail,
+    Apple Mail and current Outlook do; some webmail and older clients strip
+    it, leaving those elements unstyled — so it's off unless the caller opts
+    in. The block is capped at _STYLE_BLOCK_MAX chars because Gmail discards
+    a block larger than about 16 KB outright.
+
+Sizes are UTF-8 bytes, which is what Gmail's clip threshold counts.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+
+GMAIL_CLIP_BYTES = 102 * 1024
+
+_STYLE_BLOCK_MAX  = 15_000     # chars; Gmail drops a <head> <style> over ~16 KB
+_STYLE_MIN_USES   = 3          # hoisting a style used fewer times doesn't pay
+_COMMENT_RE       = re.compile(r"<!--(?!\[if)(?!<!\[endif).*?-->", re.S)
+_BETWEEN_TAGS_RE  = re.compile(r"(<(/?)([a-zA-Z][a-zA-Z0-9]*)[^>]*>) (?=</?([a-zA-Z][a-zA-Z0-9]*))")
+_UNSPLITTABLE_RE  = re.compile(r"\([^)]*;|[\"'][^\"']*;")
+_BLOCK_TAGS       = frozenset({
+    "html", "head", "body", "meta", "title", "style", "table", "thead", "tbody",
+    "tr", "td", "th", "div", "p", "br", "hr", "h1", "h2", "h3", "h4", "h5", "h6",
+    "ul", "ol", "li", "center",
+})
+_WHITESPACE_RE    = re.compile(r"\s+")
+_STYLE_ATTR_RE    = re.compile(r'\sstyle=(["\'])(.*?)\1', re.S)
+_CLASSLESS_TAG_RE = re.compile(r"<([a-zA-Z][a-zA-Z0-9]*)((?:(?!\sclass=)[^>])*?)\sstyle=\"([^\"]*)\"")
+_PRESERVE_RE      = re.compile(r"(<(pre|textarea)\b.*?</\2>)", re.S | re.I)
+
+
+@dataclass
+class CompactStats:
+    """Before/after sizes of one compact_html() call, in UTF-8 bytes."""
+    before:         int
+    after:          int
+    hoisted_styles: int = 0
+
+    @property
+    def saved_pct(self) -> float:
+        return 100.0 * (self.before - self.after) / self.before if self.before else 0.0
+
+
+def compact_html(html: str, style_block: bool = False) -> tuple[str, CompactStats]:
+    """Minify `html` and dedupe its inline styles. Returns (html, stats)."""
+    before = len(html.encode("utf-8"))
+
+    # <pre>/<textarea> content is whitespace-significant — set aside untouched
+    preserved: list[str] = []
+
+    def _stash(m: re.Match) -> str:
+        preserved.append(m.group(1))
+        return f"\x00{len(preserved) - 1}\x00"
+
+    out = _PRESERVE_RE.sub(_stash, html)
+    out = _COMMENT_RE.sub("", out)
+    out = _WHITESPACE_RE.sub(" ", out)
+    out = _BETWEEN_TAGS_RE.sub(_tag_gap, out).replace("> <!", "><!").strip()
+    out = _STYLE_ATTR_RE.sub(lambda m: f" style={m.group(1)}{_normalize_style(m.group(2))}{m.group(1)}", out)
+    out = out.replace(' style=""', "").replace(" style=''", "")
+
+    hoisted = 0
+    if style_block:
+        out, hoisted = _hoist_styles(out)
+
+    for i, block in enumerate(preserved):
+        out = out.replace(f"\x00{i}\x00", block, 1)
+    return out, CompactStats(before=before, after=len(out.encode("utf-8")), hoisted_styles=hoisted)
+
+
+def _tag_gap(m: re.Match) -> str:
+    """The single space between two tags, or nothing if either is block-level."""
+    if m.group(3).lower() in _BLOCK_TAGS or m.group(4).lower() in _BLOCK_TAGS:
+        return m.group(1)
+    return m.group(0)
+
+
+# ---------------------------------------------------------------------------
+# Style normalization
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=4096)
+def _normalize_style(style: str) -> str:
+    """Canonical declaration list: last value per property, minimal separators.
+
+    A document repeats a few dozen distinct styles thousands of times, so the
+    results are memoized. Values with quotes or parentheses that contain ";" can't be split safely
+    on ";" — those styles are only stripped, not rewritten.
+    """
+    style = style.strip()
+    if _UNSPLITTABLE_RE.search(style):
+        return style
+    decls: dict[str, str] = {}
+    for decl in style.split(";"):
+        prop, sep, value = decl.partition(":")
+        prop, value = prop.strip().lower(), value.strip()
+        if not sep or not prop or not value:
+            continue
+        decls.pop(prop, None)      # re-insert so the surviving one keeps its last position
+        decls[prop] = value
+    return ";".join(f"{p}:{v}" for p, v in decls.items())
+
+
+def _hoist_styles(html: str) -> tuple[str, int]:
+    """Replace style values used on many elements with classes in a head <style>."""
+    head_end = html.find("</head>")
+    if head_end < 0:
+        return html, 0
+
+    counts = Counter(m.group(3) for m in _CLASSLESS_TAG_RE.finditer(html))
+    classes: dict[str, str] = {}
+    block_len = len("<style></style>")
+    for style, uses in counts.most_common():
+        if uses < _STYLE_MIN_USES:
+            break
+        name = f"s{len(classes):x}"
+        rule = f".{name}{{{style}}}"
+        # hoisting trades len(style) per use for len(name) per use plus the rule
+        if (len(style) - len(name)) * uses <= len(rule):
+            continue
+        if block_len + len(rule) > _STYLE_BLOCK_MAX:
+            break
+        classes[style] = name
+        block_len += len(rule)
+    if not classes:
+        return html, 0
+
+    def _classed(m: re.Match) -> str:
+        name = classes.get(m.group(3))
+        if name is None:
+            return m.group(0)
+        return f'<{m.group(1)}{m.group(2)} class="{name}"'
+
+    body  = _CLASSLESS_TAG_RE.sub(_classed, html[head_end:])
+    rules = "".join(f".{name}{{{style}}}" for style, name in classes.items())
+    return f"{html[:head_end]}<style>{rules}</style>{body}", len(classes)
@@ -0,0 +1,53 @@
+"""
+html_fragments.py — A content-keyed cache for rendered HTML fragments.
+
+Provides FragmentCache.
+
+The tracker email and the status page render one inline-styled fragment per
+bill — index rows, stalled/watchlist rows, bill and change cards — and the
+tracker builds both documents in the same run from the same bills.
+
+FragmentCache maps (fragment name, display fields) → rendered HTML. The key
+is the tuple of values the fragment shows (hashed by the dict), so a fragment
+is rendered once per distinct content and every later request for it is a
+lookup. That only pays where rendering costs more than building the key: a
+bill card, or a sub-fragment shared by many bills (the risk-score pills). A
+table row is one f-string over the same fields its key would hold, so rows
+are rendered directly. The cache is per process: persisting it between weekly
+runs was measured and doesn't pay — loading and re-saving a 5,000-bill cache
+as JSON costs more than rendering the fragments it holds.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Hashable
+
+
+class FragmentCache:
+    """Rendered fragments keyed by the display fields that produced them."""
+
+    def __init__(self):
+        self.hits = self.misses = 0
+        self._fragments: dict[tuple, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._fragments)
+
+    def get(self, name: str, fields: tuple[Hashable, ...], render: Callable[[], str]) -> str:
+        """The cached fragment for (name, fields), calling render() on a miss.
+
+        `fields` must determine render()'s output completely — every value the
+        fragment displays, including ones derived from today's date.
+        """
+        key  = (name, *fields)
+        html = self._fragments.get(key)
+        if html is None:
+            html = self._fragments[key] = render()
+            self.misses += 1
+        else:
+            self.hits += 1
+        return html
+
+    def clear(self) -> None:
+        self._fragments.clear()
+        self.hits = self.misses = 0
@@ -0,0 +1,270 @@
+"""
+json_stream.py — Incremental JSON object parser with early schema checks.
+
+Provides JsonStreamParser, SchemaDeparture, and strip_trailing_commas.
+
+Claude returns structured content as one JSON object, and a long completion
+can take most of a minute. Parsing only after the last token means a response
+that went wrong in its first line (prose before the object, an unknown key, a
+story beat missing its body) still costs the whole generation.
+
+JsonStreamParser is fed text chunks as they stream in. It tracks the object's
+top-level grammar (key, colon, value, comma) with a character-level scanner
+that understands strings, escapes, and nesting, so it knows the moment each
+top-level value — and each element of a top-level array — is complete. Each
+completed value is parsed with json.loads and checked against a small schema:
+
+    {"subject": {"type": str},
+     "story":   {"type": list, "item_keys": ("line1", "body"), "count": 4},
+     "close":   {"type": dict, "keys": ("heading", "body")}}
+
+Anything that departs from it raises SchemaDeparture immediately, so the
+caller can abort the stream and retry. A ```json fence around the object and
+trailing commas before } or ] are tolerated (Claude emits both).
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Callable, Optional
+
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+_SCALAR_START      = set("-0123456789tfn")
+_FENCE             = "```"
+
+
+class SchemaDeparture(ValueError):
+    """The streamed text can no longer become an object matching the schema."""
+
+    def __init__(self, message: str, position: int):
+        super().__init__(f"{message} (at char {position})")
+        self.position = position
+
+
+def strip_trailing_commas(text: str) -> str:
+    """Drop commas directly before a closing } or ] (lenient JSON)."""
+    return _TRAILING_COMMA_RE.sub(r"\1", text)
+
+
+class JsonStreamParser:
+    """Feed chunks of one JSON object; values are validated as they complete.
+
+    Args:
+        schema:   {key: spec} for every required top-level key. spec["type"] is
+                  str, list, or dict; lists may give "item_keys" (each element
+                  must be an object with these keys) and "count"; dicts may
+                  give "keys". Strings must be non-empty.
+        on_value: Called with (key, value) as each top-level value completes.
+        on_item:  Called with (key, index, item) as each element of a
+                  top-level array completes.
+    """
+
+    def __init__(
+        self,
+        schema: dict[str, dict],
+        on_value: Optional[Callable[[str, Any], None]] = None,
+        on_item:  Optional[Callable[[str, int, Any], None]] = None,
+    ):
+        self.schema   = schema
+        self.on_value = on_value
+        self.on_item  = on_item
+        self.result: dict[str, Any] = {}
+
+        self._text   = ""
+        self._state  = "prefix"      # prefix → object → done
+        self._expect = "key"         # top-level grammar: key / colon / value / comma
+        self._stack: list[str] = []
+        self._in_string = False
+        self._escape    = False
+        self._token: Optional[str] = None   # what the open string/scalar is: key / value / item
+        self._key:   Optional[str] = None
+        self._start: Optional[int] = None   # start of the open key / value
+        self._item_start:   Optional[int] = None
+        self._item_index    = 0
+        self._scalar_start: Optional[int] = None
+
+    @property
+    def chars(self) -> int:
+        return len(self._text)
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    # ── Public API ───────────────────────────────────────────────────────────
+
+    def feed(self, chunk: str) -> None:
+        """Consume the next chunk. Raises SchemaDeparture on the first bad char."""
+        begin = len(self._text)
+        self._text += chunk
+        for i in range(begin, len(self._text)):
+            self._char(i, self._text[i])
+
+    def finish(self) -> dict:
+        """The complete object. Raises SchemaDeparture if it's truncated or missing keys."""
+        if self._state != "done":
+            raise SchemaDeparture("response ended before the JSON object closed", len(self._text))
+        missing = [k for k in self.schema if k not in self.result]
+        if missing:
+            raise SchemaDeparture(f"missing keys: {', '.join(missing)}", len(self._text))
+        return self.result
+
+    # ── Scanner ──────────────────────────────────────────────────────────────
+
+    def _char(self, i: int, ch: str) -> None:
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif ch == "\\":
+                self._escape = True
+            elif ch == '"':
+                self._in_string = False
+                self._string_closed(i)
+            return
+
+        if self._state == "prefix":
+            self._prefix_char(i, ch)
+            return
+        if self._state == "done":
+            if not ch.isspace() and ch != "`":
+                raise SchemaDeparture("text after the JSON object", i)
+            return
+
+        if self._scalar_start is not None:
+            if not (ch in ",}]" or ch.isspace()):
+                return
+            self._scalar_closed(i)
+
+        if len(self._stack) == 1:
+            self._top_level_char(i, ch)
+        else:
+            self._nested_char(i, ch)
+
+    def _prefix_char(self, i: int, ch: str) -> None:
+        if ch == "{":
+            self._state = "object"
+            self._stack.append("{")
+            return
+        prefix = self._text[:i + 1].lstrip()
+        if not prefix or _FENCE.startswith(prefix):
+            return
+        # ```json / ```JSON fence: letters up to the newline
+        if prefix.startswith(_FENCE) and (prefix[3:].strip().isalpha() or not prefix[3:].strip()) \
+                and len(prefix) < 12:
+            return
+        raise SchemaDeparture("response does not start with a JSON object", i)
+
+    def _top_level_char(self, i: int, ch: str) -> None:
+        if ch.isspace():
+            return
+        expect = self._expect
+        if expect == "key" and ch == '"':
+            self._in_string, self._token, self._start = True, "key", i
+        elif expect in ("key", "comma") and ch == "}":
+            self._stack.pop()
+            self._state = "done"
+        elif expect == "colon" and ch == ":":
+            self._expect = "value"
+        elif expect == "comma" and ch == ",":
+            self._expect = "key"
+        elif expect == "value" and ch == '"':
+            self._check_opening(i, ch)
+            self._in_string, self._token, self._start = True, "value", i
+        elif expect == "value" and ch in "{[":
+            self._check_opening(i, ch)
+            self._stack.append(ch)
+            self._start, self._item_index = i, 0
+        elif expect == "value" and ch in _SCALAR_START:
+            self._check_opening(i, ch)
+            self._scalar_start, self._token, self._start = i, "value", i
+        else:
+            raise SchemaDeparture(f"unexpected {ch!r} (expected {expect})", i)
+
+    def _nested_char(self, i: int, ch: str) -> None:
+        at_items = self._stack == ["{", "["]
+        if ch == '"':
+            self._in_string = True
+            self._token = None
+            if at_items and self._item_start is None:
+                self._item_start, self._token = i, "item"
+        elif ch in "{[":
+            if at_items and self._item_start is None:
+                self._item_start = i
+            self._stack.append(ch)
+        elif ch in "}]":
+            if self._stack[-1] != {"}": "{", "]": "["}[ch]:
+                raise SchemaDeparture(f"mismatched {ch!r}", i)
+            self._stack.pop()
+            if len(self._stack) == 1:
+                self._value_closed(self._text[self._start:i + 1], i)
+            elif self._stack == ["{", "["] and self._item_start is not None:
+                self._item_closed(self._text[self._item_start:i + 1], i)
+        elif at_items and self._item_start is None and ch in _SCALAR_START:
+            self._item_start = self._scalar_start = i
+            self._token = "item"
+
+    def _string_closed(self, i: int) -> None:
+        token, self._token = self._token, None
+        if token == "key":
+            self._key_closed(json.loads(self._text[self._start:i + 1]), i)
+        elif token == "value":
+            self._value_closed(self._text[self._start:i + 1], i)
+        elif token == "item":
+            self._item_closed(self._text[self._item_start:i + 1], i)
+
+    def _scalar_closed(self, i: int) -> None:
+        text, self._scalar_start = self._text[self._scalar_start:i], None
+        token, self._token = self._token, None
+        if token == "value":
+            self._value_closed(text, i)
+        else:
+            self._item_closed(text, i)
+
+    # ── Schema checks ────────────────────────────────────────────────────────
+
+    def _parse(self, text: str, what: str, i: int) -> Any:
+        try:
+            return json.loads(strip_trailing_commas(text))
+        except json.JSONDecodeError as exc:
+            raise SchemaDeparture(f"{what} is not valid JSON: {exc.msg}", i) from None
+
+    def _key_closed(self, key: str, i: int) -> None:
+        if key not in self.schema:
+            raise SchemaDeparture(f"unexpected key {key!r}", i)
+        if key in self.result:
+            raise SchemaDeparture(f"duplicate key {key!r}", i)
+        self._key, self._expect = key, "colon"
+
+    def _check_opening(self, i: int, ch: str) -> None:
+        """Reject a value whose first char already has the wrong type."""
+        want = self.schema[self._key]["type"]
+        if {'"': str, "{": dict, "[": list}.get(ch) is not want:
+            raise SchemaDeparture(f"{self._key} should be a {want.__name__}", i)
+
+    def _value_closed(self, text: str, i: int) -> None:
+        key, spec = self._key, self.schema[self._key]
+        value = self._parse(text, key, i)
+        if not isinstance(value, spec["type"]) or (spec["type"] is str and not value.strip()):
+            raise SchemaDeparture(f"{key} should be a non-empty {spec['type'].__name__}", i)
+        if "count" in spec and len(value) != spec["count"]:
+            raise SchemaDeparture(f"{key} has {len(value)} items, expected {spec['count']}", i)
+        missing = [k for k in spec.get("keys", ()) if k not in value]
+        if missing:
+            raise SchemaDeparture(f"{key} is missing {', '.join(missing)}", i)
+        self.result[key] = value
+        self._expect, self._start = "comma", None
+        if self.on_value:
+            self.on_value(key, value)
+
+    def _item_closed(self, text: str, i: int) -> None:
+        key, spec = self._key, self.schema[self._key]
+        item, index = self._parse(text, f"{key}[{self._item_index}]", i), self._item_index
+        self._item_start, self._item_index = None, index + 1
+        if "count" in spec and index >= spec["count"]:
+            raise SchemaDeparture(f"{key} has more than {spec['count']} items", i)
+        item_keys = spec.get("item_keys", ())
+        if item_keys and (not isinstance(item, dict) or any(k not in item for k in item_keys)):
+            raise SchemaDeparture(f"{key}[{index}] should be an object with {', '.join(item_keys)}", i)
+        if self.on_item:
+            self.on_item(key, index, item)
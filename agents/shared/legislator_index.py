@@ -0,0 +1,314 @@
+"""
+legislator_index.py — Link news coverage to tracked bills by author and committee.
+
+Provides LegislatorIndex, load_index, bills_fingerprint, and INDEX_FILE.
+
+Bill-number matching misses most coverage: reporters write "a Wicks bill" or
+"the Senate Housing Committee advanced…" far more often than "AB 1751". This
+index maps every author and committee in tracked_bills.json to the tracked
+bills they carry, and matches an article against all of them in one pass.
+
+Matching is hash-based rather than one giant regex alternation (which retries
+every alternative at every character): a single regex finds runs of
+Capitalized Words, and each run is looked up phrase-by-phrase in dicts of full
+names, surnames, and honorifics. Committees are found from the (rare)
+occurrences of "committee" and the words around them.
+
+Each match yields candidate bills with a confidence:
+
+    full name                     "Buffy Wicks"                 0.9
+    honorific + surname           "Assemblymember Wicks"        0.85
+    surname alone                 "Wicks"                       0.4
+    committee                     "Local Government Committee"  0.35
+    committee with a hearing      "Senate Housing Committee"    0.6
+      (bill has an upcoming hearing before that chamber's committee)
+
+divided by √(number of bills the name/committee carries) and by the number
+of legislators sharing a surname, so "Gonzalez" or "Rules Committee" spread
+thin while a one-bill author stays strong. Evidence for the same bill
+combines by noisy-OR (1 − Π(1 − c)). Surnames under three letters only match
+with a first name or honorific.
+
+The index spec (names / committees / hearings → bills) is persisted to
+data/media/legislator_index.json together with a fingerprint of every bill's
+number, author, committees, and hearing committees. It is rebuilt only when
+that fingerprint changes, and the built index is memoized per fingerprint
+within a process.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import re
+from collections import defaultdict
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+INDEX_FILE   = PROJECT_ROOT / "data" / "media" / "legislator_index.json"
+
+# ---------------------------------------------------------------------------
+# Tunables
+# ---------------------------------------------------------------------------
+
+CONF_FULL_NAME      = 0.9
+CONF_HONORIFIC      = 0.85
+CONF_SURNAME        = 0.4
+CONF_COMMITTEE      = 0.35
+CONF_HEARING        = 0.6
+MIN_LINK_CONFIDENCE = 0.1    # weaker links are dropped
+MIN_BARE_SURNAME    = 3      # shorter surnames ("Ta") need a first name or honorific
+_COMMITTEE_WORDS    = 7      # longest committee name, in words, incl. chamber
+
+_HONORIFICS = {
+    "Assemblymember", "Assemblywoman", "Assemblyman", "Asm.", "Asm",
+    "Senator", "Sen.", "Sen", "Speaker", "Assembly Member", "State Senator",
+    "State Sen.", "Pro Tem", "Sen. Majority Leader", "Assembly Majority Leader",
+}
+_CHAMBERS = {"assembly", "senate"}
+# Newsroom shorthand for committee names → the official name in tracked_bills.json
+_COMMITTEE_ALIASES = {
+    "Housing and Community Development": ["Assembly Housing"],
+}
+
+_CAP_RUN_RE    = re.compile(r"[A-Z][\w'’.-]*(?:[ \t]+[A-Z][\w'’.-]*)*")
+_POSSESSIVE_RE = re.compile(r"['’]s$")
+_PUNCT         = ".,;:!?()\"'“”‘’"
+
+log = logging.getLogger(__name__)
+
+_memo: dict[str, "LegislatorIndex"] = {}
+
+
+def _committee_key(name: str) -> str:
+    return " ".join(w.strip(_PUNCT) for w in name.lower().replace(",", " ").split())
+
+
+def _hearing_committees(bill: dict) -> list[str]:
+    """'Senate Housing Hearing' → 'senate housing' for each upcoming hearing."""
+    out = []
+    for h in bill.get("upcoming_hearings") or []:
+        c = _committee_key(h.get("committee") or "")
+        c = c.removesuffix(" hearing").removesuffix(" committee")
+        if c:
+            out.append(c)
+    return out
+
+
+def bills_fingerprint(bills: dict) -> str:
+    """Hash of every bill's number, author, committees, and hearing committees."""
+    h = hashlib.sha1()
+    for bn in sorted(bills):
+        b = bills[bn]
+        parts = [bn, b.get("author") or ""] + sorted(b.get("committees") or []) + _hearing_committees(b)
+        h.update(("|".join(parts) + "\n").encode())
+    return h.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Spec: names / committees / hearings → bills
+# ---------------------------------------------------------------------------
+
+def _build_spec(bills: dict) -> dict:
+    authors:    dict[str, list[str]] = defaultdict(list)
+    committees: dict[str, list[str]] = defaultdict(list)
+    hearings:   dict[str, list[str]] = defaultdict(list)
+    for bn, b in sorted(bills.items()):
+        author = (b.get("author") or "").strip()
+        if " " in author:
+            authors[author].append(bn)
+        elif author:
+            # Committee-authored bills list the committee as the author ("Housing")
+            committees[author].append(bn)
+        for c in b.get("committees") or []:
+            if bn not in committees[c]:
+                committees[c].append(bn)
+        for c in _hearing_committees(b):
+            if bn not in hearings[c]:
+                hearings[c].append(bn)
+
+    surnames: dict[str, list[str]] = defaultdict(list)
+    for author in authors:
+        surnames[author.split()[-1]].append(author)
+
+    return {
+        "authors":    dict(authors),
+        "surnames":   dict(surnames),
+        "committees": dict(committees),
+        "hearings":   dict(hearings),
+    }
+
+
+class LegislatorIndex:
+    """Phrase index over one version of the bill store's authors and committees."""
+
+    def __init__(self, spec: dict, fingerprint: str = ""):
+        self.spec        = spec
+        self.fingerprint = fingerprint
+        authors, surnames = spec["authors"], spec["surnames"]
+
+        # phrase → [(bill, confidence, via)]
+        self._full:      dict[str, list[tuple[str, float, str]]] = {}
+        self._surname:   dict[str, list[tuple[str, float, str]]] = {}
+        self._committee: dict[str, list[tuple[str, float, str]]] = {}
+        self._hearing:   dict[str, list[tuple[str, float, str]]] = {}
+
+        for author, bns in authors.items():
+            spread = math.sqrt(len(bns))
+            self._full[author] = [(bn, CONF_FULL_NAME / spread, f"author:{author}") for bn in bns]
+        for surname, names in surnames.items():
+            self._surname[surname] = [
+                (bn, 1.0 / (len(names) * math.sqrt(len(authors[a]))), f"author:{a}")
+                for a in names for bn in authors[a]
+            ]
+        for name, bns in spec["committees"].items():
+            spread = math.sqrt(len(bns))
+            links  = [(bn, CONF_COMMITTEE / spread, f"committee:{name}") for bn in bns]
+            for phrase in [name] + _COMMITTEE_ALIASES.get(name, []):
+                self._committee.setdefault(_committee_key(phrase), []).extend(links)
+        for key, bns in spec["hearings"].items():
+            spread = math.sqrt(len(bns))
+            self._hearing[key] = [(bn, CONF_HEARING / spread, f"hearing:{key}") for bn in bns]
+
+        # First word of each full name → candidate lengths in words, longest first
+        self._name_lengths: dict[str, list[int]] = defaultdict(list)
+        for author in authors:
+            first = author.split()
+            if len(first) not in self._name_lengths[first[0]]:
+                self._name_lengths[first[0]].append(len(first))
+        for lengths in self._name_lengths.values():
+            lengths.sort(reverse=True)
+
+    def __len__(self) -> int:
+        return len(self._full) + len(self._committee)
+
+    # ── Matching ─────────────────────────────────────────────────────────────
+    #
+    # The scanners below collect distinct hits — (table, key, scale) — so a
+    # name repeated through an article is expanded into bill links only once.
+
+    def _name_hits(self, text: str) -> set[tuple[str, str, float]]:
+        hits: set[tuple[str, str, float]] = set()
+        for run in _CAP_RUN_RE.findall(text):
+            raw   = run.split()
+            words = [_POSSESSIVE_RE.sub("", w).strip(_PUNCT) for w in raw]
+            i = 0
+            while i < len(words):
+                for n in self._name_lengths.get(words[i], ()):
+                    phrase = " ".join(words[i:i + n])
+                    if phrase in self._full:
+                        hits.add(("full", phrase, 1.0))
+                        i += n
+                        break
+                else:
+                    if words[i] in self._surname:
+                        before = [w.strip(",;:") for w in raw[max(0, i - 3):i]]
+                        if any(" ".join(before[k:]) in _HONORIFICS for k in range(len(before))):
+                            hits.add(("surname", words[i], CONF_HONORIFIC))
+                        elif len(words[i]) >= MIN_BARE_SURNAME:
+                            hits.add(("surname", words[i], CONF_SURNAME))
+                    i += 1
+        return hits
+
+    def _committee_hits(self, text: str) -> set[tuple[str, str, float]]:
+        hits: set[tuple[str, str, float]] = set()
+        lower = text.lower()
+        pos   = lower.find("committee")
+        while pos != -1:
+            before = _committee_key(lower[max(0, pos - 100):pos]).split()[-_COMMITTEE_WORDS:]
+            after  = _committee_key(lower[pos + 9:pos + 120]).split()
+            # (span, word before the span): "Senate Housing Committee", "Committee on Housing"
+            spans  = [(before[-n:], before[-n - 1:-n]) for n in range(len(before), 0, -1)]
+            if after[:1] == ["on"]:
+                spans += [(after[1:n + 1], before[-1:]) for n in range(min(_COMMITTEE_WORDS, len(after) - 1), 0, -1)]
+            for span, prev in spans:
+                key = " ".join(span)
+                if key not in self._committee:
+                    continue
+                hits.add(("committee", key, 1.0))
+                # "Senate Housing Committee" → bills with a hearing there soon
+                if span[0] in _CHAMBERS:
+                    chambers, name = [span[0]], " ".join(span[1:])
+                else:
+                    chambers, name = [w for w in prev if w in _CHAMBERS] or sorted(_CHAMBERS), key
+                for c in chambers:
+                    if f"{c} {name}" in self._hearing:
+                        hits.add(("hearing", f"{c} {name}", 1.0))
+                break
+            pos = lower.find("committee", pos + 9)
+        return hits
+
+    def match(self, text: str) -> list[dict]:
+        """Candidate bills for one text, strongest first.
+
+        Returns [{"bill_number", "confidence", "via"}] with confidence ≥
+        MIN_LINK_CONFIDENCE; via names the strongest evidence.
+        """
+        if not text:
+            return []
+        hits = self._name_hits(text)
+        if "ommittee" in text:
+            hits |= self._committee_hits(text)
+        tables   = {"full": self._full, "surname": self._surname,
+                    "committee": self._committee, "hearing": self._hearing}
+        evidence: dict[tuple[str, str], float] = {}   # (bill, via) → best confidence
+        for table, key, scale in hits:
+            for bn, conf, via in tables[table][key]:
+                conf *= scale
+                if conf > evidence.get((bn, via), 0.0):
+                    evidence[(bn, via)] = conf
+
+        per_bill: dict[str, list[tuple[float, str]]] = defaultdict(list)
+        for (bn, via), conf in evidence.items():
+            per_bill[bn].append((conf, via))
+        out = []
+        for bn, items in per_bill.items():
+            miss = 1.0
+            for conf, _ in items:
+                miss *= 1.0 - conf
+            confidence = round(1.0 - miss, 2)
+            if confidence >= MIN_LINK_CONFIDENCE:
+                out.append({"bill_number": bn, "confidence": confidence, "via": max(items)[1]})
+        out.sort(key=lambda l: (-l["confidence"], l["bill_number"]))
+        return out
+
+
+# ---------------------------------------------------------------------------
+# Loading
+# ---------------------------------------------------------------------------
+
+def load_index(bills: dict, path: Path | None = INDEX_FILE) -> LegislatorIndex:
+    """Index for `bills`, reusing the persisted spec unless the bills changed.
+
+    path=None skips the on-disk cache (build in memory only).
+    """
+    fingerprint = bills_fingerprint(bills)
+    if fingerprint in _memo:
+        return _memo[fingerprint]
+
+    spec = None
+    if path is not None and path.exists():
+        try:
+            cached = json.loads(path.read_text(encoding="utf-8"))
+            if cached.get("fingerprint") == fingerprint:
+                spec = cached["spec"]
+        except (OSError, json.JSONDecodeError, KeyError):
+            spec = None
+
+    if spec is None:
+        spec = _build_spec(bills)
+        log.info(
+            f"   Legislator index rebuilt: {len(spec['authors'])} authors, "
+            f"{len(spec['committees'])} committees, {len(spec['hearings'])} hearing committees"
+        )
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(
+                json.dumps({"fingerprint": fingerprint, "spec": spec}, indent=2, ensure_ascii=False),
+                encoding="utf-8",
+            )
+
+    index = _memo[fingerprint] = LegislatorIndex(spec, fingerprint)
+    return index
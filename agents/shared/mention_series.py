@@ -0,0 +1,263 @@
+"""
+mention_series.py — Daily media-mention time series per bill, source, and source type.
+
+Provides MentionSeries, SERIES_FILE, and EPOCH.
+
+media_digest.json only counts bill mentions inside the current lookback
+window, and the counts are overwritten every run. This store keeps them: one
+row per (day, bill, source) with the number of distinct articles from that
+source mentioning that bill on that day. Source type ("rss", "newsapi") is a
+property of the source, so the per-type series is a regrouping of the same
+rows.
+
+Rows are held as four parallel array('H') columns (day offset from EPOCH,
+bill index, source index, count) — 8 bytes a row — and saved to
+data/media/mention_series.bin as a one-line JSON header (bill and source
+labels, source types, first day recorded) followed by the raw little-endian
+columns. A two-year
+session of daily rows is a few hundred KB at most and loads without parsing.
+
+Each scan re-derives the counts for the days in its lookback window from the
+articles it saw and replaces those days, so re-running a scan never double
+counts; days that have rolled out of the window stay as last recorded.
+
+Queries regroup the columns into a dense (key × day) grid — with numpy a
+single np.bincount, otherwise a dict walk with identical results:
+
+    rolling()  — total mentions per key over the last N days
+    spikes()   — z-score of the recent days against the trailing baseline,
+                 once the series reaches back over the whole baseline
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import sys
+from array import array
+from collections import defaultdict
+from datetime import date, timedelta
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:   # optional — the pure-Python grid is identical, just slower
+    np = None
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+SERIES_FILE  = PROJECT_ROOT / "data" / "media" / "mention_series.bin"
+
+EPOCH   = date(2020, 1, 1)    # day column = days since EPOCH (uint16 → good until 2199)
+_MAGIC  = b"CSF-MENTIONS-1\n"
+_MAX_U16 = 0xFFFF
+
+# ---------------------------------------------------------------------------
+# Spike detection defaults
+# ---------------------------------------------------------------------------
+
+SPIKE_RECENT_DAYS   = 3      # days whose mentions are tested
+SPIKE_BASELINE_DAYS = 28     # trailing days before them that form the baseline
+SPIKE_MIN_Z         = 2.0    # z-score at or above which a key is trending
+SPIKE_MIN_MENTIONS  = 2      # and at least this many mentions in the recent days
+SPIKE_MIN_STD       = 0.5    # floor on the baseline std, so a quiet bill's first article isn't ∞σ
+
+DIMENSIONS = ("bill", "source", "source_type")
+
+log = logging.getLogger(__name__)
+
+
+def _day(d: date) -> int:
+    return (d - EPOCH).days
+
+
+class MentionSeries:
+    """Column store of daily (bill, source) mention counts."""
+
+    def __init__(self, path: Path | None = SERIES_FILE):
+        self.path = path
+        self.bills:        list[str]      = []
+        self.sources:      list[str]      = []
+        self.source_types: dict[str, str] = {}
+        self.since:        date | None    = None    # first day any window covered
+        self._bill_ix:   dict[str, int] = {}
+        self._source_ix: dict[str, int] = {}
+        self._day    = array("H")
+        self._bill   = array("H")
+        self._source = array("H")
+        self._count  = array("H")
+        if path is not None and path.exists():
+            self._load(path.read_bytes())
+
+    def __len__(self) -> int:
+        return len(self._day)
+
+    # ── Persistence ──────────────────────────────────────────────────────────
+
+    def _load(self, raw: bytes) -> None:
+        if not raw.startswith(_MAGIC):
+            log.warning(f"   ⚠ {self.path.name}: unrecognized format — starting a new series")
+            return
+        head_end = raw.index(b"\n", len(_MAGIC))
+        header   = json.loads(raw[len(_MAGIC):head_end])
+        self.bills, self.sources = header["bills"], header["sources"]
+        self.source_types = header["source_types"]
+        if header.get("since"):
+            self.since = date.fromisoformat(header["since"])
+        self._bill_ix   = {b: i for i, b in enumerate(self.bills)}
+        self._source_ix = {s: i for i, s in enumerate(self.sources)}
+
+        body, n = raw[head_end + 1:], header["rows"]
+        for k, col in enumerate((self._day, self._bill, self._source, self._count)):
+            col.frombytes(body[2 * n * k:2 * n * (k + 1)])
+            if sys.byteorder != "little":
+                col.byteswap()
+        if self.since is None and n:     # files written before "since" was recorded
+            self.since = EPOCH + timedelta(days=min(self._day))
+
+    def save(self) -> None:
+        """Write the header + columns (rows sorted by day, bill, source)."""
+        order = sorted(range(len(self)), key=lambda i: (self._day[i], self._bill[i], self._source[i]))
+        header = {
+            "bills":        self.bills,
+            "sources":      self.sources,
+            "source_types": self.source_types,
+            "since":        self.since.isoformat() if self.since else None,
+            "rows":         len(order),
+        }
+        chunks = [_MAGIC, json.dumps(header, ensure_ascii=False).encode("utf-8"), b"\n"]
+        for col in (self._day, self._bill, self._source, self._count):
+            out = array("H", (col[i] for i in order))
+            if sys.byteorder != "little":
+                out.byteswap()
+            chunks.append(out.tobytes())
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_bytes(b"".join(chunks))
+
+    # ── Recording ────────────────────────────────────────────────────────────
+
+    def _index(self, labels: list[str], ix: dict[str, int], label: str) -> int:
+        if label not in ix:
+            ix[label] = len(labels)
+            labels.append(label)
+        return ix[label]
+
+    def record_window(self, articles: list[dict], since: date, until: date) -> int:
+        """Replace days since..until with the mention counts of `articles`.
+
+        Each article counts once per bill in its bill_mentions, on its
+        published day (articles dated outside the window are ignored).
+        Returns the number of rows written.
+        """
+        lo, hi = _day(since), _day(until)
+        if self.since is None or since < self.since:
+            self.since = since
+        counts: dict[tuple[int, int, int], int] = defaultdict(int)
+        for a in articles:
+            try:
+                day = _day(date.fromisoformat((a.get("published") or "")[:10]))
+            except ValueError:
+                continue
+            if not lo <= day <= hi or not a.get("bill_mentions"):
+                continue
+            source = a.get("source") or "unknown"
+            s = self._index(self.sources, self._source_ix, source)
+            self.source_types.setdefault(source, a.get("source_type") or "unknown")
+            for bn in dict.fromkeys(a["bill_mentions"]):
+                counts[(day, self._index(self.bills, self._bill_ix, bn), s)] += 1
+
+        keep = [i for i in range(len(self)) if not lo <= self._day[i] <= hi]
+        cols = (self._day, self._bill, self._source, self._count)
+        kept = [array("H", (col[i] for i in keep)) for col in cols]
+        for (day, b, s), n in sorted(counts.items()):
+            for col, v in zip(kept, (day, b, s, min(n, _MAX_U16))):
+                col.append(v)
+        self._day, self._bill, self._source, self._count = kept
+        return len(counts)
+
+    # ── Queries ──────────────────────────────────────────────────────────────
+
+    def _labels(self, dim: str) -> tuple[list[str], list[int]]:
+        """(key labels, key index of each source) — bill rows map to themselves."""
+        if dim == "source_type":
+            types = sorted(set(self.source_types.values()))
+            return types, [types.index(self.source_types[s]) for s in self.sources]
+        if dim == "source":
+            return self.sources, list(range(len(self.sources)))
+        if dim == "bill":
+            return self.bills, []
+        raise ValueError(f"dim must be one of {DIMENSIONS}, not {dim!r}")
+
+    def grid(self, dim: str, start: date, end: date):
+        """(labels, counts) — counts[key][d] = mentions on start + d, for start..end.
+
+        counts is a numpy int64 array when numpy is available, else a list of lists.
+        """
+        labels, source_key = self._labels(dim)
+        lo, n_days = _day(start), (end - start).days + 1
+        if np is None:
+            counts = [[0] * n_days for _ in labels]
+            for d, b, s, c in zip(self._day, self._bill, self._source, self._count):
+                if 0 <= d - lo < n_days:
+                    counts[b if dim == "bill" else source_key[s]][d - lo] += c
+            return labels, counts
+
+        n_days = max(n_days, 0)
+        days   = np.frombuffer(self._day, dtype=np.uint16).astype(np.int64) - lo
+        inside = (days >= 0) & (days < n_days)
+        if dim == "bill":
+            keys = np.frombuffer(self._bill, dtype=np.uint16)[inside].astype(np.int64)
+        else:
+            keys = np.array(source_key, dtype=np.int64)[np.frombuffer(self._source, dtype=np.uint16)[inside]]
+        flat = np.bincount(
+            keys * n_days + days[inside],
+            weights   = np.frombuffer(self._count, dtype=np.uint16)[inside],
+            minlength = len(labels) * n_days,
+        )
+        return labels, flat.astype(np.int64).reshape(len(labels), n_days)
+
+    def rolling(self, dim: str, days: int, end: date) -> dict[str, int]:
+        """Total mentions per key over the `days` days ending on `end` (nonzero keys only)."""
+        labels, counts = self.grid(dim, end - timedelta(days=days - 1), end)
+        totals = counts.sum(axis=1).tolist() if np is not None else [sum(row) for row in counts]
+        return {k: t for k, t in zip(labels, totals) if t}
+
+    def spikes(
+        self,
+        dim: str = "bill",
+        end: date | None = None,
+        recent_days: int = SPIKE_RECENT_DAYS,
+        baseline_days: int = SPIKE_BASELINE_DAYS,
+        min_z: float = SPIKE_MIN_Z,
+        min_mentions: int = SPIKE_MIN_MENTIONS,
+    ) -> list[dict]:
+        """Keys whose recent daily mentions spike above their trailing baseline.
+
+        z = (mean daily mentions over the last recent_days − baseline mean) /
+        max(baseline std, SPIKE_MIN_STD), with the baseline taken over the
+        baseline_days before that. Returns [{key, mentions, baseline, z}],
+        highest z first — or [] until the series has been recording since the
+        first baseline day: on a cold start the unrecorded baseline reads as
+        zero and any bill with a few mentions would "trend".
+        """
+        end   = end or date.today()
+        start = end - timedelta(days=recent_days + baseline_days - 1)
+        if self.since is None or self.since > start:
+            covered = max(0, (end - self.since).days + 1) if self.since else 0
+            log.info(f"   Spikes: series covers {covered} of {recent_days + baseline_days} days — not scored yet")
+            return []
+        labels, counts = self.grid(dim, start, end)
+        rows = counts.tolist() if np is not None else counts
+        out = []
+        for key, row in zip(labels, rows):
+            base, recent = row[:baseline_days], row[baseline_days:]
+            mentions = sum(recent)
+            if mentions < min_mentions:
+                continue
+            mean = sum(base) / baseline_days
+            std  = math.sqrt(sum((c - mean) ** 2 for c in base) / baseline_days)
+            z    = (mentions / recent_days - mean) / max(std, SPIKE_MIN_STD)
+            if z >= min_z:
+                out.append({"key": key, "mentions": mentions, "baseline": round(mean, 2), "z": round(z, 2)})
+        out.sort(key=lambda s: (-s["z"], -s["mentions"], s["key"]))
+        return out
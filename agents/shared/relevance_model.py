@@ -0,0 +1,311 @@
+"""
+relevance_model.py — Batch TF-IDF topic relevance for media articles.
+
+Provides TopicProfile, build_topic_profile, topic_documents, article_text,
+and TOPIC_SCORE_MAX.
+
+media_scanner's keyword score is a hand-tuned list: +0.3 / +0.1 for each of
+twenty phrases, checked one by one per article. Anything the list doesn't
+name ("fourplex", "builder's remedy", "transit corridors") scores zero until
+someone edits the code.
+
+Here the topic vocabulary is learned instead. The profile is built from what
+the team already maintains:
+
+    - tracked bill titles + summaries, weighted by the housing analysis
+      (strong / moderate / indirect / none)
+    - every client voice file (clients/*/voices/*.md)
+    - the legacy keyword list, as a seed
+
+Terms are word unigrams + bigrams (ASCII letters/digits; stopwords and bare
+numbers dropped), identified by a 64-bit polynomial hash. IDF comes from the
+profile documents; the profile vector is the weighted sum of their
+L2-normalized TF-IDF vectors.
+
+Articles are scored as one batch with numpy: all texts are concatenated into
+one byte array, word boundaries and word hashes come from array ops
+(np.add.reduceat over per-byte powers), bigram hashes from adjacent words, and
+term counts from one lexsort. The batch is then a sparse (row, term, tf)
+matrix, and cosine similarity to the profile is two np.bincount reductions.
+No Python code runs per word, so a batch of 1,000 articles scores in
+~25 ms. Without numpy the same hashes and arithmetic run in pure Python
+(identical results, roughly 8× slower); scripts/bench_relevance_model.py
+checks both.
+
+Cosine similarity is mapped linearly from COSINE_FLOOR–COSINE_SATURATION
+onto 0–TOPIC_SCORE_MAX, the topic part of media_scanner's 0–5 relevance
+scale, so min_relevance_score keeps its meaning.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Iterable
+
+try:
+    import numpy as np
+except ImportError:   # optional — pure-Python scoring is identical, just slower
+    np = None
+
+
+# ---------------------------------------------------------------------------
+# Tunables
+# ---------------------------------------------------------------------------
+
+TOPIC_SCORE_MAX   = 2.0    # topic part of the 0–5 relevance scale
+COSINE_FLOOR      = 0.02   # cosine at (and below) which the topic score is 0
+COSINE_SATURATION = 0.07   # cosine at (and above) which the topic score is maxed
+# Calibrated on a labelled sample of headline + summary pairs against the
+# tracked-bill profile: housing / land-use stories land at 0.025–0.08,
+# off-topic local news (health, insurance, restaurants, traffic, schools)
+# at 0.005–0.018 — generic civic words like "county", "state", "council"
+# and "approve" are enough to get that far, so the floor sits above them.
+TITLE_REPEAT      = 2      # title terms count this many times (headline = topic)
+
+# Profile weight of a tracked bill by its strongest analysis level
+_LEVEL_WEIGHTS   = {"strong": 3.0, "moderate": 2.0, "indirect": 1.0}
+_NO_LEVEL_WEIGHT = 0.25
+_VOICE_WEIGHT    = 1.0
+_SEED_WEIGHT     = 2.0
+
+_STOPWORDS = frozenset("""
+    about after all also an and any are as at be been but by can could did do does
+    for from had has have he her his how if in into is it its just may more most must
+    no not of on one or our out over said says she should so some such than that the
+    their them then there these they this those through to under up us was we were what
+    when which who will with would you your act section sections chapter division part
+    article commencing relating add amend repeal code law laws bill bills
+""".split())
+
+# ---------------------------------------------------------------------------
+# Term hashing (shared by the pure-Python and numpy paths)
+# ---------------------------------------------------------------------------
+
+_MASK_64     = (1 << 64) - 1
+_HASH_BASE   = 0x100000001B3           # h(word) = Σ byte[k]·BASE^k  mod 2^64
+_BIGRAM_MUL  = 0x9E3779B97F4A7C15      # h(a b) = (h(a)·MUL + h(b)) ^ SALT  mod 2^64
+_BIGRAM_SALT = 0xA0761D6478BD642F
+_WORD_RE     = re.compile(rb"[a-z0-9]+")
+_DIGITS_RE   = re.compile(rb"[0-9]+")
+
+
+def _word_hash(word: bytes) -> int:
+    h, p = 0, 1
+    for b in word:
+        h = (h + b * p) & _MASK_64
+        p = (p * _HASH_BASE) & _MASK_64
+    return h
+
+
+def _bigram_hash(a: int, b: int) -> int:
+    return ((a * _BIGRAM_MUL + b) & _MASK_64) ^ _BIGRAM_SALT
+
+
+_STOP_HASHES = frozenset(_word_hash(w.encode()) for w in _STOPWORDS)
+
+
+def _words(text: str) -> list[bytes]:
+    """Kept words: ASCII-lowercased [a-z0-9] runs, ≥2 chars, not all digits, not stopwords."""
+    return [
+        w for w in _WORD_RE.findall((text or "").encode("utf-8").lower())
+        if len(w) >= 2 and not _DIGITS_RE.fullmatch(w) and _word_hash(w) not in _STOP_HASHES
+    ]
+
+
+def _term_hashes(text: str) -> list[int]:
+    """Unigram + adjacent-bigram term hashes of one text (pure Python)."""
+    hs = [_word_hash(w) for w in _words(text)]
+    return hs + [_bigram_hash(a, b) for a, b in zip(hs, hs[1:])]
+
+
+def _term_names(text: str) -> dict[int, str]:
+    """hash → readable term, for logging the profile's top terms."""
+    ws = _words(text)
+    names = {_word_hash(w): w.decode() for w in ws}
+    for a, b in zip(ws, ws[1:]):
+        names[_bigram_hash(_word_hash(a), _word_hash(b))] = f"{a.decode()} {b.decode()}"
+    return names
+
+
+if np is not None:
+    _WORD_BYTES  = np.zeros(256, dtype=bool)
+    _ALPHA_BYTES = np.zeros(256, dtype=bool)
+    _WORD_BYTES[list(b"abcdefghijklmnopqrstuvwxyz0123456789")] = True
+    _ALPHA_BYTES[list(b"abcdefghijklmnopqrstuvwxyz")] = True
+    _NP_STOP = np.array(sorted(_STOP_HASHES), dtype=np.uint64)
+
+
+def _batch_term_hashes(texts: list[str]):
+    """(row, term-hash) arrays for a batch — same terms as _term_hashes, no per-word Python."""
+    encoded = [(t or "").encode("utf-8").lower() for t in texts]
+    buf     = np.frombuffer(b"\n".join(encoded), dtype=np.uint8)
+    empty   = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.uint64))
+
+    is_word = _WORD_BYTES[buf].astype(np.int8)
+    edges   = np.diff(np.concatenate(([0], is_word, [0])))
+    starts  = np.flatnonzero(edges == 1)
+    lens    = np.flatnonzero(edges == -1) - starts
+    if not starts.size:
+        return empty
+
+    # Per-byte BASE^(offset in word), summed per word with reduceat
+    offsets  = np.concatenate(([0], np.cumsum(lens)[:-1]))
+    byte_idx = np.flatnonzero(is_word)
+    pos      = np.arange(byte_idx.size) - np.repeat(offsets, lens)
+    powers   = np.ones(int(lens.max()), dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for k in range(1, powers.size):
+            powers[k] = powers[k - 1] * np.uint64(_HASH_BASE)
+        hashes = np.add.reduceat(buf[byte_idx].astype(np.uint64) * powers[pos], offsets)
+    has_alpha = np.add.reduceat(_ALPHA_BYTES[buf[byte_idx]].astype(np.int64), offsets) > 0
+
+    text_starts = np.cumsum([0] + [len(e) + 1 for e in encoded[:-1]])
+    rows = np.searchsorted(text_starts, starts, side="right") - 1
+    keep = (lens >= 2) & has_alpha & ~np.isin(hashes, _NP_STOP)
+    hashes, rows = hashes[keep], rows[keep]
+
+    same = rows[:-1] == rows[1:]
+    with np.errstate(over="ignore"):
+        bigrams = (hashes[:-1][same] * np.uint64(_BIGRAM_MUL) + hashes[1:][same]) ^ np.uint64(_BIGRAM_SALT)
+    return np.concatenate((rows, rows[:-1][same])), np.concatenate((hashes, bigrams))
+
+
+def _tf(count: int) -> float:
+    return 1.0 + math.log(count)
+
+
+# ---------------------------------------------------------------------------
+# Profile
+# ---------------------------------------------------------------------------
+
+def topic_documents(
+    bills: dict,
+    voices_root: Path | None = None,
+    seed_terms: Iterable[str] = (),
+) -> list[tuple[str, float]]:
+    """Weighted profile documents: tracked bills, client voice files, seed terms."""
+    docs: list[tuple[str, float]] = []
+    for bill in bills.values():
+        levels = (bill.get("analysis") or {}).values()
+        weight = max((_LEVEL_WEIGHTS.get(l, 0.0) for l in levels), default=0.0) or _NO_LEVEL_WEIGHT
+        docs.append((f"{bill.get('title', '')} {bill.get('summary', '')}", weight))
+    if voices_root is not None and voices_root.exists():
+        for path in sorted(voices_root.glob("*/voices/*.md")):
+            docs.append((path.read_text(encoding="utf-8"), _VOICE_WEIGHT))
+    seed = " . ".join(seed_terms)
+    if seed:
+        docs.append((seed, _SEED_WEIGHT))
+    return docs
+
+
+class TopicProfile:
+    """IDF table + normalized topic vector, indexed by sorted term hash."""
+
+    def __init__(self, documents: list[tuple[str, float]]):
+        docs = [(Counter(_term_hashes(text)), weight) for text, weight in documents if text.strip()]
+        df: Counter = Counter()
+        for counts, _ in docs:
+            df.update(counts.keys())
+
+        n = len(docs)
+        self.terms: list[int]      = sorted(df)
+        self.index: dict[int, int] = {h: i for i, h in enumerate(self.terms)}
+        self.idf:   list[float]    = [math.log((n + 1) / (df[h] + 1)) + 1.0 for h in self.terms]
+        # Terms never seen in the profile are maximally rare
+        self.oov_idf = math.log(n + 1) + 1.0
+
+        profile = [0.0] * len(self.terms)
+        for counts, weight in docs:
+            vec  = {self.index[h]: _tf(c) * self.idf[self.index[h]] for h, c in counts.items()}
+            norm = math.sqrt(sum(v * v for v in vec.values())) or 1.0
+            for i, v in vec.items():
+                profile[i] += weight * v / norm
+        norm = math.sqrt(sum(v * v for v in profile)) or 1.0
+        self.profile: list[float] = [v / norm for v in profile]
+        self._documents = documents
+
+        if np is not None:
+            # One trailing slot for out-of-vocabulary terms (idf = oov_idf, profile = 0)
+            self._np_terms   = np.array(self.terms, dtype=np.uint64)
+            self._np_idf     = np.array(self.idf + [self.oov_idf], dtype=np.float64)
+            self._np_profile = np.array(self.profile + [0.0], dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def top_terms(self, k: int = 20) -> list[str]:
+        """Highest-weighted profile terms (for logging / tuning)."""
+        names: dict[int, str] = {}
+        for text, _ in self._documents:
+            names.update(_term_names(text))
+        order = sorted(range(len(self.profile)), key=lambda i: -self.profile[i])[:k]
+        return [names.get(self.terms[i], "?") for i in order]
+
+    # ── Scoring ──────────────────────────────────────────────────────────────
+
+    def similarities(self, texts: list[str]) -> list[float]:
+        """Cosine similarity of each text's TF-IDF vector to the profile."""
+        if not texts:
+            return []
+        if np is None:
+            return [self._similarity_py(t) for t in texts]
+
+        rows, hashes = _batch_term_hashes(texts)
+        if not rows.size:
+            return [0.0] * len(texts)
+        # Count each (row, term) pair: sort, then take run lengths
+        order  = np.lexsort((hashes, rows))
+        rows, hashes = rows[order], hashes[order]
+        first  = np.concatenate(([True], (rows[1:] != rows[:-1]) | (hashes[1:] != hashes[:-1])))
+        starts = np.flatnonzero(first)
+        counts = np.diff(np.append(starts, rows.size))
+        rows, hashes = rows[starts], hashes[starts]
+
+        n_terms = len(self.terms)
+        cols  = np.minimum(np.searchsorted(self._np_terms, hashes), n_terms)
+        known = cols < n_terms
+        known[known] = self._np_terms[cols[known]] == hashes[known]
+        cols[~known] = n_terms
+
+        w     = (1.0 + np.log(counts)) * self._np_idf[cols]
+        dots  = np.bincount(rows, weights=w * self._np_profile[cols], minlength=len(texts))
+        norms = np.sqrt(np.bincount(rows, weights=w * w, minlength=len(texts)))
+        return np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0).tolist()
+
+    def _similarity_py(self, text: str) -> float:
+        dot = sq = 0.0
+        for h, c in Counter(_term_hashes(text)).items():
+            i = self.index.get(h)
+            w = _tf(c) * (self.idf[i] if i is not None else self.oov_idf)
+            if i is not None:
+                dot += w * self.profile[i]
+            sq += w * w
+        return dot / math.sqrt(sq) if sq > 0 else 0.0
+
+    def topic_scores(self, texts: list[str]) -> list[float]:
+        """Similarities mapped onto 0–TOPIC_SCORE_MAX (rounded to 2 places)."""
+        span = COSINE_SATURATION - COSINE_FLOOR
+        return [
+            round(min(max(s - COSINE_FLOOR, 0.0) / span, 1.0) * TOPIC_SCORE_MAX, 2)
+            for s in self.similarities(texts)
+        ]
+
+
+def article_text(article: dict) -> str:
+    """The text an article is scored on: title (repeated), summary, body excerpt."""
+    title = article.get("title") or ""
+    return " . ".join(
+        [title] * TITLE_REPEAT + [article.get("summary") or "", article.get("body_excerpt") or ""]
+    )
+
+
+def build_topic_profile(
+    bills: dict,
+    voices_root: Path | None = None,
+    seed_terms: Iterable[str] = (),
+) -> TopicProfile:
+    """TopicProfile from tracked bills, client voice files, and seed terms."""
+    return TopicProfile(topic_documents(bills, voices_root, seed_terms))
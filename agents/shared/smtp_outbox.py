@@ -0,0 +1,391 @@
+"""
+smtp_outbox.py — On-disk outbox delivering one message per recipient over pooled SMTP.
+
+Provides Outbox, SmtpSettings, DeliveryReport, send_via_outbox, and OUTBOX_DIR.
+
+Both emails used to go out as one sendmail() to every recipient over one
+connection: every reader saw the whole list in To:, and a single dropped
+connection or 4xx lost the send for everyone. Lists in the hundreds need
+each recipient delivered — and retried — on its own.
+
+A send is enqueued as a batch directory under data/outbox/ (git-ignored —
+it holds recipient addresses):
+
+    <batch>/message.eml   the message once, without a To: header
+    <batch>/queue.jsonl   per-recipient state, append-only, later lines win:
+                          {"recipient", "status", "attempts", "error", "at"}
+    <batch>/report.json   the delivery report, once no recipient is pending
+
+send_via_outbox() flushes only the batch it just enqueued. Batches left behind
+by a run that crashed or hit an auth failure are only delivered by an
+explicit resume (flush() without a batch list), and even then not once they
+are older than MAX_BATCH_AGE: those are expired — their pending recipients
+reported as failed — so a re-run never sends last week's issue, or a second
+copy of today's. Delivery uses a small pool of worker threads, each holding
+one authenticated connection reused for all of its messages. A recipient is
+sent its own copy (To: just them). 4xx replies and dropped connections are
+retried with exponential backoff on a fresh connection; 5xx replies fail
+that recipient at once. A failed login stops the flush and re-raises
+SMTPAuthenticationError, leaving the queue pending. When a batch finishes,
+its message.eml is deleted and report.json written.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import smtplib
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from email.message import Message
+from email.policy import SMTP as SMTP_POLICY
+from pathlib import Path
+from queue import Empty, Queue
+from typing import Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+OUTBOX_DIR   = PROJECT_ROOT / "data" / "outbox"
+
+MAX_CONNECTIONS = 3      # pooled SMTP connections (worker threads) per flush
+RETRY_ATTEMPTS  = 4      # deliveries tried per recipient before giving up
+RETRY_BACKOFF   = 2.0    # seconds before the first retry; doubles each time
+MAX_BATCH_AGE   = timedelta(hours=24)   # older pending batches are expired, not sent
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class SmtpSettings:
+    host:     str
+    port:     int
+    user:     str
+    password: str
+    starttls: bool = True      # ignored on port 465 (implicit TLS)
+    timeout:  float = 30
+
+
+@dataclass
+class DeliveryReport:
+    """Outcome of one batch: who got it, who didn't and why."""
+    batch:     str
+    subject:   str
+    sent:      list[str] = field(default_factory=list)
+    failed:    dict[str, str] = field(default_factory=dict)
+    pending:   list[str] = field(default_factory=list)
+    attempts:  int = 0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed and not self.pending
+
+    def summary(self) -> str:
+        total = len(self.sent) + len(self.failed) + len(self.pending)
+        line = f"{len(self.sent)}/{total} delivered ({self.attempts} attempts)"
+        if self.failed:
+            line += f", {len(self.failed)} failed"
+        if self.pending:
+            line += f", {len(self.pending)} still queued"
+        return line
+
+
+class _Transient(Exception):
+    """A delivery failure worth retrying (4xx, dropped connection)."""
+
+    def __init__(self, message: str, reconnect: bool = False):
+        super().__init__(message)
+        self.reconnect = reconnect
+
+
+class _Permanent(Exception):
+    """A delivery failure retrying won't fix (5xx)."""
+
+
+class Outbox:
+    """Batches of per-recipient deliveries persisted under `path`."""
+
+    def __init__(self, path: Path = OUTBOX_DIR):
+        self.path = path
+        self._lock = threading.Lock()
+
+    # ── Queue ────────────────────────────────────────────────────────────────
+
+    def enqueue(self, msg: Message, sender: str, recipients: list[str]) -> str:
+        """Persist `msg` for each of `recipients`. Returns the batch id."""
+        batch = f"{datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:6]}"
+        bdir = self.path / batch
+        bdir.mkdir(parents=True)
+
+        del msg["To"]
+        (bdir / "message.eml").write_bytes(msg.as_bytes(policy=SMTP_POLICY))
+        (bdir / "meta.json").write_text(json.dumps({
+            "sender":  sender,
+            "subject": str(msg.get("Subject", "")),
+            "created": datetime.now().isoformat(timespec="seconds"),
+        }, indent=2))
+        self._append(bdir, [
+            {"recipient": r, "status": "pending", "attempts": 0}
+            for r in dict.fromkeys(recipients)
+        ])
+        return batch
+
+    def pending_batches(self) -> list[str]:
+        """Batch ids that still have a message to deliver, oldest first."""
+        if not self.path.exists():
+            return []
+        return sorted(p.parent.name for p in self.path.glob("*/message.eml"))
+
+    def _state(self, bdir: Path) -> dict[str, dict]:
+        state: dict[str, dict] = {}
+        for line in (bdir / "queue.jsonl").read_text(encoding="utf-8").splitlines():
+            if line.strip():
+                rec = json.loads(line)
+                state[rec["recipient"]] = rec
+        return state
+
+    def _append(self, bdir: Path, records: list[dict]) -> None:
+        with self._lock, open(bdir / "queue.jsonl", "a", encoding="utf-8") as f:
+            for rec in records:
+                f.write(json.dumps(rec) + "\n")
+
+    # ── Delivery ─────────────────────────────────────────────────────────────
+
+    def flush(
+        self,
+        settings: SmtpSettings,
+        batches: Optional[list[str]] = None,
+        max_connections: int = MAX_CONNECTIONS,
+        attempts: int = RETRY_ATTEMPTS,
+        backoff: float = RETRY_BACKOFF,
+        max_age: timedelta = MAX_BATCH_AGE,
+    ) -> list[DeliveryReport]:
+        """Deliver the pending recipients of `batches` (default: every pending batch).
+
+        Only batches sent as settings.user are touched; others are left for a
+        flush that can authenticate as their sender. A batch queued more than
+        max_age ago is expired instead of delivered: its pending recipients
+        are marked failed and its report written. Raises
+        SMTPAuthenticationError if login fails.
+        """
+        wanted = set(self.pending_batches() if batches is None else batches)
+        work: Queue = Queue()
+        loaded: dict[str, dict] = {}
+        expired: list[DeliveryReport] = []
+        for batch in self.pending_batches():
+            if batch not in wanted:
+                continue
+            bdir = self.path / batch
+            meta = json.loads((bdir / "meta.json").read_text())
+            if meta["sender"] != settings.user:
+                continue
+            state = self._state(bdir)
+            b = {
+                "dir":     bdir,
+                "meta":    meta,
+                "data":    (bdir / "message.eml").read_bytes(),
+                "state":   state,
+                "tried":   0,
+            }
+            if datetime.now() - datetime.fromisoformat(meta["created"]) > max_age:
+                expired.append(self._expire(batch, b))
+                continue
+            loaded[batch] = b
+            for rec in state.values():
+                if rec["status"] == "pending":
+                    work.put((batch, rec["recipient"]))
+
+        n_workers = min(max_connections, work.qsize())
+        stop      = threading.Event()
+        errors: list[BaseException] = []
+
+        def worker() -> None:
+            conn: Optional[smtplib.SMTP] = None
+            try:
+                while not stop.is_set():
+                    try:
+                        batch, rcpt = work.get_nowait()
+                    except Empty:
+                        return
+                    b = loaded[batch]
+                    conn, rec, tried = _deliver(conn, settings, b, rcpt, attempts, backoff)
+                    with self._lock:
+                        b["state"][rcpt] = rec
+                        b["tried"] += tried
+                    self._append(b["dir"], [rec])
+            except smtplib.SMTPAuthenticationError as exc:
+                errors.append(exc)
+                stop.set()
+            finally:
+                _close(conn)
+
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(n_workers)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        if errors:
+            raise errors[0]
+
+        return expired + [self._finish(batch, b) for batch, b in loaded.items()]
+
+    def _expire(self, batch: str, b: dict) -> DeliveryReport:
+        """Fail every still-pending recipient of a stale batch and close it out."""
+        error = f"expired: queued {b['meta']['created']}, not delivered"
+        recs  = [
+            _record(rcpt, "failed", rec["attempts"], error)
+            for rcpt, rec in b["state"].items() if rec["status"] == "pending"
+        ]
+        self._append(b["dir"], recs)
+        b["state"].update({rec["recipient"]: rec for rec in recs})
+        return self._finish(batch, b)
+
+    def _finish(self, batch: str, b: dict) -> DeliveryReport:
+        report = DeliveryReport(batch=batch, subject=b["meta"]["subject"], attempts=b["tried"])
+        for rcpt, rec in b["state"].items():
+            if rec["status"] == "sent":
+                report.sent.append(rcpt)
+            elif rec["status"] == "failed":
+                report.failed[rcpt] = rec.get("error", "")
+            else:
+                report.pending.append(rcpt)
+        if not report.pending:
+            (b["dir"] / "report.json").write_text(json.dumps(asdict(report), indent=2))
+            (b["dir"] / "message.eml").unlink()
+        return report
+
+
+# ---------------------------------------------------------------------------
+# One recipient over a pooled connection
+# ---------------------------------------------------------------------------
+
+def _connect(settings: SmtpSettings) -> smtplib.SMTP:
+    if settings.port == 465:
+        conn = smtplib.SMTP_SSL(settings.host, settings.port, timeout=settings.timeout)
+    else:
+        conn = smtplib.SMTP(settings.host, settings.port, timeout=settings.timeout)
+    try:
+        if settings.port != 465:
+            conn.ehlo()
+            if settings.starttls:
+                conn.starttls()
+                conn.ehlo()
+        conn.login(settings.user, settings.password)
+    except BaseException:
+        conn.close()
+        raise
+    return conn
+
+
+def _close(conn: Optional[smtplib.SMTP]) -> None:
+    if conn is None:
+        return
+    try:
+        conn.quit()
+    except (smtplib.SMTPException, OSError):
+        conn.close()
+
+
+def _send_one(conn: smtplib.SMTP, sender: str, rcpt: str, data: bytes) -> None:
+    """sendmail() to one recipient, sorting failures into transient / permanent."""
+    try:
+        conn.sendmail(sender, [rcpt], b"To: " + rcpt.encode() + b"\r\n" + data)
+    except smtplib.SMTPAuthenticationError:
+        raise
+    except smtplib.SMTPRecipientsRefused as exc:
+        code, resp = exc.recipients.get(rcpt, (550, b""))
+        _raise_for_reply(code, resp)
+    except smtplib.SMTPResponseException as exc:
+        _raise_for_reply(exc.smtp_code, exc.smtp_error)
+    except (smtplib.SMTPServerDisconnected, OSError) as exc:
+        raise _Transient(f"connection lost: {exc}", reconnect=True) from None
+
+
+def _raise_for_reply(code: int, resp) -> None:
+    text = resp.decode(errors="replace") if isinstance(resp, bytes) else str(resp)
+    error = f"{code} {text}"
+    if 400 <= code < 500:
+        raise _Transient(error, reconnect=code == 421)    # 421: server is closing the connection
+    raise _Permanent(error)
+
+
+def _deliver(
+    conn: Optional[smtplib.SMTP],
+    settings: SmtpSettings,
+    batch: dict,
+    rcpt: str,
+    attempts: int,
+    backoff: float,
+) -> tuple[Optional[smtplib.SMTP], dict, int]:
+    """Deliver to `rcpt`, retrying transient failures.
+
+    Returns the connection to reuse (None if it was dropped), the recipient's
+    new queue record, and the attempts made.
+    """
+    prior = batch["state"][rcpt]["attempts"]
+    error = ""
+    for attempt in range(attempts):
+        if attempt:
+            time.sleep(backoff * 2 ** (attempt - 1))
+        if conn is None:
+            try:
+                conn = _connect(settings)
+            except smtplib.SMTPAuthenticationError:
+                raise
+            except (smtplib.SMTPException, OSError) as exc:
+                error = f"connect failed: {exc}"
+                continue
+        try:
+            _send_one(conn, batch["meta"]["sender"], rcpt, batch["data"])
+            return conn, _record(rcpt, "sent", prior + attempt + 1), attempt + 1
+        except _Permanent as exc:
+            return conn, _record(rcpt, "failed", prior + attempt + 1, str(exc)), attempt + 1
+        except _Transient as exc:
+            error = str(exc)
+            if exc.reconnect:
+                _close(conn)
+                conn = None
+    error = f"gave up after {attempts} attempts: {error}"
+    return conn, _record(rcpt, "failed", prior + attempts, error), attempts
+
+
+def _record(rcpt: str, status: str, attempts: int, error: str = "") -> dict:
+    rec = {"recipient": rcpt, "status": status, "attempts": attempts,
+           "at": datetime.now().isoformat(timespec="seconds")}
+    if error:
+        rec["error"] = error
+    return rec
+
+
+# ---------------------------------------------------------------------------
+# Convenience for the senders
+# ---------------------------------------------------------------------------
+
+def send_via_outbox(
+    msg: Message,
+    sender: str,
+    recipients: list[str],
+    settings: SmtpSettings,
+    outbox: Optional[Outbox] = None,
+    logger: Optional[logging.Logger] = None,
+) -> DeliveryReport:
+    """Enqueue `msg` for `recipients`, deliver it, and log the report.
+
+    Only this message's batch is flushed. Batches left over from earlier runs
+    stay queued (and are counted in the log) until resumed explicitly with
+    Outbox.flush().
+    """
+    out = logger or log
+    outbox = outbox or Outbox()
+    batch = outbox.enqueue(msg, sender, recipients)
+    left  = [b for b in outbox.pending_batches() if b != batch]
+    if left:
+        out.warning(f"   ⚠ {len(left)} earlier batch(es) still queued in {outbox.path} — not resent")
+    reports = outbox.flush(settings, [batch])
+    for report in reports:
+        mark = "✓" if report.ok else "⚠"
+        out.info(f"   {mark} {report.subject or report.batch}: {report.summary()}")
+        for rcpt, error in report.failed.items():
+            out.warning(f"     ✗ {rcpt}: {error}")
+    return next(r for r in reports if r.batch == batch)
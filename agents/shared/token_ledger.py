@@ -0,0 +1,319 @@
+"""
+token_ledger.py — Token, latency, and cost accounting for Claude calls.
+
+Provides configure_ledger, tracked_create, tracked_stream, ledger_summary,
+print_ledger_summary, and TokenBudgetExceeded.
+
+Every agent routes its messages.create() calls through tracked_create() (or
+streamed calls through tracked_stream()), which times the call, reads
+message.usage, and appends one JSON line to the run's ledger file:
+
+    logs/token_ledger/run_<run_id>.jsonl
+
+All agents in one pipeline run share a ledger when they share a run id
+(CSF_RUN_ID, falling back to GITHUB_RUN_ID in Actions, else a per-process
+timestamp). The token budget — --budget N on each agent, or CSF_TOKEN_BUDGET
+in the environment — is checked against the whole run's ledger *before* each
+call, so a call that could push the run over the limit is never made. Each
+call's estimate stays reserved until its usage is recorded, so calls made in
+parallel (threads in one process) can't all pass the check at once.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+LEDGER_DIR   = PROJECT_ROOT / "logs" / "token_ledger"
+
+# USD per million tokens (input, output). Unknown models show no cost.
+_PRICING_PER_MTOK: dict[str, tuple[float, float]] = {
+    "claude-sonnet-4-6": (3.00, 15.00),
+}
+
+# Rough prompt-size estimate used only for the pre-call budget check.
+_CHARS_PER_TOKEN = 4
+
+
+class TokenBudgetExceeded(RuntimeError):
+    """Raised before a Claude call that could take the run past its token budget."""
+
+
+# ---------------------------------------------------------------------------
+# Run state
+# ---------------------------------------------------------------------------
+
+_lock       = threading.Lock()
+_run_id: Optional[str] = None
+_budget: Optional[int] = None
+_ledger_dir = LEDGER_DIR
+_reserved   = 0        # estimated tokens of calls in flight (guarded by _lock)
+
+
+def configure_ledger(
+    budget: Optional[int] = None,
+    run_id: Optional[str] = None,
+    ledger_dir: Optional[Path] = None,
+) -> Path:
+    """Set the run id, token budget, and ledger directory. Returns the ledger path.
+
+    Args:
+        budget:     Max total tokens (input + output) for the run. None falls
+                    back to CSF_TOKEN_BUDGET; unset/0 means no limit.
+        run_id:     Ledger key shared by every agent in one pipeline run.
+        ledger_dir: Override LEDGER_DIR (tests).
+    """
+    global _run_id, _budget, _ledger_dir, _reserved
+    with _lock:
+        _run_id = run_id or _default_run_id()
+        _reserved = 0
+        env_budget = os.environ.get("CSF_TOKEN_BUDGET")
+        if budget is None and env_budget:
+            budget = int(env_budget)
+        _budget = budget or None
+        if ledger_dir is not None:
+            _ledger_dir = ledger_dir
+    return _ledger_path()
+
+
+def _default_run_id() -> str:
+    return (
+        os.environ.get("CSF_RUN_ID")
+        or os.environ.get("GITHUB_RUN_ID")
+        or datetime.now().strftime("%Y%m%d-%H%M%S")
+    )
+
+
+def _ledger_path() -> Path:
+    global _run_id
+    if _run_id is None:
+        _run_id = _default_run_id()
+    return _ledger_dir / f"run_{_run_id}.jsonl"
+
+
+def _read_entries() -> list[dict]:
+    path = _ledger_path()
+    if not path.exists():
+        return []
+    entries = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if line.strip():
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return entries
+
+
+def _run_tokens() -> int:
+    return sum(e.get("input_tokens", 0) + e.get("output_tokens", 0) for e in _read_entries())
+
+
+# ---------------------------------------------------------------------------
+# Tracked call
+# ---------------------------------------------------------------------------
+
+def _estimate_call_tokens(kwargs: dict) -> int:
+    """Upper-ish bound for one call: prompt chars / 4 plus max_tokens."""
+    chars = len(str(kwargs.get("system", "")))
+    for msg in kwargs.get("messages", []):
+        chars += len(str(msg.get("content", "")))
+    if kwargs.get("tools"):
+        chars += len(json.dumps(kwargs["tools"]))
+    return chars // _CHARS_PER_TOKEN + int(kwargs.get("max_tokens", 0))
+
+
+def _check_budget(agent: str, kwargs: dict) -> int:
+    """Reserve this call's estimate against the budget. Returns the tokens reserved.
+
+    The reservation is settled when the call's usage is recorded (_record),
+    or released if the call fails before it returns anything (_release).
+    """
+    global _reserved
+    if not _budget:
+        return 0
+    estimate = _estimate_call_tokens(kwargs)
+    with _lock:
+        used = _run_tokens()
+        if used + _reserved + estimate > _budget:
+            in_flight = f" (+{_reserved:,} reserved by calls in flight)" if _reserved else ""
+            raise TokenBudgetExceeded(
+                f"{agent}: run has used {used:,} tokens{in_flight}; next call "
+                f"(~{estimate:,}) would exceed budget of {_budget:,}"
+            )
+        _reserved += estimate
+    return estimate
+
+
+def _release(reserved: int) -> None:
+    global _reserved
+    with _lock:
+        _reserved -= reserved
+
+
+def tracked_create(client: Any, agent: str, **kwargs: Any) -> Any:
+    """Call client.messages.create(**kwargs) and record usage + latency.
+
+    Raises TokenBudgetExceeded (without calling the API) if the run's tokens so
+    far plus this call's estimate would exceed the configured budget.
+    """
+    reserved = _check_budget(agent, kwargs)
+
+    started = time.perf_counter()
+    try:
+        message = client.messages.create(**kwargs)
+    except BaseException:
+        _release(reserved)
+        raise
+    _record(agent, kwargs, message, time.perf_counter() - started, reserved=reserved)
+    return message
+
+
+def tracked_stream(
+    client: Any,
+    agent: str,
+    on_text: Optional[Callable[[str], None]] = None,
+    **kwargs: Any,
+) -> Any:
+    """Stream client.messages.stream(**kwargs), passing each text delta to on_text.
+
+    Returns the final message, recorded like tracked_create. If on_text raises
+    (e.g. the output has gone off-schema), the stream is closed at once — no
+    more tokens are generated — the partial call is recorded with
+    stop_reason "aborted", and the exception propagates.
+    """
+    reserved = _check_budget(agent, kwargs)
+
+    started = time.perf_counter()
+    try:
+        with client.messages.stream(**kwargs) as stream:
+            try:
+                for text in stream.text_stream:
+                    if on_text is not None:
+                        on_text(text)
+            except BaseException:
+                try:
+                    partial = stream.current_message_snapshot
+                except Exception:
+                    partial = None
+                _record(agent, kwargs, partial, time.perf_counter() - started,
+                        stop_reason="aborted", reserved=reserved)
+                reserved = 0
+                raise
+            message = stream.get_final_message()
+    except BaseException:
+        _release(reserved)
+        raise
+    _record(agent, kwargs, message, time.perf_counter() - started, reserved=reserved)
+    return message
+
+
+def _record(
+    agent: str,
+    kwargs: dict,
+    message: Any,
+    latency: float,
+    stop_reason: Optional[str] = None,
+    reserved: int = 0,
+) -> None:
+    usage = getattr(message, "usage", None)
+    entry = {
+        "timestamp":     datetime.now().isoformat(timespec="seconds"),
+        "run_id":        _run_id,
+        "agent":         agent,
+        "model":         kwargs.get("model", ""),
+        "input_tokens":  int(getattr(usage, "input_tokens", 0) or 0),
+        "output_tokens": int(getattr(usage, "output_tokens", 0) or 0),
+        "cache_read_input_tokens":     int(getattr(usage, "cache_read_input_tokens", 0) or 0),
+        "cache_creation_input_tokens": int(getattr(usage, "cache_creation_input_tokens", 0) or 0),
+        "latency_s":     round(latency, 3),
+        "stop_reason":   stop_reason or getattr(message, "stop_reason", None),
+    }
+    _append_entry(entry, reserved)
+
+
+def _append_entry(entry: dict, reserved: int = 0) -> None:
+    """Append one ledger line, settling the call's reservation in the same step."""
+    global _reserved
+    with _lock:
+        path = _ledger_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+        _reserved -= reserved
+
+
+# ---------------------------------------------------------------------------
+# Summary
+# ---------------------------------------------------------------------------
+
+def _cost(model: str, input_tokens: int, output_tokens: int) -> Optional[float]:
+    prices = _PRICING_PER_MTOK.get(model)
+    if not prices:
+        return None
+    return (input_tokens * prices[0] + output_tokens * prices[1]) / 1_000_000
+
+
+def ledger_summary() -> dict[str, dict]:
+    """Aggregate the current run's ledger by agent.
+
+    Returns {agent: {calls, input_tokens, output_tokens, latency_s, cost_usd}};
+    cost_usd is None if any call used a model with no known pricing.
+    """
+    totals: dict[str, dict] = defaultdict(lambda: {
+        "calls": 0, "input_tokens": 0, "output_tokens": 0,
+        "latency_s": 0.0, "cost_usd": 0.0,
+    })
+    for e in _read_entries():
+        row = totals[e.get("agent", "?")]
+        row["calls"]         += 1
+        row["input_tokens"]  += e.get("input_tokens", 0)
+        row["output_tokens"] += e.get("output_tokens", 0)
+        row["latency_s"]     += e.get("latency_s", 0.0)
+        cost = _cost(e.get("model", ""), e.get("input_tokens", 0), e.get("output_tokens", 0))
+        row["cost_usd"] = None if cost is None or row["cost_usd"] is None else row["cost_usd"] + cost
+    return dict(totals)
+
+
+def print_ledger_summary() -> None:
+    """Print a per-agent token / latency / cost table for the current run."""
+    summary = ledger_summary()
+    if not summary:
+        return
+
+    print(f"\n  Token ledger — run {_run_id}")
+    header = f"  {'Agent':<20} {'Calls':>5} {'Input':>10} {'Output':>9} {'Latency':>9} {'Cost':>8}"
+    print(header)
+    print("  " + "─" * (len(header) - 2))
+
+    total = {"calls": 0, "input_tokens": 0, "output_tokens": 0, "latency_s": 0.0, "cost_usd": 0.0}
+    for agent, row in sorted(summary.items()):
+        cost = f"${row['cost_usd']:.3f}" if row["cost_usd"] is not None else "—"
+        print(
+            f"  {agent:<20} {row['calls']:>5} {row['input_tokens']:>10,} "
+            f"{row['output_tokens']:>9,} {row['latency_s']:>8.1f}s {cost:>8}"
+        )
+        for k in ("calls", "input_tokens", "output_tokens", "latency_s"):
+            total[k] += row[k]
+        total["cost_usd"] = (
+            None if row["cost_usd"] is None or total["cost_usd"] is None
+            else total["cost_usd"] + row["cost_usd"]
+        )
+
+    cost = f"${total['cost_usd']:.3f}" if total["cost_usd"] is not None else "—"
+    print("  " + "─" * (len(header) - 2))
+    print(
+        f"  {'TOTAL':<20} {total['calls']:>5} {total['input_tokens']:>10,} "
+        f"{total['output_tokens']:>9,} {total['latency_s']:>8.1f}s {cost:>8}"
+    )
+    if _budget:
+        used = total["input_tokens"] + total["output_tokens"]
+        print(f"  Budget: {used:,} / {_budget:,} tokens ({used / _budget:.0%})")
+    print()
@@ -76,6 +76,12 @@ from agents.shared.client_utils import (
     _load_client, _list_clients, _load_voice, _list_voices,
 )
 from agents.shared.bill_utils import _CRIT_KEYS, _select_bills, _build_bill_context
+from agents.shared.token_ledger import (
+    TokenBudgetExceeded,
+    configure_ledger,
+    print_ledger_summary,
+    tracked_create,
+)
 
 # ---------------------------------------------------------------------------
 # Logging
@@ -110,6 +116,14 @@ def _load_media_digest(path: Path | None = None) -> dict | None:
         return None
 
 
+def _related_bills(article: dict, limit: int = 3) -> list[str]:
+    """Bills linked to an article by author, committee, or similarity (not named in it)."""
+    return [
+        l["bill_number"] for l in article.get("bill_links", [])
+        if l.get("via") != "bill_number"
+    ][:limit]
+
+
 def _format_media_context(digest: dict | None) -> str:
     """Format media digest articles into a Claude-readable context block."""
     if not digest:
@@ -126,6 +140,8 @@ def _format_media_context(digest: dict | None) -> str:
         "== NEWS & MEDIA CONTEXT (past 7 days — from media_scanner.py) ==",
         "Use this to make posts timely and reactive to current news. Hook into",
         "the most relevant story where it strengthens the local control framing.",
+        "\"Related\" bills are matched by author, committee, or subject — the story",
+        "doesn't name them, so don't claim it does.",
         "",
     ]
 
@@ -137,10 +153,12 @@ def _format_media_context(digest: dict | None) -> str:
             title         = a.get("title", "")
             pub           = a.get("published", "")
             bills         = a.get("bill_mentions", [])
+            related       = _related_bills(a)
             article_blurb = a.get("summary", "")[:200]
 
             bill_str = f"  [bills: {', '.join(bills)}]" if bills else ""
-            lines.append(f"  [{score:.1f}] {source} | {pub} | {title}{bill_str}")
+            rel_str  = f"  [related: {', '.join(related)}]" if related else ""
+            lines.append(f"  [{score:.1f}] {source} | {pub} | {title}{bill_str}{rel_str}")
             if article_blurb:
                 lines.append(f"       Summary: {article_blurb}")
 
@@ -159,6 +177,13 @@ def _format_media_context(digest: dict | None) -> str:
         lines.append("")
         lines.append(f"Bills getting the most media attention: {', '.join(top_bills[:5])}")
 
+    trending = summary.get("trending_bills", [])
+    if trending:
+        lines.append(
+            "Bills trending in coverage (spiking above their usual level): "
+            + ", ".join(f"{t['bill_number']} ({t['mentions']} mentions)" for t in trending[:5])
+        )
+
     return "\n".join(lines)
 
 
@@ -391,7 +416,9 @@ Count X characters carefully — every space and punctuation mark counts toward
 
     system_prompt = _build_system_prompt(voice_text, client_cfg or {})
     log.info("→ Calling Claude to generate social media content...")
-    message = client.messages.create(
+    message = tracked_create(
+        client,
+        "social_writer",
         model="claude-sonnet-4-6",
         max_tokens=4000,
         system=system_prompt,
@@ -1051,6 +1078,13 @@ examples:
             "alongside enriched Visual Director prompts for each post. For human review."
         ),
     )
+    p.add_argument(
+        "--budget", type=int, default=None, metavar="TOKENS",
+        help=(
+            "Abort before a Claude call would take this run past TOKENS total "
+            "tokens (default: CSF_TOKEN_BUDGET, or unlimited)."
+        ),
+    )
     return p.parse_args()
 
 
@@ -1140,8 +1174,14 @@ def main() -> None:
             log.info("   (Run media_scanner.py first to enable news-aware posts)")
 
     # ── Generate content via Claude ─────────────────────────────────────────
+    configure_ledger(budget=args.budget)
     anthropic_client = anthropic.Anthropic(api_key=api_key)
-    content = _generate_content(bill_set, anthropic_client, media_digest, voice_text, client_cfg)
+    try:
+        content = _generate_content(bill_set, anthropic_client, media_digest, voice_text, client_cfg)
+    except TokenBudgetExceeded as exc:
+        log.error(f"Token budget exceeded — aborting: {exc}")
+        print_ledger_summary()
+        sys.exit(1)
     posts   = content.get("posts", [])
     log.info(f"   ✓ {len(posts)} posts generated")
 
@@ -1185,7 +1225,12 @@ def main() -> None:
             compare = getattr(args, "compare", False)
             images_dir = output_dir / "images" / iso_week
             log.info("→ Visual Director: enriching image briefs via Claude...")
-            enriched_briefs = enrich_briefs(posts, client_cfg, voice_text, compare=compare)
+            try:
+                enriched_briefs = enrich_briefs(posts, client_cfg, voice_text, compare=compare)
+            except TokenBudgetExceeded as exc:
+                log.error(f"Token budget exceeded — aborting: {exc}")
+                print_ledger_summary()
+                sys.exit(1)
 
             # Save enriched briefs for inspection
             briefs_path = social_data_dir / "visual_director_briefs.json"
@@ -1252,6 +1297,7 @@ def main() -> None:
             print(f"  ✓ VD briefs:     {(social_data_dir / 'visual_director_briefs.json').relative_to(PROJECT_ROOT)}")
     print(f"\n  Share preview: file://{html_path}")
     print(f"  Copy-paste:    file://{md_path}\n")
+    print_ledger_summary()
 
 
 if __name__ == "__main__":
@@ -58,6 +58,12 @@ from agents.shared.client_utils import (
     CLIENTS_DIR, DEFAULT_CLIENT, DEFAULT_VOICE,
     _load_client, _list_clients, _load_voice, _list_voices,
 )
+from agents.shared.token_ledger import (
+    TokenBudgetExceeded,
+    configure_ledger,
+    print_ledger_summary,
+    tracked_create,
+)
 
 # ---------------------------------------------------------------------------
 # Logging
@@ -353,7 +359,9 @@ Return ONLY valid JSON with the structure from your system prompt."""
     system_prompt = _build_system_prompt(client_cfg, voice_text)
 
     log.info(f"   → Calling Claude for Post {num} ({meta['label']})...")
-    message = claude.messages.create(
+    message = tracked_create(
+        claude,
+        "visual_director",
         model="claude-sonnet-4-6",
         max_tokens=4000,
         system=system_prompt,
@@ -601,6 +609,11 @@ def main() -> None:
         "--list-voices", action="store_true", default=False,
         help="Print all available voices for the selected client and exit.",
     )
+    p.add_argument(
+        "--budget", type=int, default=None, metavar="TOKENS",
+        help="Abort before a Claude call would take this run past TOKENS total tokens "
+             "(default: CSF_TOKEN_BUDGET, or unlimited).",
+    )
     args = p.parse_args()
 
     # ── --list-clients ────────────────────────────────────────────────────────
@@ -671,7 +684,13 @@ def main() -> None:
     print(f"  Images:  {'yes' if args.images else 'no'}\n")
 
     # ── Enrich briefs via Claude ──────────────────────────────────────────────
-    enriched_briefs = enrich_briefs(posts, client_cfg, voice_text, compare=args.compare)
+    configure_ledger(budget=args.budget)
+    try:
+        enriched_briefs = enrich_briefs(posts, client_cfg, voice_text, compare=args.compare)
+    except TokenBudgetExceeded as exc:
+        log.error(f"Token budget exceeded — aborting: {exc}")
+        print_ledger_summary()
+        sys.exit(1)
 
     # ── Write enriched briefs JSON ────────────────────────────────────────────
     output_path = args.output or (DATA_SOCIAL_DIR / client_id / "visual_director_briefs.json")
@@ -711,6 +730,7 @@ def main() -> None:
     if args.compare:
         print(f"\n  (Comparison printed above — scroll up to review)")
     print()
+    print_ledger_summary()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark bill ↔ article similarity linking (agents/shared/bill_linker.py):
+numpy batch scoring vs the pure-Python inverted-index fallback.
+
+Corpus:
+    bills    — data/bills/tracked_bills.json, padded to --bills by re-numbered
+               copies with a random 80% of each copy's words (so IDF and the
+               postings look like a larger session, not exact duplicates)
+    articles — the article store window (data/media/article_store.jsonl) or
+               the digest's articles, padded to --articles with synthetic
+               stories that paraphrase a random bill's summary amid filler
+
+Verifies both paths pick the same top-k bills before reporting timings.
+
+Usage:
+    .venv/bin/python scripts/bench_bill_linker.py
+    .venv/bin/python scripts/bench_bill_linker.py --bills 5000 --articles 500 --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+# Bootstrap path so we can import from agents/
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from agents.media.media_scanner import BILLS_FILE, OUTPUT_FILE, _link_text
+from agents.shared import bill_linker
+from agents.shared.article_store import ArticleStore
+from agents.shared.bill_linker import BillLinker
+
+_FILLER = (
+    "city council members said on Tuesday that residents packed the meeting and the "
+    "mayor promised to revisit the plan before the budget vote next month while "
+    "opponents warned of traffic and neighbors questioned the timeline"
+).split()
+
+
+def _bills(n: int, rng: random.Random) -> dict:
+    real  = json.loads(BILLS_FILE.read_text())["bills"]
+    bills = dict(real)
+    while len(bills) < n:
+        bn, b = rng.choice(list(real.items()))
+        words = f"{b.get('title', '')} {b.get('summary', '')}".split()
+        kept  = [w for w in words if rng.random() < 0.8]
+        bills[f"{bn}-{len(bills)}"] = {"title": " ".join(kept[:12]), "summary": " ".join(kept[12:])}
+    return bills
+
+
+def _articles(n: int, bills: dict, rng: random.Random) -> list[str]:
+    texts = [_link_text(r) for r in ArticleStore().in_window(date.min)]
+    if not texts and OUTPUT_FILE.exists():
+        texts = [_link_text(a) for a in json.loads(OUTPUT_FILE.read_text()).get("articles", [])]
+    numbers = list(bills)
+    while len(texts) < n:
+        words = (bills[rng.choice(numbers)].get("summary") or "").split()
+        start = rng.randrange(max(1, len(words) - 20))
+        texts.append(" ".join(rng.sample(_FILLER, 15) + words[start:start + 20] + rng.sample(_FILLER, 10)))
+    return texts[:n]
+
+
+def _time(fn, runs: int) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="Benchmark bill ↔ article similarity linking.")
+    p.add_argument("--bills", type=int, default=3000, help="Bills in the corpus (default: 3000)")
+    p.add_argument("--articles", type=int, default=300, help="Articles per batch (default: 300)")
+    p.add_argument("--runs", type=int, default=3, help="Timed runs, best kept (default: 3)")
+    args = p.parse_args()
+
+    rng   = random.Random(20260301)
+    bills = _bills(args.bills, rng)
+    texts = _articles(args.articles, bills, rng)
+    print(f"\n  Corpus: {len(bills):,} bills × {len(texts):,} articles")
+
+    started = time.perf_counter()
+    linker  = BillLinker(bills)
+    t_build = time.perf_counter() - started
+
+    fast = linker.top_bills(texts)
+    np_mod, bill_linker.np = bill_linker.np, None
+    try:
+        pure_linker = BillLinker(bills)
+        pure = pure_linker.top_bills(texts)
+        t_pure = _time(lambda: pure_linker.top_bills(texts), 1)
+    finally:
+        bill_linker.np = np_mod
+
+    if [[bn for bn, _ in r] for r in fast] != [[bn for bn, _ in r] for r in pure]:
+        print("  ✗ numpy and pure-Python top-k differ")
+        sys.exit(1)
+    linked = sum(1 for r in fast if r)
+    print(f"  Identical top-{bill_linker.TOP_K} links ✓  ({linked:,} of {len(texts):,} articles linked)")
+
+    if bill_linker.np is None:
+        print("  numpy not installed — pure-Python timing only")
+    else:
+        t_np = _time(lambda: linker.top_bills(texts), args.runs)
+        print(f"  numpy batch:         {t_np * 1000:8.1f} ms")
+    print(f"  pure Python:         {t_pure * 1000:8.1f} ms")
+    print(f"  Index build:         {t_build * 1000:8.1f} ms  ({len(linker):,} bills)\n")
+
+
+if __name__ == "__main__":
+    main()
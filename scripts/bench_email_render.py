@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark the tracker email + status page render (agents/legislative/email_sender.py)
+with the full bill index, cold vs with the fragment cache warm.
+
+Corpus:
+    data/bills/tracked_bills.json, padded to --bills by re-numbered copies
+    (2% of copies on the staff watchlist), with the first 40 bills as "new"
+    and the next 40 as status changes.
+
+A tracker run renders the email and then the status page from the same
+bills: the email pays for every cached fragment (cold), the page reuses them
+(warm). Verifies the cached render is byte-identical to a cold one before
+reporting timings.
+
+Usage:
+    .venv/bin/python scripts/bench_email_render.py
+    .venv/bin/python scripts/bench_email_render.py --bills 5000 --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+# Bootstrap path so we can import from agents/
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import yaml
+
+from agents.legislative import email_sender
+from agents.legislative.email_sender import _build_html, _build_page_html, _find_stalled_bills
+
+BILLS_FILE  = PROJECT_ROOT / "data" / "bills" / "tracked_bills.json"
+CONFIG_FILE = PROJECT_ROOT / "agents" / "legislative" / "config.yaml"
+DATE_STR    = "2026-03-01"
+
+
+def _bills(n: int, rng: random.Random) -> dict:
+    real  = json.loads(BILLS_FILE.read_text())["bills"]
+    bills = dict(real)
+    items = list(real.items())
+    while len(bills) < n:
+        bn, b = rng.choice(items)
+        copy = dict(b, bill_number=f"{bn}-{len(bills)}", watchlist=rng.random() < 0.02)
+        bills[copy["bill_number"]] = copy
+    return bills
+
+
+def _time(fn, runs: int, before=None) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        if before:
+            before()
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="Benchmark the tracker email / status page render.")
+    p.add_argument("--bills", type=int, default=5000, help="Bills in the index (default: 5000)")
+    p.add_argument("--runs", type=int, default=3, help="Timed runs, best kept (default: 3)")
+    args = p.parse_args()
+
+    config  = yaml.safe_load(CONFIG_FILE.read_text())
+    bills   = _bills(args.bills, random.Random(20260301))
+    ordered = list(bills.values())
+    new     = ordered[:40]
+    changed = [dict(b, _prev_status="Introduced") for b in ordered[40:80]]
+    stalled = _find_stalled_bills(bills, 7)
+    cache   = email_sender._fragments
+
+    def email():
+        return _build_html(new, changed, bills, config, DATE_STR)
+
+    def page():
+        return _build_page_html(new, changed, bills, stalled, 7, config, DATE_STR, "https://example.org")
+
+    cache.clear()
+    cold_email, cold_page = email(), page()
+    n_fragments = len(cache)
+    cache.clear()
+    page_only = page()
+    if email() != cold_email or page_only != cold_page:
+        print("  ✗ cached and cold renders differ")
+        sys.exit(1)
+    print(f"\n  Corpus: {len(bills):,} bills ({len(stalled):,} stalled) — "
+          f"email {len(cold_email) / 1e6:.1f} MB, page {len(cold_page) / 1e6:.1f} MB")
+    print(f"  Identical output cold vs cached ✓  ({n_fragments:,} fragments)")
+
+    t_cold_email = _time(email, args.runs, before=cache.clear)
+    t_warm_email = _time(email, args.runs)
+    t_cold_page  = _time(page, args.runs, before=cache.clear)
+    t_warm_page  = _time(page, args.runs)
+    print(f"  email, cold cache:   {t_cold_email * 1000:8.1f} ms")
+    print(f"  email, warm cache:   {t_warm_email * 1000:8.1f} ms")
+    print(f"  page,  cold cache:   {t_cold_page * 1000:8.1f} ms")
+    print(f"  page,  warm cache:   {t_warm_page * 1000:8.1f} ms  (as in a tracker run, after the email)\n")
+
+
+if __name__ == "__main__":
+    main()
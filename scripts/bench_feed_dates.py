@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark media_scanner date normalization: dateutil on every entry vs the
+memoized ISO 8601 / RFC 822 fast paths in _parse_date().
+
+Corpus (first available):
+    1. --corpus FILE                   — one raw date string per line
+    2. the active config.yaml feeds    — fetched now; --record also saves their
+                                         raw dates to --corpus (or
+                                         data/media/feed_dates.txt)
+    3. built-in sample of the date shapes the configured feeds and NewsAPI emit
+
+Verifies both paths return identical dates before reporting timings. The
+corpus is repeated --scans times to model repeated scans of the same feeds
+(where the memo cache pays off).
+
+Usage:
+    .venv/bin/python scripts/bench_feed_dates.py
+    .venv/bin/python scripts/bench_feed_dates.py --record
+    .venv/bin/python scripts/bench_feed_dates.py --corpus data/media/feed_dates.txt --scans 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Bootstrap path so we can import from agents/
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from dateutil import parser as dateparser
+
+from agents.media import media_scanner
+
+DEFAULT_RECORD = PROJECT_ROOT / "data" / "media" / "feed_dates.txt"
+
+# Shapes seen from WordPress (CalMatters, Capitol Weekly), KQED, LAist, Google
+# News RSS, and NewsAPI publishedAt — used only when nothing was recorded.
+_SAMPLE = [
+    "Fri, 27 Feb 2026 18:04:00 +0000",
+    "Thu, 26 Feb 2026 22:15:31 -0800",
+    "Wed, 25 Feb 2026 14:00:00 GMT",
+    "Tue, 24 Feb 2026 08:30:12 PST",
+    "2026-02-27T18:04:00Z",
+    "2026-02-26T09:12:44-08:00",
+    "2026-02-25T16:00:00.000Z",
+    "Mon, 2 Mar 2026 07:05:00 EST",
+    "February 27, 2026",
+]
+
+
+def _baseline(date_str: str | None) -> str | None:
+    """The pre-fast-path implementation: dateutil on every call."""
+    if not date_str:
+        return None
+    try:
+        dt = dateparser.parse(date_str, ignoretz=True)
+        return dt.date().isoformat() if dt else None
+    except Exception:
+        return None
+
+
+def _live_dates() -> list[str]:
+    """Raw published/updated strings of every entry in the configured feeds."""
+    config = media_scanner._load_config()
+    dates: list[str] = []
+    for feed in media_scanner._load_feeds(config):
+        fetch = media_scanner._fetch_feed(feed)
+        if fetch["content"] is None:
+            print(f"  ⚠ {feed['name']}: {fetch['error']}")
+            continue
+        parsed = media_scanner.feedparser.parse(fetch["content"])
+        dates += [
+            e.get("published") or e.get("updated")
+            for e in parsed.entries if e.get("published") or e.get("updated")
+        ]
+    return dates
+
+
+def _record(dates: list[str], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join(dates) + "\n", encoding="utf-8")
+    print(f"  Recorded {len(dates)} dates → {path.relative_to(PROJECT_ROOT)}")
+
+
+def _time(fn, corpus: list[str], scans: int) -> float:
+    started = time.perf_counter()
+    for _ in range(scans):
+        for s in corpus:
+            fn(s)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="Benchmark media_scanner date parsing.")
+    p.add_argument("--corpus", type=Path, default=None, help="File of raw date strings, one per line")
+    p.add_argument("--record", action="store_true", help="Fetch live feeds and record their dates first")
+    p.add_argument("--scans", type=int, default=10, help="Times to replay the corpus (default: 10)")
+    args = p.parse_args()
+
+    if args.corpus and not args.record:
+        corpus = [l.strip() for l in args.corpus.read_text(encoding="utf-8").splitlines() if l.strip()]
+        label  = str(args.corpus)
+    elif (live := _live_dates()):
+        corpus, label = live, "configured feeds (live)"
+        if args.record:
+            _record(live, args.corpus or DEFAULT_RECORD)
+    else:
+        corpus, label = _SAMPLE * 25, "built-in sample"
+
+    print(f"\n  Corpus: {len(corpus):,} dates ({len(set(corpus)):,} distinct) — {label}")
+
+    mismatches = [s for s in set(corpus) if _baseline(s) != media_scanner._parse_date(s)]
+    if mismatches:
+        print(f"  ✗ {len(mismatches)} mismatches, e.g. {mismatches[:3]}")
+        sys.exit(1)
+    fast_hits = sum(1 for s in corpus if media_scanner._parse_date_fast(s))
+    print(f"  Fast-path coverage: {fast_hits / len(corpus):.0%}  (identical output ✓)")
+
+    t_old = _time(_baseline, corpus, args.scans)
+    media_scanner._parse_date.cache_clear()
+    t_cold = _time(media_scanner._parse_date, corpus, 1)
+    t_warm = _time(media_scanner._parse_date, corpus, args.scans - 1) if args.scans > 1 else 0.0
+    t_new  = t_cold + t_warm
+
+    per_scan = len(corpus)
+    print(f"  dateutil, per scan:         {t_old / args.scans * 1000:8.2f} ms")
+    print(f"  fast paths, first scan:     {t_cold * 1000:8.2f} ms  (cold memo)")
+    if args.scans > 1:
+        print(f"  fast paths, later scans:    {t_warm / (args.scans - 1) * 1000:8.2f} ms  (memo hits)")
+    print(f"  Total over {args.scans} scans:       {t_old * 1000:8.1f} ms → {t_new * 1000:.1f} ms "
+          f"({t_old / t_new:.0f}×, {per_scan:,} dates/scan)\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark media_scanner topic scoring: the per-article _TOPIC_KEYWORDS loop vs
+the batch TF-IDF profile in agents/shared/relevance_model.py (numpy and
+pure-Python paths).
+
+Corpus (first available):
+    1. data/media/article_store.jsonl  — every article the scanner has seen
+    2. data/media/media_digest.json    — the current digest's articles
+  padded / cycled to --articles with the tracked bill titles as headlines so
+  the size is comparable run to run.
+
+Verifies the numpy and pure-Python paths return identical similarities before
+reporting timings.
+
+Usage:
+    .venv/bin/python scripts/bench_relevance_model.py
+    .venv/bin/python scripts/bench_relevance_model.py --articles 5000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+# Bootstrap path so we can import from agents/
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from agents.media import media_scanner
+from agents.shared import relevance_model
+from agents.shared.article_store import ArticleStore
+
+BILLS_FILE  = PROJECT_ROOT / "data" / "bills" / "tracked_bills.json"
+DIGEST_FILE = PROJECT_ROOT / "data" / "media" / "media_digest.json"
+
+
+def _corpus(n: int, bills: dict) -> tuple[list[dict], str]:
+    articles = ArticleStore().in_window(date.min)
+    label    = "article_store.jsonl"
+    if not articles and DIGEST_FILE.exists():
+        articles = json.loads(DIGEST_FILE.read_text(encoding="utf-8")).get("articles", [])
+        label    = "media_digest.json"
+    articles += [{"title": b.get("title", ""), "summary": b.get("summary", "")[:300]} for b in bills.values()]
+    label    += " + bill titles"
+    return [
+        {**articles[i % len(articles)], "title": f"{articles[i % len(articles)]['title']} #{i}"}
+        for i in range(n)
+    ], label
+
+
+def _best_of(fn, repeat: int) -> tuple[float, list]:
+    best, result = float("inf"), []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="Benchmark media_scanner topic scoring.")
+    p.add_argument("--articles", type=int, default=1000)
+    p.add_argument("--repeat", type=int, default=5)
+    args = p.parse_args()
+
+    bills = json.loads(BILLS_FILE.read_text(encoding="utf-8"))["bills"]
+    articles, label = _corpus(args.articles, bills)
+    texts = [relevance_model.article_text(a) for a in articles]
+    print(f"\n  Corpus: {len(articles):,} articles ({label})")
+
+    t_build, (profile,) = _best_of(lambda: [media_scanner._build_profile(bills)], 1)
+
+    t_kw, _ = _best_of(
+        lambda: [media_scanner._keyword_score(a["title"], a.get("summary", "")) for a in articles],
+        args.repeat,
+    )
+    t_np, batch = _best_of(lambda: profile.similarities(texts), args.repeat)
+    t_py, pure  = _best_of(lambda: [profile._similarity_py(t) for t in texts], 1)
+
+    if max(abs(a - b) for a, b in zip(batch, pure)) > 1e-12:
+        print("  ✗ numpy and pure-Python similarities differ")
+        sys.exit(1)
+
+    print(f"  Profile: {len(profile):,} terms, built in {t_build * 1000:.0f} ms  (identical paths ✓)")
+    print(f"  Keyword loop:        {t_kw * 1000:8.1f} ms")
+    print(f"  TF-IDF, pure Python: {t_py * 1000:8.1f} ms")
+    print(f"  TF-IDF, numpy batch: {t_np * 1000:8.1f} ms  "
+          f"({t_py / t_np:.1f}× vs pure Python)\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Tests: URL canonicalization + near-duplicate article clustering."""
+import base64
+
+from agents.shared.article_dedupe import (
+    canonical_url,
+    dedupe_articles,
+    near_duplicate_clusters,
+)
+
+
+def _article(source, title, summary="", url="", weight=1.0, score=1.0):
+    return {
+        "source": source, "title": title, "summary": summary, "url": url,
+        "source_weight": weight, "relevance_score": score,
+    }
+
+
+# ---------------------------------------------------------------------------
+# canonical_url
+# ---------------------------------------------------------------------------
+
+def test_canonical_url_strips_tracking_and_normalizes():
+    assert canonical_url(
+        "HTTPS://www.CalMatters.org/housing/2026/03/story/?utm_source=rss&utm_medium=feed&page=2#comments"
+    ) == "https://calmatters.org/housing/2026/03/story?page=2"
+
+
+def test_canonical_url_unwraps_google_redirect():
+    wrapped = "https://www.google.com/url?rct=j&url=https://www.kqed.org/news/123/amp&ct=ga"
+    assert canonical_url(wrapped) == "https://kqed.org/news/123"
+
+
+def test_canonical_url_decodes_legacy_google_news_ids():
+    payload = b"\x08\x13\x22\x2ahttps://laist.com/news/housing/story-slug\xd2\x01\x00"
+    article_id = base64.urlsafe_b64encode(payload).decode().rstrip("=")
+    url = f"https://news.google.com/rss/articles/{article_id}?oc=5"
+    assert canonical_url(url) == "https://laist.com/news/housing/story-slug"
+
+
+def test_canonical_url_keeps_opaque_google_news_ids_without_query():
+    url = "https://news.google.com/rss/articles/CBMiygFBVV95cUxQWW11ZjU0?oc=5"
+    assert canonical_url(url) == "https://news.google.com/articles/CBMiygFBVV95cUxQWW11ZjU0"
+
+
+# ---------------------------------------------------------------------------
+# Clustering
+# ---------------------------------------------------------------------------
+
+def test_edited_headline_copies_cluster_and_keep_highest_weight():
+    articles = [
+        _article("Google News — CA Housing", "Dozens of local leaders gather to oppose state zoning bills - KCRA",
+                 "Dozens of local leaders gather to oppose state zoning bills &nbsp;&nbsp; KCRA",
+                 url="https://news.google.com/rss/articles/AAA?oc=5", weight=1.0, score=1.5),
+        _article("CalMatters — Housing", "Dozens of local leaders gather to oppose state zoning bills",
+                 "Local leaders gathered Tuesday to oppose SB 79 and other zoning bills.",
+                 url="https://calmatters.org/x", weight=1.5, score=1.2),
+        _article("LAist", "City council approves ADU ordinance in Pasadena",
+                 "Pasadena council voted 6-1 on accessory dwelling rules.", url="https://laist.com/y"),
+    ]
+    out = dedupe_articles(articles)
+    assert [a["source"] for a in out] == ["CalMatters — Housing", "LAist"]
+    assert out[0]["also_reported_by"] == ["Google News — CA Housing"]
+    assert out[1]["also_reported_by"] == []
+
+
+def test_same_canonical_url_clusters_even_with_different_titles():
+    articles = [
+        _article("A", "Headline one", url="https://kqed.org/news/1?utm_source=x"),
+        _article("B", "Totally different words", url="https://www.kqed.org/news/1/"),
+    ]
+    assert near_duplicate_clusters(articles) == [[0, 1]]
+
+
+def test_distinct_stories_on_same_topic_stay_separate():
+    articles = [
+        _article("A", "Dozens of local leaders gather to oppose state zoning bills", "x"),
+        _article("B", "Group of local elected leaders push back on state housing bills", "y"),
+        _article("C", "Newsom signs SB 79 transit housing bill into law", "z"),
+    ]
+    assert len(near_duplicate_clusters(articles)) == 3
+
+
+def _google_news(title, publisher):
+    return _article(f"Google News — {publisher}", f"{title} - {publisher}", f"{title}\xa0\xa0{publisher}")
+
+
+def test_one_word_edits_of_a_syndicated_headline_still_cluster():
+    articles = [
+        _google_news("Huntington Beach loses Supreme Court appeal over housing law", "OC Register"),
+        _google_news("Huntington Beach loses Supreme Court appeal over state housing law", "Daily Pilot"),
+    ]
+    assert near_duplicate_clusters(articles) == [[0, 1]]
+
+
+def test_different_stages_of_the_same_bill_stay_separate():
+    articles = [
+        _google_news("Senate passes SB 79 transit housing bill", "CalMatters"),
+        _google_news("Newsom signs SB 79 transit housing bill", "CalMatters"),
+    ]
+    assert near_duplicate_clusters(articles) == [[0], [1]]
+
+
+def test_opposite_policy_directions_stay_separate():
+    articles = [
+        _google_news("Bill would limit local control over housing permits", "KQED"),
+        _google_news("Bill would expand local control over housing permits", "KQED"),
+    ]
+    assert near_duplicate_clusters(articles) == [[0], [1]]
+
+
+def test_generic_titles_are_not_an_exact_match():
+    articles = [
+        _article("LA Times", "Opinion", "Why the state should leave zoning to cities.", url="https://latimes.com/a"),
+        _article("LA Times", "Opinion", "Parking minimums are strangling downtown.", url="https://latimes.com/b"),
+    ]
+    assert near_duplicate_clusters(articles) == [[0], [1]]
+
+
+def test_pure_python_signature_matches_numpy(monkeypatch):
+    from agents.shared import article_dedupe
+    art = _article("A", "Newsom signs SB 79 transit housing bill into law", "Taller buildings near transit")
+    sig = article_dedupe.article_signature(art)
+    monkeypatch.setattr(article_dedupe, "np", None)
+    assert article_dedupe.article_signature(art) == sig
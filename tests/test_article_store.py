@@ -0,0 +1,62 @@
+"""Tests: seen-article store — persistence, compaction, and incremental scoring."""
+from datetime import date
+
+from freezegun import freeze_time
+
+from agents.media import media_scanner
+from agents.media.media_scanner import _articles_from_store, _feed_articles
+from agents.shared.article_store import ArticleStore
+
+
+def _rec(url, published="2026-02-27", title="AB1234 zoning preemption fight"):
+    return {"id": url, "title": title, "summary": "local control", "link": url, "published": published}
+
+
+_FEED = {"name": "Alpha", "url": "https://alpha.test/feed", "weight": 1.0}
+
+
+@freeze_time("2026-03-01")
+def test_known_articles_are_not_rescored(tmp_path, monkeypatch):
+    calls = []
+    real = media_scanner._keyword_score
+    monkeypatch.setattr(media_scanner, "_keyword_score", lambda t, s: calls.append(t) or real(t, s))
+
+    store = ArticleStore(tmp_path / "store.jsonl")
+    _feed_articles([_rec("https://a.test/1")], _FEED, {"AB1234"}, 7, 0.3, store)
+    store.save()
+
+    reloaded = ArticleStore(tmp_path / "store.jsonl")
+    out = _feed_articles(
+        [_rec("https://a.test/1?utm_source=rss"), _rec("https://a.test/2")],
+        _FEED, {"AB1234"}, 7, 0.3, reloaded,
+    )
+    assert len(calls) == 2            # one per distinct canonical URL, ever
+    assert [a["bill_mentions"] for a in out] == [["AB1234"], ["AB1234"]]
+
+
+@freeze_time("2026-03-01")
+def test_digest_window_includes_articles_from_earlier_runs(tmp_path):
+    store = ArticleStore(tmp_path / "store.jsonl")
+    _feed_articles([_rec("https://a.test/old", published="2026-02-25")], _FEED, {"AB1234"}, 7, 0.3, store)
+    _feed_articles([_rec("https://a.test/stale", published="2026-01-05")], _FEED, {"AB1234"}, 90, 0.3, store)
+
+    in_window = _articles_from_store(store, {"AB1234"}, lookback_days=7, min_score=0.3)
+    assert [a["canonical_url"] for a in in_window] == ["https://a.test/old"]
+
+    # Re-scored against the current tracked list: the bill is no longer tracked
+    assert _articles_from_store(store, set(), lookback_days=7, min_score=1.0) == []
+
+
+def test_save_appends_then_compacts_and_expires(tmp_path):
+    path  = tmp_path / "store.jsonl"
+    store = ArticleStore(path)
+    store.add({"canonical_url": "u1", "last_seen": "2026-03-01"})
+    store.add({"canonical_url": "u2", "last_seen": "2025-01-01"})
+    store.save(today=date(2026, 3, 1), retention_days=30)
+    assert len(path.read_text().splitlines()) == 1     # u2 expired on write
+
+    for day in range(2, 5):
+        store.touch("u1", date(2026, 3, day))
+        store.save(today=date(2026, 3, day), retention_days=30)
+    assert len(path.read_text().splitlines()) <= 2
+    assert ArticleStore(path).get("u1")["last_seen"] == "2026-03-04"
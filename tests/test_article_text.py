@@ -0,0 +1,149 @@
+"""Tests: full-article text extraction, fetch, and the text cache."""
+import base64
+from types import SimpleNamespace
+
+from freezegun import freeze_time
+
+from agents.media.media_scanner import _articles_from_store, _feed_articles, _score_bodies
+from agents.shared import article_text
+from agents.shared.article_store import ArticleStore
+from agents.shared.article_text import extract_main_text, fetch_article_text
+
+_BODY = (
+    "<p>Lawmakers advanced AB 1751 on Tuesday, a bill that would, among other things, "
+    "preempt local zoning rules across the state.</p>"
+    "<p>Opponents, including several city councils, argue the measure strips local control "
+    "from planning commissions and elected officials.</p>"
+    "<p>Supporters say the bill, which passed committee 8-0, will speed up approvals for "
+    "affordable housing near transit.</p>"
+)
+
+_PAGE = f"""<html><body>
+<header><nav><a href="/">Home</a> <a href="/news">News</a></nav></header>
+<div class="sidebar"><p>Subscribe to our newsletter for the latest, best, news, today.</p></div>
+<article class="story-body"><h1>Headline</h1>{_BODY}
+<p class="ad-slot">Advertisement copy that is long enough to look like a paragraph.</p></article>
+<div class="related-links"><p><a href="/x">Related: another long story about housing policy</a></p></div>
+<footer><p>Copyright 2026 The Paper, all rights reserved, forever and ever.</p></footer>
+</body></html>"""
+
+
+def _page(url, content=_PAGE, status=200, ctype="text/html; charset=utf-8"):
+    return SimpleNamespace(
+        url=url, status_code=status, content=content.encode(), headers={"Content-Type": ctype},
+    )
+
+
+def test_extract_main_text_keeps_body_and_drops_boilerplate():
+    text = extract_main_text(_PAGE)
+    assert text.startswith("Lawmakers advanced AB 1751")
+    assert text.count("\n\n") == 2
+    for junk in ("Subscribe", "Advertisement", "Related:", "Copyright", "Home"):
+        assert junk not in text
+
+
+def test_extract_main_text_handles_pages_without_paragraphs():
+    assert extract_main_text("<html><body><div>Hi</div></body></html>") == ""
+
+
+def test_fetch_article_text_statuses(monkeypatch):
+    pages = {
+        "https://ok.test/a":   _page("https://ok.test/a"),
+        "https://gone.test/a": _page("https://gone.test/a", status=404),
+        "https://pdf.test/a":  _page("https://pdf.test/a", ctype="application/pdf"),
+        "https://thin.test/a": _page("https://thin.test/a", "<p>Too short to be a story body.</p>"),
+    }
+    monkeypatch.setattr(article_text.requests, "get", lambda url, **kw: pages[url])
+
+    assert fetch_article_text("https://ok.test/a")["status"] == "ok"
+    assert fetch_article_text("https://gone.test/a")["status"] == "http_404"
+    assert fetch_article_text("https://pdf.test/a")["status"] == "not_html"
+    assert fetch_article_text("https://thin.test/a")["status"] == "empty"
+    # JS-only Google News redirects are never requested
+    assert fetch_article_text("https://news.google.com/rss/articles/CBMiX")["status"] == "unresolved"
+
+
+_FEED = {"name": "Alpha", "url": "https://alpha.test/feed", "weight": 1.0}
+
+
+def _entry(url, title):
+    return {"id": url, "title": title, "summary": "", "link": url, "published": "2026-02-27"}
+
+
+@freeze_time("2026-03-01")
+def test_body_mentions_raise_score_and_text_is_fetched_once(tmp_path, monkeypatch):
+    requested = []
+    monkeypatch.setattr(
+        article_text.requests, "get",
+        lambda url, **kw: requested.append(url) or _page(url),
+    )
+    store = ArticleStore(tmp_path / "store.jsonl")
+    _feed_articles(
+        [_entry("https://a.test/story?utm_source=rss", "Housing fight heats up in Sacramento"),
+         _entry("https://b.test/other", "Zoning preemption debate")],
+        _FEED, {"AB1751"}, 7, 0.0, store,
+    )
+    assert _articles_from_store(store, {"AB1751"}, 7, 0.3)[0]["bill_mentions"] == []
+
+    cache = ArticleStore(tmp_path / "text.jsonl")
+    assert _score_bodies(store, cache, {"AB1751"}, 7, top_k=5) == 2
+    cache.save()
+    store.save()
+
+    articles = _articles_from_store(store, {"AB1751"}, 7, 0.3)
+    assert all(a["bill_mentions"] == ["AB1751"] for a in articles)
+    assert len(articles) == 2
+
+    # Next run: records already body-scored, and a fresh store still hits the cache
+    assert _score_bodies(ArticleStore(tmp_path / "store.jsonl"),
+                         ArticleStore(tmp_path / "text.jsonl"), {"AB1751"}, 7, top_k=5) == 0
+    fresh = ArticleStore(tmp_path / "fresh.jsonl")
+    _feed_articles([_entry("https://a.test/story", "Housing fight heats up")], _FEED, {"AB1751"}, 7, 0.0, fresh)
+    assert _score_bodies(fresh, ArticleStore(tmp_path / "text.jsonl"), {"AB1751"}, 7, top_k=5) == 0
+    # The link as the feed gave it is fetched, not its canonical (dedupe) form
+    assert sorted(requested) == ["https://a.test/story?utm_source=rss", "https://b.test/other"]
+
+
+@freeze_time("2026-03-01")
+def test_decoded_google_news_links_fetch_the_publisher_page(tmp_path, monkeypatch):
+    requested = []
+    monkeypatch.setattr(
+        article_text.requests, "get",
+        lambda url, **kw: requested.append(url) or _page(url),
+    )
+    legacy_id = base64.urlsafe_b64encode(
+        b"\x08\x13\x22\x24https://laist.com/news/housing/story\xd2\x01\x00"
+    ).decode().rstrip("=")
+    store = ArticleStore(tmp_path / "store.jsonl")
+    _feed_articles(
+        [_entry(f"https://news.google.com/rss/articles/{legacy_id}?oc=5", "Zoning preemption debate"),
+         _entry("https://news.google.com/rss/articles/CBMiX?oc=5", "Housing fight heats up")],
+        _FEED, {"AB1751"}, 7, 0.0, store,
+    )
+
+    cache = ArticleStore(tmp_path / "text.jsonl")
+    _score_bodies(store, cache, {"AB1751"}, 7, top_k=5)
+
+    assert requested == ["https://laist.com/news/housing/story"]
+    assert cache.get("https://laist.com/news/housing/story")["status"] == "ok"
+    assert cache.get("https://news.google.com/articles/CBMiX")["status"] == "unresolved"
+
+
+@freeze_time("2026-03-01")
+def test_transient_fetch_failures_are_retried_next_run(tmp_path, monkeypatch):
+    answers = {"https://busy.test/a": [503, 200], "https://gone.test/a": [404, 200]}
+    monkeypatch.setattr(
+        article_text.requests, "get",
+        lambda url, **kw: _page(url, status=answers[url].pop(0)),
+    )
+    store, cache = ArticleStore(tmp_path / "store.jsonl"), ArticleStore(tmp_path / "text.jsonl")
+    _feed_articles([_entry("https://busy.test/a", "Zoning preemption debate"),
+                    _entry("https://gone.test/a", "Zoning fight")], _FEED, {"AB1751"}, 7, 0.0, store)
+
+    assert _score_bodies(store, cache, {"AB1751"}, 7, top_k=5) == 2
+    assert cache.get("https://gone.test/a")["status"] == "http_404"    # terminal — cached
+    assert cache.get("https://busy.test/a") is None                     # transient — not cached
+
+    assert _score_bodies(store, cache, {"AB1751"}, 7, top_k=5) == 1    # only the 503 is retried
+    assert cache.get("https://busy.test/a")["status"] == "ok"
+    assert answers == {"https://busy.test/a": [], "https://gone.test/a": [200]}
@@ -0,0 +1,95 @@
+"""Tests: bill ↔ article similarity linking — retrieval, numpy/pure-Python parity, digest links."""
+import json
+from pathlib import Path
+
+import pytest
+
+from agents.media.media_scanner import _link_similar_bills
+from agents.shared import bill_linker, relevance_model
+from agents.shared.bill_linker import BillLinker, build_bill_linker
+
+_BILLS = {
+    "AB2097": {"title": "Residential and commercial development: remodeling, additions, and repairs: "
+                        "parking requirements.",
+               "summary": "Prohibits a public agency from imposing a minimum automobile parking "
+                          "requirement on development within one-half mile of public transit."},
+    "SB4":    {"title": "Planning and zoning: housing development: higher education institutions "
+                        "and religious institutions.",
+               "summary": "Allows affordable housing on land owned by religious institutions such as "
+                          "churches, mosques, and synagogues."},
+    "AB1":    {"title": "Fisheries: salmon.", "summary": "Funds salmon hatchery restoration."},
+    "AB2":    {"title": "Planning and zoning: housing element.", "summary": "Housing element deadlines."},
+}
+
+_TEXTS = [
+    "New law bans parking minimums for homes near transit",
+    "Churches and synagogues could build affordable housing on their land",
+    "Warriors beat Lakers in overtime",
+    "",
+]
+
+
+@pytest.fixture
+def linker():
+    return build_bill_linker(_BILLS)
+
+
+def test_paraphrased_coverage_finds_the_bill(linker):
+    parking, churches, sports, empty = linker.top_bills(_TEXTS)
+    assert parking[0][0] == "AB2097"
+    assert churches[0][0] == "SB4"
+    assert sports == empty == []
+
+
+def test_place_names_do_not_link_unrelated_local_news():
+    bills = dict(_BILLS, AB2692={
+        "title": "Common interest developments: reinstatement of terminated declarations: County of Los Angeles.",
+        "summary": "An act to add and repeal Section 4276 of the Civil Code, relating to common interest developments.",
+    })
+    measles, parking = build_bill_linker(bills).top_bills([
+        "Measles outbreak spreads in Los Angeles County schools",
+        "A bill that would ban parking minimums near transit",
+    ])
+    assert measles == []
+    assert [bn for bn, _ in parking][:1] == ["AB2097"]
+
+
+def test_real_bill_store_links_descriptions_not_coincidences():
+    path  = Path(__file__).resolve().parent.parent / "data" / "bills" / "tracked_bills.json"
+    bills = json.loads(path.read_text(encoding="utf-8"))["bills"]
+    adu, *off_topic = build_bill_linker(bills).top_bills([
+        "Legislation would speed up permits for accessory dwelling units",
+        "Measles outbreak spreads in Los Angeles County schools",
+        "Napa County wineries brace for tariffs",
+        "Wildfire insurance rates climb as State Farm pulls back",
+    ])
+    assert adu and "dwelling" in bills[adu[0][0]]["title"].lower()
+    assert off_topic == [[], [], []]
+
+
+def test_numpy_and_pure_python_paths_agree(linker, monkeypatch):
+    if relevance_model.np is None:
+        pytest.skip("numpy not installed")
+    batch = linker.top_bills(_TEXTS * 30, k=4, min_similarity=0.0)
+    monkeypatch.setattr(bill_linker, "np", None)
+    pure = BillLinker(_BILLS).top_bills(_TEXTS * 30, k=4, min_similarity=0.0)
+    assert [[bn for bn, _ in row] for row in batch] == [[bn for bn, _ in row] for row in pure]
+    assert [s for row in batch for _, s in row] == pytest.approx([s for row in pure for _, s in row])
+
+
+def test_chunked_gather_matches_single_pass(linker, monkeypatch):
+    if relevance_model.np is None:
+        pytest.skip("numpy not installed")
+    whole = linker.similarities(_TEXTS * 10)
+    monkeypatch.setattr(bill_linker, "MAX_BATCH_PAIRS", 3)
+    assert linker.similarities(_TEXTS * 10) == pytest.approx(whole)
+
+
+def test_links_added_after_existing_ones(linker):
+    articles = [{"title": _TEXTS[0], "summary": "",
+                 "bill_links": [{"bill_number": "AB2097", "confidence": 1.0, "via": "bill_number"}]},
+                {"title": _TEXTS[1], "summary": ""}]
+    _link_similar_bills(articles, linker, k=1)
+    assert articles[0]["bill_links"] == [{"bill_number": "AB2097", "confidence": 1.0, "via": "bill_number"}]
+    assert [(l["bill_number"], l["via"]) for l in articles[1]["bill_links"]] == [("SB4", "similarity")]
+    assert 0.0 < articles[1]["bill_links"][0]["confidence"] <= 1.0
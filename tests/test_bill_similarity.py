@@ -0,0 +1,67 @@
+"""Tests: companion / near-duplicate bill detection (MinHash + LSH)."""
+
+from agents.shared.bill_similarity import (
+    _bill_fingerprint_text,
+    _find_similar_bills,
+    _minhash_signature,
+    _shingles,
+    _signature_similarity,
+)
+
+_DIGEST = (
+    "An act to amend Section 65915 of the Government Code, relating to housing. "
+    "This bill would require a city or county to grant a density bonus for "
+    "qualifying student housing developments located near a university campus."
+)
+
+
+def _bill(num, title, summary):
+    return {"bill_number": num, "title": title, "summary": summary}
+
+
+# ---------------------------------------------------------------------------
+# Normalization + signatures
+# ---------------------------------------------------------------------------
+
+def test_fingerprint_text_ignores_case_and_punctuation():
+    a = _bill("AB1", "Housing: density bonus.", "An ACT to amend, Section 1!")
+    b = _bill("SB1", "housing density bonus", "an act to amend section 1")
+    assert _bill_fingerprint_text(a) == _bill_fingerprint_text(b)
+
+
+def test_signature_is_deterministic():
+    sh = _shingles("one two three four five six")
+    assert _minhash_signature(sh) == _minhash_signature(set(sh))
+
+
+def test_identical_text_similarity_is_one():
+    sig = _minhash_signature(_shingles(_DIGEST.lower()))
+    assert _signature_similarity(sig, sig) == 1.0
+
+
+# ---------------------------------------------------------------------------
+# Corpus search
+# ---------------------------------------------------------------------------
+
+def test_companion_bills_are_linked():
+    bills = {
+        "AB2433": _bill("AB2433", "Housing development: density bonus.", _DIGEST),
+        "SB1227": _bill("SB1227", "Housing development: density bonus.", _DIGEST),
+        "AB9999": _bill(
+            "AB9999", "Insurance: wildfire coverage.",
+            "An act to add Article 4 to the Insurance Code, relating to "
+            "residential property insurance and wildfire risk models for insurers.",
+        ),
+    }
+    matches = _find_similar_bills(bills, threshold=0.9)
+    assert matches["AB2433"][0][0] == "SB1227"
+    assert matches["SB1227"][0][0] == "AB2433"
+    assert "AB9999" not in matches
+
+
+def test_thin_text_never_matches():
+    bills = {
+        "AB1": _bill("AB1", "Housing.", ""),
+        "AB2": _bill("AB2", "Housing.", ""),
+    }
+    assert _find_similar_bills(bills, threshold=0.5) == {}
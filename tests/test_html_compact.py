@@ -0,0 +1,122 @@
+"""Tests: email HTML compaction and the tracker email's size budget."""
+import json
+import logging
+import random
+import re
+from pathlib import Path
+
+from freezegun import freeze_time
+
+from agents.legislative.email_sender import _CARD_MIN, _INDEX_MIN_ROWS, _fit_email_html, _most_rows_within
+from agents.shared.html_compact import compact_html
+
+_DOC = """<!DOCTYPE html>
+<html>
+<head>
+  <title>T</title>
+</head>
+<body>
+  <!-- layout comment -->
+  <!--[if mso]><table><tr><td><![endif]-->
+  <table>
+    <tr>
+      <td style="padding: 8px;  color:#111; padding:4px;;">
+        <strong>Author:</strong> <span style='color:#666'>Smith</span>
+      </td>
+    </tr>
+  </table>
+  <pre>keep   this
+  spacing</pre>
+</body>
+</html>"""
+
+
+def test_compaction_keeps_what_renders():
+    html, stats = compact_html(_DOC)
+    assert "layout comment" not in html and "<!--[if mso]>" in html
+    assert "<table><tr><td" in html                               # block-level gaps dropped
+    assert "<strong>Author:</strong> <span" in html                # inline gap kept
+    assert 'style="color:#111;padding:4px"' in html                # last declaration wins
+    assert "style='color:#666'" in html
+    assert "<pre>keep   this\n  spacing</pre>" in html
+    assert stats.before == len(_DOC.encode()) and stats.after == len(html.encode())
+
+
+def test_style_block_hoists_repeated_styles_into_head():
+    row = '<tr><td style="padding:8px 10px; font-size:12px; color:#1a1a1a;">x</td></tr>'
+    doc = f"<html><head></head><body><table>{row * 20}</table></body></html>"
+
+    inline, _ = compact_html(doc)
+    hoisted, stats = compact_html(doc, style_block=True)
+
+    assert "<style>" not in inline
+    assert stats.hoisted_styles == 1 and stats.after < len(inline)
+    assert "<style>.s0{padding:8px 10px;font-size:12px;color:#1a1a1a}</style></head>" in hoisted
+    assert hoisted.count('<td class="s0">x</td>') == 20
+
+
+def test_most_rows_within_matches_a_scan():
+    rng = random.Random(7)
+    for _ in range(50):
+        sizes = [1000]
+        for _ in range(300):
+            sizes.append(sizes[-1] + rng.randint(50, 400))
+        budget = rng.randint(500, sizes[-1] - 1)
+        expected = max((n for n, s in enumerate(sizes) if s <= budget), default=-1)
+        assert _most_rows_within(sizes.__getitem__, 300, sizes[300], budget) == expected
+
+
+def _config(budget_kb, pages_url="https://example.org/dash/"):
+    return {
+        "legislative": {"lookback_days": 7, "stalled_days": 14},
+        "email": {"include_full_index": True, "size_budget_kb": budget_kb},
+        "github": {"pages_url": pages_url},
+    }
+
+
+def test_email_over_budget_cuts_the_index_and_links_the_dashboard(high_risk_bill, caplog):
+    bills = {}
+    for i in range(400):
+        bill = dict(high_risk_bill, bill_number=f"AB{i}", status_date="2099-01-01")
+        bills[bill["bill_number"]] = bill
+
+    with caplog.at_level(logging.INFO):
+        full = _fit_email_html([], [], bills, _config(4096), "2026-03-01", logging.getLogger("t"))
+        cut  = _fit_email_html([], [], bills, _config(60), "2026-03-01", logging.getLogger("t"))
+
+    assert "Showing" not in full and ">AB399<" in full
+    assert len(cut.encode()) <= 60 * 1024
+    assert "Showing" in cut and 'href="https://example.org/dash/"' in cut
+    assert "Email HTML: " in caplog.text and "cut index to" in caplog.text
+
+
+def _section_rows(html: str, heading: str) -> int:
+    """Bill rows in the table under `heading` (up to the next section)."""
+    section = html.split(heading, 1)[1].split("<h2", 1)[0]
+    return section.count('<tr valign="top">')
+
+
+@freeze_time("2026-03-01")
+def test_email_budget_holds_on_the_real_bills_and_keeps_part_of_the_index(caplog):
+    path  = Path(__file__).resolve().parent.parent / "data" / "bills" / "tracked_bills.json"
+    bills = json.loads(path.read_text(encoding="utf-8"))["bills"]
+    nums  = sorted(bills)
+    new     = [bills[n] for n in nums[:15]]
+    changed = [dict(bills[n], _prev_status="Introduced") for n in nums[20:30]]
+    log     = logging.getLogger("t")
+
+    with caplog.at_level(logging.INFO):
+        quiet = _fit_email_html([], [], bills, _config(96), "2026-03-01", log)
+        busy  = _fit_email_html(new, changed, bills, _config(96), "2026-03-01", log)
+
+    assert "Gmail may clip it" not in caplog.text
+    for html in (quiet, busy):
+        assert len(html.encode()) <= 96 * 1024
+        assert _section_rows(html, "All Tracked Bills") > 0
+        stalled = re.search(r"Showing (\d+) of \d+\.", html.split("No Recent Activity", 1)[1])
+        assert stalled is None or stalled.group(1) == "0"           # stalled goes before the index
+    assert _section_rows(quiet, "All Tracked Bills") >= _INDEX_MIN_ROWS
+
+    # busy week: cards are capped, never dropped, and link to the rest
+    assert busy.count(">UPDATED<") >= _CARD_MIN and busy.count("> NEW </span>") >= _CARD_MIN
+    assert "Showing" in busy.split("New Bills This Week", 1)[1].split("<h2", 1)[0]
@@ -0,0 +1,33 @@
+"""Tests: the tracker email's fragment cache."""
+from agents.legislative import email_sender
+from agents.legislative.email_sender import _html_bill_card, _risk_cell
+from agents.shared.html_fragments import FragmentCache
+
+
+def test_cache_renders_each_key_once():
+    cache, calls = FragmentCache(), []
+    render = lambda: calls.append(1) or "<tr></tr>"
+    assert cache.get("row", ("AB1", "Introduced"), render) == "<tr></tr>"
+    assert cache.get("row", ("AB1", "Introduced"), render) == "<tr></tr>"
+    cache.get("row", ("AB1", "Chaptered"), render)
+    assert (len(calls), cache.hits, cache.misses, len(cache)) == (2, 1, 2, 2)
+
+
+def test_bill_card_follows_its_display_fields(monkeypatch, bills_dict):
+    monkeypatch.setattr(email_sender, "_fragments", FragmentCache())
+    bill = next(iter(bills_dict.values()))
+
+    first = _html_bill_card(bill, "#1e8449", "NEW")
+    assert _html_bill_card(dict(bill), "#1e8449", "NEW") == first
+    assert email_sender._fragments.hits == 1
+
+    moved = _html_bill_card(dict(bill, status="Chaptered"), "#1e8449", "NEW")
+    assert moved != first and "Chaptered" in moved
+
+
+def test_risk_cell_is_shared_by_bills_with_the_same_scores(monkeypatch):
+    monkeypatch.setattr(email_sender, "_fragments", FragmentCache())
+    strong = {"pro_housing_production": "strong"}
+    assert _risk_cell(strong) == _risk_cell(dict(strong, notes="other bill"))
+    assert "—" in _risk_cell({})
+    assert (email_sender._fragments.hits, len(email_sender._fragments)) == (1, 2)
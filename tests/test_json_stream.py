@@ -0,0 +1,115 @@
+"""Tests: streamed JSON parsing — incremental schema checks, early abort, and retry."""
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from agents.newsletter import newsletter_writer
+from agents.newsletter.newsletter_writer import _NEWSLETTER_SCHEMA, _stream_json
+from agents.shared import token_ledger
+from agents.shared.json_stream import JsonStreamParser, SchemaDeparture
+from agents.shared.token_ledger import configure_ledger, ledger_summary
+
+
+def _feed(parser, text, size=7):
+    for i in range(0, len(text), size):
+        parser.feed(text[i:i + size])
+
+
+def test_values_complete_in_order_across_any_chunking(mock_newsletter_content):
+    text = "```json\n" + json.dumps(mock_newsletter_content, indent=2) + "\n```"
+    for size in (1, 5, 64):
+        keys, items = [], []
+        parser = JsonStreamParser(
+            _NEWSLETTER_SCHEMA,
+            on_value=lambda k, v: keys.append(k),
+            on_item=lambda k, i, v: items.append((k, i)),
+        )
+        _feed(parser, text.replace('"}\n  ]', '",}\n  ]'), size)   # trailing commas are tolerated
+        assert parser.finish() == mock_newsletter_content
+    assert keys == list(mock_newsletter_content)
+    assert items[:4] == [("story", 0), ("story", 1), ("story", 2), ("story", 3)]
+
+
+@pytest.mark.parametrize("text, at_most", [
+    ("Here's the newsletter you asked for: {", 0),
+    ('{"subject": ["a list"]', 12),
+    ('{"subject": "x", "headline": "y"', 27),
+    ('{"subject": "x", "story": [{"line1": "a", "line2": "b", "reveal": "c"}', 70),
+])
+def test_departures_are_caught_at_the_offending_char(text, at_most):
+    parser = JsonStreamParser(_NEWSLETTER_SCHEMA)
+    with pytest.raises(SchemaDeparture) as exc:
+        _feed(parser, text + " " * 2000)
+    assert exc.value.position <= at_most
+
+
+def test_truncated_or_incomplete_objects_fail_at_finish():
+    truncated = JsonStreamParser(_NEWSLETTER_SCHEMA)
+    truncated.feed('{"subject": "x", "dek": "y"')
+    with pytest.raises(SchemaDeparture, match="ended before"):
+        truncated.finish()
+    missing = JsonStreamParser(_NEWSLETTER_SCHEMA)
+    missing.feed('{"subject": "x"}')
+    with pytest.raises(SchemaDeparture, match="missing keys"):
+        missing.finish()
+
+
+class _FakeStreamingClient:
+    """Stands in for anthropic.Anthropic — streams each scripted response in small deltas."""
+
+    def __init__(self, responses):
+        self.messages  = self
+        self.responses = list(responses)
+        self.delivered = []   # chars actually streamed per call
+
+    def stream(self, **kwargs):
+        text, sent = self.responses.pop(0), []
+        self.delivered.append(sent)
+        usage = SimpleNamespace(input_tokens=1000, output_tokens=len(text) // 4)
+        final = SimpleNamespace(usage=usage, stop_reason="end_turn", content=[])
+
+        class _Stream:
+            current_message_snapshot = SimpleNamespace(usage=usage)
+
+            def __enter__(self):
+                def deltas():
+                    for i in range(0, len(text), 10):
+                        sent.append(text[i:i + 10])
+                        yield text[i:i + 10]
+                self.text_stream = deltas()
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def get_final_message(self):
+                return final
+
+        return _Stream()
+
+
+@pytest.fixture
+def _ledger(tmp_path, monkeypatch):
+    monkeypatch.delenv("CSF_TOKEN_BUDGET", raising=False)
+    for name in ("_budget", "_run_id", "_ledger_dir"):
+        monkeypatch.setattr(token_ledger, name, getattr(token_ledger, name))
+
+
+def test_off_schema_stream_is_abandoned_early_and_retried(tmp_path, _ledger, mock_newsletter_content):
+    configure_ledger(run_id="stream", ledger_dir=tmp_path)
+    bad  = "Sure! Here is this week's newsletter.\n\n" + json.dumps(mock_newsletter_content)
+    good = json.dumps(mock_newsletter_content)
+    client = _FakeStreamingClient([bad, good])
+
+    assert _stream_json(client, _NEWSLETTER_SCHEMA, model="m", max_tokens=10, messages=[]) == mock_newsletter_content
+    assert sum(map(len, client.delivered[0])) == 10   # first delta was enough to give up
+    assert ledger_summary()["newsletter_writer"]["calls"] == 2
+
+
+def test_retries_are_bounded(tmp_path, _ledger):
+    configure_ledger(run_id="stream-bad", ledger_dir=tmp_path)
+    client = _FakeStreamingClient(["nope"] * newsletter_writer._GENERATION_ATTEMPTS)
+    with pytest.raises(SchemaDeparture):
+        _stream_json(client, _NEWSLETTER_SCHEMA, model="m", max_tokens=10, messages=[])
+    assert client.responses == []
@@ -5,8 +5,12 @@ dates and stall calculations are stable regardless of when the suite runs.
 
 No API calls. No file I/O (all functions accept raw dicts).
 """
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
 import pytest
-from datetime import date
+from datetime import date, timedelta
 from freezegun import freeze_time
 
 from agents.legislative.legislative_intel import (
@@ -18,7 +22,10 @@ from agents.legislative.legislative_intel import (
     _find_moving,
     _find_amended,
     _find_stalled,
+    _build_buckets,
+    _build_buckets_incremental,
 )
+from agents.shared.action_classifier import classify_action, parse_ca_date
 from agents.newsletter.newsletter_writer import (
     _build_digest_context,
     _build_anti_repetition_block,
@@ -245,6 +252,25 @@ def test_parse_ca_date_invalid():
     assert _parse_ca_date("not a date") is None
 
 
+def test_parse_ca_date_cache_is_keyed_by_today():
+    """The same string resolves against each run date, never a stale cached year."""
+    with freeze_time("2026-03-01"):
+        assert parse_ca_date("January 5") == date(2027, 1, 5)
+    with freeze_time("2026-01-02"):
+        assert parse_ca_date("January 5") == date(2026, 1, 5)
+
+
+def test_classify_action_traits():
+    traits = classify_action("From printer. May be heard in committee March 7.")
+    assert traits.stage == "other"
+    assert traits.hearing_text == "March 7"
+    assert not traits.is_amendment
+
+    traits = classify_action("In Senate. Read first time. To Com. on RLS. for assignment.")
+    assert traits.stage == "cross_chamber"
+    assert traits.is_routing
+
+
 # ---------------------------------------------------------------------------
 # _risk_count
 # ---------------------------------------------------------------------------
@@ -642,6 +668,82 @@ def test_stalled_sorted_most_stalled_first():
     assert result[1]["bill_number"] == "AB002"
 
 
+# ---------------------------------------------------------------------------
+# _build_buckets — single-pass engine must match the per-bucket functions
+# ---------------------------------------------------------------------------
+
+def _per_bucket(bills, lookback=14, lookahead=14):
+    return {
+        "urgent":  _find_urgent(bills, lookahead=lookahead),
+        "moving":  _find_moving(bills, lookback=lookback),
+        "amended": _find_amended(bills, lookback=lookback),
+        "stalled": _find_stalled(bills),
+    }
+
+
+@freeze_time("2026-03-01")
+def test_build_buckets_matches_fixtures(
+    high_risk_bill_with_hearing, high_risk_bill_no_hearing, low_risk_bill_with_hearing,
+    moving_bill, amended_bill, stalled_high_risk_bill, cross_chamber_bill,
+):
+    bills = {
+        "AB1710": high_risk_bill_with_hearing,
+        "AB9999": high_risk_bill_no_hearing,
+        "SB8888": low_risk_bill_with_hearing,
+        "SB100":  moving_bill,
+        "AB200":  amended_bill,
+        "AB300":  stalled_high_risk_bill,
+        "AB400":  cross_chamber_bill,
+    }
+    for lookback, lookahead in ((14, 14), (7, 7), (30, 3)):
+        assert _build_buckets(bills, lookback, lookahead) == _per_bucket(bills, lookback, lookahead)
+
+
+@pytest.mark.parametrize("today", ["2026-02-15", "2026-03-01", "2026-04-20"])
+def test_build_buckets_matches_tracked_bills(today):
+    """Engine output is identical to the four passes on the real bill store."""
+    path = Path(__file__).resolve().parent.parent / "data" / "bills" / "tracked_bills.json"
+    bills = json.loads(path.read_text(encoding="utf-8"))["bills"]
+    with freeze_time(today):
+        assert _build_buckets(bills) == _per_bucket(bills)
+
+
+def test_incremental_buckets_track_full_rebuild_day_by_day():
+    """Carry incremental state across 75 days of a session (with edits) — always identical."""
+    path = Path(__file__).resolve().parent.parent / "data" / "bills" / "tracked_bills.json"
+    bills = json.loads(path.read_text(encoding="utf-8"))["bills"]
+    state: dict = {}
+    day = date(2026, 2, 10)
+    recomputed = []
+    for i in range(75):
+        if i == 20:
+            bn = next(iter(bills))
+            bills[bn] = dict(bills[bn], actions=bills[bn]["actions"] + [{
+                "date": (day - timedelta(days=1)).isoformat(),
+                "description": "From committee: Do pass as amended. (Ayes 8. Noes 0.)",
+                "chamber": "Assembly",
+            }])
+        with freeze_time(day.isoformat()):
+            buckets, state, stats = _build_buckets_incremental(bills, state)
+            assert buckets == _build_buckets(bills), f"diverged on {day}"
+        state = json.loads(json.dumps(state))    # round-trip like STATE_FILE
+        recomputed.append(stats["changed"] + stats["time_window"])
+        day += timedelta(days=1)
+
+    assert recomputed[0] == len(bills)           # cold start
+    assert sum(recomputed[1:]) < len(bills) * 74  # most days reuse most bills
+
+
+@freeze_time("2026-03-01")
+def test_incremental_recomputes_only_changed_bill(moving_bill, amended_bill):
+    bills = {"SB100": moving_bill, "AB200": amended_bill}
+    _, state, _ = _build_buckets_incremental(bills, {})
+    bills["AB200"] = dict(amended_bill, status="Re-referred")
+    buckets, _, stats = _build_buckets_incremental(bills, state)
+    assert stats["changed"] == 1 and stats["reused"] == 1
+    assert buckets == _build_buckets(bills)
+
+
 # ---------------------------------------------------------------------------
 # _build_digest_context — format smoke tests
 # ---------------------------------------------------------------------------
@@ -749,3 +851,120 @@ def test_anti_repetition_includes_source_file():
     }
     block = _build_anti_repetition_block(digest)
     assert "newsletter_2026-W09.html" in block
+
+
+# ---------------------------------------------------------------------------
+# Last-issue extraction (anti-repetition)
+# ---------------------------------------------------------------------------
+
+def _write_archive(path: Path, entries: list) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(entries), encoding="utf-8")
+
+
+def test_extract_last_issue_reads_archive_index(tmp_path, monkeypatch):
+    import agents.legislative.legislative_intel as li
+    monkeypatch.setattr(li, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(li, "ARCHIVE_JSON", tmp_path / "archive.json")
+    _write_archive(li.ARCHIVE_JSON, [
+        {"client_id": "csf", "date": "2026-02-20", "filename": "newsletter_2026-02-20.html",
+         "subject": "Old", "preview_text": "old", "story_beats": ["a"]},
+        {"client_id": "csf", "date": "2026-02-27", "filename": "newsletter_2026-02-27.html",
+         "subject": "New", "preview_text": "new", "story_beats": ["x", "y", "z"]},
+        {"client_id": "cma", "date": "2026-03-01", "filename": "newsletter_2026-03-01.html",
+         "subject": "Other client", "story_beats": []},
+    ])
+    last = li._extract_last_issue("csf")
+    assert last == {
+        "subject":      "New",
+        "preview_text": "new",
+        "story_beats":  ["x", "y", "z"],
+        "source_file":  "newsletter_2026-02-27.html",
+    }
+
+
+def test_extract_last_issue_falls_back_to_html_when_archive_is_stale(tmp_path, monkeypatch):
+    import agents.legislative.legislative_intel as li
+    monkeypatch.setattr(li, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(li, "ARCHIVE_JSON", tmp_path / "archive.json")
+    _write_archive(li.ARCHIVE_JSON, [
+        {"client_id": "csf", "date": "2026-02-20", "filename": "newsletter_2026-02-20.html",
+         "subject": "Archived", "story_beats": ["a"]},
+    ])
+    newer = tmp_path / "outputs" / "clients" / "csf" / "newsletter" / "newsletter_2026-02-27.html"
+    newer.parent.mkdir(parents=True)
+    newer.write_text("<html><head><title>From HTML</title></head><body></body></html>")
+
+    last = li._extract_last_issue("csf")
+    assert last["subject"] == "From HTML"
+    assert last["source_file"] == newer.name
+
+
+# ---------------------------------------------------------------------------
+# Multi-client digests (--clients)
+# ---------------------------------------------------------------------------
+
+def test_run_clients_writes_per_client_digests_from_shared_buckets(
+    tmp_path, monkeypatch, high_risk_bill_with_hearing,
+):
+    import agents.legislative.legislative_intel as li
+    digest_dir = tmp_path / "data" / "legislative"
+    bills_file = tmp_path / "tracked_bills.json"
+    bills_file.write_text(json.dumps({"bills": {"AB1234": high_risk_bill_with_hearing}}))
+    monkeypatch.setattr(li, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(li, "ARCHIVE_JSON", tmp_path / "archive.json")
+    monkeypatch.setattr(li, "BILLS_FILE", bills_file)
+    monkeypatch.setattr(li, "DIGEST_DIR", digest_dir)
+    monkeypatch.setattr(li, "DIGEST_FILE", digest_dir / "action_digest.json")
+
+    calls = []
+    real_build = li._build_buckets
+    monkeypatch.setattr(li, "_build_buckets", lambda *a, **kw: calls.append(1) or real_build(*a, **kw))
+
+    with freeze_time("2026-03-01"):
+        paths = li.run_clients(["csf", "cma"], no_claude=True)
+
+    assert [p.name for p in paths] == ["action_digest_csf.json", "action_digest_cma.json"]
+    assert len(calls) == 1
+    csf = json.loads(paths[0].read_text())
+    cma = json.loads(paths[1].read_text())
+    assert csf["client"] == "csf" and cma["client"] == "cma"
+    assert csf["urgent"] == cma["urgent"] and len(csf["urgent"]) == 1
+    # Default client's digest is also kept at the legacy path
+    assert json.loads((digest_dir / "action_digest.json").read_text())["client"] == "csf"
+
+
+def test_failed_claude_call_is_not_reused_by_the_next_incremental_run(
+    tmp_path, monkeypatch, high_risk_bill_with_hearing,
+):
+    import agents.legislative.legislative_intel as li
+    digest_dir = tmp_path / "data" / "legislative"
+    bills_file = tmp_path / "tracked_bills.json"
+    bills_file.write_text(json.dumps({"bills": {"AB1234": high_risk_bill_with_hearing}}))
+    monkeypatch.setattr(li, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(li, "ARCHIVE_JSON", tmp_path / "archive.json")
+    monkeypatch.setattr(li, "BILLS_FILE", bills_file)
+    monkeypatch.setattr(li, "DIGEST_DIR", digest_dir)
+    monkeypatch.setattr(li, "DIGEST_FILE", digest_dir / "action_digest.json")
+    monkeypatch.setattr(li, "STATE_FILE", digest_dir / "digest_state.json")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+
+    calls = []
+
+    def fake_create(client, agent, **kwargs):
+        calls.append(agent)
+        if len(calls) == 1:
+            raise RuntimeError("overloaded")
+        text = json.dumps({"gut_and_amend": [], "spot_bills": [], "week_summary": "Real summary."})
+        return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+    monkeypatch.setattr(li, "tracked_create", fake_create)
+
+    with freeze_time("2026-03-01"):
+        li.run(incremental=True)
+        state = json.loads(li.STATE_FILE.read_text())
+        assert state["claude_keys"]["action_digest.json"] is None
+        li.run(incremental=True)      # same inputs — the fallback must not be reused
+
+    assert len(calls) == 2
+    assert json.loads(li.DIGEST_FILE.read_text())["week_summary"] == "Real summary."
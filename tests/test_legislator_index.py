@@ -0,0 +1,102 @@
+"""Tests: legislator / committee index — name rules, confidence, and fingerprinted rebuilds."""
+import json
+
+import pytest
+from freezegun import freeze_time
+
+from agents.media.media_scanner import _articles_from_store, _feed_articles
+from agents.shared import legislator_index
+from agents.shared.article_store import ArticleStore
+from agents.shared.legislator_index import LegislatorIndex, bills_fingerprint, load_index
+
+_BILLS = {
+    "AB1903": {"author": "Buffy Wicks", "committees": ["Housing and Community Development"]},
+    "AB2011": {"author": "Buffy Wicks", "committees": ["Housing and Community Development"]},
+    "SB9":    {"author": "Toni Atkins", "committees": ["Housing"]},
+    "SB450":  {"author": "Tom Atkins",  "committees": ["Housing"]},
+    "AB7":    {"author": "David Ta",    "committees": []},
+    "AB2162": {"author": "Housing",     "committees": ["Housing"],
+               "upcoming_hearings": [{"date": "2026-03-10", "committee": "Senate Housing hearing"}]},
+}
+
+
+@pytest.fixture(autouse=True)
+def _clear_memo():
+    legislator_index._memo.clear()
+    yield
+    legislator_index._memo.clear()
+
+
+@pytest.fixture
+def index():
+    return load_index(_BILLS, path=None)
+
+
+def _links(index, text):
+    return {l["bill_number"]: l["confidence"] for l in index.match(text)}
+
+
+def test_full_name_and_honorific(index):
+    full = _links(index, "Assemblymember Buffy Wicks unveiled the plan.")
+    assert full["AB1903"] == full["AB2011"] > 0.6
+    honorific = _links(index, "Sen. Atkins's office declined to comment.")
+    # Two authors share the surname: the evidence is split between them
+    assert honorific["SB9"] == honorific["SB450"] < 0.5
+
+
+def test_short_surnames_need_a_first_name_or_honorific(index):
+    assert _links(index, "Ta said it would pass.") == {}
+    assert "AB7" in _links(index, "David Ta said it would pass.")
+    assert "AB7" in _links(index, "Assemblymember Ta said it would pass.")
+
+
+def test_hearing_boost_and_noisy_or(index):
+    committee_only = _links(index, "The Assembly Rules Committee met Tuesday.")
+    assert committee_only == {}
+    hearing = _links(index, "The Senate Housing Committee takes up the bill next week.")
+    assert hearing["AB2162"] > 0.5
+    both = _links(index, "Sen. Toni Atkins told the Senate Housing Committee ...")
+    assert both["SB9"] > _links(index, "Toni Atkins spoke.")["SB9"]
+
+
+def test_repeated_names_count_once(index):
+    once = index.match("Buffy Wicks spoke.")
+    assert index.match("Buffy Wicks spoke. " * 20) == once
+
+
+def test_spec_persisted_and_rebuilt_when_bills_change(tmp_path, monkeypatch):
+    path = tmp_path / "legislator_index.json"
+    first = load_index(_BILLS, path)
+    saved = json.loads(path.read_text())
+    assert saved["fingerprint"] == bills_fingerprint(_BILLS)
+
+    legislator_index._memo.clear()
+    built = []
+    real_build = legislator_index._build_spec
+    monkeypatch.setattr(legislator_index, "_build_spec", lambda b: built.append(1) or real_build(b))
+    assert load_index(_BILLS, path).spec == first.spec
+    assert built == []    # unchanged bills → persisted spec reused
+
+    changed = {**_BILLS, "AB7": {"author": "Lori Wilson", "committees": []}}
+    rebuilt = load_index(changed, path)
+    assert built == [1] and "Lori Wilson" in rebuilt.spec["authors"]
+    assert json.loads(path.read_text())["fingerprint"] == bills_fingerprint(changed)
+
+
+@freeze_time("2026-03-01")
+def test_scanner_links_articles_without_bill_numbers(tmp_path, index):
+    store = ArticleStore(tmp_path / "store.jsonl")
+    entries = [{"id": "https://a.test/1", "link": "https://a.test/1", "published": "2026-02-28",
+                "title": "Wicks pushes zoning overhaul", "summary": "Assemblymember Buffy Wicks..."}]
+    _feed_articles(entries, {"name": "A", "url": "x", "weight": 1.0}, set(_BILLS), 7, 0.0, store)
+
+    plain  = _articles_from_store(store, set(_BILLS), 7, 0.0)
+    linked = _articles_from_store(store, set(_BILLS), 7, 0.0, legislators=index)
+    assert plain[0]["bill_links"] == []
+    assert {l["bill_number"] for l in linked[0]["bill_links"]} == {"AB1903", "AB2011"}
+    assert linked[0]["bill_mentions"] == []
+    assert linked[0]["relevance_score"] > plain[0]["relevance_score"]
+
+
+def test_index_from_empty_bill_store():
+    assert LegislatorIndex(legislator_index._build_spec({})).match("Buffy Wicks") == []
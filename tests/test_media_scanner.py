@@ -0,0 +1,310 @@
+"""Tests: media_scanner.py — feed fetching, parsing, and scoring.
+
+No network access: requests.get is replaced with canned responses.
+Dates frozen to 2026-03-01 so feed pubDates fall inside the lookback window.
+"""
+from types import SimpleNamespace
+
+import pytest
+import requests
+from freezegun import freeze_time
+
+from agents.media import media_scanner
+from agents.media.media_scanner import (
+    _breaker_open,
+    _entry_date,
+    _parse_date,
+    _parse_date_fast,
+    _load_config,
+    _load_feeds,
+    _NewsApiLedger,
+    _record_feed_result,
+    _scan_newsapi,
+    _scan_rss_feeds,
+)
+
+
+def _rss(*items: tuple[str, str]) -> bytes:
+    body = "".join(
+        f"<item><title>{t}</title><link>{u}</link>"
+        f"<pubDate>Fri, 27 Feb 2026 10:00:00 GMT</pubDate>"
+        f"<description>Zoning preemption story</description></item>"
+        for t, u in items
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel>{body}</channel></rss>'.encode()
+
+
+def _response(url: str, content: bytes = b"", status: int = 200, headers: dict | None = None):
+    resp = SimpleNamespace(
+        url=url, content=content, status_code=status,
+        headers=headers or {"Content-Type": "application/rss+xml"},
+    )
+    resp.raise_for_status = lambda: None
+    return resp
+
+
+@pytest.fixture
+def feeds():
+    return [
+        {"name": "Alpha", "url": "https://alpha.test/feed", "weight": 1.0},
+        {"name": "Slow",  "url": "https://slow.test/feed",  "weight": 1.0},
+        {"name": "Beta",  "url": "https://beta.test/feed",  "weight": 1.5},
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Concurrent RSS fetch
+# ---------------------------------------------------------------------------
+
+@freeze_time("2026-03-01")
+def test_scan_rss_feeds_parses_downloaded_bytes_and_skips_timeouts(feeds, monkeypatch):
+    seen_timeouts = []
+
+    def fake_get(url, headers=None, timeout=None, **kw):
+        seen_timeouts.append(timeout)
+        if "slow" in url:
+            raise requests.Timeout("read timed out")
+        if "alpha" in url:
+            return _response(url, _rss(("AB1234 zoning fight", "https://alpha.test/1")))
+        return _response(url, _rss(("Local control vote", "https://beta.test/2")))
+
+    monkeypatch.setattr(media_scanner.requests, "get", fake_get)
+    articles = _scan_rss_feeds(feeds, {"AB1234"}, lookback_days=7)
+
+    assert {a["source"] for a in articles} == {"Alpha", "Beta"}
+    assert articles[0]["bill_mentions"] == ["AB1234"]
+    assert all(t == (media_scanner.RSS_CONNECT_TIMEOUT, media_scanner.RSS_READ_TIMEOUT)
+               for t in seen_timeouts)
+
+
+# ---------------------------------------------------------------------------
+# Conditional GET (ETag / Last-Modified)
+# ---------------------------------------------------------------------------
+
+@freeze_time("2026-03-01")
+def test_not_modified_feed_reuses_cached_entries(monkeypatch):
+    feed = [{"name": "Alpha", "url": "https://alpha.test/feed", "weight": 1.0}]
+    sent_headers = []
+
+    def fake_get(url, headers=None, timeout=None, **kw):
+        sent_headers.append(headers)
+        if headers.get("If-None-Match") == '"v1"':
+            return _response(url, status=304, headers={})
+        return _response(
+            url, _rss(("AB1234 zoning fight", "https://alpha.test/1")),
+            headers={"Content-Type": "application/rss+xml", "ETag": '"v1"'},
+        )
+
+    monkeypatch.setattr(media_scanner.requests, "get", fake_get)
+    monkeypatch.setattr(media_scanner.feedparser, "parse", _counting(media_scanner.feedparser.parse))
+    state: dict = {}
+    first  = _scan_rss_feeds(feed, {"AB1234"}, lookback_days=7, feed_state=state)
+    second = _scan_rss_feeds(feed, {"AB1234"}, lookback_days=7, feed_state=state)
+
+    assert "If-None-Match" not in sent_headers[0]
+    assert sent_headers[1]["If-None-Match"] == '"v1"'
+    assert media_scanner.feedparser.parse.calls == 1
+    assert second == first
+    assert state["https://alpha.test/feed"]["entry_ids"] == ["https://alpha.test/1"]
+
+
+def _counting(fn):
+    def wrapper(*a, **kw):
+        wrapper.calls += 1
+        return fn(*a, **kw)
+    wrapper.calls = 0
+    return wrapper
+
+
+# ---------------------------------------------------------------------------
+# Config-driven feeds + circuit breaker
+# ---------------------------------------------------------------------------
+
+def test_load_feeds_respects_active_flag():
+    feeds = _load_feeds({"rss_feeds": [
+        {"name": "On",  "url": "https://on.test/feed",  "weight": 1.2, "active": True},
+        {"name": "Off", "url": "https://off.test/feed", "active": False},
+    ]})
+    assert feeds == [{"name": "On", "url": "https://on.test/feed", "weight": 1.2}]
+
+
+def test_shipped_config_has_active_feeds():
+    names = [f["name"] for f in _load_feeds(_load_config())]
+    assert names and "LA Times" not in names
+
+
+def test_breaker_opens_after_threshold_and_backs_off_exponentially():
+    from datetime import datetime, timedelta
+    health, url, now = {}, "https://dead.test/feed", datetime(2026, 3, 1, 12)
+    settings = {"failure_threshold": 3, "base_backoff_hours": 24, "max_backoff_days": 30}
+
+    for _ in range(2):
+        _record_feed_result(health, url, False, 5.0, "timed out", now, settings)
+    assert not _breaker_open(health[url], now)
+
+    _record_feed_result(health, url, False, 5.0, "timed out", now, settings)
+    assert health[url]["open_until"] == (now + timedelta(hours=24)).isoformat()
+    assert _breaker_open(health[url], now + timedelta(hours=23))
+
+    later = now + timedelta(days=2)
+    _record_feed_result(health, url, False, 5.0, "timed out", later, settings)
+    assert health[url]["open_until"] == (later + timedelta(hours=48)).isoformat()
+
+    _record_feed_result(health, url, True, 0.4, None, later + timedelta(days=3), settings)
+    assert health[url]["consecutive_failures"] == 0
+    assert not _breaker_open(health[url], later + timedelta(days=3))
+
+
+def test_open_breaker_skips_feed_without_request(monkeypatch):
+    feed   = [{"name": "Dead", "url": "https://dead.test/feed", "weight": 1.0}]
+    health = {"https://dead.test/feed": {
+        "consecutive_failures": 5, "open_until": "2999-01-01T00:00:00", "history": [],
+    }}
+
+    def fail_get(*a, **kw):
+        raise AssertionError("open breaker must not issue a request")
+
+    monkeypatch.setattr(media_scanner.requests, "get", fail_get)
+    assert _scan_rss_feeds(feed, set(), lookback_days=7, feed_health=health) == []
+
+
+# ---------------------------------------------------------------------------
+# Date normalization fast paths
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("raw", [
+    "Fri, 27 Feb 2026 18:04:00 +0000",
+    "Sat, 28 Feb 2026 23:30:00 -0800",     # as-written date, not UTC
+    "27 Feb 2026 10:00 GMT",
+    "2026-02-27T23:30:00Z",
+    "2026-02-27",
+])
+def test_fast_paths_match_dateutil_as_written(raw):
+    from dateutil import parser as dateparser
+    expected = dateparser.parse(raw, ignoretz=True).date().isoformat()
+    assert _parse_date_fast(raw) == expected
+    assert _parse_date(raw) == expected
+
+
+def test_unusual_formats_fall_back_to_dateutil():
+    assert _parse_date_fast("February 27, 2026") is None
+    assert _parse_date("February 27, 2026") == "2026-02-27"
+    assert _parse_date("Fri, 31 Feb 2026 00:00:00 GMT") is None
+    assert _parse_date("") is None
+
+
+def test_entry_date_uses_parsed_struct_when_string_is_unusual():
+    import time as _time
+    entry = {"published": "Friday the 27th", "published_parsed": _time.strptime("2026-02-27", "%Y-%m-%d")}
+    assert _entry_date(entry) == "2026-02-27"
+    assert _entry_date({"updated": "2026-02-26T08:00:00Z"}) == "2026-02-26"
+    assert _entry_date({}) is None
+
+
+# ---------------------------------------------------------------------------
+# NewsAPI: concurrent queries, relevance-gated paging, daily ledger
+# ---------------------------------------------------------------------------
+
+def _newsapi_item(i: int, relevant: bool) -> dict:
+    return {
+        "url":         f"https://news.test/{i}",
+        "title":       f"Zoning preemption housing bill {i}" if relevant else f"Sports roundup {i}",
+        "description": "California housing local control" if relevant else "Scores",
+        "publishedAt": "2026-02-27T10:00:00Z",
+        "source":      {"name": "Test News"},
+    }
+
+
+def _fake_newsapi(pages: dict, calls: list):
+    """pages: query → list of pages (lists of items)."""
+    def fake_get(url, params=None, timeout=None):
+        calls.append((params["q"], params["page"]))
+        batches = pages[params["q"]]
+        batch = batches[params["page"] - 1] if params["page"] <= len(batches) else []
+        resp = SimpleNamespace(status_code=200, json=lambda: {"articles": batch})
+        resp.raise_for_status = lambda: None
+        return resp
+    return fake_get
+
+
+@freeze_time("2026-03-01")
+def test_newsapi_pages_only_while_results_stay_relevant(tmp_path, monkeypatch):
+    monkeypatch.setenv("NEWSAPI_KEY", "k")
+    pages = {
+        "hot":  [[_newsapi_item(i, True) for i in range(2)],
+                 [_newsapi_item(i, True) for i in range(2, 4)],
+                 [_newsapi_item(i, False) for i in range(4, 6)]],
+        "cold": [[_newsapi_item(i, False) for i in range(10, 12)],
+                 [_newsapi_item(i, True) for i in range(12, 14)]],
+    }
+    calls: list = []
+    monkeypatch.setattr(media_scanner.requests, "get", _fake_newsapi(pages, calls))
+    ledger = _NewsApiLedger(tmp_path / "ledger.json")
+
+    articles, status = _scan_newsapi(
+        set(), 7, settings={"queries": ["hot", "cold"], "page_size": 2, "max_results_per_query": 10},
+        ledger=ledger,
+    )
+
+    assert status == "ok"
+    assert sorted(calls) == [("cold", 1), ("hot", 1), ("hot", 2), ("hot", 3)]
+    assert {a["url"] for a in articles} == {f"https://news.test/{i}" for i in range(4)}
+    assert ledger.made == 4
+
+
+@freeze_time("2026-03-01")
+def test_newsapi_request_failure_keeps_earlier_pages(tmp_path, monkeypatch):
+    monkeypatch.setenv("NEWSAPI_KEY", "k")
+    pages = {"hot":  [[_newsapi_item(i, True) for i in range(2)]],
+             "cold": [[_newsapi_item(i, True) for i in range(10, 12)]]}
+    fake = _fake_newsapi(pages, [])
+
+    def flaky_get(url, params=None, timeout=None):
+        if params["q"] == "hot" and params["page"] == 2:
+            raise media_scanner.requests.ConnectionError("reset by peer")
+        return fake(url, params, timeout)
+
+    monkeypatch.setattr(media_scanner.requests, "get", flaky_get)
+    articles, status = _scan_newsapi(
+        set(), 7, settings={"queries": ["hot", "cold"], "page_size": 2, "max_results_per_query": 10},
+        ledger=_NewsApiLedger(tmp_path / "ledger.json"),
+    )
+
+    assert status == "error"
+    assert {a["url"] for a in articles} == {f"https://news.test/{i}" for i in (0, 1, 10, 11)}
+
+
+@freeze_time("2026-03-01")
+def test_newsapi_ledger_caps_requests_across_runs(tmp_path, monkeypatch):
+    monkeypatch.setenv("NEWSAPI_KEY", "k")
+    path = tmp_path / "ledger.json"
+    path.write_text('{"2026-03-01": 98}')
+    pages = {q: [[_newsapi_item(i, True)] for i in range(5)] for q in ("a", "b", "c")}
+    calls: list = []
+    monkeypatch.setattr(media_scanner.requests, "get", _fake_newsapi(pages, calls))
+
+    _, status = _scan_newsapi(
+        set(), 7,
+        settings={"queries": ["a", "b", "c"], "page_size": 1, "max_results_per_query": 5},
+        ledger=_NewsApiLedger(path),
+    )
+
+    assert status == "quota_exhausted"
+    assert len(calls) == 2
+    assert media_scanner.json.loads(path.read_text()) == {"2026-03-01": 100}
+
+    calls.clear()
+    _, status = _scan_newsapi(set(), 7, settings={"queries": ["a"]}, ledger=_NewsApiLedger(path))
+    assert status == "quota_exhausted"
+    assert calls == []
+
+
+@freeze_time("2026-03-01")
+def test_ledger_reservations_are_shared_with_a_concurrent_run(tmp_path):
+    path = tmp_path / "ledger.json"
+    path.write_text('{"2026-03-01": 97}')
+    first, second = _NewsApiLedger(path), _NewsApiLedger(path)
+    assert first.reserve() and first.reserve() and second.reserve()
+    assert not first.reserve() and not second.reserve()      # both opened with 3 left
+    assert (first.made, second.made, first.remaining) == (2, 1, 0)
+    assert media_scanner.json.loads(path.read_text()) == {"2026-03-01": 100}
@@ -0,0 +1,98 @@
+"""Tests: media mention time series — window replacement, persistence, rolling sums, spikes."""
+from datetime import date, timedelta
+
+import pytest
+
+from agents.media.media_scanner import _trending_bills
+from agents.shared import mention_series
+from agents.shared.mention_series import MentionSeries
+
+_TODAY = date(2026, 3, 1)
+
+
+def _article(day: date, bills: list[str], source: str = "CalMatters", source_type: str = "rss") -> dict:
+    return {"published": day.isoformat(), "bill_mentions": bills, "source": source, "source_type": source_type}
+
+
+def _history(series: MentionSeries) -> None:
+    """One AB1 mention every other day for four weeks, then a burst; SB2 steady."""
+    articles = [_article(_TODAY - timedelta(days=d), ["AB1", "SB2"]) for d in range(3, 31, 2)]
+    articles += [_article(_TODAY - timedelta(days=d), ["SB2"], "KQED") for d in range(3, 31, 2)]
+    articles += [_article(_TODAY - timedelta(days=d), ["AB1"], src, "newsapi")
+                 for d in range(3) for src in ("LA Times", "SF Chronicle", "KQED")]
+    articles += [_article(_TODAY, ["SB2"])]
+    series.record_window(articles, _TODAY - timedelta(days=40), _TODAY)
+
+
+def test_rerunning_a_window_replaces_instead_of_double_counting(tmp_path):
+    series = MentionSeries(tmp_path / "series.bin")
+    window = [_article(_TODAY, ["AB1"]), _article(_TODAY, ["AB1"], "KQED"), _article(_TODAY, ["AB1", "AB1"])]
+    series.record_window(window, _TODAY - timedelta(days=7), _TODAY)
+    series.record_window(window, _TODAY - timedelta(days=7), _TODAY)
+    assert series.rolling("bill", 7, _TODAY) == {"AB1": 3}
+    assert series.rolling("source", 7, _TODAY) == {"CalMatters": 2, "KQED": 1}
+
+    # A later window leaves earlier days as recorded
+    series.record_window([], _TODAY + timedelta(days=1), _TODAY + timedelta(days=8))
+    assert series.rolling("bill", 30, _TODAY + timedelta(days=8)) == {"AB1": 3}
+
+
+def test_round_trip_through_the_binary_file(tmp_path):
+    path = tmp_path / "series.bin"
+    series = MentionSeries(path)
+    _history(series)
+    series.save()
+    reloaded = MentionSeries(path)
+    assert len(reloaded) == len(series)
+    for dim in mention_series.DIMENSIONS:
+        assert reloaded.rolling(dim, 60, _TODAY) == series.rolling(dim, 60, _TODAY)
+    assert path.stat().st_size < 1_000 + 8 * len(series)
+
+
+def test_source_type_regroups_sources():
+    series = MentionSeries(None)
+    _history(series)
+    # A source keeps the type it was first seen with (KQED: rss)
+    assert series.rolling("source_type", 3, _TODAY) == {"newsapi": 6, "rss": 4}
+    with pytest.raises(ValueError):
+        series.rolling("author", 3, _TODAY)
+
+
+def test_spike_detector_flags_the_burst_not_the_steady_bill():
+    series = MentionSeries(None)
+    _history(series)
+    spikes = series.spikes("bill", end=_TODAY)
+    assert [s["key"] for s in spikes] == ["AB1"]
+    assert spikes[0]["mentions"] == 9 and spikes[0]["z"] >= 2.0
+    assert _trending_bills(series, {"AB1", "SB2"}, today=_TODAY)[0]["bill_number"] == "AB1"
+    assert _trending_bills(series, {"SB2"}, today=_TODAY) == []
+
+
+def test_no_spikes_until_the_series_covers_the_baseline(tmp_path):
+    path = tmp_path / "series.bin"
+    series = MentionSeries(path)
+    burst = [_article(_TODAY - timedelta(days=d), ["AB1"], src) for d in range(3) for src in ("A", "B")]
+    series.record_window(burst, _TODAY - timedelta(days=6), _TODAY)     # first scan: 7-day lookback
+    assert series.spikes("bill", end=_TODAY) == []
+
+    series.save()
+    later = _TODAY + timedelta(days=30)
+    series = MentionSeries(path)
+    series.record_window([_article(later - timedelta(days=d), ["AB1"], src) for d in range(3) for src in ("A", "B")],
+                         later - timedelta(days=6), later)
+    assert series.since == _TODAY - timedelta(days=6)
+    assert [s["key"] for s in series.spikes("bill", end=later)] == ["AB1"]
+
+
+def test_numpy_and_pure_python_grids_agree(monkeypatch):
+    if mention_series.np is None:
+        pytest.skip("numpy not installed")
+    series = MentionSeries(None)
+    _history(series)
+    start = _TODAY - timedelta(days=40)
+    batch = {dim: series.grid(dim, start, _TODAY)[1].tolist() for dim in mention_series.DIMENSIONS}
+    spikes = series.spikes("source", end=_TODAY, min_z=0.0)
+    monkeypatch.setattr(mention_series, "np", None)
+    for dim in mention_series.DIMENSIONS:
+        assert series.grid(dim, start, _TODAY)[1] == batch[dim]
+    assert series.spikes("source", end=_TODAY, min_z=0.0) == spikes
@@ -0,0 +1,196 @@
+"""Tests: newsletter_writer concurrency — --client all fan-out and --sections generation."""
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from agents.newsletter import newsletter_writer
+from agents.newsletter.newsletter_writer import (
+    _NEWSLETTER_SCHEMA,
+    _generate_content_sections,
+    _recipients_var,
+    _resolve_clients,
+    run_clients,
+)
+from agents.shared.json_stream import JsonStreamParser
+from agents.shared import token_ledger
+from agents.shared.token_ledger import configure_ledger, ledger_summary
+
+
+class _ConcurrentStreamingClient:
+    """Stands in for anthropic.Anthropic — streams respond(kwargs), records overlap and prompts."""
+
+    def __init__(self, respond):
+        self.messages = self
+        self.respond  = respond
+        self.lock     = threading.Lock()
+        self.active   = 0
+        self.peak     = 0
+        self.prompts  = []
+
+    def stream(self, **kwargs):
+        client = self
+        text   = self.respond(kwargs)
+        with self.lock:
+            self.prompts.append(kwargs["messages"][0]["content"])
+        usage  = SimpleNamespace(input_tokens=1000, output_tokens=len(text) // 4)
+
+        class _Stream:
+            current_message_snapshot = SimpleNamespace(usage=usage)
+
+            def __enter__(self):
+                with client.lock:
+                    client.active += 1
+                    client.peak = max(client.peak, client.active)
+
+                def deltas():
+                    for i in range(0, len(text), 200):
+                        time.sleep(0.005)
+                        yield text[i:i + 200]
+                self.text_stream = deltas()
+                return self
+
+            def __exit__(self, *exc):
+                with client.lock:
+                    client.active -= 1
+                return False
+
+            def get_final_message(self):
+                return SimpleNamespace(usage=usage, stop_reason="end_turn", content=[])
+
+        return _Stream()
+
+
+@pytest.fixture
+def _sandbox(tmp_path, monkeypatch):
+    """Outputs, archive, digests, and the token ledger all under tmp_path."""
+    monkeypatch.delenv("CSF_TOKEN_BUDGET", raising=False)
+    for name in ("_budget", "_run_id", "_ledger_dir"):
+        monkeypatch.setattr(token_ledger, name, getattr(token_ledger, name))
+    configure_ledger(run_id="fanout", ledger_dir=tmp_path / "ledger")
+    monkeypatch.setattr(newsletter_writer, "_claude_slots", newsletter_writer._claude_slots)
+
+    archive_dir = tmp_path / "docs" / "newsletters"
+    archive_dir.mkdir(parents=True)
+    monkeypatch.setattr(newsletter_writer, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(newsletter_writer, "ARCHIVE_DIR", archive_dir)
+    monkeypatch.setattr(newsletter_writer, "ARCHIVE_JSON", archive_dir / "archive.json")
+    monkeypatch.setattr(newsletter_writer, "DIGEST_FILE", tmp_path / "action_digest.json")
+    return tmp_path
+
+
+def test_digest_file_prefers_the_newer_digest(_sandbox):
+    shared = _sandbox / "action_digest.json"
+    own    = _sandbox / "action_digest_cma.json"
+    assert newsletter_writer._digest_file("cma") == shared
+
+    own.write_text(json.dumps({"generated": "2026-03-01T06:00:00"}))
+    shared.write_text(json.dumps({"generated": "2026-02-22T06:00:00"}))
+    assert newsletter_writer._digest_file("cma") == own
+
+    shared.write_text(json.dumps({"generated": "2026-03-08T06:00:00"}))   # later single-client run
+    assert newsletter_writer._digest_file("cma") == shared
+
+
+def test_resolve_clients():
+    assert _resolve_clients("csf") == ["csf"]
+    assert _resolve_clients("csf, cma,csf") == ["csf", "cma"]
+    assert set(_resolve_clients("all")) >= {"csf", "cma"}
+
+
+def test_multi_client_sends_never_fall_back_to_the_shared_list(monkeypatch):
+    monkeypatch.setenv("NEWSLETTER_RECIPIENTS", "everyone@example.org")
+    monkeypatch.setenv("NEWSLETTER_RECIPIENTS_CSF", "csf-list@example.org")
+    monkeypatch.delenv("NEWSLETTER_RECIPIENTS_CMA", raising=False)
+
+    assert _recipients_var("cma", shared_ok=True)  == "NEWSLETTER_RECIPIENTS"
+    assert _recipients_var("cma", shared_ok=False) == "NEWSLETTER_RECIPIENTS_CMA"   # unset → not sent
+    assert _recipients_var("csf", shared_ok=False) == "NEWSLETTER_RECIPIENTS_CSF"
+    assert _recipients_var("csf", shared_ok=True)  == "NEWSLETTER_RECIPIENTS_CSF"
+
+
+def test_clients_share_loads_and_the_claude_limit(_sandbox, monkeypatch, bills_dict, mock_newsletter_content):
+    (_sandbox / "action_digest.json").write_text(json.dumps({"week": "2026-W09", "moving": []}))
+    reads = []
+    real_read = newsletter_writer._read_digest
+    monkeypatch.setattr(newsletter_writer, "_read_digest", lambda p: reads.append(p) or real_read(p))
+    builds = []
+    monkeypatch.setattr(newsletter_writer, "_build_archive_index", lambda entries: builds.append(len(entries)))
+    newsletter_writer._set_claude_concurrency(2)
+
+    client = _ConcurrentStreamingClient(lambda kw: json.dumps(mock_newsletter_content))
+    issues, failed = run_clients(["csf", "cma", "cprc"], client, bills_dict)
+
+    assert list(issues) == ["csf", "cma", "cprc"] and failed == {}
+    assert len(reads) == 1                      # one shared digest file, read once
+    assert client.peak == 2                     # never more Claude calls than the limit
+    assert builds == [3]                        # archive index rebuilt once, with every issue
+    archive = json.loads(newsletter_writer.ARCHIVE_JSON.read_text())
+    assert sorted(e["client_id"] for e in archive) == ["cma", "cprc", "csf"]
+    assert all(i["out_path"].exists() for i in issues.values())
+    assert ledger_summary()["newsletter_writer"]["calls"] == 3
+
+
+def test_one_failing_client_does_not_stop_the_others(_sandbox, monkeypatch, bills_dict, mock_newsletter_content):
+    monkeypatch.setattr(newsletter_writer, "_GENERATION_ATTEMPTS", 1)
+    client = _ConcurrentStreamingClient(
+        lambda kw: "Sorry, I can't." if "City Managers" in kw["system"] else json.dumps(mock_newsletter_content)
+    )
+
+    issues, failed = run_clients(["csf", "cma"], client, bills_dict)
+
+    assert list(issues) == ["csf"] and list(failed) == ["cma"]
+    archive = json.loads(newsletter_writer.ARCHIVE_JSON.read_text())
+    assert [e["client_id"] for e in archive] == ["csf"]
+
+
+def test_unexpected_errors_and_unknown_slugs_are_isolated(_sandbox, bills_dict, mock_newsletter_content):
+    def respond(kw):
+        if "City Managers" in kw["system"]:
+            raise RuntimeError("API unavailable")
+        return json.dumps(mock_newsletter_content)
+
+    issues, failed = run_clients(["csf", "cma", "nosuchclient"], _ConcurrentStreamingClient(respond), bills_dict)
+
+    assert list(issues) == ["csf"] and list(failed) == ["cma", "nosuchclient"]
+    assert failed["cma"] == "RuntimeError: API unavailable"
+    assert "unknown client" in failed["nosuchclient"]
+    archive = json.loads(newsletter_writer.ARCHIVE_JSON.read_text())
+    assert [e["client_id"] for e in archive] == ["csf"]
+
+
+def _section_responses(content):
+    """Outline + section responses that assemble back into `content`."""
+    beats = [{k: p[k] for k in ("line1", "line2", "reveal")} | {"thesis": f"Thesis {i}."}
+             for i, p in enumerate(content["story"])]
+    return {
+        '"beats"':          {"subject": content["subject"], "preview_text": content["preview_text"],
+                             "dek": content["dek"], "anchor_facts": ["AB1 hearing March 7."], "beats": beats},
+        '"story"':          {"story": [{"body": p["body"]} for p in content["story"]]},
+        '"watch_items"':    {"watch_items": content["watch_items"]},
+        '"call_to_action"': {k: content[k] for k in ("call_to_action", "close")},
+    }
+
+
+def test_sectioned_generation_assembles_the_single_call_shape(
+    _sandbox, bill_set, csf_client, mock_newsletter_content,
+):
+    responses = _section_responses(mock_newsletter_content)
+
+    def respond(kw):
+        requested = kw["messages"][0]["content"].split("exactly these keys:")[1]
+        return next(json.dumps(r) for marker, r in responses.items() if marker in requested)
+
+    client  = _ConcurrentStreamingClient(respond)
+    content = _generate_content_sections(bill_set, client, csf_client, digest={"week_summary": "x"})
+
+    assert content == mock_newsletter_content
+    parser = JsonStreamParser(_NEWSLETTER_SCHEMA)
+    parser.feed(json.dumps(content))
+    assert parser.finish() == content
+    assert '"beats"' in client.prompts[0]                          # outline first
+    assert all("Thesis 3." in p for p in client.prompts[1:])       # sections share it
+    assert client.peak == 3                                        # sections ran concurrently
+    assert ledger_summary()["newsletter_writer"]["calls"] == 4
@@ -0,0 +1,116 @@
+"""Tests: TF-IDF topic relevance model — batch scoring, scale, and learned vocabulary."""
+import json
+from pathlib import Path
+
+import pytest
+from freezegun import freeze_time
+
+from agents.media.media_scanner import CLIENTS_DIR, _TOPIC_KEYWORDS, _articles_from_store, _feed_articles
+from agents.shared import relevance_model
+from agents.shared.article_store import ArticleStore
+from agents.shared.relevance_model import TOPIC_SCORE_MAX, TopicProfile, article_text, build_topic_profile
+
+_BILLS = {
+    "AB1": {"title": "Housing: fourplex approvals: ministerial review.",
+            "summary": "Requires cities to ministerially approve fourplex projects on single-family lots.",
+            "analysis": {"reduce_discretion": "strong"}},
+    "SB2": {"title": "Land use: builder's remedy: housing element compliance.",
+            "summary": "Expands the builder's remedy when a city's housing element lapses.",
+            "analysis": {"pro_housing_production": "moderate"}},
+    "AB3": {"title": "Fisheries: salmon.", "summary": "Salmon hatchery funding.",
+            "analysis": {"pro_housing_production": "none"}},
+}
+
+_TEXTS = [
+    "Berkeley council fights fourplex approvals . Cities say ministerial review strips local control",
+    "Builder's remedy project approved after housing element lapsed",
+    "Warriors beat Lakers in overtime thriller",
+    "",
+    "123 456 — ü é",
+]
+
+
+@pytest.fixture
+def profile():
+    return build_topic_profile(_BILLS, seed_terms=_TOPIC_KEYWORDS)
+
+
+def test_vocabulary_is_learned_from_tracked_bills(profile):
+    on_topic, remedy, sports, empty, numbers = profile.topic_scores(_TEXTS)
+    # "fourplex" and "builder's remedy" aren't in _TOPIC_KEYWORDS
+    assert on_topic > 0.3 and remedy > 0.3
+    assert sports == empty == numbers == 0.0
+    assert all(0.0 <= s <= TOPIC_SCORE_MAX for s in (on_topic, remedy))
+
+
+def test_numpy_and_pure_python_paths_agree(profile, monkeypatch):
+    if relevance_model.np is None:
+        pytest.skip("numpy not installed")
+    batch = profile.similarities(_TEXTS * 50)
+    monkeypatch.setattr(relevance_model, "np", None)
+    pure = TopicProfile(profile._documents).similarities(_TEXTS * 50)
+    assert batch == pytest.approx(pure, abs=1e-12)
+
+
+def test_voice_files_feed_the_profile(tmp_path):
+    voices = tmp_path / "clients" / "acme" / "voices"
+    voices.mkdir(parents=True)
+    (voices / "default.md").write_text("We fight for neighborhood stewardship and sprawl limits.")
+    without = build_topic_profile({}, seed_terms=["zoning"])
+    with_voice = build_topic_profile({}, tmp_path / "clients", ["zoning"])
+    text = ["Neighborhood stewardship groups rally against sprawl"]
+    assert without.topic_scores(text) == [0.0]
+    assert with_voice.topic_scores(text)[0] > 0.3
+
+
+_OFF_TOPIC = [
+    ("Measles outbreak spreads in Los Angeles County schools",
+     "Public health officials in Los Angeles County confirmed new measles cases at three schools."),
+    ("Wildfire insurance rates climb again as State Farm pulls back",
+     "California homeowners face higher premiums as insurers retreat; the state commissioner weighs new rules."),
+    ("Michelin-starred chef opens a second restaurant downtown",
+     "The owner of a Michelin-starred restaurant is opening a second location in the city's downtown district."),
+    ("Traffic safety advocates call for lower speed limits",
+     "Advocates asked state legislators to let cities lower speed limits after a rise in pedestrian deaths."),
+    ("School board approves budget amid enrollment decline",
+     "The district's board approved a budget that closes two schools as state funding shrinks."),
+]
+_ON_TOPIC = [
+    ("Builder's remedy project approved after housing element lapsed",
+     "A 200-unit apartment project was approved after the city missed its housing element deadline."),
+    ("Housing element deadline looms for Bay Area cities",
+     "Cities must rezone for thousands of homes to meet their regional housing needs allocation."),
+]
+
+
+def test_off_topic_news_scores_below_threshold_on_the_real_profile():
+    """Generic civic vocabulary alone doesn't clear min_relevance_score (0.3)."""
+    path  = Path(__file__).resolve().parent.parent / "data" / "bills" / "tracked_bills.json"
+    bills = json.loads(path.read_text(encoding="utf-8"))["bills"]
+    real  = build_topic_profile(bills, CLIENTS_DIR, _TOPIC_KEYWORDS)
+    texts = [article_text({"title": t, "summary": s}) for t, s in _OFF_TOPIC + _ON_TOPIC]
+    scores = real.topic_scores(texts)
+    assert all(s < 0.3 for s in scores[:len(_OFF_TOPIC)]), scores
+    # no legacy keyword in these two — the profile alone carries them
+    assert all(s >= 0.3 for s in scores[len(_OFF_TOPIC):]), scores
+
+
+@freeze_time("2026-03-01")
+def test_store_window_scored_against_profile(tmp_path, profile):
+    store = ArticleStore(tmp_path / "store.jsonl")
+    entries = [
+        {"id": u, "title": t, "summary": "", "link": u, "published": "2026-02-28"}
+        for u, t in [("https://a.test/1", "Cities push back on fourplex approvals"),
+                     ("https://a.test/2", "Warriors beat Lakers in overtime")]
+    ]
+    _feed_articles(entries, {"name": "A", "url": "x", "weight": 1.0}, set(), 7, 0.0, store)
+
+    keyword = _articles_from_store(store, set(), 7, 0.3)
+    learned = _articles_from_store(store, set(), 7, 0.3, profile=profile)
+    assert keyword == []    # no legacy keyword in either headline
+    assert [a["url"] for a in learned] == ["https://a.test/1"]
+
+
+def test_article_text_weights_title_and_includes_body_excerpt():
+    text = article_text({"title": "T", "summary": "S", "body_excerpt": "B"})
+    assert text.count("T") == relevance_model.TITLE_REPEAT and "S" in text and "B" in text
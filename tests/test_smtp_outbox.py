@@ -0,0 +1,198 @@
+"""Tests: the SMTP outbox — pooled per-recipient delivery, retries, and resume, against a local stand-in."""
+import base64
+import json
+import smtplib
+import socketserver
+import threading
+from email.mime.text import MIMEText
+
+import pytest
+
+from agents.shared.smtp_outbox import Outbox, SmtpSettings, send_via_outbox
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Just enough ESMTP for smtplib: EHLO, AUTH PLAIN, MAIL/RCPT/DATA, RSET, QUIT."""
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+
+        def reply(line):
+            self.wfile.write(line.encode() + b"\r\n")
+
+        reply("220 stand-in ESMTP")
+        rcpts = []
+        while line := self.rfile.readline():
+            cmd  = line.decode().strip()
+            verb = cmd[:4].upper()
+            if verb == "EHLO":
+                reply("250-stand-in")
+                reply("250 AUTH PLAIN")
+            elif verb == "AUTH":
+                _, user, password = base64.b64decode(cmd.split()[-1]).split(b"\0")
+                reply("235 ok" if password == server.password.encode() else "535 bad credentials")
+            elif verb == "MAIL":
+                rcpts = []
+                reply("250 ok")
+            elif verb == "RCPT":
+                addr = cmd.split(":", 1)[1].strip().strip("<>")
+                with server.lock:
+                    server.rcpt_tries[addr] = server.rcpt_tries.get(addr, 0) + 1
+                    answer = server.answer(addr, server.rcpt_tries[addr])
+                if answer == "DROP":
+                    return
+                if answer.startswith("250"):
+                    rcpts.append(addr)
+                reply(answer)
+            elif verb == "DATA":
+                reply("354 go ahead")
+                data = b"".join(iter(self.rfile.readline, b".\r\n"))
+                with server.lock:
+                    server.delivered.append((rcpts, data))
+                reply("250 queued")
+            elif verb in ("RSET", "NOOP"):
+                reply("250 ok")
+            elif verb == "QUIT":
+                reply("221 bye")
+                return
+            else:
+                reply("502 not implemented")
+
+
+class _SmtpStandIn(socketserver.ThreadingTCPServer):
+    daemon_threads      = True
+    allow_reuse_address = True
+
+    def __init__(self, answer=lambda addr, n: "250 ok", password="secret"):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.answer      = answer       # (recipient, attempt) -> RCPT reply, or "DROP"
+        self.password    = password
+        self.lock        = threading.Lock()
+        self.connections = 0
+        self.rcpt_tries  = {}
+        self.delivered   = []
+
+    def settings(self, password="secret"):
+        return SmtpSettings("127.0.0.1", self.server_address[1], "tracker@example.org", password,
+                            starttls=False, timeout=5)
+
+
+@pytest.fixture
+def standin():
+    servers = []
+
+    def start(**kwargs):
+        server = _SmtpStandIn(**kwargs)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _message():
+    msg = MIMEText("<p>Weekly digest</p>", "html", "utf-8")
+    msg["Subject"] = "CA Housing Intelligence"
+    msg["From"]    = "Tracker <tracker@example.org>"
+    return msg
+
+
+def test_each_recipient_gets_their_own_copy_over_pooled_connections(tmp_path, standin):
+    server     = standin()
+    recipients = [f"r{i}@example.org" for i in range(20)]
+    outbox     = Outbox(tmp_path)
+
+    report = send_via_outbox(_message(), "tracker@example.org", recipients, server.settings(), outbox)
+
+    assert report.ok and sorted(report.sent) == sorted(recipients) and report.attempts == 20
+    assert server.connections <= 3                                  # connections were reused
+    assert all(len(rcpts) == 1 for rcpts, _ in server.delivered)
+    for rcpts, data in server.delivered:
+        assert f"To: {rcpts[0]}\r\n".encode() in data
+        assert [r for r in recipients if f"{r}\r\n".encode() in data] == rcpts   # nobody else's address
+    batch = tmp_path / report.batch
+    assert not (batch / "message.eml").exists()
+    assert json.loads((batch / "report.json").read_text())["sent"] == report.sent
+
+
+def test_transient_failures_are_retried_and_permanent_ones_are_not(tmp_path, standin):
+    def answer(addr, n):
+        if addr == "busy@example.org" and n <= 2:
+            return "451 try again later"
+        if addr == "drop@example.org" and n == 1:
+            return "DROP"
+        if addr == "gone@example.org":
+            return "550 no such user"
+        return "250 ok"
+
+    server = standin(answer=answer)
+    outbox = Outbox(tmp_path)
+    outbox.enqueue(_message(), "tracker@example.org",
+                   ["busy@example.org", "drop@example.org", "gone@example.org", "ok@example.org"])
+
+    [report] = outbox.flush(server.settings(), max_connections=2, backoff=0)
+
+    assert sorted(report.sent) == ["busy@example.org", "drop@example.org", "ok@example.org"]
+    assert list(report.failed) == ["gone@example.org"] and report.failed["gone@example.org"].startswith("550")
+    assert server.rcpt_tries == {"busy@example.org": 3, "drop@example.org": 2,
+                                 "gone@example.org": 1, "ok@example.org": 1}
+    assert not report.ok and "3/4 delivered" in report.summary()
+
+
+def test_retries_give_up_after_the_attempt_limit(tmp_path, standin):
+    server = standin(answer=lambda addr, n: "452 mailbox full")
+    outbox = Outbox(tmp_path)
+    outbox.enqueue(_message(), "tracker@example.org", ["full@example.org"])
+
+    [report] = outbox.flush(server.settings(), attempts=3, backoff=0)
+
+    assert server.rcpt_tries == {"full@example.org": 3}
+    assert report.failed["full@example.org"].startswith("gave up after 3 attempts: 452")
+
+
+def test_queue_survives_an_auth_failure_and_resumes(tmp_path, standin):
+    server = standin()
+    outbox = Outbox(tmp_path)
+    batch  = outbox.enqueue(_message(), "tracker@example.org", ["a@example.org", "b@example.org"])
+
+    with pytest.raises(smtplib.SMTPAuthenticationError):
+        outbox.flush(server.settings(password="wrong"))
+    assert server.delivered == [] and Outbox(tmp_path).pending_batches() == [batch]
+
+    [report] = Outbox(tmp_path).flush(server.settings())
+    assert report.batch == batch and sorted(report.sent) == ["a@example.org", "b@example.org"]
+    assert Outbox(tmp_path).pending_batches() == []
+
+
+def test_a_new_send_does_not_resend_earlier_batches(tmp_path, standin):
+    server = standin()
+    outbox = Outbox(tmp_path)
+    stale  = outbox.enqueue(_message(), "tracker@example.org", ["a@example.org"])   # e.g. a crashed run
+
+    report = send_via_outbox(_message(), "tracker@example.org", ["a@example.org"], server.settings(), outbox)
+
+    assert report.batch != stale and report.ok
+    assert len(server.delivered) == 1                      # one copy, not two
+    assert outbox.pending_batches() == [stale]             # left for an explicit resume
+
+
+def test_resume_expires_batches_past_the_max_age(tmp_path, standin):
+    server = standin()
+    outbox = Outbox(tmp_path)
+    old    = outbox.enqueue(_message(), "tracker@example.org", ["a@example.org", "b@example.org"])
+    meta   = tmp_path / old / "meta.json"
+    meta.write_text(json.dumps(dict(json.loads(meta.read_text()), created="2020-01-01T09:00:00")))
+    fresh  = outbox.enqueue(_message(), "tracker@example.org", ["c@example.org"])
+
+    expired, sent = outbox.flush(server.settings())
+
+    assert (expired.batch, sent.batch) == (old, fresh)
+    assert expired.sent == [] and sorted(expired.failed) == ["a@example.org", "b@example.org"]
+    assert expired.failed["a@example.org"].startswith("expired: queued 2020-01-01")
+    assert sent.sent == ["c@example.org"] and [r for r, _ in server.delivered] == [["c@example.org"]]
+    assert outbox.pending_batches() == []
@@ -0,0 +1,107 @@
+"""Tests: token ledger recording, per-agent summary, and budget enforcement."""
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from agents.shared import token_ledger
+from agents.shared.token_ledger import (
+    TokenBudgetExceeded,
+    configure_ledger,
+    ledger_summary,
+    tracked_create,
+)
+
+
+class _FakeClient:
+    """Stands in for anthropic.Anthropic — returns a message with fixed usage."""
+
+    def __init__(self, input_tokens=100, output_tokens=50):
+        self.calls = 0
+        self.messages = self
+        self._usage = SimpleNamespace(input_tokens=input_tokens, output_tokens=output_tokens)
+
+    def create(self, **kwargs):
+        self.calls += 1
+        return SimpleNamespace(usage=self._usage, stop_reason="end_turn", content=[])
+
+
+@pytest.fixture(autouse=True)
+def _isolated_ledger(tmp_path, monkeypatch):
+    monkeypatch.delenv("CSF_TOKEN_BUDGET", raising=False)
+    yield
+    monkeypatch.setattr(token_ledger, "_budget", None)
+    monkeypatch.setattr(token_ledger, "_ledger_dir", token_ledger.LEDGER_DIR)
+    monkeypatch.setattr(token_ledger, "_run_id", None)
+
+
+def _call(client, agent="newsletter_writer", max_tokens=100):
+    return tracked_create(
+        client, agent,
+        model="claude-sonnet-4-6", max_tokens=max_tokens,
+        messages=[{"role": "user", "content": "hi"}],
+    )
+
+
+def test_calls_are_appended_and_summarized_per_agent(tmp_path):
+    path = configure_ledger(run_id="t1", ledger_dir=tmp_path)
+    client = _FakeClient()
+    _call(client, "newsletter_writer")
+    _call(client, "newsletter_writer")
+    _call(client, "social_writer")
+
+    assert len(path.read_text().splitlines()) == 3
+    summary = ledger_summary()
+    assert summary["newsletter_writer"]["calls"] == 2
+    assert summary["newsletter_writer"]["input_tokens"] == 200
+    assert summary["social_writer"]["output_tokens"] == 50
+    assert summary["social_writer"]["cost_usd"] == pytest.approx((100 * 3 + 50 * 15) / 1e6)
+
+
+def test_budget_aborts_before_the_call_is_made(tmp_path):
+    configure_ledger(budget=300, run_id="t2", ledger_dir=tmp_path)
+    client = _FakeClient()
+    _call(client)                      # 150 used
+    with pytest.raises(TokenBudgetExceeded):
+        _call(client, max_tokens=200)  # 150 + ~200 > 300
+    assert client.calls == 1
+
+
+def test_budget_falls_back_to_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv("CSF_TOKEN_BUDGET", "10")
+    configure_ledger(run_id="t3", ledger_dir=tmp_path)
+    with pytest.raises(TokenBudgetExceeded):
+        _call(_FakeClient())
+
+
+def test_budget_holds_for_calls_in_flight(tmp_path):
+    configure_ledger(budget=250, run_id="t4", ledger_dir=tmp_path)
+    release = threading.Event()
+
+    class _SlowClient(_FakeClient):
+        def create(self, **kwargs):
+            self.calls += 1
+            release.wait(5)
+            return SimpleNamespace(usage=self._usage, stop_reason="end_turn", content=[])
+
+    client, refused = _SlowClient(), []
+
+    def call():
+        try:
+            _call(client)              # ~100 tokens estimated each
+        except TokenBudgetExceeded:
+            refused.append(1)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for t in threads:
+        t.start()
+    deadline = time.monotonic() + 5
+    while client.calls + len(refused) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert (client.calls, len(refused)) == (2, 1)      # two reservations fill the budget
+    assert token_ledger._reserved == 0